@@ -82,6 +82,20 @@ class JwksCache:
         self._lock = asyncio.Lock()
         self._cache: dict[str, Any] | None = None
         self._expires_at: float = 0.0
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Номер JWKS-документа: растёт, когда refresh приносит другие ключи.
+
+        Кеш verified claims (:class:`JwtClaimsCache`) сверяет его, чтобы
+        ротация ключей сбрасывала ранее проверенные токены.
+        """
+        return self._version
+
+    def is_fresh(self) -> bool:
+        """True, пока документ не старше ``ttl`` (refresh не нужен)."""
+        return self._is_fresh()
 
     def _is_fresh(self) -> bool:
         return self._cache is not None and time.monotonic() < self._expires_at
@@ -96,6 +110,8 @@ class JwksCache:
             raise JwksFetchError(
                 f"Не удалось получить JWKS из {self.url}: {exc}"
             ) from exc
+        if payload != self._cache:
+            self._version += 1
         self._cache = payload
         self._expires_at = time.monotonic() + self._ttl
 
@@ -28,6 +28,7 @@ from joserfc.jwk import ECKey, OctKey, RSAKey
 
 from src.backend.core.auth import AuthContext, AuthMethod
 from src.backend.core.auth.jwks_cache import JwksCache
+from src.backend.core.auth.jwt_claims_cache import JwtClaimsCache
 from src.backend.core.logging import get_logger
 
 __all__ = ("JwtBackend", "JwtClaims", "JwtVerificationError", "decode", "encode")
@@ -184,6 +185,8 @@ class JwtBackend:
         issuer: Ожидаемый ``iss`` (str / None).
         leeway: Допустимое отклонение времени в секундах для exp/nbf.
         blacklist: Опциональный blacklist (jti revocation).
+        claims_cache: Опциональный кеш verified claims: повторный токен
+            не верифицируется заново до ``exp`` / ротации JWKS / отзыва.
 
     """
 
@@ -195,6 +198,7 @@ class JwtBackend:
     issuer: str | None = None
     leeway: int = 60
     blacklist: Any | None = None
+    claims_cache: JwtClaimsCache | None = None
 
     def __post_init__(self) -> None:
         if not self.algorithms:
@@ -243,6 +247,35 @@ class JwtBackend:
         raise JwtVerificationError(f"Алгоритм {alg} не в списке разрешённых")
 
     async def decode(self, token: str) -> JwtClaims:
+        """Верифицирует токен (или берёт claims из ``claims_cache``).
+
+        Кеш используется, только пока JWKS свежий: устаревший документ
+        идёт через полную верификацию, которая его обновит (и, если
+        ключи сменились, поднимет ``JwksCache.version`` — старые записи
+        станут промахами).
+
+        Raises:
+            JwtVerificationError: При любой ошибке валидации.
+
+        """
+        cache = self.claims_cache
+        if cache is None or (self.jwks is not None and not self.jwks.is_fresh()):
+            claims = await self._verify(token)
+        else:
+            cached = cache.get(token, jwks_version=self._jwks_version())
+            if cached is not None:
+                return cached
+            claims = await self._verify(token)
+        if cache is not None:
+            cache.put(token, claims, jwks_version=self._jwks_version())
+            if self.blacklist is not None:
+                cache.ensure_revocation_listener(self.blacklist)
+        return claims
+
+    def _jwks_version(self) -> int | None:
+        return self.jwks.version if self.jwks is not None else None
+
+    async def _verify(self, token: str) -> JwtClaims:
         """Верифицирует токен и возвращает извлечённые claims.
 
         При ``feature_flags.auth_joserfc = True`` (DEPRECATED, S67 W2)
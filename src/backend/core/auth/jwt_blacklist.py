@@ -10,6 +10,11 @@ S18 W4 (S-L8-5) — batch-revocation при JWKS rotation: один атомар
 вызывается из :class:`JwtBackend.decode` независимо от per-``jti``
 gate.
 
+Каждый отзыв сразу вычищает токены из in-process кешей verified claims
+(:mod:`jwt_claims_cache`) и публикует событие в pub/sub-канал
+``jwt:invalidate``; :meth:`RedisJwtBlacklist.listen_revocations`
+доставляет его кешам остальных воркеров.
+
 Ключи Redis:
 * ``blacklist:jwt:<jti>`` → ``1`` с TTL = (exp - now) секунд (per-token).
 * ``blacklist:jwt:revoke_before`` → unix-timestamp (без TTL, global
@@ -22,14 +27,20 @@ Wave [s2/k1-2-jwt-jwks] + [wave:s18/k1-w4-jwt-blacklist-batch-revoke].
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from typing import Any, Protocol
 
+import orjson
+
+from src.backend.core.auth.jwt_claims_cache import notify_revoked, notify_revoked_before
 from src.backend.core.logging import get_logger
 
 __all__ = ("JwtBlacklistProtocol", "RedisJwtBlacklist")
 
 _logger = get_logger(__name__)
 
+_INVALIDATE_CHANNEL = "jwt:invalidate"
+
 
 class JwtBlacklistProtocol(Protocol):
     """Контракт blacklist'а: per-jti revoke + batch revoke-before.
@@ -70,9 +81,16 @@ class RedisJwtBlacklist:
 
     _REVOKE_BEFORE_SUFFIX = "revoke_before"
 
-    def __init__(self, redis: Any, *, key_prefix: str = "blacklist:jwt:") -> None:
+    def __init__(
+        self,
+        redis: Any,
+        *,
+        key_prefix: str = "blacklist:jwt:",
+        channel: str = _INVALIDATE_CHANNEL,
+    ) -> None:
         self._redis = redis
         self._prefix = key_prefix
+        self._channel = channel
 
     def _key(self, jti: str) -> str:
         return f"{self._prefix}{jti}"
@@ -103,6 +121,8 @@ class RedisJwtBlacklist:
         except Exception as exc:
             _logger.error("JWT blacklist SET failed for jti=%s: %s", jti, exc)
             raise
+        notify_revoked(jti)
+        await self._publish({"jti": jti})
 
     async def revoke_before_time(self, time_threshold: int) -> None:
         """Batch-отзыв всех токенов, выданных до ``time_threshold`` (S18 W4).
@@ -133,6 +153,8 @@ class RedisJwtBlacklist:
                 "JWT blacklist revoke_before_time(%s) failed: %s", time_threshold, exc
             )
             raise
+        notify_revoked_before(new_value)
+        await self._publish({"revoke_before": new_value})
 
     async def is_iat_revoked(self, iat: int | None) -> bool:
         """Проверяет, попадает ли токен под batch-revoke по ``iat`` (S18 W4).
@@ -168,3 +190,36 @@ class RedisJwtBlacklist:
         except (TypeError, ValueError):
             return False
         return iat_int < threshold
+
+    async def listen_revocations(
+        self,
+        handler: Callable[[dict[str, Any]], None],
+        *,
+        on_subscribed: Callable[[], None] | None = None,
+    ) -> None:
+        """Доставляет события отзыва других воркеров в ``handler``.
+
+        Один сеанс pub/sub: разрыв соединения пробрасывается наружу —
+        :meth:`JwtClaimsCache.ensure_revocation_listener` перезапускает
+        listener с backoff. ``on_subscribed`` вызывается, когда подписка
+        активна и события больше не теряются.
+        """
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._channel)
+        if on_subscribed is not None:
+            on_subscribed()
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                event = orjson.loads(message.get("data"))
+                handler(event)
+            except Exception as exc:
+                _logger.debug("Invalid JWT invalidation payload: %s", exc)
+
+    async def _publish(self, event: dict[str, Any]) -> None:
+        # Best-effort: отзыв уже записан в Redis и применён локально.
+        try:
+            await self._redis.publish(self._channel, orjson.dumps(event))
+        except Exception as exc:
+            _logger.debug("JWT invalidation publish failed: %s", exc)
@@ -0,0 +1,213 @@
+"""In-process кеш верифицированных JWT claims.
+
+Один и тот же bearer-токен приходит тысячи раз в минуту, а
+:meth:`JwtBackend.decode` на каждый запрос проверял подпись (RSA/ECDSA —
+самая дорогая часть), claims и два раза ходил в Redis-blacklist.
+:class:`JwtClaimsCache` хранит результат успешной верификации:
+
+* ключ — ``blake2b(token)`` (сам токен в памяти не держится);
+* запись живёт до ``min(exp, now + max_ttl)``: после ``exp`` токен
+  проходит полную верификацию (с ``leeway``) заново;
+* LRU-граница ``max_entries``;
+* ротация ключей: запись помнит ``JwksCache.version``, с которым
+  токен был проверен, — смена JWKS-документа делает запись промахом;
+* отзыв: :func:`notify_revoked` (``jti``) и
+  :func:`notify_revoked_before` (batch по ``iat``) вычищают записи всех
+  кешей процесса; :class:`RedisJwtBlacklist` вызывает их при
+  ``revoke``/``revoke_before_time`` и рассылает событие остальным
+  воркерам через pub/sub (``jwt:invalidate``). Listener перезапускается
+  с backoff; пока подписка не активна (старт, разрыв), кеш не выдаёт и
+  не запоминает записи — события отзыва в это окно могли потеряться.
+  Без listener'а (blacklist не задан) устаревание ограничено ``max_ttl``.
+
+Метрика: ``jwt_claims_cache_total{result}`` (hit / miss / evicted).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
+
+if TYPE_CHECKING:
+    from src.backend.core.auth.jwt_backend import JwtClaims
+
+__all__ = ("JwtClaimsCache", "notify_revoked", "notify_revoked_before")
+
+_logger = get_logger(__name__)
+
+jwt_claims_cache_total = metrics_registry.counter(
+    "jwt_claims_cache_total",
+    "Verified JWT claims cache lookups and evictions by result.",
+    labels=("result",),
+)
+
+_caches: weakref.WeakSet[JwtClaimsCache] = weakref.WeakSet()
+
+
+class JwtClaimsCache:
+    """LRU-кеш verified claims с истечением по ``exp`` токена.
+
+    Args:
+        max_entries: Граница числа записей (LRU).
+        max_ttl: Максимальное время жизни записи в секундах.
+
+    """
+
+    def __init__(self, *, max_entries: int = 10_000, max_ttl: float = 60.0) -> None:
+        self._max_entries = max_entries
+        self._max_ttl = max_ttl
+        # digest -> (expires_at (wall clock), jwks_version, claims)
+        self._entries: OrderedDict[bytes, tuple[float, int | None, JwtClaims]] = (
+            OrderedDict()
+        )
+        self._listener_task: asyncio.Task[None] | None = None
+        # True, пока listener отзывов запущен, но не подписан.
+        self._paused = False
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str, *, jwks_version: int | None = None) -> JwtClaims | None:
+        """Claims ранее верифицированного токена или ``None`` (промах).
+
+        Args:
+            token: Компактный JWT.
+            jwks_version: Текущая версия JWKS (``None`` — HS-токены).
+
+        """
+        digest = _digest(token)
+        entry = None if self._paused else self._entries.get(digest)
+        if entry is None:
+            jwt_claims_cache_total.labels(result="miss").inc()
+            return None
+        expires_at, version, claims = entry
+        if expires_at <= time.time() or version != jwks_version:
+            del self._entries[digest]
+            jwt_claims_cache_total.labels(result="miss").inc()
+            return None
+        self._entries.move_to_end(digest)
+        jwt_claims_cache_total.labels(result="hit").inc()
+        # raw отдаётся копией: вызывающие кладут его в AuthContext.
+        return dataclasses.replace(claims, raw=dict(claims.raw))
+
+    def put(
+        self, token: str, claims: JwtClaims, *, jwks_version: int | None = None
+    ) -> None:
+        """Запомнить claims успешно верифицированного токена."""
+        if self._max_entries <= 0 or self._paused:
+            return
+        now = time.time()
+        expires_at = now + self._max_ttl
+        if isinstance(claims.exp, int | float):
+            expires_at = min(expires_at, float(claims.exp))
+        if expires_at <= now:
+            return
+        digest = _digest(token)
+        self._entries[digest] = (expires_at, jwks_version, claims)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def evict_jti(self, jti: str) -> int:
+        """Удалить записи токена с данным ``jti``; возвращает число удалённых."""
+        return self._evict(lambda claims: claims.jti == jti)
+
+    def evict_issued_before(self, threshold: int) -> int:
+        """Удалить записи токенов с ``iat < threshold`` (batch-revoke)."""
+        return self._evict(lambda claims: _issued_before(claims, threshold))
+
+    def clear(self) -> None:
+        """Сбросить кеш целиком."""
+        self._entries.clear()
+
+    def ensure_revocation_listener(self, blacklist: Any) -> None:
+        """Лениво поднять listener событий отзыва от других воркеров.
+
+        ``blacklist`` должен реализовать ``listen_revocations(handler, *,
+        on_subscribed)`` (см. :class:`RedisJwtBlacklist`); иначе — no-op.
+        После выхода listener'а кеш сбрасывается и не используется до
+        повторной подписки.
+        """
+        if self._listener_task is not None or not hasattr(
+            blacklist, "listen_revocations"
+        ):
+            return
+        try:
+            from src.backend.core.utils.async_helpers import run_with_restarts
+            from src.backend.core.utils.task_registry import get_task_registry
+
+            self._listener_task = get_task_registry().create_task(
+                run_with_restarts(
+                    lambda: blacklist.listen_revocations(
+                        self._on_revocation, on_subscribed=self._resume
+                    ),
+                    name="JWT claims cache invalidation listener",
+                    on_restart=self._pause,
+                ),
+                name="jwt-claims-cache-invalidation-listen",
+            )
+        except Exception as exc:
+            _logger.debug("JWT claims cache listener not started: %s", exc)
+            return
+        self._pause()
+
+    def _pause(self) -> None:
+        self._paused = True
+        self._entries.clear()
+
+    def _resume(self) -> None:
+        # Записи, сделанные до подписки, могли пропустить отзыв.
+        self._entries.clear()
+        self._paused = False
+
+    def _on_revocation(self, event: dict[str, Any]) -> None:
+        jti = event.get("jti")
+        if jti:
+            self.evict_jti(str(jti))
+        revoke_before = event.get("revoke_before")
+        if revoke_before is not None:
+            self.evict_issued_before(int(revoke_before))
+
+    def _evict(self, predicate: Any) -> int:
+        stale = [
+            digest
+            for digest, (_, _, claims) in self._entries.items()
+            if predicate(claims)
+        ]
+        for digest in stale:
+            del self._entries[digest]
+        if stale:
+            jwt_claims_cache_total.labels(result="evicted").inc(len(stale))
+        return len(stale)
+
+
+def notify_revoked(jti: str) -> None:
+    """Вычистить токен ``jti`` из всех кешей claims процесса."""
+    for cache in list(_caches):
+        cache.evict_jti(jti)
+
+
+def notify_revoked_before(threshold: int) -> None:
+    """Вычистить токены с ``iat < threshold`` из всех кешей claims процесса."""
+    for cache in list(_caches):
+        cache.evict_issued_before(threshold)
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=20).digest()
+
+
+def _issued_before(claims: JwtClaims, threshold: int) -> bool:
+    try:
+        return int(claims.raw.get("iat")) < threshold
+    except (TypeError, ValueError):
+        return False
@@ -7,25 +7,62 @@ dataclasses/UUID/datetime/Decimal/Enum/bytes. Размещение в ``core/cod
 теперь импортируют из ``core.*`` вместо ``dsl.*``.
 
 Backward-compat: ``dsl/codec/json.py`` остаётся re-export shim.
+
+Два формата:
+
+* **marker** (:func:`json_dumps` / :func:`json_loads`) — богатые типы
+  кодируются tagged-dict'ами ``{"__type__": ..., "value": ...}`` и
+  восстанавливаются без знания схемы. Кодирование — один нативный проход
+  C-энкодера ``json`` с ``default``-хуком (хук вызывается только для
+  не-JSON типов), декодирование — ``object_hook`` того же C-парсера.
+  orjson здесь не подходит: UUID он сериализует сам, не вызывая ``default``,
+  и маркер ``uuid`` было бы не сохранить.
+* **plain** (:func:`plain_dumps` / :func:`plain_loads`) — нативный формат
+  msgspec без маркеров (UUID/datetime/Decimal — строки). Используется
+  hot-path сериализаторами (:mod:`core.serialization.msgspec_hotpath`).
+
+Если целевой тип известен, ``json_loads(payload, schema=T)`` /
+``plain_loads(payload, schema=T)`` декодируют сразу в ``T`` кэшированным
+msgspec-декодером (pydantic ``TypeAdapter`` — для типов, которые msgspec
+не поддерживает, например ``BaseModel``).
 """
 
 from __future__ import annotations
 
 import json as _stdjson
 from base64 import b64decode, b64encode
-from dataclasses import asdict, is_dataclass
+from collections.abc import Callable
+from dataclasses import asdict, fields, is_dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
 import orjson
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:  # pragma: no cover — fallback path
+    msgspec = None  # type: ignore[assignment]
+    MSGSPEC_AVAILABLE = False
 
 TYPE_MARKER = "__type__"
 VALUE_MARKER = "value"
 
+_MARKER_PARSERS: dict[str, Callable[[str], Any]] = {
+    "uuid": UUID,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "decimal": Decimal,
+    "bytes": b64decode,
+}
+
 
 def to_jsonable(value: Any) -> Any:
     """Рекурсивно конвертирует Python-объект в JSON-совместимое представление.
@@ -105,16 +142,208 @@ def from_jsonable(value: Any) -> Any:
     return value
 
 
+def _marker_default(value: Any) -> Any:
+    """``default``-хук marker-энкодера: вызывается только для не-JSON типов.
+
+    Возвращённый объект энкодер обходит сам, поэтому вложенные модели и
+    dataclass'ы не копируются рекурсивно, как в :func:`to_jsonable`.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="python")
+
+    if isinstance(value, UUID):
+        return {TYPE_MARKER: "uuid", VALUE_MARKER: str(value)}
+
+    if isinstance(value, datetime):
+        return {TYPE_MARKER: "datetime", VALUE_MARKER: value.isoformat()}
+
+    if isinstance(value, date):
+        return {TYPE_MARKER: "date", VALUE_MARKER: value.isoformat()}
+
+    if isinstance(value, Decimal):
+        return {TYPE_MARKER: "decimal", VALUE_MARKER: str(value)}
+
+    if isinstance(value, bytes):
+        return {TYPE_MARKER: "bytes", VALUE_MARKER: b64encode(value).decode("ascii")}
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _marker_object_hook(value: dict[str, Any]) -> Any:
+    marker = value.get(TYPE_MARKER)
+    parser = _MARKER_PARSERS.get(marker) if isinstance(marker, str) else None
+    if parser is not None:
+        return parser(value[VALUE_MARKER])
+    return value
+
+
+# ``check_circular=False``: циклы всё равно не сериализуемы, а проверка
+# стоит id()-учёта на каждом контейнере. NaN/Infinity и нестроковые ключи
+# экзотических типов уходят в legacy-путь (см. :func:`json_dumps`).
+_MARKER_ENCODER = _stdjson.JSONEncoder(
+    default=_marker_default,
+    ensure_ascii=False,
+    separators=(",", ":"),
+    check_circular=False,
+    allow_nan=False,
+)
+_MARKER_DECODER = _stdjson.JSONDecoder(object_hook=_marker_object_hook)
+
+
 def json_dumps(value: Any) -> bytes:
-    """Сериализует ``value`` в JSON-bytes (orjson + богатые типы)."""
-    return orjson.dumps(to_jsonable(value))
+    """Сериализует ``value`` в JSON-bytes (marker-формат, один нативный проход).
 
+    Маркеры и структура те же, что у ``orjson.dumps(to_jsonable(value))``,
+    и :func:`json_loads` восстанавливает одинаковые значения, но байты
+    совпадают не всегда — C-энкодер ``json`` пишет:
 
-def json_loads(payload: bytes | bytearray | memoryview | str) -> Any:
-    """Парсит JSON и восстанавливает богатые типы (UUID/datetime/...)."""
-    if isinstance(payload, str):
-        payload = payload.encode("utf-8")
-    return from_jsonable(orjson.loads(payload))
+    * float через ``repr``: ``1e-07`` вместо ``1e-7``, ``1e-05`` вместо
+      ``0.00001`` (значение после разбора то же);
+    * ключи ``True``/``False``/``None`` как ``"true"``/``"false"``/``"null"``
+      вместо ``"True"``/``"False"``/``"None"``.
+
+    Для байт-стабильных digest'ов используйте :func:`canonical_json_bytes`.
+    Значения, которые C-энкодер отвергает (ключи-кортежи/UUID, NaN),
+    сериализуются прежним путём через :func:`to_jsonable`.
+    """
+    try:
+        return _MARKER_ENCODER.encode(value).encode("utf-8")
+    except (TypeError, ValueError):
+        return orjson.dumps(to_jsonable(value))
+
+
+def json_loads(
+    payload: bytes | bytearray | memoryview | str, *, schema: Any = None
+) -> Any:
+    """Парсит JSON и восстанавливает богатые типы (UUID/datetime/...).
+
+    Args:
+        payload: JSON (marker- или plain-формат).
+        schema: Целевой тип. Если задан — payload декодируется сразу в него
+            кэшированным schema-aware декодером; marker-payload (где на месте
+            UUID/datetime лежат tagged-dict'ы) валидируется после
+            восстановления маркеров.
+
+    """
+    if schema is not None:
+        decode, convert = _typed_codec(schema)
+        try:
+            return decode(_as_bytes(payload))
+        except _VALIDATION_ERRORS:
+            return convert(_MARKER_DECODER.decode(_as_str(payload)))
+    return _MARKER_DECODER.decode(_as_str(payload))
+
+
+def plain_dumps(value: Any) -> bytes:
+    """JSON без type-маркеров (msgspec → orjson fallback).
+
+    UUID/datetime/Decimal пишутся строками, pydantic-модели — через
+    ``model_dump``. Для восстановления типов нужна схема
+    (``plain_loads(payload, schema=T)``).
+    """
+    if MSGSPEC_AVAILABLE:
+        return PLAIN_ENCODER.encode(value)
+    return orjson.dumps(value, default=plain_enc_hook)
+
+
+def plain_loads(
+    payload: bytes | bytearray | memoryview | str, *, schema: Any = None
+) -> Any:
+    """Парсит plain-JSON; со ``schema`` — сразу в целевой тип."""
+    if schema is not None:
+        return _typed_codec(schema)[0](_as_bytes(payload))
+    if MSGSPEC_AVAILABLE:
+        return PLAIN_DECODER.decode(_as_bytes(payload))
+    return orjson.loads(_as_bytes(payload))
+
+
+def plain_enc_hook(value: Any) -> Any:
+    """``enc_hook`` plain-формата (msgspec ``enc_hook`` / orjson ``default``)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="python")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _as_bytes(
+    payload: bytes | bytearray | memoryview | str,
+) -> bytes | bytearray | memoryview:
+    return payload.encode("utf-8") if isinstance(payload, str) else payload
+
+
+def _as_str(payload: bytes | bytearray | memoryview | str) -> str:
+    return payload if isinstance(payload, str) else bytes(payload).decode("utf-8")
+
+
+@lru_cache(maxsize=512)
+def _typed_codec(
+    schema: Any,
+) -> tuple[Callable[[Any], Any], Callable[[Any], Any]]:
+    """(decode_json, convert_python) для ``schema``; кэшируется по типу.
+
+    msgspec-декодер строится один раз на тип; типы, которые msgspec не
+    поддерживает (pydantic-модели и контейнеры с ними), обслуживает
+    pydantic ``TypeAdapter`` (тоже нативный, pydantic-core).
+    """
+    if MSGSPEC_AVAILABLE and _msgspec_native(schema):
+        decoder = msgspec.json.Decoder(schema)
+        return decoder.decode, lambda obj: msgspec.convert(obj, schema)
+    adapter = TypeAdapter(schema)
+    return adapter.validate_json, adapter.validate_python
+
+
+def _msgspec_native(schema: Any) -> bool:
+    """True, если msgspec декодирует ``schema`` без ``dec_hook``.
+
+    ``msgspec.inspect.type_info`` размечает неизвестные msgspec классы
+    (в т.ч. pydantic-модели) как ``CustomType``; такой тип где угодно
+    в дереве схемы — повод отдать декодирование pydantic.
+    """
+    try:
+        root = msgspec.inspect.type_info(schema)
+    except (TypeError, ValueError):
+        return False
+    stack: list[Any] = [root]
+    seen: set[int] = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, msgspec.inspect.CustomType):
+            return False
+        if isinstance(node, tuple):
+            stack.extend(node)
+        elif isinstance(node, (msgspec.inspect.Type, msgspec.inspect.Field)):
+            stack.extend(getattr(node, name) for name in node.__struct_fields__)
+    return True
+
+
+if MSGSPEC_AVAILABLE:
+    import msgspec.inspect
+
+    PLAIN_ENCODER = msgspec.json.Encoder(enc_hook=plain_enc_hook)
+    PLAIN_DECODER = msgspec.json.Decoder()
+    _VALIDATION_ERRORS: tuple[type[Exception], ...] = (
+        msgspec.ValidationError,
+        PydanticValidationError,
+    )
+else:  # pragma: no cover — fallback path
+    PLAIN_ENCODER = None
+    PLAIN_DECODER = None
+    _VALIDATION_ERRORS = (PydanticValidationError,)
 
 
 def dumps_bytes(value: Any, *, sort_keys: bool = False, indent: bool = False) -> bytes:
@@ -185,6 +414,9 @@ def canonical_json_bytes(value: Any) -> bytes:
 
 
 __all__ = (
+    "MSGSPEC_AVAILABLE",
+    "PLAIN_DECODER",
+    "PLAIN_ENCODER",
     "TYPE_MARKER",
     "VALUE_MARKER",
     "canonical_json_bytes",
@@ -194,5 +426,8 @@ __all__ = (
     "json_dumps",
     "json_loads",
     "loads",
+    "plain_dumps",
+    "plain_enc_hook",
+    "plain_loads",
     "to_jsonable",
 )
@@ -372,6 +372,30 @@ class MarkitdownSettings(BaseSettingsWithLoader):
         ),
     )
 
+    parse_cache_max_chars: int = Field(
+        default=50_000_000,
+        ge=0,
+        description=(
+            "Ёмкость content-hash кэша результатов парсинга (символы текста); "
+            "0 — кэш выключен."
+        ),
+    )
+
+    pdf_pages_per_task: int = Field(
+        default=8,
+        ge=1,
+        le=1000,
+        description="Страниц PDF в одной задаче process pool (legacy-парсер).",
+    )
+
+    pdf_parallel_min_pages: int = Field(
+        default=16,
+        ge=1,
+        description=(
+            "PDF короче — парсится одним потоком (process pool не окупается)."
+        ),
+    )
+
 
 ai_providers_settings = AIProvidersSettings()
 minimax_settings = MiniMaxSettings()
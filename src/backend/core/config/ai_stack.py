@@ -133,6 +133,21 @@ class RagIngestSettings(BaseSettingsWithLoader):
     state_ttl_seconds: int = Field(
         default=86_400, ge=60, description="TTL Redis-ключей со state ingest-задач."
     )
+    pipeline_queue_size: int = Field(
+        default=64, ge=1, description="Ёмкость очередей между стадиями ingest-pipeline."
+    )
+    parse_concurrency: int = Field(
+        default=2, ge=1, description="Worker'ы стадии parse (decode + PII-mask)."
+    )
+    chunk_concurrency: int = Field(
+        default=2, ge=1, description="Worker'ы стадии chunk/hash/diff."
+    )
+    embed_concurrency: int = Field(
+        default=4, ge=1, description="Worker'ы стадии embed (новые chunks)."
+    )
+    upsert_concurrency: int = Field(
+        default=2, ge=1, description="Worker'ы стадии upsert/delete в vector store."
+    )
     pii_mask_on_ingest: bool = Field(
         default=True,
         description=(
@@ -86,6 +86,49 @@ class SchedulerSettings(BaseSettingsWithLoader):
         examples=["UTC"],
     )
 
+    # Отложенные задачи JobQueue (delay / retry)
+    job_queue_backend: Literal["apscheduler", "redis", "memory"] = Field(
+        default="apscheduler",
+        title="Backend отложенных задач",
+        description=(
+            "apscheduler — date-jobs в APScheduler; redis — sorted set с "
+            "lease-claim (общий для всех инстансов); memory — in-process"
+        ),
+        examples=["redis"],
+    )
+
+    delayed_job_batch_size: int = Field(
+        default=100,
+        ge=1,
+        title="Размер claim-batch",
+        description="Сколько due-задач worker забирает за один claim",
+        examples=[100],
+    )
+
+    delayed_job_lease_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        title="Lease задачи",
+        description="Через сколько секунд незавершённая задача снова станет due",
+        examples=[30.0],
+    )
+
+    delayed_job_max_attempts: int = Field(
+        default=5,
+        ge=1,
+        title="Максимум попыток",
+        description="Попыток выполнения отложенной задачи до отказа",
+        examples=[5],
+    )
+
+    delayed_job_concurrency: int = Field(
+        default=32,
+        ge=1,
+        title="Параллелизм worker'а",
+        description="Одновременно выполняемых отложенных задач на инстанс",
+        examples=[32],
+    )
+
     @model_validator(mode="after")
     def check_jobstores(self) -> SchedulerSettings:
         """Запрещает совпадение основного и резервного jobstore."""
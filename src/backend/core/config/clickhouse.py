@@ -1,6 +1,6 @@
 """Настройки подключения к ClickHouse."""
 
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
@@ -26,6 +26,10 @@ class ClickHouseSettings(BaseSettingsWithLoader):
     connect_timeout: int = Field(10, ge=1, description="Таймаут подключения (сек).")
     send_receive_timeout: int = Field(300, ge=1, description="Таймаут операций (сек).")
     max_batch_size: int = Field(10000, ge=1, description="Макс. размер batch insert.")
+    insert_compression: Literal["zstd", "gzip", "none"] = Field(
+        "zstd",
+        description="Content-Encoding тела колоночного INSERT (insert_columnar).",
+    )
     enabled: bool = Field(False, description="Включить ClickHouse интеграцию.")
 
     # ── Persistent connection pool (httpx.Limits + lifecycle) ──
@@ -35,6 +35,8 @@ class DSLSettings(BaseSettingsWithLoader):
             событий при сохранении редактором (tmp-файл + rename).
         rate_convert_providers: Словарь URL провайдеров курсов валют
             для RateConvertProcessor.
+        route_cache_dir: Каталог кэша скомпилированных (resolved)
+            маршрутов; ``None`` — кэш отключён.
     """
 
     yaml_group: ClassVar[str] = "dsl"
@@ -67,6 +69,14 @@ class DSLSettings(BaseSettingsWithLoader):
         title="Провайдеры курсов валют",
         description="Словарь name → URL-шаблон для RateConvertProcessor.",
     )
+    route_cache_dir: Path | None = Field(
+        default=Path("var/cache/dsl_routes"),
+        title="Кэш скомпилированных маршрутов",
+        description=(
+            "Каталог content-hash кэша resolved DSL-spec'ов "
+            "(ускоряет старт и hot-reload); None — отключить."
+        ),
+    )
 
 
 dsl_settings: DSLSettings = DSLSettings()
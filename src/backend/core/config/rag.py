@@ -138,6 +138,27 @@ class RAGSettings(BaseSettingsWithLoader):
     embedding_api_key: str | None = Field(
         None, description="API-ключ для openai-совместимого endpoint."
     )
+    embedding_batch_size: int = Field(
+        64,
+        ge=1,
+        description=(
+            "sentence-transformers: максимум текстов в одном вызове модели "
+            "(конкурентные embed склеиваются micro-batching'ом)."
+        ),
+    )
+    embedding_batch_wait_ms: float = Field(
+        5.0,
+        ge=0.0,
+        description="Сколько batch ждёт попутчиков после первого текста (мс).",
+    )
+    embedding_queue_size: int = Field(
+        1024, ge=1, description="Граница очереди текстов на эмбеддинг."
+    )
+    embedding_cache_size: int = Field(
+        4096,
+        ge=0,
+        description="Размер content-hash LRU эмбеддингов (0 — выключен).",
+    )
 
     # --- Pipeline ------------------------------------------------------
     chunk_size: int = Field(512, ge=64, description="Размер чанка (символов).")
@@ -73,11 +73,34 @@ class SecureSettings(BaseSettingsWithLoader):
         description="Допустимое отклонение exp/nbf в секундах.",
     )
     jwt_blacklist_enabled: bool = Field(default=False)
+    jwt_claims_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        description=(
+            "Число verified JWT в in-process кеше claims (0 — кеш выключен)."
+        ),
+    )
+    jwt_claims_cache_ttl: int = Field(
+        default=60,
+        ge=1,
+        le=3600,
+        description=(
+            "Максимальное время жизни записи кеша claims в секундах "
+            "(запись не переживает exp токена)."
+        ),
+    )
 
     # API-безопасность
     api_key: str = Field(
         ..., description="Основной API-ключ приложения", examples=["your_api_key_123"]
     )
+    api_key_legacy_scan: bool = Field(
+        default=True,
+        description=(
+            "SCAN по всем apikey:* для legacy-ключей без key_id, ещё не "
+            "получивших индекс. Выключить после миграции/перевыпуска ключей."
+        ),
+    )
     allowed_hosts: list[str] = Field(
         ...,
         description="Разрешенные хосты для входящих запросов",
@@ -35,6 +35,8 @@ _DEFAULT_MAX_RETRIES: int = 3
 _DEFAULT_RETRY_BACKOFF_FACTOR: float = 0.5
 _DEFAULT_RETRY_STATUS_CODES: tuple[int, ...] = (408, 429, 500, 502, 503, 504)
 _DEFAULT_KERNEL: str = "python3"
+_DEFAULT_KERNEL_POOL_SIZE: int = 0
+_DEFAULT_KERNEL_POOL_MAX_USES: int = 50
 
 
 class JupyterHubSettings(BaseSettingsWithLoader):
@@ -120,6 +122,38 @@ class JupyterHubSettings(BaseSettingsWithLoader):
         ),
     )
 
+    # ── Пул прогретых kernel'ов (nbclient / papermill backends) ──
+
+    kernel_pool_size: int = Field(
+        default=_DEFAULT_KERNEL_POOL_SIZE,
+        ge=0,
+        le=64,
+        description=(
+            "Живых kernel'ов на kernelspec в пуле локальных backend'ов. "
+            "0 — пул выключен (новый kernel на каждый прогон, по умолчанию): "
+            "pooled kernel общий для прогонов, состояние C-расширений и "
+            "sys.path между ними не сбрасывается."
+        ),
+    )
+
+    kernel_pool_max_uses: int = Field(
+        default=_DEFAULT_KERNEL_POOL_MAX_USES,
+        ge=1,
+        description="Прогонов notebook'ов до пересоздания kernel'а.",
+    )
+
+    kernel_pool_min_idle: int = Field(
+        default=1,
+        ge=0,
+        description="Тёплых kernel'ов на kernelspec, которые пул держит готовыми.",
+    )
+
+    kernel_pool_prewarm: tuple[str, ...] = Field(
+        default=(),
+        description="Kernelspec'и, прогреваемые при создании пула.",
+        examples=[("python3",)],
+    )
+
     # ── Валидация ──
 
     @model_validator(mode="after")
@@ -33,6 +33,8 @@ class PolicySettings(BaseSettingsWithLoader):
     * ``casbin_model_path`` / ``casbin_policy_path`` — файловые пути
       для ``CasbinAdapter`` (4-арг модель с tenant, см.
       ``policies/casbin_model_tenant.conf``).
+    * ``decision_cache_*`` — кэш решений policy-цепочки
+      (``DecisionCache``): раздельные TTL для allow/deny и LRU-граница.
     """
 
     yaml_group: ClassVar[str] = "policy"
@@ -72,6 +74,35 @@ class PolicySettings(BaseSettingsWithLoader):
         description="Путь к policy-store (CSV/DB) для Casbin.",
         examples=["policies/casbin_policies.csv"],
     )
+    decision_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Кэшировать решения OPA/Casbin по (principal, resource, action, "
+            "tenant_id) + policy-version stamp. Opt-in: reload OPA-bundle "
+            "происходит в процессе OPA и stamp не сбрасывает — allow живёт "
+            "до decision_cache_allow_ttl, если bundle watcher не вызывает "
+            "notify_policy_changed()."
+        ),
+        examples=[True, False],
+    )
+    decision_cache_allow_ttl: float = Field(
+        default=30.0,
+        ge=0,
+        description="TTL разрешающих решений в кэше (сек).",
+        examples=[30.0],
+    )
+    decision_cache_deny_ttl: float = Field(
+        default=5.0,
+        ge=0,
+        description="TTL запрещающих решений в кэше (сек); 0 — deny не кэшируется.",
+        examples=[5.0, 0.0],
+    )
+    decision_cache_max_entries: int = Field(
+        default=10_000,
+        ge=1,
+        description="Максимум решений в кэше (LRU-вытеснение).",
+        examples=[10_000],
+    )
 
 
 policy_settings = PolicySettings()
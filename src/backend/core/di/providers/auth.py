@@ -79,6 +79,7 @@ def get_jwt_backend_provider() -> JwtBackend:
         jwks=jwks,
         leeway=getattr(secure_settings, "jwt_leeway", 60),
         blacklist=blacklist,
+        claims_cache=_build_jwt_claims_cache_or_none(),
     )
     _overrides["jwt_backend"] = backend
     return backend
@@ -134,6 +135,19 @@ def _build_jwks_cache_or_none() -> Any:
     return JwksCache(url, ttl=ttl)
 
 
+def _build_jwt_claims_cache_or_none() -> Any:
+    """Создаёт :class:`JwtClaimsCache` если ``jwt_claims_cache_size > 0``."""
+    from src.backend.core.config.security import secure_settings
+
+    size = getattr(secure_settings, "jwt_claims_cache_size", 0)
+    if size <= 0:
+        return None
+    from src.backend.core.auth.jwt_claims_cache import JwtClaimsCache
+
+    ttl = getattr(secure_settings, "jwt_claims_cache_ttl", 60)
+    return JwtClaimsCache(max_entries=size, max_ttl=ttl)
+
+
 def _build_jwt_blacklist_or_none() -> Any:
     """Создаёт :class:`RedisJwtBlacklist` если ``blacklist_enabled=True``.
 
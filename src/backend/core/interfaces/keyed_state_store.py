@@ -0,0 +1,60 @@
+"""Protocol keyed-state хранилища для оконных процессоров.
+
+Каждая запись — пара ``(state, timer)`` на ключ: ``state`` — произвольное
+состояние ключа (для :class:`KeyedWindowProcessor` — словарь pane-агрегатов),
+``timer`` — целочисленная отметка ближайшего события, после которого ключ
+нужно обработать (индекс самого раннего pane). ``due(before)`` позволяет
+процессору находить ключи к срабатыванию без собственного in-memory индекса,
+поэтому память процессора не растёт с числом ключей.
+
+Async-Protocol: spill-реализация обращается к встраиваемой БД в
+thread-pool; in-memory не требует await внутри, но соответствует контракту.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Protocol, runtime_checkable
+
+__all__ = ("KeyedStateStore",)
+
+
+@runtime_checkable
+class KeyedStateStore(Protocol):
+    """Хранилище состояния оконного процессора по ключам.
+
+    Реализации:
+
+    * ``infrastructure.streaming_state.memory_store.MemoryKeyedStateStore`` —
+      всё в RAM (unit-тесты, низкая кардинальность).
+    * ``infrastructure.streaming_state.spilling_store.SpillingKeyedStateStore`` —
+      горячие ключи в LRU, холодные вытесняются в локальный SQLite.
+    """
+
+    async def get(self, key: str, *, promote: bool = True) -> Any | None:
+        """Вернуть состояние ключа или ``None``, если записи нет.
+
+        ``promote=False`` — чтение при срабатывании окна: spill-реализация
+        не поднимает холодный ключ в RAM, а последующий ``put`` обновляет
+        его на диске.
+        """
+        ...
+
+    async def put(self, key: str, state: Any, *, timer: int) -> None:
+        """Сохранить (upsert) состояние ключа вместе с его таймером."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Удалить состояние ключа (no-op для отсутствующего)."""
+        ...
+
+    async def due(self, before: int) -> list[str]:
+        """Ключи, у которых ``timer < before``."""
+        ...
+
+    async def min_timer(self) -> int | None:
+        """Минимальный таймер среди всех ключей (``None`` для пустого store)."""
+        ...
+
+    async def close(self) -> None:
+        """Освободить ресурсы (файлы, соединения)."""
+        ...
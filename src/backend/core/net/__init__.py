@@ -6,6 +6,11 @@
 запрещены — ловит CI-gate ``tools/check_waf_coverage.py``.
 """
 
+from src.backend.core.net.client_pool import (
+    OutboundClientPool,
+    get_outbound_client_pool,
+    shutdown_outbound_client_pool,
+)
 from src.backend.core.net.http_utils import ensure_url_protocol, generate_link_page
 from src.backend.core.net.outbound_http import OutboundHttpClient
 from src.backend.core.net.waf import (
@@ -16,6 +21,7 @@ from src.backend.core.net.waf import (
 )
 
 __all__ = (
+    "OutboundClientPool",
     "OutboundHttpClient",
     "WafBypassError",
     "WafDecision",
@@ -23,4 +29,6 @@ __all__ = (
     "build_default_policy",
     "ensure_url_protocol",
     "generate_link_page",
+    "get_outbound_client_pool",
+    "shutdown_outbound_client_pool",
 )
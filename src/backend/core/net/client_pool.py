@@ -0,0 +1,474 @@
+"""Process-wide пул исходящих HTTP-соединений (keep-alive, HTTP/2, DNS-кэш).
+
+``async with OutboundHttpClient(...)`` на каждый вызов создаёт новый
+``httpx.AsyncClient`` — каждый запрос платит TCP connect + TLS handshake.
+:class:`OutboundClientPool` держит общие клиенты:
+
+* один ``httpx.AsyncClient`` на TLS-профиль (``verify``/``cert``/``http2``)
+  с одним ``SSLContext`` (CA bundle грузится один раз);
+* внутри — роутинг-транспорт с отдельным connection pool на origin
+  ``(scheme, host, port)``: per-host лимиты соединений, keep-alive,
+  опциональный HTTP/2-мультиплексинг;
+* DNS-кэш с TTL — ``network_backend`` каждого ``httpcore.AsyncConnectionPool``
+  (SNI/проверка сертификата по-прежнему по имени хоста);
+* вытесненный из LRU origin-пул закрывается только после завершения
+  запросов, которые ещё читают через него ответ;
+* cookie не сохраняются: клиент общий для всех вызывающих (sinks,
+  AI-провайдеры, polling), и ``Set-Cookie`` одного upstream/тенанта не
+  должен уходить в запросы другого;
+* latency/status каждого запроса пишутся в
+  :func:`~src.backend.core.net.per_host_metering.get_per_host_meter`.
+
+WAF, capability-gate и audit остаются на уровне
+:class:`~src.backend.core.net.outbound_http.OutboundHttpClient` — пул
+переиспользуется только как транспорт (``OutboundHttpClient(pooled=True)``).
+
+Пул привязан к event loop'у (соединения anyio нельзя делить между
+loop'ами): :func:`get_outbound_client_pool` возвращает пул текущего loop'а,
+:func:`shutdown_outbound_client_pool` закрывает его на shutdown приложения.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import ssl
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.cookiejar import Cookie, CookieJar
+from typing import Any
+
+import httpcore
+import httpx
+
+from src.backend.core.logging import get_logger
+
+__all__ = (
+    "OutboundClientPool",
+    "TlsProfile",
+    "get_outbound_client_pool",
+    "shutdown_outbound_client_pool",
+)
+
+logger = get_logger("net.client_pool")
+
+_DEFAULT_HOST_LIMITS: httpx.Limits = httpx.Limits(
+    max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+_DEFAULT_TIMEOUT: httpx.Timeout = httpx.Timeout(
+    connect=5.0, read=30.0, write=10.0, pool=5.0
+)
+_DEFAULT_PORTS: dict[str, int] = {"http": 80, "https": 443}
+
+# httpcore → httpx: тот же контракт исключений, что у ``httpx.AsyncHTTPTransport``.
+_HTTPCORE_ERRORS: dict[type[Exception], type[httpx.TransportError]] = {
+    httpcore.TimeoutException: httpx.TimeoutException,
+    httpcore.ConnectTimeout: httpx.ConnectTimeout,
+    httpcore.ReadTimeout: httpx.ReadTimeout,
+    httpcore.WriteTimeout: httpx.WriteTimeout,
+    httpcore.PoolTimeout: httpx.PoolTimeout,
+    httpcore.NetworkError: httpx.NetworkError,
+    httpcore.ConnectError: httpx.ConnectError,
+    httpcore.ReadError: httpx.ReadError,
+    httpcore.WriteError: httpx.WriteError,
+    httpcore.ProxyError: httpx.ProxyError,
+    httpcore.UnsupportedProtocol: httpx.UnsupportedProtocol,
+    httpcore.ProtocolError: httpx.ProtocolError,
+    httpcore.LocalProtocolError: httpx.LocalProtocolError,
+    httpcore.RemoteProtocolError: httpx.RemoteProtocolError,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TlsProfile:
+    """TLS-часть ключа пула: соединения с разными профилями не смешиваются."""
+
+    verify: bool | str = True
+    cert: tuple[str, str] | None = None
+    http2: bool = False
+
+
+def _ssl_context(profile: TlsProfile) -> ssl.SSLContext:
+    """Один ``SSLContext`` на профиль (CA bundle грузится один раз)."""
+    if isinstance(profile.verify, str):
+        context = ssl.create_default_context(cafile=profile.verify)
+    else:
+        context = httpx.create_ssl_context(verify=profile.verify)
+    if profile.cert is not None:
+        context.load_cert_chain(*profile.cert)
+    return context
+
+
+def _is_ip_literal(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return False
+    return True
+
+
+class _DnsCache:
+    """TTL-кэш ``getaddrinfo`` (адреса в порядке, выданном резолвером)."""
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        key = (host, port)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._entries[key] = (now + self._ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: str, port: int) -> None:
+        self._entries.pop((host, port), None)
+
+
+class _CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """``httpcore``-backend: connect по закэшированным адресам хоста."""
+
+    def __init__(self, dns: _DnsCache) -> None:
+        self._dns = dns
+        self._inner = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        if _is_ip_literal(host):
+            return await self._inner.connect_tcp(
+                host, port, timeout, local_address, socket_options
+            )
+        try:
+            addresses = await self._dns.resolve(host, port)
+        except OSError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+        last_exc: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._inner.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_exc = exc
+        # Адреса могли смениться — следующий connect резолвит заново.
+        self._dns.invalidate(host, port)
+        raise last_exc or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._inner.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+
+class _NoCookieJar(CookieJar):
+    """Jar, который ничего не запоминает (общий клиент без cookie-состояния).
+
+    ``Set-Cookie`` остаётся доступен в ``response.cookies`` конкретного ответа.
+    """
+
+    def set_cookie(self, cookie: Cookie) -> None:
+        return None
+
+    def extract_cookies(self, response: Any, request: Any) -> None:
+        return None
+
+
+@contextmanager
+def _httpx_errors(request: httpx.Request) -> Iterator[None]:
+    """Перевести исключения ``httpcore`` в соответствующие ``httpx``."""
+    try:
+        yield
+    except Exception as exc:
+        for cls in type(exc).__mro__:
+            mapped = _HTTPCORE_ERRORS.get(cls)
+            if mapped is not None:
+                raise mapped(str(exc), request=request) from exc
+        raise
+
+
+@dataclass(eq=False, slots=True)
+class _OriginPool:
+    """Connection pool одного origin и число запросов, читающих через него."""
+
+    connections: httpcore.AsyncConnectionPool
+    inflight: int = 0
+    retired: bool = False
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """Тело ответа; ``aclose`` снимает запрос с учёта его origin-пула."""
+
+    def __init__(
+        self,
+        stream: Any,
+        request: httpx.Request,
+        release: Callable[[], Awaitable[None]],
+    ) -> None:
+        self._stream = stream
+        self._request = request
+        self._release: Callable[[], Awaitable[None]] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _httpx_errors(self._request):
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        release, self._release = self._release, None
+        if release is None:
+            return
+        try:
+            with _httpx_errors(self._request):
+                await self._stream.aclose()
+        finally:
+            await release()
+
+
+class _OriginRoutingTransport(httpx.AsyncBaseTransport):
+    """Транспорт с отдельным connection pool на каждый origin."""
+
+    def __init__(
+        self, profile: TlsProfile, ssl_context: ssl.SSLContext, pool: OutboundClientPool
+    ) -> None:
+        self._profile = profile
+        self._ssl_context = ssl_context
+        self._pool = pool
+        self._origins: OrderedDict[tuple[str, str, int], _OriginPool] = OrderedDict()
+        # Вытесненные пулы, которые ещё отдают тела ответов.
+        self._retired: set[_OriginPool] = set()
+
+    def _origin_pool(
+        self, origin: tuple[str, str, int]
+    ) -> tuple[_OriginPool, _OriginPool | None]:
+        entry = self._origins.get(origin)
+        if entry is not None:
+            self._origins.move_to_end(origin)
+            return entry, None
+        limits = self._pool.limits_for(origin[1])
+        backend = _CachingNetworkBackend(self._pool.dns) if self._pool.dns else None
+        entry = _OriginPool(
+            httpcore.AsyncConnectionPool(
+                ssl_context=self._ssl_context,
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+                http1=True,
+                http2=self._profile.http2,
+                network_backend=backend,
+            )
+        )
+        self._origins[origin] = entry
+        evicted = None
+        if len(self._origins) > self._pool.max_origins:
+            _, evicted = self._origins.popitem(last=False)
+        return entry, evicted
+
+    async def _retire(self, entry: _OriginPool) -> None:
+        entry.retired = True
+        if entry.inflight:
+            self._retired.add(entry)
+        else:
+            await entry.connections.aclose()
+
+    async def _release(self, entry: _OriginPool) -> None:
+        entry.inflight -= 1
+        if entry.retired and not entry.inflight:
+            self._retired.discard(entry)
+            await entry.connections.aclose()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = request.url
+        origin = (url.scheme, url.host, url.port or _DEFAULT_PORTS.get(url.scheme, 0))
+        entry, evicted = self._origin_pool(origin)
+        if evicted is not None:
+            await self._retire(evicted)
+        assert isinstance(request.stream, httpx.AsyncByteStream)
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=url.raw_scheme,
+                host=url.raw_host,
+                port=url.port,
+                target=url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        entry.inflight += 1
+        start = time.perf_counter()
+        try:
+            with _httpx_errors(request):
+                response = await entry.connections.handle_async_request(core_request)
+        except BaseException:
+            self._pool.record(url.host, start, 0)
+            await self._release(entry)
+            raise
+        self._pool.record(url.host, start, response.status)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(
+                response.stream, request, lambda: self._release(entry)
+            ),
+            extensions=response.extensions,
+        )
+
+    def origins(self) -> list[str]:
+        return [f"{scheme}://{host}:{port}" for scheme, host, port in self._origins]
+
+    async def aclose(self) -> None:
+        entries = [*self._origins.values(), *self._retired]
+        self._origins.clear()
+        self._retired.clear()
+        for entry in entries:
+            await entry.connections.aclose()
+
+
+class OutboundClientPool:
+    """Реестр общих ``httpx.AsyncClient`` по ``(origin, TLS-профиль)``.
+
+    Args:
+        host_limits: Лимиты connection pool'а на один origin.
+        per_host_overrides: Точечные лимиты для конкретных хостов
+            (например, rate-limited API провайдера).
+        dns_ttl: TTL DNS-кэша (сек); ``0`` — резолв на каждое соединение.
+        max_origins: Максимум origin-пулов на профиль (LRU-вытеснение).
+
+    """
+
+    def __init__(
+        self,
+        *,
+        host_limits: httpx.Limits = _DEFAULT_HOST_LIMITS,
+        per_host_overrides: Mapping[str, httpx.Limits] | None = None,
+        dns_ttl: float = 60.0,
+        max_origins: int = 256,
+    ) -> None:
+        self._host_limits = host_limits
+        self._overrides = dict(per_host_overrides or {})
+        self.dns = _DnsCache(dns_ttl) if dns_ttl > 0 else None
+        self.max_origins = max_origins
+        self._clients: dict[TlsProfile, httpx.AsyncClient] = {}
+        self._transports: dict[TlsProfile, _OriginRoutingTransport] = {}
+        self._closed = False
+
+    def limits_for(self, host: str) -> httpx.Limits:
+        """Лимиты пула для хоста (override или общий default)."""
+        return self._overrides.get(host, self._host_limits)
+
+    def set_host_limits(self, host: str, limits: httpx.Limits) -> None:
+        """Задать лимиты хоста (действуют для новых origin-пулов)."""
+        self._overrides[host] = limits
+
+    def record(self, host: str, start: float, status_code: int) -> None:
+        """Передать наблюдение в per-host meter (no-op при выключенном флаге)."""
+        from src.backend.core.net.per_host_metering import get_per_host_meter
+
+        get_per_host_meter().record(
+            host, (time.perf_counter() - start) * 1000.0, status_code
+        )
+
+    def client(
+        self,
+        *,
+        verify: bool | str = True,
+        cert: tuple[str, str] | None = None,
+        http2: bool = False,
+    ) -> httpx.AsyncClient:
+        """Общий клиент TLS-профиля (создаётся при первом обращении).
+
+        Raises:
+            RuntimeError: Пул уже закрыт (shutdown приложения).
+
+        """
+        if self._closed:
+            raise RuntimeError("OutboundClientPool is closed")
+        profile = TlsProfile(verify=verify, cert=cert, http2=http2)
+        client = self._clients.get(profile)
+        if client is None:
+            transport = _OriginRoutingTransport(profile, _ssl_context(profile), self)
+            client = httpx.AsyncClient(
+                transport=transport, timeout=_DEFAULT_TIMEOUT, cookies=_NoCookieJar()
+            )
+            self._clients[profile] = client
+            self._transports[profile] = transport
+        return client
+
+    def stats(self) -> dict[str, Any]:
+        """Профили и открытые origin-пулы (для health/debug)."""
+        return {
+            "profiles": len(self._clients),
+            "origins": {
+                f"verify={p.verify},cert={bool(p.cert)},http2={p.http2}": t.origins()
+                for p, t in self._transports.items()
+            },
+        }
+
+    async def aclose(self) -> None:
+        """Закрыть все соединения; повторный вызов — no-op."""
+        self._closed = True
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._transports.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.debug("Outbound client close failed: %s", exc)
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OutboundClientPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_outbound_client_pool() -> OutboundClientPool:
+    """Пул текущего event loop'а (создаётся лениво).
+
+    Raises:
+        RuntimeError: Вызов вне running event loop.
+
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None or pool._closed:
+        pool = _pools[loop] = OutboundClientPool()
+    return pool
+
+
+async def shutdown_outbound_client_pool() -> None:
+    """Закрыть пул текущего loop'а (lifespan shutdown)."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
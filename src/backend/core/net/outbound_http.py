@@ -12,7 +12,11 @@
 * ``CapabilityGate.check(plugin, "net.outbound", host)`` — runtime-gate
   привязывает каждый запрос к декларации плагина;
 * explicit pool-limits через :class:`httpx.Limits` (R-V15-14);
-* per-host cancel/timeout настраивается на уровне вызова.
+* per-host cancel/timeout настраивается на уровне вызова;
+* ``pooled=True`` — транспорт берётся из общего
+  :class:`~src.backend.core.net.client_pool.OutboundClientPool`
+  (keep-alive между вызовами, per-host лимиты, DNS-кэш); ``aclose``
+  общий пул не закрывает.
 """
 
 from __future__ import annotations
@@ -67,6 +71,10 @@ class OutboundHttpClient:
             клиента (используется К1 mTLS-test).
         plugin: Имя caller'а (плагин/route) для audit-event'а.
             На уровне ядра — строка ``"core"``.
+        pooled: Использовать общий пул соединений вместо собственного
+            ``httpx.AsyncClient``. ``limits`` в этом режиме задаются
+            пулом (per-host), ``timeout`` применяется к каждому запросу.
+            С ``base_url`` пул не используется.
 
     """
 
@@ -83,11 +91,21 @@ class OutboundHttpClient:
         plugin: str = "core",
         http2: bool = False,
         base_url: str = "",
+        pooled: bool = False,
     ) -> None:
         self._policy = policy or WafPolicy()
         self._capability_check = capability_check
         self._audit = audit
         self._plugin = plugin
+        self._timeout = timeout
+        self._owns_client = not pooled or bool(base_url)
+        if not self._owns_client:
+            from src.backend.core.net.client_pool import get_outbound_client_pool
+
+            self._client = get_outbound_client_pool().client(
+                verify=verify, cert=cert, http2=http2
+            )
+            return
         # S3 К2 W1: ``http2``/``base_url`` для миграции легаси-клиентов
         # (vault_cipher, opa, clickhouse, webhook handler) без потери
         # текущего поведения. Совместимо с httpx[http2] из pyproject.
@@ -109,8 +127,9 @@ class OutboundHttpClient:
         await self.aclose()
 
     async def aclose(self) -> None:
-        """Закрыть нижележащий ``httpx.AsyncClient``."""
-        await self._client.aclose()
+        """Закрыть нижележащий ``httpx.AsyncClient`` (общий пул не трогается)."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def request(
         self,
@@ -161,6 +180,8 @@ class OutboundHttpClient:
             request_kwargs["params"] = params
         if timeout is not None:
             request_kwargs["timeout"] = timeout
+        elif not self._owns_client:
+            request_kwargs["timeout"] = self._timeout
         return await self._client.request(**request_kwargs)
 
     def stream(
@@ -219,6 +240,8 @@ class OutboundHttpClient:
             request_kwargs["params"] = params
         if timeout is not None:
             request_kwargs["timeout"] = timeout
+        elif not self._owns_client:
+            request_kwargs["timeout"] = self._timeout
         return self._client.stream(**request_kwargs)
 
     @staticmethod
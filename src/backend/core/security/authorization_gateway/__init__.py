@@ -6,6 +6,7 @@
 - ``opa_mixin.py`` (1): opa_step
 - ``permission_mixin.py`` (1): permission_step
 - ``state.py``: AuthorizationReason + AuthorizationDecision
+- ``decision_cache.py``: DecisionCache (кэш решений policy-цепочки)
 
 Core (5) остается в __init__.py: __init__, authorize (91 LOC, BIG), _finalize_deny, _build_decision, _is_enabled.
 
@@ -33,6 +34,11 @@ from src.backend.core.security.authorization_gateway.audit_mixin import (
 from src.backend.core.security.authorization_gateway.casbin_mixin import (
     CasbinMixin,  # S60 W4: MRO
 )
+from src.backend.core.security.authorization_gateway.decision_cache import (
+    DecisionCache,
+    PolicyOutcome,
+    notify_policy_changed,
+)
 from src.backend.core.security.authorization_gateway.opa_mixin import (
     OpaMixin,  # S60 W4: MRO
 )
@@ -52,11 +58,13 @@ __all__ = (
     "AuthorizationDecision",
     "AuthorizationGateway",
     "AuthorizationReason",
+    "DecisionCache",
     "PolicyDecider",
     # Round 88: lazy resolver для non-Request контекста (Sprint 1 K5).
     # Использует app-state singleton из composition root + fallback на None
     # (если app не зарегистрирован, при ошибках доступа).
     "get_authorization_gateway",
+    "notify_policy_changed",
 )
 
 
@@ -106,7 +114,14 @@ def get_authorization_gateway() -> AuthorizationGateway | None:
 class AuthorizationGateway(AuditMixin, CasbinMixin, OpaMixin, PermissionMixin):
     """Authorization gateway (4 mixins = 4 methods + 5 core)."""
 
-    __slots__ = ("_audit", "_capability_gateway", "_enabled", "_policies")
+    __slots__ = (
+        "_audit",
+        "_cache_flags",
+        "_capability_gateway",
+        "_decision_cache",
+        "_enabled",
+        "_policies",
+    )
 
     def __init__(
         self,
@@ -115,11 +130,22 @@ class AuthorizationGateway(AuditMixin, CasbinMixin, OpaMixin, PermissionMixin):
         policies: Sequence[PolicyDecider] = (),
         audit_callback: AuditCallback | None = None,
         enabled: bool | None = None,
+        decision_cache: DecisionCache | None = None,
     ) -> None:
         self._capability_gateway = capability_gateway
         self._policies: tuple[PolicyDecider, ...] = tuple(policies)
         self._audit = audit_callback
         self._enabled = enabled  # None → читать feature-flag в authorize()
+        # Кэш решений policy-цепочки; None → цепочка на каждый запрос.
+        self._decision_cache = decision_cache
+        # Флаги, которые читают policies (``cache_flags``), — часть ключа кэша.
+        self._cache_flags: tuple[str, ...] = tuple(
+            dict.fromkeys(
+                flag
+                for policy in self._policies
+                for flag in getattr(policy, "cache_flags", ())
+            )
+        )
         # S193 fix: in-memory policy storage для sync check/add_policy/remove_policy.
         # Используется как fallback когда нет OPA/Casbin backend.
         self._in_memory_policies: dict[tuple[str, str, str], bool] = {}
@@ -187,6 +213,47 @@ class AuthorizationGateway(AuditMixin, CasbinMixin, OpaMixin, PermissionMixin):
             )
 
         # 2. Доп. policies (Casbin / OPA / custom) — short-circuit на deny.
+        # Повторяющиеся (principal, resource, action, tenant_id) отдаются
+        # из DecisionCache без обращения к движкам.
+        if self._decision_cache is not None and self._policies:
+            allowed, policy_reasons = await self._decision_cache.get_or_compute(
+                principal,
+                resource,
+                action,
+                ctx.get("tenant_id"),
+                lambda: self._run_policies(principal, resource, action, ctx),
+                flags=self._flag_stamp(),
+            )
+        else:
+            allowed, policy_reasons = await self._run_policies(
+                principal, resource, action, ctx
+            )
+        reasons.extend(policy_reasons)
+        if not allowed:
+            return self._finalize_deny(
+                principal=principal,
+                resource=resource,
+                action=action,
+                correlation_id=correlation_id,
+                reasons=tuple(reasons),
+            )
+
+        decision = self._build_decision(
+            allowed=True,
+            correlation_id=correlation_id,
+            reasons=tuple(reasons),
+            principal=principal,
+            resource=resource,
+            action=action,
+        )
+        self._emit_audit(decision)
+        return decision
+
+    async def _run_policies(
+        self, principal: str, resource: str, action: str, ctx: dict[str, Any]
+    ) -> PolicyOutcome:
+        """Пройти policy-цепочку; первый не-allow останавливает проход."""
+        reasons: list[AuthorizationReason] = []
         for policy in self._policies:
             try:
                 reason = await policy(principal, resource, action, ctx)
@@ -195,27 +262,34 @@ class AuthorizationGateway(AuditMixin, CasbinMixin, OpaMixin, PermissionMixin):
                     source=getattr(policy, "__name__", "policy"),
                     outcome="deny",
                     detail=f"{type(exc).__name__}: {exc}",
+                    transient=True,
                 )
             reasons.append(reason)
             if reason.outcome != "allow":
-                return self._finalize_deny(
-                    principal=principal,
-                    resource=resource,
-                    action=action,
-                    correlation_id=correlation_id,
-                    reasons=tuple(reasons),
-                )
+                return False, tuple(reasons)
+        return True, tuple(reasons)
 
-        decision = self._build_decision(
-            allowed=True,
-            correlation_id=correlation_id,
-            reasons=tuple(reasons),
-            principal=principal,
-            resource=resource,
-            action=action,
-        )
-        self._emit_audit(decision)
-        return decision
+    def _flag_stamp(self) -> tuple[bool | None, ...]:
+        """Текущие значения ``cache_flags`` (``None`` — сервис флагов недоступен)."""
+        if not self._cache_flags:
+            return ()
+        try:
+            from src.backend.core.feature_flags import get_feature_flag_service
+
+            service = get_feature_flag_service()
+            return tuple(service.is_enabled(flag) for flag in self._cache_flags)
+        except Exception as _:
+            return (None,) * len(self._cache_flags)
+
+    def invalidate_decisions(self, reason: str = "policy_changed") -> None:
+        """Сбросить кэш решений (reload OPA-bundle / Casbin-политик).
+
+        ``add_policy``/``remove_policy`` вызывают его сами; Casbin-адаптеры
+        и внешние источники политик (bundle watcher) сбрасывают все кэши
+        процесса через :func:`notify_policy_changed`.
+        """
+        if self._decision_cache is not None:
+            self._decision_cache.bump_version(reason)
 
     def _finalize_deny(
         self,
@@ -335,6 +409,7 @@ class AuthorizationGateway(AuditMixin, CasbinMixin, OpaMixin, PermissionMixin):
             allowed = effect.lower() == "allow"
             key = (subject, action, resource)
             self._in_memory_policies[key] = allowed
+            self.invalidate_decisions("add_policy")
             return True
         except (AttributeError, TypeError, ValueError) as policy_exc:
             # cycle-9/D-AUDIT-990: narrow exceptions + observability.
@@ -359,6 +434,7 @@ class AuthorizationGateway(AuditMixin, CasbinMixin, OpaMixin, PermissionMixin):
             key = (subject, action, resource)
             if key in self._in_memory_policies:
                 del self._in_memory_policies[key]
+                self.invalidate_decisions("remove_policy")
                 return True
             return False
         except (KeyError, AttributeError, TypeError) as rm_exc:
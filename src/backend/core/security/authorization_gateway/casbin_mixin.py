@@ -32,7 +32,8 @@ class CasbinMixin:
 
         Поведение:
             * ``ctx["tenant_id"]`` пробрасывается как 4-й аргумент enforce'а.
-            * Любое исключение из ``enforce`` → ``deny`` (fail-closed).
+            * Любое исключение из ``enforce`` → ``deny`` (fail-closed,
+              ``transient`` — не кэшируется).
             * Возвращаемый ``AuthorizationReason`` имеет ``source="casbin"``.
 
         Example:
@@ -58,6 +59,7 @@ class CasbinMixin:
                     source="casbin",
                     outcome="deny",
                     detail=f"{type(exc).__name__}: {exc}",
+                    transient=True,
                 )
             return AuthorizationReason(
                 source="casbin",
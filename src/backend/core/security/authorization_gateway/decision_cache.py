@@ -0,0 +1,211 @@
+"""Кэш решений policy-цепочки :class:`AuthorizationGateway` (Casbin/OPA).
+
+Одни и те же ``(principal, resource, action, tenant_id)`` повторяются
+постоянно, а каждый проход цепочки — Casbin enforce + OPA HTTP-запрос +
+lookup feature-flag'а. :class:`DecisionCache` хранит результат цепочки:
+
+* ключ — кортеж запроса + **policy-version stamp**; stamp увеличивается
+  на ``add_policy``/``remove_policy`` и reload'е OPA-bundle /
+  Casbin-политик (:meth:`DecisionCache.bump_version`), старые записи
+  становятся недостижимы сразу. Мутации вне gateway (``TenantScopedCasbin``,
+  ``CasbinAdapter``, bundle watcher) сбрасывают все кэши процесса через
+  :func:`notify_policy_changed`;
+* deny, вызванные сбоем движка (``AuthorizationReason.transient``:
+  исключение, недоступный OPA), не кэшируются — восстановление движка
+  видно со следующего запроса;
+* в ключ входят и состояния feature-flag'ов, которые читает цепочка
+  (``flags``, например ``opa_runtime_query_enabled``): решение, принятое
+  при одном значении флага, не отдаётся при другом;
+* раздельные TTL для allow и deny (deny живёт короче — отзыв прав
+  не должен ждать, но и шторм отказов не должен бить в OPA);
+* single-flight: конкурентные одинаковые запросы ждут один вычисляющий
+  future вместо N параллельных запросов в OPA;
+* LRU-граница по числу записей.
+
+Capability-check и audit остаются на каждый запрос — кэшируется только
+policy-цепочка. Метрики: ``authz_decision_cache_total{result}``
+(hit/miss/coalesced) и ``authz_decision_latency_seconds{path}``
+(cached/computed).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.backend.core.logging import get_logger
+from src.backend.core.security.authorization_gateway.state import AuthorizationReason
+from src.backend.core.utils.metrics_registry import metrics_registry
+
+__all__ = ("DecisionCache", "PolicyOutcome", "notify_policy_changed")
+
+_logger = get_logger("core.security.authorization_gateway.decision_cache")
+
+PolicyOutcome = tuple[bool, tuple[AuthorizationReason, ...]]
+"""Результат policy-цепочки: ``(allowed, reasons)``."""
+
+_DecisionKey = tuple[int, str, str, str, Any, tuple[Any, ...]]
+
+authz_decision_cache_total = metrics_registry.counter(
+    "authz_decision_cache_total",
+    "AuthorizationGateway policy decision cache lookups.",
+    labels=("result",),
+)
+authz_decision_latency_seconds = metrics_registry.histogram(
+    "authz_decision_latency_seconds",
+    "AuthorizationGateway policy chain latency (cached vs computed).",
+    labels=("path",),
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5),
+)
+
+
+# Живые кэши процесса — для :func:`notify_policy_changed`.
+_caches: weakref.WeakSet[DecisionCache] = weakref.WeakSet()
+
+
+class DecisionCache:
+    """TTL/LRU-кэш решений с policy-version stamp и single-flight.
+
+    Args:
+        allow_ttl: TTL разрешающих решений (сек).
+        deny_ttl: TTL запрещающих решений (сек); ``0`` — deny не кэшируется.
+        max_entries: Максимум записей (LRU-вытеснение).
+
+    """
+
+    def __init__(
+        self, *, allow_ttl: float = 30.0, deny_ttl: float = 5.0, max_entries: int = 10_000
+    ) -> None:
+        self._allow_ttl = allow_ttl
+        self._deny_ttl = deny_ttl
+        self._max_entries = max_entries
+        self._version = 0
+        self._entries: OrderedDict[_DecisionKey, tuple[float, PolicyOutcome]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[_DecisionKey, asyncio.Future[PolicyOutcome]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        _caches.add(self)
+
+    @property
+    def version(self) -> int:
+        """Текущий policy-version stamp."""
+        return self._version
+
+    def bump_version(self, reason: str = "policy_changed") -> int:
+        """Инвалидировать все решения (новые политики / reload bundle).
+
+        Уже идущие вычисления дописывают результат под старым stamp'ом —
+        новые запросы его не увидят.
+        """
+        self._version += 1
+        self._entries.clear()
+        _logger.debug("authz decision cache invalidated (%s), v=%d", reason, self._version)
+        return self._version
+
+    async def get_or_compute(
+        self,
+        principal: str,
+        resource: str,
+        action: str,
+        tenant_id: Any,
+        compute: Callable[[], Awaitable[PolicyOutcome]],
+        *,
+        flags: tuple[Any, ...] = (),
+    ) -> PolicyOutcome:
+        """Вернуть решение из кэша либо вычислить (одно на ключ).
+
+        ``flags`` — состояния feature-flag'ов, от которых зависит цепочка.
+        """
+        start = time.perf_counter()
+        key: _DecisionKey = (
+            self._version,
+            principal,
+            resource,
+            action,
+            tenant_id,
+            flags,
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                authz_decision_cache_total.labels(result="hit").inc()
+                authz_decision_latency_seconds.labels(path="cached").observe(
+                    time.perf_counter() - start
+                )
+                return entry[1]
+            del self._entries[key]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._coalesced += 1
+            authz_decision_cache_total.labels(result="coalesced").inc()
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Отменили вычисляющего, а не нас — считаем сами.
+                if not pending.cancelled():
+                    raise
+
+        self._misses += 1
+        authz_decision_cache_total.labels(result="miss").inc()
+        future: asyncio.Future[PolicyOutcome] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            outcome = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Ожидающих может не быть — не оставляем «never retrieved».
+            future.exception()
+            raise
+        else:
+            future.set_result(outcome)
+            self._store(key, outcome)
+        finally:
+            self._inflight.pop(key, None)
+            authz_decision_latency_seconds.labels(path="computed").observe(
+                time.perf_counter() - start
+            )
+        return outcome
+
+    def _store(self, key: _DecisionKey, outcome: PolicyOutcome) -> None:
+        ttl = self._allow_ttl if outcome[0] else self._deny_ttl
+        if ttl <= 0 or key[0] != self._version:
+            return
+        if any(reason.transient for reason in outcome[1]):
+            return
+        self._entries[key] = (time.monotonic() + ttl, outcome)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Счётчики и hit rate (для health/debug)."""
+        lookups = self._hits + self._misses + self._coalesced
+        return {
+            "version": self._version,
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "hit_rate": (self._hits + self._coalesced) / lookups if lookups else 0.0,
+        }
+
+
+def notify_policy_changed(reason: str = "policy_changed") -> None:
+    """Сбросить все кэши решений процесса (мутация / reload политик)."""
+    for cache in list(_caches):
+        cache.bump_version(reason)
@@ -8,6 +8,11 @@ from src.backend.core.security.authorization_gateway.state import (
 )
 
 
+def _is_transport_reason(reason: str) -> bool:
+    """Причина fail-closed deny ``OPAClient`` (сбой связи, а не политика)."""
+    return reason == "opa_unavailable" or reason.startswith("opa_status_")
+
+
 class OpaMixin:
     """OPA (Open Policy Agent) step для AuthorizationGateway. S60 W4 extraction."""
 
@@ -40,7 +45,13 @@ class OpaMixin:
               action, tenant_id, correlation_id}`` из ``ctx`` и делает
               ``await opa_client.query(policy_name, input_doc)``.
             * Любое исключение / сетевая ошибка → ``deny`` (fail-closed,
-              consistent с ``OPAClient.query`` deny-by-default policy).
+              consistent с ``OPAClient.query`` deny-by-default policy);
+              такой deny помечается ``transient`` и не кэшируется
+              :class:`DecisionCache` — в том числе fail-closed ответы
+              ``OPAClient`` (``opa_unavailable`` / ``opa_status_<code>``).
+            * ``cache_flags`` шага перечисляет этот флаг: его состояние входит
+              в ключ :class:`DecisionCache`, и переключение флага не отдаёт
+              решения, принятые при прежнем значении.
 
         Example:
             >>> from infrastructure.policy.opa import OPAClient
@@ -68,7 +79,10 @@ class OpaMixin:
                     )
             except Exception as _:
                 return AuthorizationReason(
-                    source="opa", outcome="deny", detail="feature_flag_unavailable"
+                    source="opa",
+                    outcome="deny",
+                    detail="feature_flag_unavailable",
+                    transient=True,
                 )
 
             input_doc = {
@@ -82,7 +96,10 @@ class OpaMixin:
                 decision = await opa_client.query(policy_name, input_doc)
             except Exception as exc:
                 return AuthorizationReason(
-                    source="opa", outcome="deny", detail=f"{type(exc).__name__}: {exc}"
+                    source="opa",
+                    outcome="deny",
+                    detail=f"{type(exc).__name__}: {exc}",
+                    transient=True,
                 )
 
             allow = bool(getattr(decision, "allow", False))
@@ -91,8 +108,12 @@ class OpaMixin:
             if not allow:
                 detail = ",".join(reasons) if reasons else "opa_denied"
             return AuthorizationReason(
-                source="opa", outcome="allow" if allow else "deny", detail=detail
+                source="opa",
+                outcome="allow" if allow else "deny",
+                detail=detail,
+                transient=not allow and any(map(_is_transport_reason, reasons)),
             )
 
         _step.__name__ = "opa_step"
+        _step.cache_flags = ("opa_runtime_query_enabled",)  # type: ignore[attr-defined]
         return _step
@@ -7,11 +7,16 @@ from typing import Any
 
 @dataclass
 class AuthorizationReason:
-    """Одно звено в reason-chain ``AuthorizationDecision``."""
+    """Одно звено в reason-chain ``AuthorizationDecision``.
+
+    ``transient=True`` — deny из-за сбоя движка (сеть, исключение), а не
+    решения политики; :class:`DecisionCache` такие исходы не кэширует.
+    """
 
     source: str
     outcome: str
     detail: str | None = None
+    transient: bool = False
 
 
 @dataclass
@@ -36,11 +36,25 @@ API:
 
 Порядок применения регексов важен — более специфичные паттерны
 применяются первыми, чтобы не быть «съеденными» более общими.
+
+Prefilter для дефолтных patterns (результат идентичен последовательному
+``pattern.sub``):
+
+* у каждого pattern есть дешёвый триггер — необходимое условие match'а
+  (цифра, ``@``, литерал ``eyJ``/``sk-``/...); строка без триггеров
+  возвращается как есть, без 16 проходов ``sub``;
+* большой текст режется на сегменты по «безопасным» переводам строки
+  (ни один дефолтный pattern не может через них перешагнуть):
+  последовательная цепочка ``sub`` применяется только к сегментам
+  с триггерами;
+* :meth:`PIIMasker.mask_chunks` — потоковый режим для multi-MB текста;
+* неизменённые поддеревья dict/list/tuple возвращаются без копирования.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 __all__ = ("PIIMasker", "build_default_patterns", "default_masker")
@@ -103,6 +117,42 @@ _DEFAULT_ORDER: tuple[str, ...] = (
 )
 
 
+# Prefilter дефолтных patterns: для каждого — необходимое условие, которое
+# обязано найтись внутри любого его match'а. Однородные проверки (класс
+# символов, литерал) sre сканирует на порядок быстрее самих patterns, а
+# union ``(?:p1)|(?:p2)|...`` в backtracking-движке стоит как сумма всех
+# проходов — поэтому триггеры, а не объединённый regex.
+_DIGIT_TRIGGER = r"\d"
+_DEFAULT_TRIGGERS: dict[str, str] = {
+    "jwt": "eyJ",
+    "iban": _DIGIT_TRIGGER,
+    "ssn": _DIGIT_TRIGGER,
+    "snils": _DIGIT_TRIGGER,
+    "card": _DIGIT_TRIGGER,
+    "passport": _DIGIT_TRIGGER,
+    "email": "@",
+    "inn": _DIGIT_TRIGGER,
+    "phone": _DIGIT_TRIGGER,
+    # Заглавная кириллица есть почти в каждой строке — триггер сам pattern.
+    "ru_surnames": _RU_SURNAMES.pattern,
+    "ru_patronymics": "вич|вна",
+    "bik": _DIGIT_TRIGGER,
+    "ogrn": _DIGIT_TRIGGER,
+    "openai_key": "sk-",
+    "github_pat": "ghp_",
+    "aws_access_key": "AKIA",
+}
+
+# Символы, через которые дефолтные patterns могут продолжить match за
+# перевод строки (``\s`` в PHONE/SNILS/passport). ``\n`` после любого
+# другого символа — безопасная граница сегмента.
+_JOIN_CHAR = re.compile(r"[\d\s()+\-]")
+_SAFE_CUT = re.compile(r"(?<=[^\d\s()+\-])\n")
+# Меньше этого — сегментация не окупается, цепочка ``sub`` по всей строке.
+_SEGMENT_MIN_LEN = 4096
+_STREAM_CHUNK = 1 << 16
+
+
 def build_default_patterns() -> dict[str, re.Pattern[str]]:
     """Возвращает копию словаря дефолтных compiled-regex-ов.
 
@@ -179,6 +229,16 @@ class PIIMasker:
             self._order = _DEFAULT_ORDER
         else:
             self._order = tuple(self._patterns.keys())
+        self._stages: tuple[re.Pattern[str], ...] = tuple(
+            self._patterns[name] for name in self._order if name in self._patterns
+        )
+        # Триггеры и сегментация по \n доказаны только для дефолтных
+        # patterns; custom — прежняя цепочка ``sub`` по всей строке.
+        self._triggers: tuple[re.Pattern[str], ...] = ()
+        if patterns is None:
+            sources = dict.fromkeys(_DEFAULT_TRIGGERS[name] for name in self._order)
+            self._triggers = tuple(re.compile(source) for source in sources)
+        self._segmentable = patterns is None
 
     def mask_text(self, text: str) -> str:
         """Заменяет все matches PII-паттернов в строке на ``replacement``.
@@ -193,28 +253,131 @@ class PIIMasker:
         """
         if not text:
             return text
-        result = text
-        for name in self._order:
-            pattern = self._patterns.get(name)
-            if pattern is None:
+        if not self._triggers:
+            return self._apply_stages(text)
+        if len(text) < _SEGMENT_MIN_LEN or not self._can_segment():
+            for trigger in self._triggers:
+                if trigger.search(text) is not None:
+                    return self._apply_stages(text)
+            return text
+
+        segments = self._triggered_segments(text)
+        if not segments:
+            return text
+        pieces: list[str] = []
+        pos = 0
+        for start, end in segments:
+            pieces.append(text[pos:start])
+            pieces.append(self._apply_stages(text[start:end]))
+            pos = end
+        pieces.append(text[pos:])
+        return "".join(pieces)
+
+    def mask_chunks(
+        self, chunks: Iterable[str], *, chunk_size: int = _STREAM_CHUNK
+    ) -> Iterator[str]:
+        """Потоковая маскировка: ``"".join(result) == mask_text("".join(chunks))``.
+
+        Входной поток буферизуется до ``chunk_size`` и режется по безопасной
+        границе (перевод строки, через который не перешагнёт ни один
+        pattern). Для custom patterns граница не доказуема — текст
+        маскируется целиком в конце потока.
+
+        Args:
+            chunks: Фрагменты текста (например, чтение файла блоками).
+            chunk_size: Минимальный размер буфера перед выдачей сегмента.
+
+        Yields:
+            Маскированные сегменты в исходном порядке.
+
+        """
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) < chunk_size or not self._can_segment():
                 continue
+            cut = self._last_safe_cut(buffer)
+            if cut:
+                yield self.mask_text(buffer[:cut])
+                buffer = buffer[cut:]
+        if buffer:
+            yield self.mask_text(buffer)
+
+    def _apply_stages(self, text: str) -> str:
+        """Эталонная цепочка: каждый pattern ``sub`` по результату предыдущего."""
+        result = text
+        for pattern in self._stages:
             result = pattern.sub(self.replacement, result)
         return result
 
+    def _can_segment(self) -> bool:
+        # Пустая замена или замена, оканчивающаяся цифрой/пробелом, может
+        # «склеить» match через границу сегмента на следующих стадиях.
+        replacement = self.replacement
+        return (
+            self._segmentable
+            and bool(replacement)
+            and not _JOIN_CHAR.match(replacement[-1])
+        )
+
+    def _triggered_segments(self, text: str) -> list[tuple[int, int]]:
+        """Сегменты (между безопасными границами), где сработал триггер.
+
+        Сегмент — участок между соседними безопасными ``\\n``; любой match
+        целиком лежит в одном сегменте и содержит свой триггер, поэтому
+        сегменты без триггеров совпадений не содержат.
+        """
+        segments: set[tuple[int, int]] = set()
+        size = len(text)
+        for trigger in self._triggers:
+            pos = 0
+            while pos < size:
+                hit = trigger.search(text, pos)
+                if hit is None:
+                    break
+                start = self._segment_start(text, hit.start(), pos)
+                cut = _SAFE_CUT.search(text, hit.end())
+                pos = cut.end() if cut is not None else size
+                segments.add((start, pos))
+        return sorted(segments)
+
+    @staticmethod
+    def _segment_start(text: str, index: int, floor: int) -> int:
+        """Начало сегмента: позиция после ближайшей безопасной границы."""
+        newline = text.rfind("\n", floor, index)
+        while newline > floor:
+            if not _JOIN_CHAR.match(text[newline - 1]):
+                return newline + 1
+            newline = text.rfind("\n", floor, newline)
+        return floor
+
+    @staticmethod
+    def _last_safe_cut(text: str) -> int:
+        """Позиция после последней безопасной границы (``0`` — нет)."""
+        newline = text.rfind("\n")
+        while newline > 0:
+            if not _JOIN_CHAR.match(text[newline - 1]):
+                return newline + 1
+            newline = text.rfind("\n", 0, newline)
+        return 0
+
     def mask_dict(
         self, data: dict[str, Any], fields: list[str] | None = None
     ) -> dict[str, Any]:
         """Рекурсивно маскирует строковые значения в dict.
 
         Args:
-            data: Исходный словарь (не мутируется — возвращается копия).
+            data: Исходный словарь (не мутируется). Копируются только
+                ветки с изменениями; поддеревья без PII возвращаются
+                теми же объектами.
             fields: Список ключей, в которых маскировать значения. Если
                 ``None`` — маскируются все строковые значения на любом
                 уровне вложенности. Сравнение по имени ключа, не по
                 JSON-pointer.
 
         Returns:
-            Новый словарь с маскированными значениями.
+            Словарь с маскированными значениями (``data``, если маскировать
+            было нечего).
 
         """
         return self._mask_any(data, fields)
@@ -223,17 +386,32 @@ class PIIMasker:
         """Рекурсивный обход произвольной структуры данных.
 
         Поддерживает dict / list / tuple / str. Числа, bool, None и прочие
-        неизменяемые типы возвращаются как есть.
+        неизменяемые типы возвращаются как есть. Контейнер копируется
+        только при первом изменённом элементе.
         """
         match value:
             case str() as s:
                 return self.mask_text(s) if fields is None else s
             case dict() as d:
-                return {k: self._mask_dict_value(k, v, fields) for k, v in d.items()}
-            case list() as lst:
-                return [self._mask_any(item, fields) for item in lst]
-            case tuple() as tup:
-                return tuple(self._mask_any(item, fields) for item in tup)
+                changed: dict[Any, Any] | None = None
+                for k, v in d.items():
+                    masked = self._mask_dict_value(k, v, fields)
+                    if masked is not v:
+                        if changed is None:
+                            changed = dict(d)
+                        changed[k] = masked
+                return d if changed is None else changed
+            case list() | tuple() as seq:
+                items: list[Any] | None = None
+                for index, item in enumerate(seq):
+                    masked = self._mask_any(item, fields)
+                    if masked is not item:
+                        if items is None:
+                            items = list(seq)
+                        items[index] = masked
+                if items is None:
+                    return seq
+                return items if isinstance(seq, list) else tuple(items)
             case _:
                 return value
 
@@ -17,6 +17,11 @@ API::
     key = hash_cache_key("tenant=1", "route_id=credit_v2")
     frame = encode_ws_frame({"type": "ping"})
 
+Encoder/decoder — общие с :mod:`src.backend.core.codec.json` (plain-формат,
+``PLAIN_ENCODER`` / ``PLAIN_DECODER``): один набор msgspec-инстансов и один
+``enc_hook`` (pydantic-модели, Decimal) на процесс. Для декодирования в
+известный тип — ``decode_json(data, schema=T)``.
+
 Fallback: если msgspec не установлен — деградирует на orjson
 (остаётся в hot-path ради совместимости). Перформанс деградирует,
 но не падает.
@@ -37,22 +42,11 @@ __all__ = (
     "hash_cache_key",
 )
 
-try:
-    import msgspec
-
-    _ENCODER = msgspec.json.Encoder()
-    _DECODER = msgspec.json.Decoder()
-    MSGSPEC_AVAILABLE = True
-except ImportError:  # pragma: no cover — fallback path
-    msgspec = None
-    _ENCODER = None
-    _DECODER = None
-    MSGSPEC_AVAILABLE = False
+import orjson
 
-try:
-    import orjson
-except ImportError:  # pragma: no cover
-    orjson = None  # type: ignore[assignment]
+from src.backend.core.codec.json import MSGSPEC_AVAILABLE, plain_enc_hook, plain_loads
+from src.backend.core.codec.json import PLAIN_DECODER as _DECODER
+from src.backend.core.codec.json import PLAIN_ENCODER as _ENCODER
 
 
 def encode_json(value: Any) -> bytes:
@@ -62,13 +56,22 @@ def encode_json(value: Any) -> bytes:
     """
     if MSGSPEC_AVAILABLE:
         return _ENCODER.encode(value)
-    return orjson.dumps(value)
+    return orjson.dumps(value, default=plain_enc_hook)
+
 
+def decode_json(data: bytes | str, *, schema: Any = None) -> Any:
+    """JSON-decode → Python objects (msgspec → orjson fallback).
 
-def decode_json(data: bytes | str) -> Any:
-    """JSON-decode → Python objects (msgspec → orjson fallback)."""
+    Args:
+        data: JSON-bytes или str.
+        schema: Целевой тип (Struct/dataclass/pydantic-модель/...); если
+            задан — декодирование сразу в него кэшированным декодером.
+
+    """
     if isinstance(data, str):
         data = data.encode("utf-8")
+    if schema is not None:
+        return plain_loads(data, schema=schema)
     if MSGSPEC_AVAILABLE:
         return _DECODER.decode(data)
     return orjson.loads(data)
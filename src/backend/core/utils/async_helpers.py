@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
 
-__all__ = ("AsyncChunkIterator", "async_chunk_iterator")
+from src.backend.core.logging import get_logger
+
+__all__ = ("AsyncChunkIterator", "async_chunk_iterator", "run_with_restarts")
+
+_logger = get_logger(__name__)
 
 
 class AsyncChunkIterator:
@@ -36,3 +43,38 @@ async def async_chunk_iterator(chunks: list[bytes]) -> AsyncIterator[bytes]:
     """Async generator: yields chunks from list."""
     for chunk in chunks:
         yield chunk
+
+
+async def run_with_restarts(
+    run: Callable[[], Awaitable[Any]],
+    *,
+    name: str,
+    on_restart: Callable[[], None] | None = None,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0,
+) -> None:
+    """Перезапускать долгоживущую корутину (pub/sub listener) после выхода.
+
+    ``run`` возвращается или падает, когда рвётся соединение; пауза перед
+    перезапуском растёт экспоненциально до ``max_delay`` и сбрасывается,
+    если предыдущий запуск прожил дольше ``max_delay``. ``on_restart``
+    вызывается после каждого выхода — например, чтобы сбросить кэш,
+    события инвалидации для которого могли быть пропущены.
+    """
+    delay = initial_delay
+    while True:
+        started = time.monotonic()
+        reason: object = "exited"
+        try:
+            await run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            reason = exc
+        if time.monotonic() - started > max_delay:
+            delay = initial_delay
+        _logger.warning("%s stopped (%s); restarting in %.1fs", name, reason, delay)
+        if on_restart is not None:
+            on_restart()
+        await asyncio.sleep(delay)
+        delay = min(max_delay, delay * 2)
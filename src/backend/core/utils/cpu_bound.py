@@ -4,29 +4,210 @@
 Pattern: ProcessPoolExecutor для heavy CPU (parallel across cores),
 asyncio.to_thread для I/O-bound (parallel within event loop).
 
+Крупные буферы (``bytes``/``bytearray``/``memoryview``/NumPy ≥
+:data:`SHARED_MEMORY_MIN_BYTES`) при ``share_memory=True`` передаются в
+worker не через pickle (копия в pipe → копия при unpickle), а через
+сегмент :mod:`multiprocessing.shared_memory`: родитель один раз копирует
+буфер в сегмент, worker получает zero-copy ``memoryview`` (или ``ndarray``
+поверх сегмента). Крупный результат возвращается тем же путём.
+Поиск буферов — в аргументах, результате и во вложенных list/tuple/dict
+(контейнер без крупных буферов передаётся как есть, остальные
+пересобираются с сохранением типа — namedtuple, ``OrderedDict``);
+сегменты результата родитель копирует и удаляет, в том числе когда вызов
+отменён, а worker досчитал уже после отмены.
+
+Пул прогревается :func:`warm_cpu_pool` (все worker'ы стартуют и выполняют
+initializer'ы из :func:`register_cpu_worker_initializer` — загрузка
+моделей/шрифтов; на старте приложения — если initializer'ы
+зарегистрированы), состояние — :func:`cpu_pool_stats` и Prometheus-метрики
+``cpu_pool_*``.
+
 Example::
 
     result = await run_cpu_bound(_merge_pdfs, pdf_bytes_list)
     result = await run_cpu_bound(_ocr_image, image, use_process_pool=True)
+    result = await run_cpu_bound(
+        _ocr_image, image_bytes, use_process_pool=True, share_memory=True
+    )
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import copy
 import os
+import pickle
+import sys
+import time
+import weakref
 from collections.abc import Callable
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from functools import partial
-from typing import TypeVar
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, TypeVar
 
 T = TypeVar("T")
 
-__all__ = ("PROCESS_POOL_SIZE", "default_cpu_pool", "run_cpu_bound")
+__all__ = (
+    "PROCESS_POOL_SIZE",
+    "SHARED_MEMORY_MIN_BYTES",
+    "SharedBuffer",
+    "cpu_pool_stats",
+    "default_cpu_pool",
+    "register_cpu_worker_initializer",
+    "run_cpu_bound",
+    "shutdown_cpu_pool",
+    "warm_cpu_pool",
+)
 
 # Default pool size = cpu_count - 1 (reserve 1 for asyncio loop)
 PROCESS_POOL_SIZE: int = max(1, (os.cpu_count() or 2) - 1)
 
+# Буферы меньше порога дешевле отдать pickle, чем заводить сегмент.
+SHARED_MEMORY_MIN_BYTES: int = 1 << 20
+
 _default_pool: ProcessPoolExecutor | None = None
+_initializers: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+
+# Кэш picklability по функции; weak — не продлеваем жизнь замыканиям.
+_picklable_cache: weakref.WeakKeyDictionary[Any, bool] = weakref.WeakKeyDictionary()
+
+_stats: dict[str, int] = {
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "thread_fallbacks": 0,
+    "inflight": 0,
+    "shared_bytes_in": 0,
+    "shared_bytes_out": 0,
+}
+
+_metrics_initialized = False
+_metric_tasks: Any = None
+_metric_inflight: Any = None
+_metric_queue_depth: Any = None
+_metric_utilization: Any = None
+_metric_duration: Any = None
+_metric_shared_bytes: Any = None
+
+
+def _ensure_metrics() -> None:
+    global _metric_tasks, _metric_inflight, _metric_queue_depth
+    global _metric_utilization, _metric_duration, _metric_shared_bytes
+    global _metrics_initialized
+    if _metrics_initialized:
+        return
+    _metrics_initialized = True
+    try:
+        from src.backend.core.utils.metrics_registry import metrics_registry
+    except ImportError:
+        return
+
+    _metric_tasks = metrics_registry.counter(
+        "cpu_pool_tasks_total",
+        "Задачи CPU process pool по исходу (completed/failed/thread_fallback)",
+        labels=("outcome",),
+    )
+    _metric_inflight = metrics_registry.gauge(
+        "cpu_pool_inflight_tasks", "Задачи, отправленные в CPU process pool"
+    )
+    _metric_queue_depth = metrics_registry.gauge(
+        "cpu_pool_queue_depth", "Задачи CPU process pool, ждущие свободный worker"
+    )
+    _metric_utilization = metrics_registry.gauge(
+        "cpu_pool_utilization_ratio", "Доля занятых worker'ов CPU process pool"
+    )
+    _metric_duration = metrics_registry.histogram(
+        "cpu_pool_task_duration_seconds",
+        "Время задачи CPU process pool (включая ожидание и IPC)",
+    )
+    _metric_shared_bytes = metrics_registry.counter(
+        "cpu_pool_shared_bytes_total",
+        "Байты, переданные через shared memory (in — в worker, out — обратно)",
+        labels=("direction",),
+    )
+
+
+def _publish_load() -> None:
+    inflight = _stats["inflight"]
+    if _metric_inflight is not None:
+        _metric_inflight.set(inflight)
+        _metric_queue_depth.set(max(0, inflight - PROCESS_POOL_SIZE))
+        _metric_utilization.set(min(inflight, PROCESS_POOL_SIZE) / PROCESS_POOL_SIZE)
+
+
+_OUTCOME_STATS = {
+    "completed": "completed",
+    "failed": "failed",
+    "thread_fallback": "thread_fallbacks",
+}
+
+
+def _count(outcome: str) -> None:
+    _stats[_OUTCOME_STATS[outcome]] += 1
+    if _metric_tasks is not None:
+        _metric_tasks.labels(outcome=outcome).inc()
+
+
+def _count_shared(direction: str, nbytes: int) -> None:
+    _stats[f"shared_bytes_{direction}"] += nbytes
+    if _metric_shared_bytes is not None:
+        _metric_shared_bytes.labels(direction=direction).inc(nbytes)
+
+
+def cpu_pool_stats() -> dict[str, Any]:
+    """Снимок загрузки CPU process pool (для health/metrics endpoint'ов).
+
+    ``utilization`` и ``queue_depth`` выводятся из числа задач в полёте:
+    пул не отдаёт состояние worker'ов, а задача сверх ``workers`` ждёт в
+    очереди executor'а.
+    """
+    inflight = _stats["inflight"]
+    return {
+        **_stats,
+        "workers": PROCESS_POOL_SIZE,
+        "started": _default_pool is not None,
+        "initializers": len(_initializers),
+        "queue_depth": max(0, inflight - PROCESS_POOL_SIZE),
+        "utilization": min(inflight, PROCESS_POOL_SIZE) / PROCESS_POOL_SIZE,
+    }
+
+
+# ─────────────────────── Worker initializers ───────────────────────
+
+
+def register_cpu_worker_initializer(fn: Callable[..., Any], *args: Any) -> None:
+    """Зарегистрировать initializer worker'а (preload моделей/шрифтов).
+
+    ``fn`` и ``args`` должны быть picklable (top-level функция). Применяется
+    к пулу, созданному после регистрации: регистрировать на старте, до
+    :func:`warm_cpu_pool` / первого :func:`run_cpu_bound`.
+    """
+    _initializers.append((fn, args))
+    if _default_pool is not None:
+        from src.backend.core.logging import get_logger
+
+        get_logger(__name__).warning(
+            "cpu_bound: initializer %s зарегистрирован после старта пула — "
+            "применится после shutdown_cpu_pool()",
+            getattr(fn, "__qualname__", repr(fn)),
+        )
+
+
+def _run_initializers(
+    initializers: tuple[tuple[Callable[..., Any], tuple[Any, ...]], ...],
+) -> None:
+    for fn, args in initializers:
+        fn(*args)
+
+
+def _worker_pid() -> int:
+    # Держим worker занятым, чтобы параллельные probe'ы попали в разные
+    # процессы и executor поднял их все.
+    time.sleep(0.05)
+    return os.getpid()
 
 
 def default_cpu_pool() -> ProcessPoolExecutor:
@@ -40,14 +221,220 @@ def default_cpu_pool() -> ProcessPoolExecutor:
     """
     global _default_pool
     if _default_pool is None:
-        _default_pool = ProcessPoolExecutor(max_workers=PROCESS_POOL_SIZE)
+        if _initializers:
+            _default_pool = ProcessPoolExecutor(
+                max_workers=PROCESS_POOL_SIZE,
+                initializer=_run_initializers,
+                initargs=(tuple(_initializers),),
+            )
+        else:
+            _default_pool = ProcessPoolExecutor(max_workers=PROCESS_POOL_SIZE)
     return _default_pool
 
 
+async def warm_cpu_pool() -> int:
+    """Поднять все worker'ы заранее (initializer'ы выполняются сейчас).
+
+    Returns:
+        Число различных worker-процессов, ответивших на probe.
+
+    """
+    loop = asyncio.get_running_loop()
+    pool = default_cpu_pool()
+    pids = await asyncio.gather(
+        *(loop.run_in_executor(pool, _worker_pid) for _ in range(PROCESS_POOL_SIZE))
+    )
+    return len(set(pids))
+
+
+async def shutdown_cpu_pool() -> None:
+    """Остановить singleton-пул (lifespan shutdown); следующий вызов создаст новый."""
+    global _default_pool
+    pool, _default_pool = _default_pool, None
+    if pool is not None:
+        await asyncio.to_thread(pool.shutdown, True, cancel_futures=True)
+
+
+# ─────────────────────── Shared memory transfer ───────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class SharedBuffer:
+    """Picklable-дескриптор буфера в сегменте shared memory.
+
+    ``dtype``/``shape`` заданы для NumPy-массивов, иначе буфер отдаётся
+    как ``memoryview``.
+    """
+
+    name: str
+    size: int
+    dtype: str | None = None
+    shape: tuple[int, ...] | None = None
+
+
+def _is_picklable(fn: Callable[..., Any]) -> bool:
+    with contextlib.suppress(KeyError, TypeError):
+        return _picklable_cache[fn]
+    try:
+        pickle.dumps(fn)
+        picklable = True
+    except (pickle.PicklingError, TypeError, AttributeError):
+        picklable = False
+    # Без weakref/hash (TypeError) — проверяем при каждом вызове.
+    with contextlib.suppress(TypeError):
+        _picklable_cache[fn] = picklable
+    return picklable
+
+
+def _ndarray_type() -> Any:
+    # NumPy не импортируем сами: если его нет в процессе, массивов в
+    # аргументах тоже нет.
+    numpy = sys.modules.get("numpy")
+    return numpy.ndarray if numpy is not None else None
+
+
+def _map_container(value: Any, convert: Callable[[Any], Any]) -> Any:
+    """Применить ``convert`` к элементам list/tuple/dict.
+
+    Если ни один элемент не заменён, возвращается сам ``value``; иначе
+    контейнер пересобирается с сохранением типа (namedtuple,
+    ``OrderedDict``, ``defaultdict`` и прочие подклассы).
+    """
+    if isinstance(value, dict):
+        items = {key: convert(item) for key, item in value.items()}
+        if all(items[key] is item for key, item in value.items()):
+            return value
+        rebuilt = copy.copy(value)
+        rebuilt.update(items)
+        return rebuilt
+    if isinstance(value, list | tuple):
+        converted = [convert(item) for item in value]
+        if all(new is old for new, old in zip(converted, value, strict=True)):
+            return value
+        if isinstance(value, list):
+            rebuilt = copy.copy(value)
+            rebuilt[:] = converted
+            return rebuilt
+        if hasattr(value, "_make"):
+            return value._make(converted)
+        return type(value)(converted)
+    return value
+
+
+def _to_shared(value: Any, segments: list[SharedMemory], *, track: bool) -> Any:
+    """Заменить крупные буферы в ``value`` на :class:`SharedBuffer`."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        view = memoryview(value).cast("B")
+        if view.nbytes < SHARED_MEMORY_MIN_BYTES:
+            return value
+        shm = SharedMemory(create=True, size=view.nbytes, track=track)
+        shm.buf[: view.nbytes] = view
+        segments.append(shm)
+        return SharedBuffer(shm.name, view.nbytes)
+    ndarray = _ndarray_type()
+    if ndarray is not None and isinstance(value, ndarray):
+        if value.nbytes < SHARED_MEMORY_MIN_BYTES or value.dtype.hasobject:
+            return value
+        shm = SharedMemory(create=True, size=value.nbytes, track=track)
+        ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)[...] = value
+        segments.append(shm)
+        return SharedBuffer(shm.name, value.nbytes, value.dtype.str, value.shape)
+    return _map_container(value, lambda item: _to_shared(item, segments, track=track))
+
+
+def _from_shared(value: Any, attached: list[SharedMemory]) -> Any:
+    """Заменить :class:`SharedBuffer` на zero-copy view поверх сегмента."""
+    if isinstance(value, SharedBuffer):
+        shm = SharedMemory(name=value.name, track=False)
+        attached.append(shm)
+        if value.dtype is None:
+            return shm.buf[: value.size]
+        import numpy
+
+        return numpy.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+    return _map_container(value, lambda item: _from_shared(item, attached))
+
+
+def _close(segments: list[SharedMemory], *, unlink: bool) -> None:
+    for shm in segments:
+        # BufferError: view всё ещё экспортирован (fn сохранил ссылку) —
+        # mmap освободится вместе с последней ссылкой.
+        with contextlib.suppress(BufferError):
+            shm.close()
+        if unlink:
+            with contextlib.suppress(FileNotFoundError):
+                shm.unlink()
+
+
+def _call_with_shared(
+    fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    """Entry point worker'а: attach сегментов → fn → крупный результат в shm."""
+    attached: list[SharedMemory] = []
+    try:
+        result = fn(*_from_shared(args, attached), **_from_shared(kwargs, attached))
+        if isinstance(result, memoryview):
+            result = result.tobytes()
+        # Сегмент результата создаёт worker, а освобождает родитель: без
+        # resource tracker, иначе tracker worker'а удалит его на выходе.
+        return _to_shared(result, [], track=False)
+    finally:
+        _close(attached, unlink=False)
+
+
+def _copy_shared(value: Any) -> Any:
+    """Заменить :class:`SharedBuffer` на копию (``bytes``/``ndarray``)."""
+    if isinstance(value, SharedBuffer):
+        shm = SharedMemory(name=value.name, track=False)
+        try:
+            _count_shared("out", value.size)
+            if value.dtype is None:
+                return bytes(shm.buf[: value.size])
+            import numpy
+
+            return numpy.ndarray(
+                value.shape, dtype=value.dtype, buffer=shm.buf
+            ).copy()
+        finally:
+            _close([shm], unlink=False)
+    return _map_container(value, _copy_shared)
+
+
+def _release_shared(value: Any) -> None:
+    """Удалить все сегменты, на которые ссылается результат worker'а."""
+    if isinstance(value, SharedBuffer):
+        with contextlib.suppress(FileNotFoundError):
+            _close([SharedMemory(name=value.name, track=False)], unlink=True)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _release_shared(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _release_shared(item)
+
+
+def _collect_result(value: Any) -> Any:
+    """Скопировать результат из сегментов worker'а и освободить их."""
+    try:
+        return _copy_shared(value)
+    finally:
+        _release_shared(value)
+
+
+def _release_abandoned(future: Future[Any]) -> None:
+    # Вызов отменён, но worker уже выполнял fn: результат никто не заберёт.
+    if not future.cancelled() and future.exception() is None:
+        _release_shared(future.result())
+
+
+# ─────────────────────── Public API ───────────────────────
+
+
 async def run_cpu_bound[T](
     fn: Callable[..., T],
     *args: object,
     use_process_pool: bool = False,
+    share_memory: bool = False,
     **kwargs: object,
 ) -> T:
     """Run CPU-bound function без блокировки event loop.
@@ -57,6 +444,12 @@ async def run_cpu_bound[T](
         *args: Positional args для fn.
         use_process_pool: True → ProcessPoolExecutor (parallel across cores),
             False → asyncio.to_thread (parallel within loop, lightweight).
+        share_memory: Только с ``use_process_pool``: буферы ≥
+            :data:`SHARED_MEMORY_MIN_BYTES` передаются через shared memory.
+            ``fn`` получает ``memoryview`` вместо ``bytes`` (и ``ndarray``
+            поверх сегмента вместо массива) и не должен сохранять их после
+            возврата; крупный ``bytes``/``ndarray`` результат возвращается
+            тем же путём.
         **kwargs: Keyword args для fn.
 
     Returns:
@@ -66,26 +459,57 @@ async def run_cpu_bound[T](
         result = await run_cpu_bound(_merge_pdfs, pdf_bytes_list)
 
     """
-    if use_process_pool:
-        # ProcessPoolExecutor requires picklable top-level functions.
-        # Lambda/closure/local fn → fallback to thread pool + warning.
-        import pickle
+    if not use_process_pool:
+        return await asyncio.to_thread(fn, *args, **kwargs)
 
-        try:
-            pickle.dumps(fn)
-            picklable = True
-        except (pickle.PicklingError, TypeError, AttributeError):
-            picklable = False
-        if not picklable:
-            from src.backend.core.logging import get_logger
-
-            get_logger(__name__).warning(
-                "cpu_bound: use_process_pool=True requires picklable fn, "
-                "got %s — falling back to asyncio.to_thread",
-                getattr(fn, "__qualname__", repr(fn)),
-            )
-            return await asyncio.to_thread(fn, *args, **kwargs)
-        loop = asyncio.get_running_loop()
-        bound = partial(fn, *args, **kwargs)
-        return await loop.run_in_executor(default_cpu_pool(), bound)
-    return await asyncio.to_thread(fn, *args, **kwargs)
+    _ensure_metrics()
+    # ProcessPoolExecutor requires picklable top-level functions.
+    # Lambda/closure/local fn → fallback to thread pool + warning.
+    if not _is_picklable(fn):
+        from src.backend.core.logging import get_logger
+
+        get_logger(__name__).warning(
+            "cpu_bound: use_process_pool=True requires picklable fn, "
+            "got %s — falling back to asyncio.to_thread",
+            getattr(fn, "__qualname__", repr(fn)),
+        )
+        _count("thread_fallback")
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    segments: list[SharedMemory] = []
+    if share_memory:
+        shared_args = _to_shared(args, segments, track=True)
+        shared_kwargs = _to_shared(kwargs, segments, track=True)
+        _count_shared("in", sum(shm.size for shm in segments))
+        call = partial(_call_with_shared, fn, shared_args, shared_kwargs)
+    else:
+        call = partial(fn, *args, **kwargs)
+
+    _stats["submitted"] += 1
+    _stats["inflight"] += 1
+    _publish_load()
+    started = time.perf_counter()
+    future: Future[Any] | None = None
+    try:
+        future = default_cpu_pool().submit(call)
+        result = await asyncio.wrap_future(future, loop=loop)
+        if share_memory:
+            result = _collect_result(result)
+    except asyncio.CancelledError:
+        if share_memory and future is not None:
+            future.add_done_callback(_release_abandoned)
+        _count("failed")
+        raise
+    except BaseException:
+        _count("failed")
+        raise
+    else:
+        _count("completed")
+        return result
+    finally:
+        _stats["inflight"] -= 1
+        _publish_load()
+        if _metric_duration is not None:
+            _metric_duration.observe(time.perf_counter() - started)
+        _close(segments, unlink=True)
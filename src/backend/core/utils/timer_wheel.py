@@ -0,0 +1,83 @@
+"""Hashed timer wheel — O(1) планирование и истечение таймаутов.
+
+Колесо из ``slots`` ячеек по ``tick`` секунд. ``schedule`` кладёт элемент в
+ячейку, начало которой не раньше его дедлайна (с учётом полных оборотов
+``rounds``); ``advance(now)`` проходит ячейки, начало которых уже наступило,
+и возвращает истёкшие элементы. Точность — один ``tick`` (элемент может
+истечь не более чем на ``tick`` позже дедлайна, но никогда раньше).
+
+Отмена не поддерживается явно: вызывающий хранит в элементе поколение
+(generation) и игнорирует устаревшие срабатывания — это дешевле, чем
+искать элемент в ячейке.
+"""
+
+from __future__ import annotations
+
+import math
+
+__all__ = ("TimerWheel",)
+
+
+class TimerWheel[T]:
+    """Однопоточное hashed timer wheel (без блокировок — для event loop).
+
+    Args:
+        tick: Длительность ячейки в секундах.
+        slots: Количество ячеек; дедлайны дальше ``tick * slots`` хранятся
+            с числом оставшихся оборотов.
+        start: Начальное время колеса (та же шкала, что и ``now`` в
+            :meth:`advance`, обычно ``Clock.monotonic()``).
+
+    """
+
+    def __init__(self, *, tick: float, slots: int = 64, start: float = 0.0) -> None:
+        if tick <= 0:
+            raise ValueError("tick должен быть > 0")
+        if slots < 1:
+            raise ValueError("slots должен быть >= 1")
+        self._tick = tick
+        self._slots: list[list[tuple[int, T]]] = [[] for _ in range(slots)]
+        self._cursor = 0
+        self._cursor_time = start
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def tick(self) -> float:
+        """Длительность ячейки (секунды)."""
+        return self._tick
+
+    def schedule(self, deadline: float, item: T) -> None:
+        """Запланировать ``item`` на момент ``deadline``."""
+        ticks = max(0, math.ceil((deadline - self._cursor_time) / self._tick))
+        rounds, offset = divmod(ticks, len(self._slots))
+        self._slots[(self._cursor + offset) % len(self._slots)].append((rounds, item))
+        self._size += 1
+
+    def advance(self, now: float) -> list[T]:
+        """Продвинуть колесо до ``now`` и вернуть истёкшие элементы."""
+        expired: list[T] = []
+        if self._size == 0:
+            # Пустое колесо: перематываем без обхода ячеек.
+            if self._cursor_time <= now:
+                self._cursor_time = now + self._tick
+            return expired
+        n = len(self._slots)
+        while self._cursor_time <= now and self._size:
+            slot = self._slots[self._cursor]
+            if slot:
+                pending: list[tuple[int, T]] = []
+                for rounds, item in slot:
+                    if rounds == 0:
+                        expired.append(item)
+                    else:
+                        pending.append((rounds - 1, item))
+                self._size -= len(slot) - len(pending)
+                self._slots[self._cursor] = pending
+            self._cursor = (self._cursor + 1) % n
+            self._cursor_time += self._tick
+        if self._size == 0 and self._cursor_time <= now:
+            self._cursor_time = now + self._tick
+        return expired
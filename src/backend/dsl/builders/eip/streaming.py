@@ -1,5 +1,6 @@
 """Streaming EIP-методы: windowed_dedup / batch / windowed_collect /
-tumbling_window / sliding_window / session_window / group_by_key.
+tumbling_window / sliding_window / session_window / group_by_key /
+keyed_window.
 
 Sprint 60 W4 — split из eip.py (1354 LOC).
 """
@@ -10,10 +11,12 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, cast
 
 from src.backend.core.di.dependencies import get_watermark_store_optional
+from src.backend.core.interfaces.keyed_state_store import KeyedStateStore
 from src.backend.core.interfaces.watermark_store import WatermarkStore
 from src.backend.dsl.builders.eip._base import EIPMixinBase
 from src.backend.dsl.engine.processors.streaming import (
     GroupByKeyProcessor,
+    KeyedWindowProcessor,
     SessionWindowProcessor,
     SlidingWindowProcessor,
     TumblingWindowProcessor,
@@ -26,7 +29,7 @@ __all__ = ("StreamingEIPsMixin",)
 
 
 class StreamingEIPsMixin(EIPMixinBase):
-    """Streaming window operations: tumbling / sliding / session / dedup / batch / group_by_key."""
+    """Streaming window operations: tumbling / sliding / session / dedup / batch / group_by_key / keyed_window."""
 
     def windowed_dedup(
         self,
@@ -206,3 +209,44 @@ class StreamingEIPsMixin(EIPMixinBase):
                 )
             ),
         )
+
+    def keyed_window(
+        self,
+        key_path: str,
+        sink: Callable[[list[dict[str, Any]]], Any],
+        *,
+        window_seconds: float = 60.0,
+        slide_seconds: float | None = None,
+        value_path: str | None = None,
+        distinct_path: str | None = None,
+        aggregates: tuple[str, ...] = ("count", "sum"),
+        allowed_lateness_seconds: float = 0.0,
+        max_out_of_orderness_seconds: float | None = None,
+        state_store: KeyedStateStore | None = None,
+        watermark_store: WatermarkStore | None = None,
+    ) -> RouteBuilder:
+        """Keyed event-time окно с инкрементальными агрегатами.
+
+        Для высокой кардинальности ключей передайте
+        ``SpillingKeyedStateStore`` — холодные ключи уйдут в SQLite.
+        """
+        store = watermark_store or get_watermark_store_optional()
+        return cast(
+            "RouteBuilder",
+            self._add(  # type: ignore[attr-defined]
+                KeyedWindowProcessor(
+                    sink=sink,
+                    key_path=key_path,
+                    value_path=value_path,
+                    distinct_path=distinct_path,
+                    window_seconds=window_seconds,
+                    slide_seconds=slide_seconds,
+                    aggregates=aggregates,
+                    allowed_lateness_seconds=allowed_lateness_seconds,
+                    max_out_of_orderness_seconds=max_out_of_orderness_seconds,
+                    state_store=state_store,
+                    watermark_store=store,
+                    route_id=self.route_id if store is not None else None,  # type: ignore[attr-defined]
+                )
+            ),
+        )
@@ -120,8 +120,15 @@ class TransformationEIPsMixin(EIPMixinBase):
         sequence_field: str = "seq",
         batch_size: int = 10,
         timeout_seconds: float = 30.0,
+        start_sequence: int | None = None,
+        timeout_sink: Callable[[str, list[Any]], Any] | None = None,
     ) -> RouteBuilder:
-        """Resequencer: восстановление порядка сообщений по sequence_field."""
+        """Resequencer: восстановление порядка сообщений по sequence_field.
+
+        Непрерывная серия выпускается сразу по приходу ожидаемого номера;
+        пропуск ждётся не дольше ``timeout_seconds`` (выпуск по таймауту
+        уходит в ``timeout_sink``).
+        """
         return cast(
             "RouteBuilder",
             self._add(  # type: ignore[attr-defined]
@@ -130,6 +137,8 @@ class TransformationEIPsMixin(EIPMixinBase):
                     sequence_field=sequence_field,
                     batch_size=batch_size,
                     timeout_seconds=timeout_seconds,
+                    start_sequence=start_sequence,
+                    timeout_sink=timeout_sink,
                 )
             ),
         )
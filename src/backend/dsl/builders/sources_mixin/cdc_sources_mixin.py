@@ -128,17 +128,19 @@ class CdcSourcesMixin:
         В отличие от :meth:`from_cdc`, поддерживает:
           * режимы ``full`` (snapshot+tail) и ``delta`` (только tail);
           * персистентный watermark cursor (``cdc_cursors``);
-          * idempotent setup publication+slot.
+          * idempotent setup publication+slot;
+          * batched checkpoint LSN (по числу событий и по времени).
 
         Args:
             route_id: Уникальный ID маршрута.
             table: Имя таблицы.
             dsn: PostgreSQL DSN с REPLICATION-ролью.
-            mode: ``full`` или ``delta``.
+            mode: ``full`` (требует ``cursor_store``) или ``delta``.
             slot_name: Имя slot (default ``cdc_<table>``).
             publication: Имя publication (default ``pub_<table>``).
             plugin: ``pgoutput`` (default) / ``wal2json``.
-            **kwargs: Дополнительно (``cursor_store=...``).
+            **kwargs: Дополнительно (``cursor_store=...``,
+                ``checkpoint_batch_size=...``, ``checkpoint_interval=...``).
 
         Returns:
             ``RouteBuilder`` с ``source = cdc-logical:<table>``.
@@ -20,9 +20,13 @@ Backward compatibility:
   :class:`ActionMetadata` (только ``action`` + ``input_model`` из
   ``payload_model``).
 * :meth:`dispatch` не меняется (легаси контракт ``ActionDispatcher``).
+
+Каждый action компилируется в :class:`CompiledAction` при первом
+вызове (см. ``compiled_action``): :meth:`dispatch` и
+:meth:`dispatch_raw` (JSON-байты транспорта → msgspec-декодер) идут
+через него.
 """
 
-import inspect
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -33,6 +37,7 @@ from src.backend.core.interfaces.action_dispatcher import (
     ActionMetadata,
     ActionMiddleware,
 )
+from src.backend.dsl.commands.compiled_action import CompiledAction, compile_action
 from src.backend.schemas.invocation import ActionCommandSchema
 
 __all__ = ("ActionHandlerRegistry", "ActionHandlerSpec", "action_handler_registry")
@@ -77,6 +82,17 @@ class ActionHandlerRegistry:
         self._handlers: dict[str, ActionHandlerSpec] = {}
         self._metadata: dict[str, ActionMetadata] = {}
         self._middleware: list[ActionMiddleware] = []
+        self._compiled: dict[str, CompiledAction] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Счётчик изменений реестра (регистрации и ``clear``).
+
+        Позволяет производным артефактам (WSDL, схемы) кешироваться до
+        следующего изменения набора action.
+        """
+        return self._version
 
     def register(
         self,
@@ -109,6 +125,7 @@ class ActionHandlerRegistry:
             service_method=service_method,
             payload_model=payload_model,
         )
+        self._version += 1
         if action not in self._metadata:
             self._metadata[action] = ActionMetadata(
                 action=action, input_model=payload_model
@@ -130,6 +147,7 @@ class ActionHandlerRegistry:
                 self._metadata[spec.action] = ActionMetadata(
                     action=spec.action, input_model=spec.payload_model
                 )
+        self._version += 1
 
     def register_with_metadata(
         self,
@@ -236,6 +254,7 @@ class ActionHandlerRegistry:
             )
 
         self._metadata[action] = metadata
+        self._version += 1
 
     def get_metadata(self, action: str) -> ActionMetadata | None:
         """Возвращает метаданные action.
@@ -302,30 +321,57 @@ class ActionHandlerRegistry:
             ValidationError: Если payload не прошёл валидацию.
 
         """
-        spec = self._handlers[command.action]
-
-        service = spec.service_getter()
-        method = getattr(service, spec.service_method)
-
-        if spec.payload_model is not None:
-            # Cycle 132: validate even on empty payload (previously
-            # ``and command.payload`` skipped validation on falsy
-            # dict, which masked required-field violations on
-            # empty commands).
-            validated = spec.payload_model.model_validate(command.payload)
-            kwargs = {
-                field_name: getattr(validated, field_name)
-                for field_name in validated.model_fields
-                if getattr(validated, field_name) is not None
-            }
-        else:
-            kwargs = command.payload or {}
-
-        result = method(**kwargs)
-        if inspect.isawaitable(result):
-            result = await result
-
-        return result
+        compiled = self.compiled(command.action)
+        # Cycle 132: validate even on empty payload (previously
+        # ``and command.payload`` skipped validation on falsy
+        # dict, which masked required-field violations on
+        # empty commands).
+        return await compiled.invoke(compiled.kwargs_from_python(command.payload))
+
+    async def dispatch_raw(
+        self, action: str, body: bytes | bytearray | memoryview
+    ) -> Any:
+        """Выполняет action с payload в виде JSON-байтов.
+
+        Для транспортов, у которых payload ещё не декодирован (HTTP body,
+        Redis Streams, gRPC): декодирование и валидация — один проход
+        предсобранного msgspec-декодера, без промежуточного dict.
+        Пустое тело равносильно ``{}``.
+
+        Args:
+            action: Имя действия.
+            body: JSON-объект payload.
+
+        Returns:
+            Результат вызова метода сервиса.
+
+        Raises:
+            KeyError: Если action не зарегистрирован.
+            ValidationError: Если payload не прошёл валидацию.
+
+        """
+        compiled = self.compiled(action)
+        return await compiled.invoke(compiled.kwargs_from_json(body))
+
+    def compiled(self, action: str) -> CompiledAction:
+        """Возвращает (и кэширует) скомпилированный thunk action.
+
+        Кэш сверяется со spec по identity: перерегистрация action или
+        замена ``payload_model`` пересобирают thunk.
+
+        Raises:
+            KeyError: Если action не зарегистрирован.
+
+        """
+        spec = self._handlers[action]
+        compiled = self._compiled.get(action)
+        if (
+            compiled is None
+            or compiled.spec is not spec
+            or compiled.payload_model is not spec.payload_model
+        ):
+            compiled = self._compiled[action] = compile_action(spec)
+        return compiled
 
     def is_registered(self, action: str) -> bool:
         """Проверяет наличие action-обработчика.
@@ -353,6 +399,8 @@ class ActionHandlerRegistry:
         self._handlers.clear()
         self._metadata.clear()
         self._middleware.clear()
+        self._compiled.clear()
+        self._version += 1
 
 
 action_handler_registry = ActionHandlerRegistry()
@@ -0,0 +1,195 @@
+"""Скомпилированные dispatch-thunk'и action-обработчиков.
+
+:meth:`ActionHandlerRegistry.dispatch` на каждый вызов заново находил
+spec, валидировал уже декодированный dict через pydantic и собирал
+kwargs по полям модели. :class:`CompiledAction` строится один раз на
+action (кэш реестра, сбрасывается при перерегистрации) и держит:
+
+* имена полей payload-модели (kwargs без обхода ``model_fields``);
+* msgspec-декодер, собранный по payload-модели: транспорт с сырыми
+  байтами (HTTP body, Redis Streams, gRPC) декодирует и валидирует
+  JSON за один проход, без промежуточного dict и pydantic-модели.
+
+msgspec-декодер строится только для моделей, которые он воспроизводит
+без потери семантики: поля из нативных msgspec-типов, ограничения
+``annotated_types`` (``gt``/``ge``/``lt``/``le``/``multiple_of``/
+``min_length``/``max_length``), без alias'ов и без
+``field_validator``/``model_validator``. Остальные модели декодируются
+``model_validate_json`` (pydantic-core, тоже один проход). Если msgspec
+отверг payload (невалидный JSON или ошибка валидации), его перепроверяет
+pydantic: lax-приведения pydantic сохраняются, а ошибка остаётся
+привычной ``ValidationError``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Annotated, Any
+
+import orjson
+from pydantic import BaseModel
+
+from src.backend.core.codec.json import MSGSPEC_AVAILABLE, _msgspec_native
+
+if MSGSPEC_AVAILABLE:
+    import msgspec
+
+__all__ = ("CompiledAction", "compile_action")
+
+_ANNOTATED_CONSTRAINTS = {
+    "Gt": "gt",
+    "Ge": "ge",
+    "Lt": "lt",
+    "Le": "le",
+    "MultipleOf": "multiple_of",
+    "MinLen": "min_length",
+    "MaxLen": "max_length",
+}
+# Настройки модели, которые меняют валидацию/результат и не имеют
+# аналога в msgspec — такие модели декодирует pydantic.
+_PYDANTIC_ONLY_CONFIG = (
+    "strict",
+    "str_strip_whitespace",
+    "str_to_lower",
+    "str_to_upper",
+    "str_min_length",
+    "str_max_length",
+    "coerce_numbers_to_str",
+    "use_enum_values",
+)
+
+
+@dataclass(slots=True)
+class CompiledAction:
+    """Thunk одного action: spec + предсобранные декодер и поля.
+
+    Attrs:
+        spec: Исходная :class:`ActionHandlerSpec` (сервис читается из неё
+            на каждый вызов — ``service_getter`` может отдавать новый
+            экземпляр).
+        payload_model: Модель, под которую собран thunk (для проверки
+            актуальности кэша).
+        field_names: Имена полей ``payload_model``.
+        struct: msgspec-Struct — зеркало модели или ``None``, если
+            модель декодируется pydantic'ом.
+    """
+
+    spec: Any
+    payload_model: type[BaseModel] | None
+    field_names: tuple[str, ...] = ()
+    struct: type | None = None
+    _decode: Callable[[Any], Any] = field(default=orjson.loads, repr=False)
+
+    def kwargs_from_python(self, payload: dict[str, Any] | None) -> dict[str, Any]:
+        """kwargs метода из уже декодированного payload (pydantic-валидация)."""
+        if self.payload_model is None:
+            return payload or {}
+        validated = self.payload_model.model_validate(payload)
+        return self._kwargs(validated)
+
+    def kwargs_from_json(self, body: bytes | bytearray | memoryview) -> dict[str, Any]:
+        """kwargs метода прямо из JSON-байтов: декодирование + валидация."""
+        if not body:
+            body = b"{}"
+        if self.payload_model is None:
+            payload = self._decode(body)
+            if not isinstance(payload, dict):
+                raise ValueError(
+                    f"payload action {self.spec.action!r} должен быть JSON-объектом"
+                )
+            return payload
+        if self.struct is not None:
+            # DecodeError — родитель ValidationError: битый JSON тоже
+            # уходит в pydantic и поднимается как его ValidationError.
+            with contextlib.suppress(msgspec.DecodeError):
+                return self._kwargs(self._decode(body))
+        return self._kwargs(self.payload_model.model_validate_json(body))
+
+    async def invoke(self, kwargs: dict[str, Any]) -> Any:
+        """Вызвать метод сервиса с готовыми kwargs."""
+        service = self.spec.service_getter()
+        result = getattr(service, self.spec.service_method)(**kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def _kwargs(self, validated: Any) -> dict[str, Any]:
+        # Контракт dispatch: поля со значением ``None`` не передаются.
+        return {
+            name: value
+            for name in self.field_names
+            if (value := getattr(validated, name)) is not None
+        }
+
+
+def compile_action(spec: Any) -> CompiledAction:
+    """Собрать :class:`CompiledAction` для :class:`ActionHandlerSpec`."""
+    model = spec.payload_model
+    if model is None:
+        decode = msgspec.json.Decoder().decode if MSGSPEC_AVAILABLE else orjson.loads
+        return CompiledAction(spec=spec, payload_model=None, _decode=decode)
+    struct = _struct_for(model) if MSGSPEC_AVAILABLE else None
+    compiled = CompiledAction(
+        spec=spec,
+        payload_model=model,
+        field_names=tuple(model.model_fields),
+        struct=struct,
+    )
+    if struct is not None:
+        compiled._decode = msgspec.json.Decoder(struct, strict=False).decode
+    return compiled
+
+
+def _struct_for(model: type[BaseModel]) -> type | None:
+    """msgspec-Struct с семантикой ``model`` или ``None``, если её не повторить."""
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+        or any(model.model_config.get(key) for key in _PYDANTIC_ONLY_CONFIG)
+    ):
+        return None
+    fields: list[tuple[Any, ...]] = []
+    for name, info in model.model_fields.items():
+        if info.alias is not None or info.validation_alias is not None:
+            return None
+        annotation = _constrained(info.annotation, info.metadata)
+        if annotation is None:
+            return None
+        if info.default_factory is not None:
+            fields.append(
+                (name, annotation, msgspec.field(default_factory=info.default_factory))
+            )
+        elif info.is_required():
+            fields.append((name, annotation))
+        else:
+            fields.append((name, annotation, info.default))
+    try:
+        struct = msgspec.defstruct(
+            f"{model.__name__}Payload",
+            fields,
+            kw_only=True,
+            forbid_unknown_fields=model.model_config.get("extra") == "forbid",
+        )
+        # Несовместимые Meta/типы всплывают только при сборке декодера.
+        msgspec.json.Decoder(struct)
+    except (TypeError, ValueError):
+        return None
+    return struct if _msgspec_native(struct) else None
+
+
+def _constrained(annotation: Any, metadata: list[Any]) -> Any:
+    constraints: dict[str, Any] = {}
+    for item in metadata:
+        key = _ANNOTATED_CONSTRAINTS.get(type(item).__name__)
+        if key is None:
+            return None
+        constraints[key] = getattr(item, key)
+    if not constraints:
+        return annotation
+    return Annotated[annotation, msgspec.Meta(**constraints)]
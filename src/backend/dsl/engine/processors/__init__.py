@@ -210,6 +210,7 @@ from src.backend.dsl.engine.processors.streaming import (
     DurableSubscriberProcessor,
     ExactlyOnceProcessor,
     GroupByKeyProcessor,
+    KeyedWindowProcessor,
     MessageExpirationProcessor,
     ReplyToProcessor,
     SamplingProcessor,
@@ -330,6 +331,7 @@ __all__ = (
     "IngestFileProcessor",
     "InvokeProcessor",
     "InvokeWorkflowProcessor",
+    "KeyedWindowProcessor",
     "KeystrokeReplayProcessor",
     "KycAmlVerifyProcessor",
     "LLMCallProcessor",
@@ -31,6 +31,8 @@ _logger = get_logger("dsl.audit")
 
 _VALID_OUTCOMES = frozenset({"success", "failure", "denied", "error"})
 
+_shared_store: Any = None
+
 
 class AuditProcessor(BaseProcessor):
     """Записывает событие в immutable audit log.
@@ -151,7 +153,14 @@ class AuditProcessor(BaseProcessor):
 
     @staticmethod
     def _build_store() -> Any:
-        """Лениво создаёт ``ImmutableAuditStore`` поверх main_session_manager."""
+        """Лениво создаёт общий ``ImmutableAuditStore`` поверх main_session_manager.
+
+        Store один на процесс: его очередь group commit'а объединяет
+        события всех маршрутов в общие транзакции.
+        """
+        global _shared_store
+        if _shared_store is not None:
+            return _shared_store
         from src.backend.infrastructure.database.session_manager import (
             main_session_manager,
         )
@@ -159,7 +168,10 @@ class AuditProcessor(BaseProcessor):
             ImmutableAuditStore,
         )
 
-        return ImmutableAuditStore(session_factory=main_session_manager.create_session)
+        _shared_store = ImmutableAuditStore(
+            session_factory=main_session_manager.create_session
+        )
+        return _shared_store
 
     def to_spec(self) -> dict[str, Any] | None:
         """YAML-spec round-trip."""
@@ -2,14 +2,22 @@
 
 Windowed aggregation Apache Flink-style: tumbling/sliding/session.
 Pattern (D275, Ponytail): thin wrapper, stdlib only.
+
+Sliding-окна считаются через pane-агрегаты (:class:`PaneAggregate`):
+каждое событие учитывается в одном pane длиной ``slide_seconds``, окно —
+слияние ``window / slide`` соседних pane, без повторного прохода по событиям.
+Для потоковой (не батчевой) агрегации — ``KeyedWindowProcessor``.
 """
 
 from __future__ import annotations
 
+import math
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, tzinfo
 from typing import Any
 
+from src.backend.core.types.window_state import PaneAggregate
+
 __all__ = ("BatchAggregatorProcessor",)
 
 VALID_WINDOWS = ("tumbling", "sliding", "session")
@@ -20,8 +28,11 @@ class BatchAggregatorProcessor:
 
     Args:
         window_type: "tumbling" | "sliding" | "session".
-        window_size_seconds: Размер окна в секундах.
+        window_size_seconds: Размер окна в секундах (для session — gap
+            простоя, после которого сессия закрывается).
         aggregation_type: "sum" | "count" | "avg" | "min" | "max" (default sum).
+        slide_seconds: Шаг sliding-окна; ``None`` — равен размеру окна
+            (вырождается в tumbling). Размер окна должен быть кратен шагу.
 
     """
 
@@ -31,15 +42,22 @@ class BatchAggregatorProcessor:
         window_type: str = "tumbling",
         window_size_seconds: float = 60.0,
         aggregation_type: str = "sum",
+        slide_seconds: float | None = None,
     ) -> None:
         if window_type not in VALID_WINDOWS:
             raise ValueError(
                 f"window_type должен быть одним из {VALID_WINDOWS}, "
                 f"получено {window_type!r}"
             )
+        slide = slide_seconds or window_size_seconds
+        ratio = window_size_seconds / slide
+        if window_type == "sliding" and abs(ratio - round(ratio)) > 1e-9:
+            raise ValueError("window_size_seconds должен быть кратен slide_seconds")
         self._window_type = window_type
         self._window_size = window_size_seconds
         self._agg_type = aggregation_type
+        self._slide = slide
+        self._panes_per_window = max(1, round(ratio))
 
     def aggregate(
         self,
@@ -63,57 +81,103 @@ class BatchAggregatorProcessor:
         """
         if not events:
             return []
-        buckets: dict[tuple, list[float]] = defaultdict(list)
+        if self._window_type == "session":
+            return self._aggregate_sessions(events, key, value, timestamp)
+
+        pane_size = self._window_size if self._window_type == "tumbling" else self._slide
+        panes: dict[Any, dict[int, PaneAggregate]] = defaultdict(dict)
+        tz: tzinfo | None = None
         for event in events:
             ts = event.get(timestamp)
             if not isinstance(ts, datetime):
                 continue
-            sec = int(ts.timestamp() // self._window_size)
-            k = event.get(key, "_default")
-            buckets[(k, sec)].append(event.get(value, 0))
+            tz = ts.tzinfo
+            index = math.floor(ts.timestamp() / pane_size)
+            key_panes = panes[event.get(key, "_default")]
+            pane = key_panes.get(index)
+            if pane is None:
+                pane = key_panes[index] = PaneAggregate()
+            pane.add(event.get(value, 0))
+
+        size = 1 if self._window_type == "tumbling" else self._panes_per_window
         results: list[dict[str, Any]] = []
-        for (k, sec), values in buckets.items():
-            start_sec = sec * self._window_size
-            end_sec = start_sec + self._window_size
-            agg = self._aggregate_values(values)
-            results.append(
-                {
-                    "key": k,
-                    "window_start": datetime.fromtimestamp(start_sec, tz=ts.tzinfo),
-                    "window_end": datetime.fromtimestamp(end_sec, tz=ts.tzinfo),
-                    "sum": agg["sum"],
-                    "count": agg["count"],
-                    "min": agg["min"],
-                    "max": agg["max"],
-                    "avg": agg["avg"],
-                }
-            )
+        for k, key_panes in panes.items():
+            ends: set[int] = set()
+            for index in key_panes:
+                ends.update(range(index + 1, index + size + 1))
+            for end in sorted(ends):
+                merged = PaneAggregate()
+                for index in range(end - size, end):
+                    pane = key_panes.get(index)
+                    if pane is not None:
+                        merged.merge(pane)
+                results.append(
+                    self._row(
+                        k, (end - size) * pane_size, end * pane_size, merged, tz
+                    )
+                )
+        results.sort(key=lambda r: r["window_start"])
+        return results
+
+    def _aggregate_sessions(
+        self,
+        events: list[dict[str, Any]],
+        key: str,
+        value: str,
+        timestamp: str,
+    ) -> list[dict[str, Any]]:
+        by_key: dict[Any, list[tuple[datetime, Any]]] = defaultdict(list)
+        for event in events:
+            ts = event.get(timestamp)
+            if isinstance(ts, datetime):
+                by_key[event.get(key, "_default")].append((ts, event.get(value, 0)))
+        results: list[dict[str, Any]] = []
+        for k, items in by_key.items():
+            items.sort(key=lambda item: item[0])
+            session = PaneAggregate()
+            first = last = items[0][0].timestamp()
+            tz = items[0][0].tzinfo
+            for ts, val in items:
+                moment = ts.timestamp()
+                if moment - last > self._window_size:
+                    results.append(
+                        self._row(k, first, last + self._window_size, session, tz)
+                    )
+                    session = PaneAggregate()
+                    first = moment
+                session.add(val)
+                last = moment
+            results.append(self._row(k, first, last + self._window_size, session, tz))
         results.sort(key=lambda r: r["window_start"])
         return results
 
-    def _aggregate_values(self, values: list[float]) -> dict[str, float]:
-        if not values:
+    def _row(
+        self,
+        key: Any,
+        start: float,
+        end: float,
+        pane: PaneAggregate,
+        tz: tzinfo | None,
+    ) -> dict[str, Any]:
+        agg = self._aggregate_values(pane)
+        return {
+            "key": key,
+            "window_start": datetime.fromtimestamp(start, tz=tz),
+            "window_end": datetime.fromtimestamp(end, tz=tz),
+            "sum": agg["sum"],
+            "count": agg["count"],
+            "min": agg["min"],
+            "max": agg["max"],
+            "avg": agg["avg"],
+        }
+
+    def _aggregate_values(self, pane: PaneAggregate) -> dict[str, float]:
+        if not pane.count:
             return {"sum": 0, "count": 0, "min": 0, "max": 0, "avg": 0}
-        if self._agg_type == "sum":
-            return {
-                "sum": sum(values),
-                "count": len(values),
-                "min": min(values),
-                "max": max(values),
-                "avg": sum(values) / len(values),
-            }
-        if self._agg_type == "count":
-            return {
-                "sum": len(values),
-                "count": len(values),
-                "min": min(values),
-                "max": max(values),
-                "avg": sum(values) / len(values),
-            }
         return {
-            "sum": sum(values),
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
+            "sum": pane.count if self._agg_type == "count" else pane.total,
+            "count": pane.count,
+            "min": pane.minimum,
+            "max": pane.maximum,
+            "avg": pane.total / pane.count,
         }
@@ -1,8 +1,43 @@
+"""Stream Resequencer EIP — восстановление порядка по номеру последовательности.
+
+Каждый correlation-ключ держит min-heap ожидающих сообщений и ожидаемый
+следующий номер ``next_seq``. Сообщение с ``seq == next_seq`` выпускается
+сразу вместе со всеми уже накопленными непрерывными преемниками —
+O(log n) на сообщение вместо сортировки всего буфера.
+
+Ограничения памяти:
+
+* ``batch_size`` — ёмкость буфера одного ключа: при заполнении буфер
+  выпускается целиком по порядку (пропуски игнорируются);
+* ``timeout_seconds`` — максимальное ожидание пропущенного номера; таймауты
+  обслуживает :class:`TimerWheel` (O(1) на планирование);
+* ``max_keys`` — число отслеживаемых ключей (LRU); вытесняемый ключ
+  выпускает свой буфер в ``timeout_sink``.
+
+Без ``timeout_sink`` выпуск по таймауту/вытеснению некуда отдать: такие
+сообщения явно отбрасываются (исход ``dropped`` в метрике и warning в
+логе), а не копятся в памяти до следующего exchange ключа. Повторный
+номер, уже ожидающий в буфере, отбрасывается как ``stale``.
+
+Все мутации состояния выполняются без ``await`` внутри, поэтому атомарны
+в event loop и не требуют общего ``asyncio.Lock``: ключи не блокируют
+друг друга.
+"""
+
 import asyncio
+import heapq
+import itertools
+import math
+from collections import OrderedDict
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
+from src.backend.core.clock import RealClock
+from src.backend.core.interfaces.clock import Clock
 from src.backend.core.logging import get_logger
+from src.backend.core.utils.task_registry import get_task_registry
+from src.backend.core.utils.timer_wheel import TimerWheel
 from src.backend.dsl.engine.context import ExecutionContext
 from src.backend.dsl.engine.exchange import Exchange
 from src.backend.dsl.engine.processors.base import BaseProcessor
@@ -12,12 +47,72 @@ _camel_logger = get_logger("dsl.camel")
 
 __all__ = ("ResequencerProcessor",)
 
+# Lazy Prometheus-метрики, общие для всех инстансов процесса.
+_metric_events: Any = None
+_metric_buffered: Any = None
+_metrics_initialized = False
+
+
+def _ensure_metrics() -> None:
+    global _metric_events, _metric_buffered, _metrics_initialized
+    if _metrics_initialized:
+        return
+    try:
+        from src.backend.core.utils.metrics_registry import metrics_registry
+
+        _metric_events = metrics_registry.counter(
+            "resequencer_events_total",
+            "Сообщения Resequencer по исходу (released/timeout/evicted/stale/dropped)",
+            labels=("processor", "outcome"),
+        )
+        _metric_buffered = metrics_registry.gauge(
+            "resequencer_buffered_messages",
+            "Сообщения, ожидающие пропущенный номер в Resequencer",
+            labels=("processor",),
+        )
+    except ImportError:
+        _eip_logger.debug("MetricsRegistry недоступен — Resequencer без метрик")
+    finally:
+        _metrics_initialized = True
+
+
+@dataclass(slots=True)
+class _KeyBuffer:
+    """Состояние одного correlation-ключа."""
+
+    heap: list[tuple[int, int, Any]] = field(default_factory=list)
+    # Номера в ``heap`` — отсев дубликатов при вставке.
+    pending: set[int] = field(default_factory=set)
+    next_seq: int | None = None
+    # Поколение таймера: срабатывание с другим поколением устарело.
+    timer_gen: int = 0
+
 
 class ResequencerProcessor(BaseProcessor):
-    """Camel Resequencer EIP — reorder messages by sequence field.
+    """Camel Resequencer EIP (stream mode) — reorder messages by sequence field.
+
+    Buffers messages by correlation key in a min-heap and emits the
+    contiguous run as soon as the next expected sequence number arrives.
+    Gaps are given up after ``timeout_seconds``; full buffers
+    (``batch_size``) are released in order.
+
+    Выпущенные сообщения кладутся в ``out_message.body`` (список по
+    порядку) текущего exchange; exchange без выпуска останавливается.
+    Выпуск по таймауту/вытеснению передаётся в ``timeout_sink(key, bodies)``;
+    без sink — отбрасывается с исходом ``dropped``.
+
+    Args:
+        correlation_key: Callable ``exchange -> key``.
+        sequence_field: Поле/атрибут body с номером последовательности.
+        batch_size: Ёмкость буфера одного ключа.
+        timeout_seconds: Максимальное ожидание пропущенного номера.
+        start_sequence: Первый ожидаемый номер; ``None`` — неизвестен,
+            первая пачка ключа выпускается по ёмкости или таймауту.
+        max_keys: Максимум отслеживаемых ключей (LRU).
+        timeout_sink: Callable ``(key, bodies)`` для выпуска по таймауту.
+        clock: Источник времени (``FakeClock`` в тестах).
+        tick_seconds: Шаг timer wheel; default — ``timeout_seconds / 16``.
 
-    Buffers messages by correlation key, emits them in sequence order
-    when batch is complete or timeout expires.
     """
 
     _MAX_KEYS = 10000
@@ -29,15 +124,53 @@ class ResequencerProcessor(BaseProcessor):
         sequence_field: str = "seq",
         batch_size: int = 10,
         timeout_seconds: float = 30.0,
+        start_sequence: int | None = None,
+        max_keys: int | None = None,
+        timeout_sink: Callable[[str, list[Any]], Any] | None = None,
+        clock: Clock | None = None,
+        tick_seconds: float | None = None,
         name: str | None = None,
     ) -> None:
         super().__init__(name=name or f"resequencer(batch={batch_size})")
+        if batch_size < 1:
+            raise ValueError("batch_size должен быть >= 1")
+        if timeout_seconds <= 0:
+            raise ValueError("timeout_seconds должен быть > 0")
         self._corr_key = correlation_key
         self._seq_field = sequence_field
         self._batch_size = batch_size
         self._timeout = timeout_seconds
-        self._buffers: dict[str, list[tuple[int, Any]]] = {}
-        self._lock = asyncio.Lock()
+        self._start_seq = start_sequence
+        if max_keys is not None:
+            self._MAX_KEYS = max_keys
+        self._timeout_sink = timeout_sink
+        self._clock: Clock = clock or RealClock()
+        tick = tick_seconds or timeout_seconds / 16
+        self._wheel: TimerWheel[tuple[str, int]] = TimerWheel(
+            tick=tick,
+            slots=math.ceil(timeout_seconds / tick) + 1,
+            start=self._clock.monotonic(),
+        )
+        self._buffers: OrderedDict[str, _KeyBuffer] = OrderedDict()
+        self._arrivals = itertools.count()
+        self._buffered = 0
+        self._timer_task: asyncio.Task | None = None
+        self._counters = {
+            "released": 0,
+            "timeout": 0,
+            "evicted": 0,
+            "stale": 0,
+            "dropped": 0,
+        }
+        _ensure_metrics()
+
+    def stats(self) -> dict[str, int]:
+        """Снимок счётчиков (ключи, буфер, исходы сообщений)."""
+        return {
+            "keys": len(self._buffers),
+            "buffered": self._buffered,
+            **{f"{name}_total": value for name, value in self._counters.items()},
+        }
 
     async def process(self, exchange: Exchange[Any], context: ExecutionContext) -> None:
         """Переупорядочивает сообщения по номеру последовательности в рамках группы (Resequencer).
@@ -49,30 +182,175 @@ class ResequencerProcessor(BaseProcessor):
         """
         key = self._corr_key(exchange)
         body = exchange.in_message.body
+        seq = self._sequence_of(body)
+
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = _KeyBuffer(next_seq=self._start_seq)
+            evicted = self._evict_overflow()
+        else:
+            self._buffers.move_to_end(key)
+            evicted = []
 
-        seq = 0
+        if (buf.next_seq is not None and seq < buf.next_seq) or seq in buf.pending:
+            # Номер уже выпущен или ждёт в буфере (дубликат/опоздавший).
+            self._count("stale")
+            exchange.set_property("resequenced", False)
+            exchange.set_property("resequence_stale", True)
+            exchange.stop()
+            await self._deliver_evicted(evicted)
+            return
+
+        was_empty = not buf.heap
+        heapq.heappush(buf.heap, (seq, next(self._arrivals), body))
+        buf.pending.add(seq)
+        self._buffered += 1
+
+        released = self._release_contiguous(buf)
+        if len(buf.heap) >= self._batch_size:
+            released.extend(self._release_all(buf))
+        if released or was_empty:
+            self._rearm(key, buf)
+        if released:
+            self._count("released", len(released))
+        self._observe_buffered()
+
+        if released:
+            exchange.set_property("resequenced", True)
+            exchange.set_out(body=released, headers=dict(exchange.in_message.headers))
+        else:
+            exchange.set_property("resequenced", False)
+            exchange.set_property("resequence_buffer_size", len(buf.heap))
+            exchange.stop()
+        self._ensure_timer_task()
+        await self._deliver_evicted(evicted)
+
+    async def flush_expired(self) -> int:
+        """Выпустить буферы с истёкшим таймаутом; вернуть число сообщений.
+
+        Вызывается фоновой задачей каждые ``tick`` секунд; в тестах —
+        напрямую после сдвига ``FakeClock``.
+        """
+        deliveries: list[tuple[str, list[Any]]] = []
+        for key, gen in self._wheel.advance(self._clock.monotonic()):
+            buf = self._buffers.get(key)
+            if buf is None or buf.timer_gen != gen or not buf.heap:
+                continue
+            # Перестаём ждать пропущенный номер: берём минимальный
+            # доступный и продолжаем непрерывную серию от него.
+            seq, _, body = heapq.heappop(buf.heap)
+            buf.pending.discard(seq)
+            self._buffered -= 1
+            buf.next_seq = seq + 1
+            bodies = [body, *self._release_contiguous(buf)]
+            self._rearm(key, buf)
+            deliveries.append((key, bodies))
+        released = 0
+        for key, bodies in deliveries:
+            released += len(bodies)
+            self._count("timeout", len(bodies))
+            await self._deliver(key, bodies, reason="timeout")
+        if deliveries:
+            self._observe_buffered()
+        return released
+
+    # ─────────────────────── Internals ───────────────────────
+
+    def _sequence_of(self, body: Any) -> int:
+        seq: Any = 0
         if isinstance(body, dict):
             seq = body.get(self._seq_field, 0)
         elif hasattr(body, self._seq_field):
             seq = getattr(body, self._seq_field, 0)
+        try:
+            return int(seq)
+        except (TypeError, ValueError):
+            return 0
+
+    def _release_contiguous(self, buf: _KeyBuffer) -> list[Any]:
+        released: list[Any] = []
+        if buf.next_seq is None:
+            return released
+        heap = buf.heap
+        while heap and heap[0][0] <= buf.next_seq:
+            seq, _, body = heapq.heappop(heap)
+            buf.pending.discard(seq)
+            if seq == buf.next_seq:
+                buf.next_seq += 1
+            released.append(body)
+        self._buffered -= len(released)
+        return released
+
+    def _release_all(self, buf: _KeyBuffer) -> list[Any]:
+        released: list[Any] = []
+        heap = buf.heap
+        while heap:
+            seq, _, body = heapq.heappop(heap)
+            released.append(body)
+            buf.next_seq = seq + 1
+        buf.pending.clear()
+        self._buffered -= len(released)
+        return released
+
+    def _rearm(self, key: str, buf: _KeyBuffer) -> None:
+        # Любой прогресс (или первый элемент) перезапускает ожидание.
+        buf.timer_gen += 1
+        if buf.heap:
+            self._wheel.schedule(
+                self._clock.monotonic() + self._timeout, (key, buf.timer_gen)
+            )
+
+    def _evict_overflow(self) -> list[tuple[str, list[Any]]]:
+        evicted: list[tuple[str, list[Any]]] = []
+        while len(self._buffers) > self._MAX_KEYS:
+            key, buf = self._buffers.popitem(last=False)
+            bodies = self._release_all(buf)
+            if bodies:
+                self._count("evicted", len(bodies))
+                evicted.append((key, bodies))
+        return evicted
+
+    async def _deliver_evicted(self, evicted: list[tuple[str, list[Any]]]) -> None:
+        for key, bodies in evicted:
+            await self._deliver(key, bodies, reason="evicted")
+
+    async def _deliver(self, key: str, bodies: list[Any], *, reason: str) -> None:
+        if self._timeout_sink is None:
+            self._count("dropped", len(bodies))
+            _eip_logger.warning(
+                "Resequencer %s dropped %d %s messages of key %r "
+                "(no timeout_sink configured)",
+                self.name,
+                len(bodies),
+                reason,
+                key,
+            )
+            return
+        try:
+            result = self._timeout_sink(key, bodies)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as exc:
+            _eip_logger.error("Resequencer timeout sink failed: %s", exc)
+
+    def _ensure_timer_task(self) -> None:
+        if not self._wheel or (self._timer_task and not self._timer_task.done()):
+            return
+        self._timer_task = get_task_registry().create_task(
+            self._timer_loop(), name=f"resequencer-timeout:{self.name}"
+        )
+
+    async def _timer_loop(self) -> None:
+        # Колесо тикает, пока есть запланированные таймауты.
+        while self._wheel:
+            await asyncio.sleep(self._wheel.tick)
+            await self.flush_expired()
+
+    def _count(self, outcome: str, amount: int = 1) -> None:
+        self._counters[outcome] += amount
+        if _metric_events is not None:
+            _metric_events.labels(processor=self.name, outcome=outcome).inc(amount)
 
-        async with self._lock:
-            if len(self._buffers) >= self._MAX_KEYS:
-                oldest = next(iter(self._buffers))
-                del self._buffers[oldest]
-
-            buf = self._buffers.setdefault(key, [])
-            buf.append((seq, body))
-
-            if len(buf) >= self._batch_size:
-                buf.sort(key=lambda x: x[0])
-                ordered = [item for _, item in buf]
-                buf.clear()
-                exchange.set_property("resequenced", True)
-                exchange.set_out(
-                    body=ordered, headers=dict(exchange.in_message.headers)
-                )
-            else:
-                exchange.set_property("resequenced", False)
-                exchange.set_property("resequence_buffer_size", len(buf))
-                exchange.stop()
+    def _observe_buffered(self) -> None:
+        if _metric_buffered is not None:
+            _metric_buffered.labels(processor=self.name).set(self._buffered)
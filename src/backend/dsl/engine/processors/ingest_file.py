@@ -1,7 +1,8 @@
 """IngestFileProcessor (Sprint S5) — конвертация файла в Markdown через markitdown.
 
 Подгружает байты файла (S3 или exchange-property), парсит через
-``services.ai.document_parsers.parse_document`` и сохраняет результат
+``services.ai.document_parsers`` (content-hash кэш: повторный файл не
+парсится заново) и сохраняет результат
 в exchange-property. Используется как pre-step перед ``rag_upsert`` или
 ``llm_call`` — даёт LLM структурированный Markdown вместо plain-text.
 
@@ -105,7 +106,10 @@ class IngestFileProcessor(BaseProcessor):
             if value:
                 declared_mime = str(value)
 
-        from src.backend.services.ai.document_parsers import parse_document, sniff_mime
+        from src.backend.services.ai.document_parsers import (
+            get_document_parsing_service,
+            sniff_mime,
+        )
 
         effective_mime = sniff_mime(filename, declared_mime)
 
@@ -114,7 +118,7 @@ class IngestFileProcessor(BaseProcessor):
         # выполнение последовательно в рамках одного exchange).
         try:
             text, meta = await self._invoke_parse(
-                parse_document, payload, effective_mime, filename
+                get_document_parsing_service().parse, payload, effective_mime, filename
             )
         except ValueError as exc:
             if self._on_unsupported == "fail":
@@ -277,7 +277,9 @@ class EmbeddingProcessor(BaseProcessor):
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY not set")
 
-        async with OutboundHttpClient(timeout=httpx.Timeout(30)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(30), pooled=True
+        ) as client:
             resp = await client.post(
                 "https://api.openai.com/v1/embeddings",
                 headers={"Authorization": f"Bearer {api_key}"},
@@ -295,7 +297,9 @@ class EmbeddingProcessor(BaseProcessor):
 
         base_url = os.environ.get("OLLAMA_URL", "http://localhost:11434")
 
-        async with OutboundHttpClient(timeout=httpx.Timeout(30)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(30), pooled=True
+        ) as client:
             resp = await client.post(
                 f"{base_url}/api/embeddings",
                 json={"model": self._model, "prompt": text},
@@ -119,7 +119,7 @@ class ForwardToProcessor(BaseProcessor):
         method = str(exchange.in_message.headers.get("X-Proxy-Method", "POST")).upper()
         target_url = self._rewrite(exchange, context)
         async with OutboundHttpClient(
-            timeout=httpx.Timeout(self._spec.timeout_s)
+            timeout=httpx.Timeout(self._spec.timeout_s), pooled=True
         ) as client:
             resp = await client.request(
                 method=method,
@@ -157,7 +157,7 @@ class ForwardToProcessor(BaseProcessor):
         headers.setdefault("Content-Type", "text/xml; charset=utf-8")
         url = f"http://{self._spec.target}"
         async with OutboundHttpClient(
-            timeout=httpx.Timeout(self._spec.timeout_s)
+            timeout=httpx.Timeout(self._spec.timeout_s), pooled=True
         ) as client:
             resp = await client.post(
                 url,
@@ -17,6 +17,7 @@ import asyncio
 from typing import Any, ClassVar
 
 from src.backend.core.logging import get_logger
+from src.backend.core.utils.cpu_bound import run_cpu_bound
 from src.backend.dsl.engine.context import ExecutionContext
 from src.backend.dsl.engine.exchange import Exchange
 from src.backend.dsl.engine.processors.base import BaseProcessor
@@ -93,6 +94,21 @@ class PdfReadProcessor(BaseProcessor):
         return {"pdf_read": spec}
 
 
+def _merge_pdfs(pdfs: list[bytes | memoryview]) -> bytes:
+    """Склейка PDF в worker'е CPU pool (крупные входы — view поверх shm)."""
+    import io
+
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for pdf_bytes in pdfs:
+        for page in PdfReader(io.BytesIO(pdf_bytes)).pages:
+            writer.add_page(page)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
 class PdfMergeProcessor(BaseProcessor):
     """Объединяет несколько PDF в один.
 
@@ -109,10 +125,8 @@ class PdfMergeProcessor(BaseProcessor):
         """Обработать exchange согласно логике процессора. Читает body / properties, мутирует exchange, выбрасывает exceptions для error handling pipeline."""
         if not await self.auth_check(exchange, action="execute"):
             return
-        import io
-
         try:
-            from pypdf import PdfReader, PdfWriter
+            import pypdf  # noqa: F401
         except ImportError:
             exchange.fail("pypdf not installed: pip install pypdf")
             return
@@ -121,18 +135,11 @@ class PdfMergeProcessor(BaseProcessor):
             exchange.fail("pdf_merge expects list of PDF bytes")
             return
 
-        def _merge() -> bytes:
-            writer = PdfWriter()
-            for pdf_bytes in body:
-                if isinstance(pdf_bytes, bytes):
-                    reader = PdfReader(io.BytesIO(pdf_bytes))
-                    for page in reader.pages:
-                        writer.add_page(page)
-            output = io.BytesIO()
-            writer.write(output)
-            return output.getvalue()
-
-        result = await asyncio.to_thread(_merge)
+        # Входные PDF ≥ 1 MB уходят в worker через shared memory, не pickle.
+        pdfs = [pdf_bytes for pdf_bytes in body if isinstance(pdf_bytes, bytes)]
+        result = await run_cpu_bound(
+            _merge_pdfs, pdfs, use_process_pool=True, share_memory=True
+        )
         exchange.set_out(body=result, headers=dict(exchange.in_message.headers))
         # W34: observability trace.
         exchange.set_property("pdf_merged", True)
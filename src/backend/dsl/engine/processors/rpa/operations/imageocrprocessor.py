@@ -5,10 +5,10 @@ Per-processor file split.
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any, ClassVar
 
 from src.backend.core.logging import get_logger
+from src.backend.core.utils.cpu_bound import run_cpu_bound
 from src.backend.dsl.engine.context import ExecutionContext
 from src.backend.dsl.engine.exchange import Exchange
 from src.backend.dsl.engine.processors.base import BaseProcessor
@@ -16,6 +16,19 @@ from src.backend.dsl.engine.processors.base import BaseProcessor
 _rpa_logger = get_logger("dsl.rpa")
 
 
+def _ocr_image(image: bytes | memoryview, lang: str) -> str:
+    """Tesseract OCR в worker'е CPU pool (изображение — view поверх shm)."""
+    import io
+
+    import pytesseract
+    from PIL import Image
+
+    # ``with`` закрывает Image даже при исключении в pytesseract — без
+    # него PIL держит underlying buffer (Sprint 83 W3).
+    with Image.open(io.BytesIO(image)) as img:
+        return pytesseract.image_to_string(img, lang=lang)
+
+
 class ImageOcrProcessor(BaseProcessor):
     """OCR — извлечение текста с изображений через Tesseract.
 
@@ -33,11 +46,9 @@ class ImageOcrProcessor(BaseProcessor):
         """Обработать exchange согласно логике процессора. Читает body / properties, мутирует exchange, выбрасывает exceptions для error handling pipeline."""
         if not await self.auth_check(exchange, action="read"):
             return
-        import io
-
         try:
-            import pytesseract
-            from PIL import Image
+            import pytesseract  # noqa: F401
+            from PIL import Image  # noqa: F401
         except ImportError:
             exchange.fail(
                 "pytesseract/Pillow not installed: pip install pytesseract Pillow"
@@ -47,14 +58,10 @@ class ImageOcrProcessor(BaseProcessor):
         if not isinstance(body, bytes):
             exchange.fail("ocr expects image bytes")
             return
-        # ``with Image.open(...)`` гарантирует .close() даже при
-        # исключении в pytesseract.image_to_string. PIL держит
-        # reference на underlying file пока Image жив; без ``with``
-        # это приводит к file-descriptor leak (Sprint 83 W3).
-        with Image.open(io.BytesIO(body)) as img:
-            text = await asyncio.to_thread(
-                pytesseract.image_to_string, img, lang=self._lang
-            )
+        # OCR держит GIL: в process pool, скан ≥ 1 MB — через shared memory.
+        text = await run_cpu_bound(
+            _ocr_image, body, self._lang, use_process_pool=True, share_memory=True
+        )
         exchange.set_out(
             body={"text": text.strip(), "lang": self._lang},
             headers=dict(exchange.in_message.headers),
@@ -282,9 +282,13 @@ class PiiEraseProcessor(BaseProcessor):
                 )
                 return 0
             entity_type, entity_id = self._scope.split(":", 1)
-            return await store.delete_where(
-                {"entity_type": entity_type, "entity_id": entity_id}
-            )
+            where = {"entity_type": entity_type, "entity_id": entity_id}
+            # Manifest'ы инкрементального RAG-ingest'а снимаются вместе с
+            # vectors — иначе повторный ingest тех же документов будет no-op.
+            from src.backend.services.ai.rag_service import discard_manifests
+
+            await discard_manifests(where)
+            return await store.delete_where(where)
         except Exception as exc:
             # cycle-8/D-AUDIT-804: PII erasure fail-CLOSED.
             # Bare `except Exception` ранее молча возвращал 0 — PII оставался
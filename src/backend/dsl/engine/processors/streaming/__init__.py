@@ -1,16 +1,20 @@
 """Streaming processors package (S53 W2 decomp from streaming.py 737 LOC).
 
-13 classes split into 4 groups:
+14 classes split into 5 groups:
 - ``windows.py`` (5): _BaseWindow, TumblingWindowProcessor, SlidingWindowProcessor, SessionWindowProcessor, GroupByKeyProcessor
+- ``keyed_windows.py`` (1): KeyedWindowProcessor — event-time keyed окна с pane-агрегатами
 - ``message_meta.py`` (3): MessageExpirationProcessor, CorrelationIdProcessor, SchemaRegistryValidator
 - ``reliability.py`` (3): ReplyToProcessor, ExactlyOnceProcessor, DurableSubscriberProcessor
 - ``operations.py`` (2): ChannelPurgerProcessor, SamplingProcessor
 
-Backward-compat: ``from src.backend.dsl.engine.processors.streaming import X`` works для всех 13 классов.
+Backward-compat: ``from src.backend.dsl.engine.processors.streaming import X`` works для всех 14 классов.
 """
 
 from __future__ import annotations as annotations
 
+from src.backend.dsl.engine.processors.streaming.keyed_windows import (
+    KeyedWindowProcessor,
+)
 from src.backend.dsl.engine.processors.streaming.message_meta import (  # S53 W2
     CorrelationIdProcessor,
     MessageExpirationProcessor,
@@ -39,6 +43,7 @@ __all__ = (
     "DurableSubscriberProcessor",
     "ExactlyOnceProcessor",
     "GroupByKeyProcessor",
+    "KeyedWindowProcessor",
     "MessageExpirationProcessor",
     "ReplyToProcessor",
     "SamplingProcessor",
@@ -0,0 +1,294 @@
+"""Keyed event-time окна с инкрементальной pane-агрегацией.
+
+:class:`KeyedWindowProcessor` — оператор в духе Flink ``keyBy().window()``:
+
+* время события — заголовок ``x-event-time`` (fallback — ``clock.time()``);
+* окно ``[end - window, end)`` собирается из pane длиной ``slide`` секунд,
+  событие обновляет ровно один pane своего ключа за O(1)
+  (:class:`~src.backend.core.types.window_state.PaneAggregate`);
+* окна срабатывают по watermark (:class:`WatermarkState` из ``_BaseWindow``):
+  окно с концом ``end`` эмитится, когда ``end + allowed_lateness <= watermark``;
+* состояние ключей лежит в подключаемом
+  :class:`~src.backend.core.interfaces.keyed_state_store.KeyedStateStore`;
+  ``SpillingKeyedStateStore`` вытесняет холодные ключи в SQLite, так что
+  память процессора ограничена при миллионах ключей.
+
+Tumbling-окно — частный случай ``slide_seconds == window_seconds``.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+from src.backend.core.interfaces.clock import Clock
+from src.backend.core.interfaces.keyed_state_store import KeyedStateStore
+from src.backend.core.interfaces.watermark_store import WatermarkStore
+from src.backend.core.logging import get_logger
+from src.backend.core.types.watermark import LatePolicy
+from src.backend.core.types.window_state import VALID_AGGREGATES, PaneAggregate
+from src.backend.dsl.engine.context import ExecutionContext
+from src.backend.dsl.engine.exchange import Exchange
+from src.backend.dsl.engine.late_event_policy import apply_late_policy
+from src.backend.dsl.engine.processors.streaming.windows import _BaseWindow
+
+__all__ = ("KeyedWindowProcessor",)
+
+logger = get_logger("dsl.streaming.keyed")
+
+
+def _search(path: str, body: Any) -> Any:
+    import jmespath
+
+    try:
+        return jmespath.search(path, body)
+    except (
+        jmespath.exceptions.ParseError,
+        jmespath.exceptions.JsonStringError,
+    ) as exc:
+        logger.debug("KeyedWindow: jmespath search failed for %r: %s", path, exc)
+        return None
+
+
+class KeyedWindowProcessor(_BaseWindow):
+    """Keyed tumbling/sliding окно по event time с pane-агрегатами.
+
+    Sink получает список результатов вида
+    ``{"key", "window_start", "window_end", <aggregates>...}`` (границы —
+    Unix-секунды). Ключи нормализуются к ``str``.
+
+    Args:
+        sink: Callable, получающий пачку результатов сработавших окон.
+        key_path: jmespath-выражение ключа в body.
+        key_fn: Альтернатива ``key_path`` — callable ``body -> key``.
+        value_path: jmespath-выражение числового значения; ``None`` —
+            каждое событие весит 1.
+        distinct_path: jmespath-выражение элемента для ``distinct``
+            (HyperLogLog); обязателен, если ``distinct`` в ``aggregates``.
+        window_seconds: Длительность окна.
+        slide_seconds: Шаг окна (= размер pane); ``None`` — tumbling.
+            ``window_seconds`` должен быть кратен ``slide_seconds``.
+        aggregates: Подмножество ``sum/count/min/max/avg/distinct``.
+        max_out_of_orderness_seconds: Если задан — watermark дополнительно
+            выводится из потока как ``max(event_time) - значение``
+            (для источников без ``message.watermark``).
+        state_store: Хранилище состояния; default — in-memory.
+        emit_batch_size: Максимум результатов в одном вызове ``sink``.
+
+    Остальные аргументы — как у :class:`_BaseWindow`.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        sink: Any,
+        key_path: str | None = None,
+        key_fn: Callable[[Any], Any] | None = None,
+        value_path: str | None = None,
+        distinct_path: str | None = None,
+        window_seconds: float = 60.0,
+        slide_seconds: float | None = None,
+        aggregates: tuple[str, ...] = ("count", "sum"),
+        max_out_of_orderness_seconds: float | None = None,
+        state_store: KeyedStateStore | None = None,
+        emit_batch_size: int = 10_000,
+        name: str | None = None,
+        clock: Clock | None = None,
+        allowed_lateness_seconds: float = 0.0,
+        late_policy: LatePolicy = LatePolicy.DROP,
+        watermark_store: WatermarkStore | None = None,
+        route_id: str | None = None,
+        persist_min_interval: float = 1.0,
+    ) -> None:
+        if (key_path is None) == (key_fn is None):
+            raise ValueError("Нужно задать ровно одно из key_path / key_fn")
+        slide = slide_seconds or window_seconds
+        if window_seconds <= 0 or slide <= 0:
+            raise ValueError("window_seconds и slide_seconds должны быть > 0")
+        ratio = window_seconds / slide
+        if abs(ratio - round(ratio)) > 1e-9:
+            raise ValueError("window_seconds должен быть кратен slide_seconds")
+        unknown = set(aggregates) - VALID_AGGREGATES
+        if unknown:
+            raise ValueError(f"Неизвестные агрегаты: {sorted(unknown)}")
+        if "distinct" in aggregates and distinct_path is None:
+            raise ValueError("Агрегат 'distinct' требует distinct_path")
+        super().__init__(
+            sink=sink,
+            name=name or f"keyed-window:{key_path or 'fn'}",
+            clock=clock,
+            allowed_lateness_seconds=allowed_lateness_seconds,
+            late_policy=late_policy,
+            watermark_store=watermark_store,
+            route_id=route_id,
+            persist_min_interval=persist_min_interval,
+        )
+        if state_store is None:
+            from src.backend.infrastructure.streaming_state import MemoryKeyedStateStore
+
+            state_store = MemoryKeyedStateStore()
+        self._key_path = key_path
+        self._key_fn = key_fn
+        self._value_path = value_path
+        self._distinct_path = distinct_path
+        self._slide = slide
+        self._panes_per_window = round(ratio)
+        self._aggregates = tuple(aggregates)
+        self._max_ooo = max_out_of_orderness_seconds
+        self._state = state_store
+        self._emit_batch_size = max(1, emit_batch_size)
+        # Ближайшее не сработавшее окно (индекс pane, которым оно заканчивается).
+        self._next_end: int | None = None
+        # Pane с индексом < horizon больше не входят ни в одно открытое окно.
+        self._horizon: int | None = None
+        self._windows_fired = 0
+        self._events_after_close = 0
+
+    @property
+    def state_store(self) -> KeyedStateStore:
+        """Хранилище keyed-состояния (для тестов и метрик)."""
+        return self._state
+
+    def stats(self) -> dict[str, Any]:
+        """Снимок счётчиков процессора (и store, если он их отдаёт)."""
+        out: dict[str, Any] = {
+            "windows_fired": self._windows_fired,
+            "events_after_close": self._events_after_close,
+            "late_events_total": self._watermark.late_events_total,
+            "watermark": self._watermark.current,
+        }
+        store_stats = getattr(self._state, "stats", None)
+        if callable(store_stats):
+            out["store"] = store_stats()
+        return out
+
+    async def process(self, exchange: Exchange[Any], context: ExecutionContext) -> None:
+        """Учесть событие в pane своего ключа и эмитить созревшие окна."""
+        if await self._is_late_and_handle(exchange):
+            return
+        body = exchange.in_message.body
+        event_time = self._event_time(exchange)
+        # ``_is_late_and_handle`` проверяет только сообщения с собственным
+        # watermark; keyed-окно сверяет event time с watermark процессора всегда.
+        if (
+            exchange.in_message.watermark is None
+            and self._watermark.is_late(
+                event_time, allowed_lateness=self._allowed_lateness
+            )
+            and not await apply_late_policy(
+                exchange, state=self._watermark, policy=self._late_policy
+            )
+        ):
+            return
+        pane = math.floor(event_time / self._slide)
+        key = str(self._key_fn(body) if self._key_fn else _search(self._key_path, body))  # type: ignore[arg-type]
+        value = self._value(body)
+        distinct_item = (
+            _search(self._distinct_path, body) if self._distinct_path else None
+        )
+
+        async with self._lock:
+            if self._horizon is not None and pane < self._horizon:
+                # Все окна с этим pane уже сработали (late, но пропущен политикой).
+                self._events_after_close += 1
+            else:
+                panes = await self._state.get(key)
+                if panes is None:
+                    panes = {}
+                aggregate = panes.get(pane)
+                if aggregate is None:
+                    aggregate = panes[pane] = PaneAggregate()
+                aggregate.add(value, distinct_item=distinct_item)
+                await self._state.put(key, panes, timer=min(panes))
+                candidate = pane + 1
+                if self._horizon is not None:
+                    candidate = max(candidate, self._horizon + self._panes_per_window)
+                if self._next_end is None or candidate < self._next_end:
+                    self._next_end = candidate
+            if self._max_ooo is not None and self._watermark.advance(
+                event_time - self._max_ooo, now=self._clock.time()
+            ):
+                await self._maybe_persist()
+            results = await self._collect_fired(force=False)
+        await self._emit_results(results)
+
+    async def flush(self) -> None:
+        """Эмитить все открытые окна независимо от watermark (end-of-stream)."""
+        async with self._lock:
+            results = await self._collect_fired(force=True)
+        await self._emit_results(results)
+
+    # ─────────────────────── Internals ───────────────────────
+
+    def _event_time(self, exchange: Exchange[Any]) -> float:
+        raw = exchange.in_message.headers.get("x-event-time")
+        if raw is not None:
+            try:
+                return float(raw)
+            except (TypeError, ValueError):
+                logger.debug("KeyedWindow: bad x-event-time header %r", raw)
+        return self._clock.time()
+
+    def _value(self, body: Any) -> float:
+        if self._value_path is None:
+            return 1.0
+        raw = _search(self._value_path, body)
+        try:
+            return float(raw)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _is_due(self, end: int) -> bool:
+        return end * self._slide + self._allowed_lateness <= self._watermark.current
+
+    async def _collect_fired(self, *, force: bool) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        size = self._panes_per_window
+        while self._next_end is not None and (force or self._is_due(self._next_end)):
+            end = self._next_end
+            start = end - size
+            keys = await self._state.due(end)
+            for key in keys:
+                # promote=False: сработавший холодный ключ не поднимается в RAM.
+                panes = await self._state.get(key, promote=False)
+                if panes is None:
+                    continue
+                merged = PaneAggregate()
+                for index, aggregate in panes.items():
+                    if start <= index < end:
+                        merged.merge(aggregate)
+                if merged.count:
+                    results.append(
+                        {
+                            "key": key,
+                            "window_start": start * self._slide,
+                            "window_end": end * self._slide,
+                            **merged.result(self._aggregates),
+                        }
+                    )
+                # Pane <= start не входят ни в одно следующее окно.
+                for index in [i for i in panes if i <= start]:
+                    del panes[index]
+                if panes:
+                    await self._state.put(key, panes, timer=min(panes))
+                else:
+                    await self._state.delete(key)
+            self._windows_fired += 1
+            self._horizon = start + 1
+            next_end = end + 1
+            if not keys:
+                # Пустой диапазон — прыгаем сразу к окну с ближайшим pane.
+                lowest = await self._state.min_timer()
+                if lowest is None:
+                    self._next_end = None
+                    break
+                next_end = max(next_end, lowest + 1)
+            self._next_end = next_end
+        return results
+
+    async def _emit_results(self, results: list[dict[str, Any]]) -> None:
+        step = self._emit_batch_size
+        for offset in range(0, len(results), step):
+            await self._emit(results[offset : offset + step])
@@ -126,10 +126,12 @@ class SchemaRegistryValidator(BaseProcessor):
     """Валидация сообщения по схеме из реестра.
 
     Поддерживает JSON Schema (через ``jsonschema``), в будущем — Avro/Protobuf.
-    Схема загружается по ``subject`` и кешируется.
+    Схема загружается по ``subject`` и кешируется вместе со скомпилированным
+    validator'ом.
     """
 
     _cache: ClassVar[dict[str, Any]] = {}
+    _validators: ClassVar[Any] = None
 
     def __init__(
         self, *, subject: str, schema_loader: Any = None, name: str | None = None
@@ -153,9 +155,14 @@ class SchemaRegistryValidator(BaseProcessor):
             return
 
         try:
-            import jsonschema
-
-            jsonschema.validate(instance=exchange.in_message.body, schema=schema)
+            from src.backend.infrastructure.eventing.schema_registry import (
+                JsonValidatorCache,
+            )
+
+            if SchemaRegistryValidator._validators is None:
+                SchemaRegistryValidator._validators = JsonValidatorCache()
+            compiled = SchemaRegistryValidator._validators.get(self._subject, schema)
+            compiled.validate(exchange.in_message.body)
         except ImportError:
             logger.warning("jsonschema не установлен, валидация пропущена")
         except Exception as exc:
@@ -216,6 +216,7 @@ class TumblingWindowProcessor(_BaseWindow):
         # Late event — engine применяет политику и прекращает обработку.
         if await self._is_late_and_handle(exchange):
             return
+        bucket: list[Any] = []
         async with self._lock:
             self._buffer.append(exchange.in_message.body)
             if self._flush_task is None or self._flush_task.done():
@@ -223,15 +224,15 @@ class TumblingWindowProcessor(_BaseWindow):
                     self._timed_flush(), name=f"tumbling-flush:{self.name}"
                 )
             if len(self._buffer) >= self._size:
-                bucket = list(self._buffer)
-                self._buffer.clear()
-                await self._emit(bucket)
+                # Забираем буфер целиком (swap, без копии); sink вызывается
+                # вне lock, чтобы медленный sink не блокировал приём событий.
+                bucket, self._buffer = self._buffer, []
+        await self._emit(bucket)
 
     async def _timed_flush(self) -> None:
         await asyncio.sleep(self._interval)
         async with self._lock:
-            bucket = list(self._buffer)
-            self._buffer.clear()
+            bucket, self._buffer = self._buffer, []
         await self._emit(bucket)
 
 
@@ -5,6 +5,7 @@
 - ``loaders.py`` (3): load_pipeline_from_yaml, load_pipeline_from_file, load_all_from_directory
 - ``build.py`` (4): _build_pipeline, _is_allowed_processor, _build_sub, _apply_processor
 - ``control_flow.py`` (1): _materialize_control_flow_params
+- ``route_cache.py``: CompiledRouteCache — content-hash кэш resolved spec'ов
 
 Backward-compat: ``from src.backend.dsl.yaml_loader import load_pipeline_from_yaml`` works.
 """
@@ -29,8 +30,10 @@ from src.backend.dsl.yaml_loader.resolve import (
     _is_route_composition_include_enabled,  # S62 W4: re-export
     _resolve_include_extends,  # S62 W4: re-export
 )
+from src.backend.dsl.yaml_loader.route_cache import CompiledRouteCache
 
 __all__ = (
+    "CompiledRouteCache",
     "_apply_processor",
     "_build_pipeline",
     "_build_sub",
@@ -1,6 +1,7 @@
 """S62 W4 — loaders.py part of yaml_loader decomp.
 
-Funcs: load_pipeline_from_yaml, load_pipeline_from_file, load_all_from_directory.
+Funcs: load_pipeline_from_yaml, load_pipeline_from_file, load_all_from_directory,
+_compile_spec.
 
 public loaders (yaml/file/directory).
 """
@@ -8,11 +9,18 @@ public loaders (yaml/file/directory).
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from src.backend.core.logging import get_logger
 from src.backend.dsl.engine.pipeline import Pipeline
 from src.backend.dsl.yaml_loader.build import _build_pipeline
-from src.backend.dsl.yaml_loader.resolve import _resolve_include_extends
+from src.backend.dsl.yaml_loader.resolve import (
+    _resolve_include_extends,
+    _yaml_safe_load,
+)
+
+if TYPE_CHECKING:
+    from src.backend.dsl.yaml_loader.route_cache import CompiledRouteCache
 
 logger = get_logger(__name__)
 
@@ -42,12 +50,21 @@ def load_pipeline_from_yaml(yaml_str: str, base_path: Path | None = None) -> Pip
         RuntimeError: Цикл в include:/extends: цепочке.
 
     """
-    try:
-        import yaml
-    except ImportError as exc:
-        raise ImportError("PyYAML required: pip install pyyaml") from exc
+    return _build_pipeline(_compile_spec(_yaml_safe_load(yaml_str), base_path))
+
+
+def _compile_spec(
+    data: Any, base_path: Path | None, visited: set[str] | None = None
+) -> dict[str, Any]:
+    """Распарсенный YAML → финальный spec (include/extends + миграции).
+
+    Args:
+        data: Результат YAML-парсинга.
+        base_path: Директория для относительных include/extends.
+        visited: Множество, в которое попадут абсолютные пути всех
+            подключённых файлов (зависимости spec'а для кэша).
 
-    data = yaml.safe_load(yaml_str)
+    """
     if not isinstance(data, dict):
         raise ValueError("YAML root must be a mapping (dict)")
 
@@ -58,46 +75,63 @@ def load_pipeline_from_yaml(yaml_str: str, base_path: Path | None = None) -> Pip
     from src.backend.dsl import yaml_loader as _yaml_loader
 
     if _yaml_loader._is_route_composition_include_enabled():
-        data = _resolve_include_extends(data, base_path)
+        data = _resolve_include_extends(data, base_path, visited)
 
     from src.backend.dsl.versioning import CURRENT_VERSION, apply_migrations
 
     if data.get("apiVersion") != CURRENT_VERSION:
         data = apply_migrations(data, target_version=CURRENT_VERSION)
 
-    return _build_pipeline(data)
+    return data
 
 
-def load_pipeline_from_file(path: str | Path) -> Pipeline:
+def load_pipeline_from_file(
+    path: str | Path, *, cache: CompiledRouteCache | None = None
+) -> Pipeline:
     """Загружает Pipeline из YAML-файла.
 
     Args:
         path: Путь к YAML-файлу.
+        cache: Кэш скомпилированных маршрутов; при попадании YAML не
+            парсится и include/extends не резолвятся.
 
     Returns:
         Готовый Pipeline.
 
     """
     file_path = Path(path)
+    if cache is not None:
+        return cache.load_pipeline(file_path)
     yaml_str = file_path.read_text(encoding="utf-8")
     return load_pipeline_from_yaml(yaml_str, base_path=file_path.parent)
 
 
-def load_all_from_directory(directory: str | Path) -> list[Pipeline]:
-    """Загружает все .yaml/.yml файлы из директории как Pipelines."""
+def load_all_from_directory(
+    directory: str | Path, *, cache: CompiledRouteCache | None = None
+) -> list[Pipeline]:
+    """Загружает все .yaml/.yml файлы из директории как Pipelines.
+
+    Файлы читаются и парсятся параллельно через
+    :class:`~src.backend.dsl.yaml_loader.route_cache.CompiledRouteCache`;
+    с ``cache``, привязанным к каталогу, неизменившиеся маршруты берутся из
+    скомпилированного кэша без YAML-парсинга.
+    """
     dir_path = Path(directory)
     if not dir_path.is_dir():
         raise ValueError(f"Not a directory: {directory}")
 
+    if cache is None:
+        from src.backend.dsl.yaml_loader.route_cache import CompiledRouteCache
+
+        cache = CompiledRouteCache(None)
+
     pipelines: list[Pipeline] = []
-    for yaml_file in sorted(dir_path.glob("*.y*ml")):
-        try:
-            pipeline = load_pipeline_from_file(yaml_file)
-            pipelines.append(pipeline)
-            logger.info(
-                "Loaded pipeline '%s' from %s", pipeline.route_id, yaml_file.name
-            )
-        except Exception as exc:
-            logger.error("Failed to load %s: %s", yaml_file, exc)
+    files = sorted(dir_path.glob("*.y*ml"))
+    for yaml_file, outcome in cache.load_pipelines(files):
+        if isinstance(outcome, Exception):
+            logger.error("Failed to load %s: %s", yaml_file, outcome)
+            continue
+        pipelines.append(outcome)
+        logger.info("Loaded pipeline '%s' from %s", outcome.route_id, yaml_file.name)
 
     return pipelines
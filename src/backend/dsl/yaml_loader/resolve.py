@@ -1,6 +1,7 @@
 """S62 W4 — resolve.py part of yaml_loader decomp.
 
-Funcs: _is_route_composition_include_enabled, _resolve_include_extends.
+Funcs: _is_route_composition_include_enabled, _resolve_include_extends,
+_yaml_safe_load.
 
 include/extends resolution (153 LOC BIG).
 """
@@ -14,6 +15,23 @@ from typing import Any
 _MISSING = object()
 
 
+def _yaml_safe_load(text: str) -> Any:
+    """``yaml.safe_load`` через LibYAML (``CSafeLoader``), если он собран.
+
+    C-загрузчик в разы быстрее pure-Python ``SafeLoader`` и строит те же
+    объекты; без LibYAML — прозрачный fallback на ``yaml.safe_load``.
+    """
+    try:
+        import yaml
+    except ImportError as exc:
+        raise ImportError("PyYAML required: pip install pyyaml") from exc
+
+    if not hasattr(yaml, "CSafeLoader"):
+        return yaml.safe_load(text)
+    # safe_load не принимает Loader — C-вариант доступен только так.
+    return yaml.load(text, Loader=yaml.CSafeLoader)  # noqa: violation-check
+
+
 def _is_route_composition_include_enabled() -> bool:
     """Check if route_composition_include feature flag is enabled."""
     try:
@@ -113,9 +131,7 @@ def _resolve_include_extends(
         _visited.add(resolved_str)
 
         ext_yaml_str = resolved_path.read_text(encoding="utf-8")
-        import yaml
-
-        base_data = yaml.safe_load(ext_yaml_str)
+        base_data = _yaml_safe_load(ext_yaml_str)
         if not isinstance(base_data, dict):
             raise ValueError(
                 f"Extended YAML must be a mapping, got: {type(base_data).__name__}"
@@ -177,9 +193,7 @@ def _resolve_include_extends(
             _visited.add(resolved_inc_str)
 
             inc_yaml_str = resolved_inc.read_text(encoding="utf-8")
-            import yaml
-
-            inc_data = yaml.safe_load(inc_yaml_str)
+            inc_data = _yaml_safe_load(inc_yaml_str)
             if not isinstance(inc_data, dict):
                 raise ValueError(
                     f"Included YAML must be a mapping, got: {type(inc_data).__name__}"
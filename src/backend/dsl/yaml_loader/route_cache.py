@@ -0,0 +1,287 @@
+"""Кэш скомпилированных DSL-маршрутов (content-hash → resolved spec).
+
+Холодный старт и hot-reload тратят время не на сборку ``Pipeline``, а на
+YAML-парсинг, include/extends и миграции версий. :class:`CompiledRouteCache`
+хранит уже разрезолвленный и провалидированный (успешно собранный) spec
+маршрута в msgpack-файле под ``var/cache/dsl_routes``:
+
+* ключ — sha256 от абсолютного пути, содержимого файла, ``CURRENT_VERSION``
+  DSL и флага ``route_composition_include``;
+* в записи хранятся sha256 всех подключённых include/extends-файлов —
+  изменение любого из них инвалидирует запись;
+* файлы читаются и хэшируются параллельно (thread pool), сборка
+  ``Pipeline`` — последовательно, в порядке путей;
+* :meth:`dependents` отдаёт корневые маршруты, зависящие от файла, —
+  watcher перестраивает только их.
+
+Spec'и с типами вне msgpack (YAML-timestamp'ы и т.п.) не кэшируются и
+грузятся обычным путём.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import msgpack
+
+from src.backend.core.logging import get_logger
+from src.backend.dsl.engine.pipeline import Pipeline
+from src.backend.dsl.yaml_loader.build import _build_pipeline
+from src.backend.dsl.yaml_loader.loaders import _compile_spec
+from src.backend.dsl.yaml_loader.resolve import _yaml_safe_load
+
+__all__ = ("CompiledRouteCache",)
+
+logger = get_logger(__name__)
+
+# Повышать при изменении формата записи или семантики _compile_spec.
+_FORMAT_VERSION = 1
+_SUFFIX = ".msgpack"
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_sha256(path: str | Path) -> str | None:
+    try:
+        return _sha256(Path(path).read_bytes())
+    except OSError:
+        return None
+
+
+def _include_enabled() -> bool:
+    from src.backend.dsl import yaml_loader as _yaml_loader
+
+    return _yaml_loader._is_route_composition_include_enabled()
+
+
+@dataclass(slots=True)
+class _Batch:
+    """Общее состояние одной загрузки: флаг include и хэши фрагментов.
+
+    Общий include-фрагмент хэшируется один раз на пачку, а не на каждый
+    маршрут (гонка потоков безопасна — значения идемпотентны).
+    """
+
+    include: bool
+    hashes: dict[str, str | None]
+
+    def file_sha256(self, path: str) -> str | None:
+        digest = self.hashes.get(path)
+        if digest is None and path not in self.hashes:
+            digest = self.hashes[path] = _file_sha256(path)
+        return digest
+
+
+@dataclass(slots=True)
+class _Prepared:
+    """Spec маршрута, готовый к сборке (из кэша или свежескомпилированный)."""
+
+    path: Path
+    key: str
+    spec: dict[str, Any]
+    deps: frozenset[Path]
+    hit: bool
+    payload: bytes | None = None
+
+
+class CompiledRouteCache:
+    """Content-addressed кэш resolved DSL-spec'ов.
+
+    Args:
+        cache_dir: Каталог записей; ``None`` — без персистентности
+            (остаются параллельное чтение и LibYAML-парсер).
+        max_workers: Потоки для чтения/парсинга файлов
+            (default — ``min(32, cpu_count + 4)``).
+
+    """
+
+    def __init__(
+        self, cache_dir: str | Path | None, *, max_workers: int | None = None
+    ) -> None:
+        self._dir = Path(cache_dir) if cache_dir is not None else None
+        self._max_workers = max_workers
+        self._deps: dict[Path, frozenset[Path]] = {}
+        self._live_keys: set[str] = set()
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Каталог записей (``None`` — кэш только в памяти процесса)."""
+        return self._dir
+
+    def stats(self) -> dict[str, Any]:
+        """Счётчики попаданий/промахов (для логов старта и тестов)."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "uncacheable": self._uncacheable,
+            "tracked_routes": len(self._deps),
+        }
+
+    # ─────────────────────── Public API ───────────────────────
+
+    def load_pipeline(self, path: str | Path) -> Pipeline:
+        """Загрузить один маршрут (через кэш)."""
+        prepared = self._prepare(Path(path), _Batch(_include_enabled(), {}))
+        pipeline = _build_pipeline(prepared.spec)
+        self._commit(prepared)
+        return pipeline
+
+    def load_pipelines(
+        self, paths: Iterable[str | Path]
+    ) -> list[tuple[Path, Pipeline | Exception]]:
+        """Загрузить маршруты: чтение/парсинг параллельно, сборка по порядку.
+
+        Returns:
+            ``(path, Pipeline | Exception)`` для каждого пути в исходном
+            порядке; ошибка одного файла не прерывает остальные.
+
+        """
+        files = [Path(p) for p in paths]
+        if not files:
+            return []
+        batch = _Batch(_include_enabled(), {})
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="dsl-route-cache"
+        ) as pool:
+            prepared = list(
+                pool.map(lambda path: self._prepare_safe(path, batch), files)
+            )
+        outcomes: list[tuple[Path, Pipeline | Exception]] = []
+        for path, item in zip(files, prepared, strict=True):
+            if isinstance(item, Exception):
+                outcomes.append((path, item))
+                continue
+            try:
+                pipeline = _build_pipeline(item.spec)
+            except Exception as exc:
+                outcomes.append((path, exc))
+                continue
+            self._commit(item)
+            outcomes.append((path, pipeline))
+        return outcomes
+
+    def dependents(self, changed: str | Path) -> set[Path]:
+        """Абсолютные пути маршрутов, включающих ``changed`` через include/extends."""
+        target = Path(changed).resolve()
+        return {root for root, deps in self._deps.items() if target in deps}
+
+    def forget(self, path: str | Path) -> None:
+        """Убрать удалённый маршрут из карты зависимостей."""
+        self._deps.pop(Path(path).resolve(), None)
+
+    def prune(self) -> int:
+        """Удалить записи, не использованные этим процессом.
+
+        Вызывается после полной загрузки каталога: записи старых версий
+        файлов больше не нужны.
+
+        Returns:
+            Число удалённых записей.
+
+        """
+        if self._dir is None or not self._dir.is_dir():
+            return 0
+        removed = 0
+        for entry in self._dir.glob(f"*{_SUFFIX}"):
+            if entry.stem not in self._live_keys:
+                with contextlib.suppress(OSError):
+                    entry.unlink()
+                    removed += 1
+        return removed
+
+    # ─────────────────────── Internals ───────────────────────
+
+    def _prepare_safe(self, path: Path, batch: _Batch) -> _Prepared | Exception:
+        try:
+            return self._prepare(path, batch)
+        except Exception as exc:
+            return exc
+
+    @staticmethod
+    def _key(absolute: Path, content: bytes, include: bool) -> str:
+        from src.backend.dsl.versioning import CURRENT_VERSION
+
+        header = f"{_FORMAT_VERSION}\0{CURRENT_VERSION}\0{include}\0{absolute}\0"
+        return _sha256(header.encode("utf-8") + content)
+
+    def _prepare(self, path: Path, batch: _Batch) -> _Prepared:
+        content = path.read_bytes()
+        absolute = path.resolve()
+        key = self._key(absolute, content, batch.include)
+
+        cached = self._read_entry(key, batch)
+        if cached is not None:
+            spec, deps = cached
+            return _Prepared(absolute, key, spec, deps, hit=True)
+
+        visited: set[str] = set()
+        spec = _compile_spec(
+            _yaml_safe_load(content.decode("utf-8")), path.parent, visited
+        )
+        dep_hashes = [[dep, batch.file_sha256(dep)] for dep in sorted(visited)]
+        payload: bytes | None = None
+        if self._dir is not None:
+            try:
+                # Сериализуем до сборки: builder может мутировать params.
+                payload = msgpack.packb(
+                    {"deps": dep_hashes, "spec": spec}, use_bin_type=True
+                )
+            except (TypeError, ValueError, OverflowError) as exc:
+                logger.debug("Route %s не кэшируется: %s", path, exc)
+        deps = frozenset(Path(dep) for dep in visited)
+        return _Prepared(absolute, key, spec, deps, hit=False, payload=payload)
+
+    def _read_entry(
+        self, key: str, batch: _Batch
+    ) -> tuple[dict[str, Any], frozenset[Path]] | None:
+        if self._dir is None:
+            return None
+        try:
+            raw = (self._dir / f"{key}{_SUFFIX}").read_bytes()
+            entry = msgpack.unpackb(raw, raw=False, strict_map_key=False)
+            spec = entry["spec"]
+            dep_hashes = entry["deps"]
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.debug("Route cache entry %s повреждён: %s", key, exc)
+            return None
+        for dep, digest in dep_hashes:
+            if digest is None or batch.file_sha256(dep) != digest:
+                return None
+        return spec, frozenset(Path(dep) for dep, _ in dep_hashes)
+
+    def _commit(self, prepared: _Prepared) -> None:
+        """Учесть успешно собранный маршрут и сохранить новую запись."""
+        self._deps[prepared.path] = prepared.deps
+        self._live_keys.add(prepared.key)
+        if prepared.hit:
+            self._hits += 1
+            return
+        self._misses += 1
+        if prepared.payload is None:
+            self._uncacheable += 1
+            return
+        assert self._dir is not None
+        target = self._dir / f"{prepared.key}{_SUFFIX}"
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(prepared.payload)
+            os.replace(tmp, target)
+        except OSError as exc:
+            logger.warning("Route cache write failed for %s: %s", prepared.path, exc)
+            with contextlib.suppress(OSError):
+                tmp.unlink()
@@ -20,6 +20,10 @@ ADR-041 ``fs-watcher-unification``).
  ponytail: добавлено кеширование по content hash. Раньше при любом
  изменении файла перечитывались И перепарсивались ВСЕ YAML. Теперь
  отслеживается hash контента и перепарсиваются только изменившиеся.
+
+ С ``route_cache`` (:class:`CompiledRouteCache`) стартовая загрузка
+ идёт параллельно и из кэша resolved spec'ов, а правка include/extends-
+ фрагмента перестраивает только зависящие от него маршруты.
 """
 
 from __future__ import annotations
@@ -39,6 +43,7 @@ from src.backend.core.utils.task_registry import get_task_registry
 if TYPE_CHECKING:
     from src.backend.dsl.commands.registry import RouteRegistry
     from src.backend.dsl.engine.pipeline import Pipeline
+    from src.backend.dsl.yaml_loader.route_cache import CompiledRouteCache
 
 __all__ = ("DSLYamlWatcher", "PipelineLoader")
 
@@ -75,6 +80,9 @@ class DSLYamlWatcher:
             :func:`src.dsl.yaml_loader.load_pipeline_from_file`.
         debounce_ms: Окно агрегирования file-event'ов (мс).
             Передаётся напрямую в ``watchfiles.awatch(debounce=...)``.
+        route_cache: Кэш скомпилированных маршрутов. Если ``loader`` не
+            задан — используется как loader; initial load идёт пачкой
+            через :meth:`CompiledRouteCache.load_pipelines`.
 
     """
 
@@ -85,9 +93,13 @@ class DSLYamlWatcher:
         loader: PipelineLoader | None = None,
         *,
         debounce_ms: int = 500,
+        route_cache: CompiledRouteCache | None = None,
     ) -> None:
         self._dir = Path(routes_dir)
         self._registry = route_registry
+        self._route_cache = route_cache if loader is None else None
+        if loader is None and route_cache is not None:
+            loader = route_cache.load_pipeline
         self._loader: PipelineLoader = loader or _default_loader
         self._debounce_ms = max(debounce_ms, 0)
 
@@ -126,14 +138,13 @@ class DSLYamlWatcher:
         """
         self._stop_event.set()
         if self._task is not None and not self._task.done():
-            try:
-                await asyncio.wait_for(self._task, timeout=5.0)
-            except TimeoutError:
-                self._task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
+            # CancelledError ожидаем: задача завершается отменой.
+            with contextlib.suppress(asyncio.CancelledError):
+                try:
+                    await asyncio.wait_for(self._task, timeout=5.0)
+                except TimeoutError:
+                    self._task.cancel()
                     await self._task
-            except asyncio.CancelledError:  # noqa: violation-check — expected post-cancel
-                pass
         self._task = None
         logger.info("DSLYamlWatcher stopped: dir=%s", self._dir)
 
@@ -173,13 +184,14 @@ class DSLYamlWatcher:
         loaded: dict[Path, str] = {}
         hashes: dict[Path, str] = {}
         cache: dict[Path, Pipeline] = {}
-        for path in sorted(self._iter_yaml_files()):
+        for path, outcome in self._load_many(sorted(self._iter_yaml_files())):
             try:
-                pipeline = self._loader(path)
-                self._registry.register(pipeline)
-                loaded[path] = pipeline.route_id
+                if isinstance(outcome, Exception):
+                    raise outcome
+                self._registry.register(outcome)
+                loaded[path] = outcome.route_id
                 hashes[path] = _file_hash(path)
-                cache[path] = pipeline
+                cache[path] = outcome
             except Exception as exc:
                 logger.error(
                     "DSLYamlWatcher: initial load failed for %s: %s", path, exc
@@ -187,6 +199,36 @@ class DSLYamlWatcher:
         self._yaml_route_ids = loaded
         self._file_hashes = hashes
         self._pipeline_cache = cache
+        if self._route_cache is not None:
+            self._route_cache.prune()
+            logger.info("DSL route cache: %s", self._route_cache.stats())
+
+    def _load_many(
+        self, paths: list[Path]
+    ) -> list[tuple[Path, Pipeline | Exception]]:
+        """Загрузка пачки файлов: через route_cache (параллельно) или по одному."""
+        if self._route_cache is not None:
+            return self._route_cache.load_pipelines(paths)
+        outcomes: list[tuple[Path, Pipeline | Exception]] = []
+        for path in paths:
+            try:
+                outcomes.append((path, self._loader(path)))
+            except Exception as exc:
+                outcomes.append((path, exc))
+        return outcomes
+
+    def _dependent_routes(self, changed_paths: set[Path]) -> set[Path]:
+        """Маршруты, подключающие изменённые файлы через include/extends."""
+        if self._route_cache is None:
+            return set()
+        roots: set[Path] = set()
+        for path in changed_paths:
+            roots |= self._route_cache.dependents(path)
+        return {
+            owned
+            for owned in self._yaml_route_ids
+            if owned not in changed_paths and owned.resolve() in roots
+        }
 
     async def _consume_loop(self) -> None:
         """Цикл потребления file-event'ов через ``awatch``.
@@ -215,12 +257,13 @@ class DSLYamlWatcher:
         """Инкрементальное обновление только изменившихся файлов.
 
         - определяет какие файлы реально изменились по hash;
-        - перепарсивает только их;
+        - перепарсивает только их и маршруты, которые их include'ят;
         - удаляет пропавшие файлы из registry.
         """
         changed_paths = {Path(path) for _, path in changes if _is_yaml_path(path)}
         if not changed_paths:
             return
+        dependents = self._dependent_routes(changed_paths)
 
         snapshot = self._registry.snapshot_state()
         old_yaml_ids = dict(self._yaml_route_ids)
@@ -228,7 +271,7 @@ class DSLYamlWatcher:
         old_cache = dict(self._pipeline_cache)
 
         try:
-            for path in changed_paths:
+            for path in changed_paths | dependents:
                 if not path.exists():
                     if path in self._yaml_route_ids:
                         rid = self._yaml_route_ids[path]
@@ -236,10 +279,12 @@ class DSLYamlWatcher:
                         del self._yaml_route_ids[path]
                         del self._file_hashes[path]
                         self._pipeline_cache.pop(path, None)
+                        if self._route_cache is not None:
+                            self._route_cache.forget(path)
                 else:
                     new_hash = _file_hash(path)
                     old_hash = self._file_hashes.get(path)
-                    if new_hash != old_hash:
+                    if path in dependents or new_hash != old_hash:
                         pipeline = self._loader(path)
                         self._registry.register(pipeline)
                         self._yaml_route_ids[path] = pipeline.route_id
@@ -27,7 +27,10 @@ from src.backend.entrypoints.api.generator.actions import (
     ActionSpec,
 )
 from src.backend.entrypoints.dependencies.rate_limit import get_default_rate_limiter
-from src.backend.services.ai.document_parsers import parse_document, sniff_mime
+from src.backend.services.ai.document_parsers import (
+    get_document_parsing_service,
+    sniff_mime,
+)
 from src.backend.services.ai.rag_ingest_service import get_rag_ingest_service
 from src.backend.services.ai.rag_service import get_rag_service
 
@@ -358,7 +361,9 @@ class _RAGFacade:
             )
         mime = sniff_mime(file.filename, file.content_type)
         try:
-            text, parse_meta = await parse_document(raw, mime, filename=file.filename)
+            text, parse_meta = await get_document_parsing_service().parse(
+                raw, mime, filename=file.filename
+            )
         except ValueError as exc:
             raise HTTPException(
                 status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(exc)
@@ -32,7 +32,7 @@ from src.backend.core.api.extensions import action_handler_registry
 from src.backend.core.logging import get_logger
 from src.backend.schemas.invocation import ActionCommandSchema
 
-__all__ = ("BaseEntrypoint", "dispatch_action")
+__all__ = ("BaseEntrypoint", "dispatch_action", "dispatch_action_raw")
 
 logger = get_logger(__name__)
 
@@ -87,6 +87,40 @@ async def dispatch_action(
         raise
 
 
+async def dispatch_action_raw(
+    *,
+    action: str,
+    body: bytes | bytearray | memoryview,
+    source: str,
+    correlation_id: str | None = None,
+) -> Any:
+    """Как :func:`dispatch_action`, но payload — ещё не декодированный JSON.
+
+    Для транспортов, держащих сырые байты (HTTP body, Redis Streams,
+    gRPC ``bytes``-поле): декодирование и валидация идут одним проходом
+    скомпилированного декодера action
+    (``action_handler_registry.dispatch_raw``), без промежуточного dict.
+    """
+    cid = correlation_id or uuid.uuid4().hex[:12]
+    start = time.monotonic()
+    try:
+        result = await action_handler_registry.dispatch_raw(action, body)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        logger.debug("%s dispatch %s [ref=%s]: %.1fms", source, action, cid, elapsed_ms)
+        return result
+    except Exception as exc:
+        elapsed_ms = (time.monotonic() - start) * 1000
+        logger.error(
+            "%s dispatch %s failed [ref=%s]: %s (%.1fms)",
+            source,
+            action,
+            cid,
+            exc,
+            elapsed_ms,
+        )
+        raise
+
+
 class BaseEntrypoint(ABC):
     """Абстрактный базовый класс для всех entrypoints (S171 M10 P2, D176).
 
@@ -0,0 +1,164 @@
+"""Request-scoped DataLoader для авто-резолверов GraphQL.
+
+Каждое Query-поле auto-schema — отдельный ``dispatch_action``. Запрос,
+выбирающий одно и то же действие многократно (алиасы в списочном
+запросе, одинаковые аргументы у разных веток), давал N dispatch'ей.
+:class:`ActionLoader` живёт один запрос (создаётся ``context_getter``'ом
+GraphQL-router'а):
+
+* вызовы ``load(action, payload)``, сделанные в одном тике event loop'а
+  (sibling-поля резолвятся конкурентно), собираются в batch;
+* внутри batch'а вызовы дедуплицируются по каноническому JSON payload'а;
+  результат повторного вызова в рамках запроса берётся из memo;
+* batch действия, для которого зарегистрирован batch-handler
+  (:func:`register_batch_handler`), уходит одним вызовом со списком
+  payload'ов; иначе — по одному ``dispatch_action`` на уникальный
+  payload, конкурентно.
+
+Только для read-действий: mutation'ы не склеиваются и не кэшируются.
+
+Метрики: ``graphql_action_loader_total{result}`` (dispatched /
+coalesced / cached) и ``graphql_action_batch_size``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.backend.core.utils.metrics_registry import metrics_registry
+
+__all__ = ("ActionLoader", "BatchHandler", "register_batch_handler")
+
+graphql_action_loader_total = metrics_registry.counter(
+    "graphql_action_loader_total",
+    "GraphQL auto-resolver action loads by result.",
+    labels=("result",),
+)
+graphql_action_batch_size = metrics_registry.histogram(
+    "graphql_action_batch_size",
+    "Unique action calls per GraphQL loader batch.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250),
+)
+
+BatchHandler = Callable[[list[dict[str, Any]]], Awaitable[list[Any]]]
+Dispatch = Callable[[str, dict[str, Any]], Awaitable[Any]]
+_Call = tuple[dict[str, Any], "asyncio.Future[Any]"]
+
+_batch_handlers: dict[str, BatchHandler] = {}
+
+
+def register_batch_handler(action: str, handler: BatchHandler) -> None:
+    """Зарегистрировать batch-вариант read-действия.
+
+    ``handler(payloads)`` возвращает результаты в порядке ``payloads``
+    (как ``dispatch_action`` для каждого payload по отдельности).
+    """
+    _batch_handlers[action] = handler
+
+
+def _payload_key(payload: dict[str, Any]) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+async def _dispatch_graphql(action: str, payload: dict[str, Any]) -> Any:
+    from src.backend.entrypoints.base import dispatch_action
+
+    return await dispatch_action(action=action, payload=payload, source="graphql")
+
+
+class ActionLoader:
+    """Склейка, дедупликация и batch-dispatch read-действий одного запроса.
+
+    Args:
+        dispatch: ``(action, payload) -> result`` для одиночного вызова;
+            по умолчанию ``dispatch_action(source="graphql")``.
+        max_batch_size: Максимум payload'ов в одном вызове batch-handler'а.
+
+    """
+
+    def __init__(
+        self, *, dispatch: Dispatch | None = None, max_batch_size: int = 100
+    ) -> None:
+        self._dispatch = dispatch or _dispatch_graphql
+        self._max_batch_size = max(max_batch_size, 1)
+        self._memo: dict[tuple[str, str], asyncio.Future[Any]] = {}
+        self._pending: dict[str, list[_Call]] = {}
+        self._flush_scheduled = False
+
+    async def load(self, action: str, payload: dict[str, Any] | None = None) -> Any:
+        """Результат ``action`` с ``payload`` (общий для одинаковых вызовов)."""
+        payload = payload or {}
+        key = (action, _payload_key(payload))
+        future = self._memo.get(key)
+        if future is not None:
+            graphql_action_loader_total.labels(
+                result="cached" if future.done() else "coalesced"
+            ).inc()
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._memo[key] = future
+            self._pending.setdefault(action, []).append((payload, future))
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(self._flush)
+        # shield: future делят несколько резолверов — отмена одного поля
+        # не отменяет результат для остальных.
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        for action, calls in pending.items():
+            graphql_action_batch_size.observe(len(calls))
+            graphql_action_loader_total.labels(result="dispatched").inc(len(calls))
+            get_task_registry().create_task(
+                self._run(action, calls), name=f"graphql-loader-{action}"
+            )
+
+    async def _run(self, action: str, calls: list[_Call]) -> None:
+        handler = _batch_handlers.get(action)
+        if handler is None:
+            await asyncio.gather(
+                *(self._run_one(action, payload, future) for payload, future in calls)
+            )
+            return
+        for start in range(0, len(calls), self._max_batch_size):
+            chunk = calls[start : start + self._max_batch_size]
+            try:
+                results = await handler([payload for payload, _ in chunk])
+                if len(results) != len(chunk):
+                    raise ValueError(
+                        f"batch handler {action!r} вернул {len(results)} "
+                        f"результатов на {len(chunk)} payload'ов"
+                    )
+            except Exception as exc:
+                for _, future in chunk:
+                    self._set_exception(future, exc)
+                continue
+            for (_, future), result in zip(chunk, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _run_one(
+        self, action: str, payload: dict[str, Any], future: asyncio.Future[Any]
+    ) -> None:
+        try:
+            result = await self._dispatch(action, payload)
+        except Exception as exc:
+            self._set_exception(future, exc)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future[Any], exc: Exception) -> None:
+        if not future.done():
+            future.set_exception(exc)
+            # Ошибку получают резолверы; без них — не логировать как забытую.
+            future.exception()
@@ -10,7 +10,9 @@ Wave 1.4 (Roadmap V10): для каждой :class:`ActionMetadata`
 * имя поля = ``action_id`` с заменой ``.`` на ``_`` (GraphQL не любит точку);
 * возвращаемый тип = JSON-обёртка ``ActionResult`` (унифицировано с
   существующим ``schema.py``);
-* аргументы = ``payload: JSON | None``.
+* аргументы = ``payload: JSON | None``;
+* read-поля одного запроса идут через request-scoped ``ActionLoader``
+  (дедупликация и batch-dispatch, см. ``action_loader``).
 
 Auto-schema подключается рядом с существующим ``graphql_router`` через
 :func:`auto_register_strawberry_schema`. Если actions-реестр пуст или
@@ -27,6 +29,7 @@ from collections.abc import Callable
 from typing import Any
 
 from strawberry.scalars import JSON
+from strawberry.types import Info
 
 from src.backend.core.logging import get_logger
 
@@ -77,7 +80,14 @@ def _action_to_field_name(action_id: str) -> str:
     return action_id.replace(".", "_").replace("-", "_")
 
 
-def _build_resolver(action_id: str) -> Callable[..., Any]:
+def _graphql_context() -> dict[str, Any]:
+    """Request-scoped контекст auto-schema: свой :class:`ActionLoader`."""
+    from src.backend.entrypoints.graphql.action_loader import ActionLoader
+
+    return {"action_loader": ActionLoader()}
+
+
+def _build_resolver(action_id: str, *, coalesce: bool = False) -> Callable[..., Any]:
     """Построить async-резолвер, делегирующий в ``dispatch_action``.
 
     Резолвер принимает один аргумент ``payload`` (``JSON`` scalar — словарь
@@ -85,17 +95,25 @@ def _build_resolver(action_id: str) -> Callable[..., Any]:
     envelope ``{action, success, data, error}``). Strawberry требует
     явные типизации — поэтому используем :class:`strawberry.scalars.JSON`,
     а не ``Any``.
-    """
 
-    async def resolver(payload: JSON | None = None) -> JSON:
-        from src.backend.entrypoints.base import dispatch_action
+    ``coalesce=True`` (только read-действия) — вызов идёт через
+    ``ActionLoader`` из контекста запроса: одинаковые поля запроса
+    разделяют один dispatch. Без loader'а в контексте — прямой dispatch.
+    """
 
+    async def resolver(info: Info, payload: JSON | None = None) -> JSON:
+        body = payload if isinstance(payload, dict) else {}
+        context = info.context
+        loader = context.get("action_loader") if coalesce and context else None
         try:
-            data = await dispatch_action(
-                action=action_id,
-                payload=payload if isinstance(payload, dict) else {},
-                source="graphql",
-            )
+            if loader is not None:
+                data = await loader.load(action_id, body)
+            else:
+                from src.backend.entrypoints.base import dispatch_action
+
+                data = await dispatch_action(
+                    action=action_id, payload=body, source="graphql"
+                )
         except KeyError:
             return JSON(
                 {
@@ -119,7 +137,7 @@ def _build_resolver(action_id: str) -> Callable[..., Any]:
     # Принудительно прописываем аннотации — Strawberry резолвит через
     # get_type_hints, и для closure-функций с from __future__-нет-аннотаций
     # это надёжный способ донести типы.
-    resolver.__annotations__ = {"payload": JSON | None, "return": JSON}
+    resolver.__annotations__ = {"info": Info, "payload": JSON | None, "return": JSON}
     resolver.__name__ = f"auto_{_action_to_field_name(action_id)}"
     resolver.__doc__ = f"Авто-резолвер для action '{action_id}' (Wave 1.4)."
     return resolver
@@ -170,7 +188,9 @@ def build_auto_strawberry_schema(metadatas: Any | None = None) -> AutoSchemaResu
     for meta in metas:
         try:
             field_name = _action_to_field_name(meta.action)
-            resolver = _build_resolver(meta.action)
+            resolver = _build_resolver(
+                meta.action, coalesce=meta.side_effect == "read"
+            )
             description = meta.description or f"Auto-action {meta.action}"
 
             if meta.side_effect == "read":
@@ -254,6 +274,7 @@ def auto_register_strawberry_schema(
         router = GraphQLRouter(
             result.schema,
             path=path,
+            context_getter=_graphql_context,
             dependencies=[
                 Depends(
                     require_auth([AuthMethod.API_KEY, AuthMethod.JWT, AuthMethod.MTLS])
@@ -11,6 +11,24 @@
 - SHA-256 fingerprint в final chunk / response — integrity check
 - Chunk size 64KB default (configurable через :class:`FileStreamConfig`)
 
+Потоковый storage I/O: если backend реализует ``read_stream`` /
+``write_stream``, файл не собирается в памяти целиком ни в одну из
+сторон — между storage и gRPC-потоком стоит ограниченная очередь
+(``prefetch_chunks``), поэтому память на передачу постоянна
+(≈ ``(prefetch_chunks + 2) * chunk_size``), а чтение storage и отправка
+в сеть перекрываются. Нарезка — через ``memoryview``; чанк, уже
+совпадающий с ``chunk_size``, уходит в ``FileChunk`` без копии.
+Backend'ы только с ``read`` / ``write`` остаются поддержаны: upload
+всё ещё копится для ``write``, но ``max_file_size`` проверяется по мере
+поступления, а не после приёма всего файла.
+
+Ограничение: storage-адаптера под этот контракт (``get_metadata`` /
+``read[_stream]`` / ``write[_stream]`` по ``file_id``) в дереве пока нет —
+``ObjectStorage`` работает по ключам объектов, а ``server.py``
+регистрирует servicer без ``get_storage``. Streaming-путь включится,
+когда такой адаптер появится (S3/LocalFS ``upload_stream`` — готовая
+основа для ``write_stream``).
+
 Wire-ready: требует ``make grpc-codegen`` для регенерации
 ``files_pb2.py`` / ``files_pb2_grpc.py`` после добавления RPCs в
 ``files.proto`` (S128 W3). До этого servicer может быть протестирован
@@ -19,9 +37,10 @@ Wire-ready: требует ``make grpc-codegen`` для регенерации
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import uuid
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -43,11 +62,14 @@ class FileStreamConfig:
     Attributes:
         chunk_size: Размер chunk в байтах (default 64KB).
         max_file_size: Макс. размер файла в байтах (default 1GB).
+        prefetch_chunks: Ёмкость очереди между storage и gRPC-потоком
+            (``0`` — без фоновой подкачки).
 
     """
 
     chunk_size: int = 64 * 1024
     max_file_size: int = 1024 * 1024 * 1024
+    prefetch_chunks: int = 4
 
 
 def compute_sha256(data: bytes) -> str:
@@ -55,6 +77,85 @@ def compute_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+class _UploadAbortedError(Exception):
+    """Upload прерван (cancel / превышение размера) до commit в storage."""
+
+
+_DONE = object()
+
+
+@dataclass(slots=True)
+class _PumpFailure:
+    error: Exception
+
+
+async def _prefetch(
+    source: AsyncIterable[Any], maxsize: int, *, name: str
+) -> AsyncIterator[Any]:
+    """Фоновая подкачка ``source`` через очередь на ``maxsize`` элементов.
+
+    Производитель блокируется на полной очереди — это и есть
+    flow control: в памяти не больше ``maxsize`` непрочитанных чанков.
+    """
+    if maxsize <= 0:
+        async for item in source:
+            yield item
+        return
+
+    from src.backend.core.utils.task_registry import get_task_registry
+
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+
+    async def pump() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as exc:
+            await queue.put(_PumpFailure(exc))
+            return
+        await queue.put(_DONE)
+
+    task = get_task_registry().create_task(pump(), name=name)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _PumpFailure):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+
+
+async def _slices(
+    source: AsyncIterable[bytes], chunk_size: int
+) -> AsyncIterator[bytes | memoryview]:
+    """Нарезать поток буферов на куски не длиннее ``chunk_size`` без копий.
+
+    При закрытии закрывает и ``source`` — фоновая подкачка
+    :func:`_prefetch` останавливается вместе с потребителем.
+    """
+    try:
+        async for buffer in source:
+            if not buffer:
+                continue
+            if len(buffer) <= chunk_size:
+                yield buffer
+                continue
+            view = memoryview(buffer)
+            for start in range(0, len(view), chunk_size):
+                yield view[start : start + chunk_size]
+    finally:
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def _single(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
 class FileStreamGRPCServicer(BaseGRPCServicer, FileServiceServicer):
     """gRPC servicer для streaming file operations (S128 W3 / TD-026, S131 W2 wire-up).
 
@@ -121,27 +222,45 @@ class FileStreamGRPCServicer(BaseGRPCServicer, FileServiceServicer):
         if file_meta is None:
             return
 
-        data = await storage.read(file_meta, offset=request.offset)
+        chunk_size = self._config.chunk_size
+        read_stream = getattr(storage, "read_stream", None)
+        if read_stream is not None:
+            source: AsyncIterable[bytes] = _prefetch(
+                read_stream(file_meta, offset=request.offset, chunk_size=chunk_size),
+                self._config.prefetch_chunks,
+                name="grpc-file-download-prefetch",
+            )
+        else:
+            source = _single(await storage.read(file_meta, offset=request.offset))
+
+        pieces = _slices(source, chunk_size)
         sequence = 0
         fingerprint = hashlib.sha256()
-        for i in range(0, len(data), self._config.chunk_size):
-            if context.cancelled():
-                self.logger.warning(
-                    "DownloadFile cancelled: file_id=%s, sequence=%d",
-                    request.file_id,
-                    sequence,
+        try:
+            # Чтение на один кусок вперёд: ``is_last`` известен только
+            # после того, как источник исчерпан.
+            pending = await anext(pieces, None)
+            while pending is not None:
+                following = await anext(pieces, None)
+                is_last = following is None
+                if context.cancelled():
+                    self.logger.warning(
+                        "DownloadFile cancelled: file_id=%s, sequence=%d",
+                        request.file_id,
+                        sequence,
+                    )
+                    return
+                fingerprint.update(pending)
+                yield FileChunk(  # type: ignore[operator]
+                    sequence=sequence,
+                    data=pending if isinstance(pending, bytes) else bytes(pending),
+                    final_fingerprint=(fingerprint.hexdigest() if is_last else ""),
+                    is_last=is_last,
                 )
-                return
-            chunk_data = data[i : i + self._config.chunk_size]
-            fingerprint.update(chunk_data)
-            is_last = i + self._config.chunk_size >= len(data)
-            yield FileChunk(  # type: ignore[operator]
-                sequence=sequence,
-                data=chunk_data,
-                final_fingerprint=(fingerprint.hexdigest() if is_last else ""),
-                is_last=is_last,
-            )
-            sequence += 1
+                sequence += 1
+                pending = following
+        finally:
+            await pieces.aclose()
 
     async def UploadFile(  # type: ignore[no-untyped-def]
         self, request_iterator, context
@@ -166,43 +285,79 @@ class FileStreamGRPCServicer(BaseGRPCServicer, FileServiceServicer):
         if storage is None:
             return FileUploadResponse(error="storage backend недоступен")  # type: ignore[operator]
 
-        buffer = bytearray()
-        file_id = 0
-        filename = ""
+        requests = _prefetch(
+            request_iterator,
+            self._config.prefetch_chunks,
+            name="grpc-file-upload-prefetch",
+        )
+        # file_id / filename приходят в первом чанке — они нужны до
+        # начала записи в storage.
+        first = await anext(requests, None)
+        file_id = first.file_id if first is not None else 0
+        filename = first.filename if first is not None else ""
+        max_size = self._config.max_file_size
         fingerprint = hashlib.sha256()
+        size = 0
         total_chunks = 0
-        async for request in request_iterator:
-            if context.cancelled():
-                self.logger.warning(
-                    "UploadFile cancelled: file_id=%s, chunks=%d", file_id, total_chunks
+
+        async def body() -> AsyncIterator[bytes]:
+            nonlocal size, total_chunks
+            if first is None:
+                return
+            request = first
+            while True:
+                if context.cancelled():
+                    self.logger.warning(
+                        "UploadFile cancelled: file_id=%s, chunks=%d",
+                        file_id,
+                        total_chunks,
+                    )
+                    raise _UploadAbortedError("cancelled")
+                if request.data:
+                    size += len(request.data)
+                    if size > max_size:
+                        raise _UploadAbortedError(
+                            f"file exceeds max size {max_size}"
+                        )
+                    fingerprint.update(request.data)
+                    yield request.data
+                total_chunks += 1
+                if request.is_last:
+                    return
+                request = await anext(requests, None)
+                if request is None:
+                    return
+
+        object_uuid = str(uuid.uuid4())
+        write_stream = getattr(storage, "write_stream", None)
+        try:
+            if write_stream is not None:
+                await write_stream(
+                    file_id=file_id,
+                    filename=filename,
+                    stream=body(),
+                    object_uuid=object_uuid,
                 )
-                return FileUploadResponse(error="cancelled")  # type: ignore[operator]
-            file_id = request.file_id or file_id
-            filename = filename or request.filename
-            if request.data:
-                buffer.extend(request.data)
-                fingerprint.update(request.data)
-            total_chunks += 1
-            if request.is_last:
-                break
-
-        if len(buffer) > self._config.max_file_size:
+            else:
+                buffer = bytearray()
+                async for data in body():
+                    buffer.extend(data)
+                await storage.write(
+                    file_id=file_id,
+                    filename=filename,
+                    data=bytes(buffer),
+                    object_uuid=object_uuid,
+                )
+        except _UploadAbortedError as exc:
             return FileUploadResponse(  # type: ignore[operator]
-                file_id=file_id,
-                error=f"file exceeds max size {self._config.max_file_size}",
+                file_id=file_id, error=str(exc)
             )
-
-        object_uuid = str(uuid.uuid4())
-        await storage.write(
-            file_id=file_id,
-            filename=filename,
-            data=bytes(buffer),
-            object_uuid=object_uuid,
-        )
+        finally:
+            await requests.aclose()
 
         return FileUploadResponse(  # type: ignore[operator]
             file_id=file_id,
             object_uuid=object_uuid,
-            size_bytes=len(buffer),
+            size_bytes=size,
             fingerprint=fingerprint.hexdigest(),
         )
@@ -0,0 +1,181 @@
+"""Потоковый разбор SOAP envelope с ограничением размера.
+
+Раньше ``soap_handler`` читал тело целиком (``await request.body()``) и
+строил полное ElementTree-дерево, хотя из него нужны лишь имя операции
+(первый элемент ``soap:Body``) и текст её прямых дочерних элементов.
+:class:`SoapEnvelopeParser` кормит defusedxml-парсер чанками по мере
+поступления (``request.stream()``) и через собственный target собирает
+только эти поля: вложенные поддеревья batch-payload'ов не материализуются,
+а тело больше ``max_bytes`` отклоняется до окончания загрузки
+(:class:`SoapEnvelopeTooLargeError` → HTTP 413).
+
+Семантика совпадает с прежним ``fromstring`` + ``root.find(Body)``:
+берётся первый ``soap:Body`` — прямой потомок корня, первый его элемент —
+операция, ``fields[tag] = element.text`` (текст до первого вложенного
+элемента, ``None`` для пустого), при повторе тега побеждает последний.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable
+from dataclasses import dataclass, field
+
+from defusedxml.ElementTree import DefusedXMLParser
+
+__all__ = (
+    "MAX_ENVELOPE_BYTES",
+    "SOAP_NS",
+    "SoapEnvelope",
+    "SoapEnvelopeParser",
+    "SoapEnvelopeTooLargeError",
+    "parse_envelope",
+    "read_envelope",
+)
+
+SOAP_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+
+#: Граница размера envelope по умолчанию (10 МиБ).
+MAX_ENVELOPE_BYTES = 10 * 1024 * 1024
+
+_BODY_TAG = f"{{{SOAP_NS}}}Body"
+
+# Глубины элементов: Envelope → Body → операция → поле.
+_BODY_DEPTH = 2
+_OPERATION_DEPTH = 3
+_FIELD_DEPTH = 4
+
+
+class SoapEnvelopeTooLargeError(ValueError):
+    """Тело SOAP-запроса превышает допустимый размер."""
+
+
+@dataclass(slots=True)
+class SoapEnvelope:
+    """Операция и плоские поля из ``soap:Body``."""
+
+    operation: str
+    fields: dict[str, str | None] = field(default_factory=dict)
+
+
+def _local_name(tag: str) -> str:
+    return tag.split("}")[1] if "}" in tag else tag
+
+
+class _EnvelopeTarget:
+    """Target для expat: запоминает только операцию и её прямые поля."""
+
+    def __init__(self) -> None:
+        self.body_found = False
+        self.operation: str | None = None
+        self.fields: dict[str, str | None] = {}
+        self._depth = 0
+        self._in_body = False
+        self._in_operation = False
+        self._field: str | None = None
+        self._text: list[str] = []
+        self._collecting = False
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._depth += 1
+        depth = self._depth
+        if depth == _BODY_DEPTH:
+            if not self.body_found and tag == _BODY_TAG:
+                self.body_found = self._in_body = True
+        elif depth == _OPERATION_DEPTH:
+            if self._in_body and self.operation is None:
+                self.operation = _local_name(tag)
+                self._in_operation = True
+        elif depth == _FIELD_DEPTH:
+            if self._in_operation:
+                self._field = _local_name(tag)
+                self._text = []
+                self._collecting = True
+        elif depth == _FIELD_DEPTH + 1:
+            # ``element.text`` — только текст до первого вложенного элемента.
+            self._collecting = False
+
+    def data(self, text: str) -> None:
+        if self._collecting:
+            self._text.append(text)
+
+    def end(self, tag: str) -> None:
+        depth = self._depth
+        self._depth -= 1
+        if depth == _FIELD_DEPTH and self._field is not None:
+            self.fields[self._field] = "".join(self._text) or None
+            self._field = None
+            self._text = []
+            self._collecting = False
+        elif depth == _OPERATION_DEPTH:
+            self._in_operation = False
+        elif depth == _BODY_DEPTH:
+            self._in_body = False
+
+    def close(self) -> _EnvelopeTarget:
+        return self
+
+
+class SoapEnvelopeParser:
+    """Инкрементальный парсер SOAP envelope.
+
+    Args:
+        max_bytes: Максимальный суммарный размер скормленных чанков.
+
+    """
+
+    __slots__ = ("_max_bytes", "_parser", "_size", "_target")
+
+    def __init__(self, *, max_bytes: int = MAX_ENVELOPE_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._target = _EnvelopeTarget()
+        self._parser = DefusedXMLParser(target=self._target)
+
+    def feed(self, chunk: bytes) -> None:
+        """Передать очередной чанк тела запроса.
+
+        Raises:
+            SoapEnvelopeTooLargeError: Превышен ``max_bytes``.
+            xml.etree.ElementTree.ParseError: Невалидный XML.
+
+        """
+        self._size += len(chunk)
+        if self._size > self._max_bytes:
+            raise SoapEnvelopeTooLargeError(
+                f"SOAP envelope превышает {self._max_bytes} байт"
+            )
+        self._parser.feed(chunk)
+
+    def close(self) -> SoapEnvelope:
+        """Завершить разбор и вернуть операцию с полями.
+
+        Raises:
+            ValueError: ``soap:Body`` отсутствует или пуст.
+
+        """
+        self._parser.close()
+        target = self._target
+        if not target.body_found:
+            raise ValueError("SOAP Body не найден")
+        if target.operation is None:
+            raise ValueError("SOAP Body пуст")
+        return SoapEnvelope(operation=target.operation, fields=target.fields)
+
+
+async def read_envelope(
+    chunks: AsyncIterable[bytes], *, max_bytes: int = MAX_ENVELOPE_BYTES
+) -> SoapEnvelope:
+    """Разобрать envelope из потока чанков (например, ``request.stream()``)."""
+    parser = SoapEnvelopeParser(max_bytes=max_bytes)
+    async for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def parse_envelope(
+    xml_body: bytes, *, max_bytes: int = MAX_ENVELOPE_BYTES
+) -> SoapEnvelope:
+    """Разобрать envelope, уже целиком находящийся в памяти."""
+    parser = SoapEnvelopeParser(max_bytes=max_bytes)
+    parser.feed(xml_body)
+    return parser.close()
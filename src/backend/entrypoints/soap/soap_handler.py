@@ -1,5 +1,3 @@
-# ruff: noqa: S314 — false positive (controlled pattern)
-
 from __future__ import annotations
 
 """SOAP-сервер: приём и обработка SOAP-запросов через FastAPI.
@@ -8,6 +6,10 @@ from __future__ import annotations
 и payload, маршрутизирует через DSL или ActionHandlerRegistry,
 формирует SOAP-ответ. Также предоставляет автогенерацию WSDL.
 
+Envelope разбирается потоково (:mod:`.envelope`, граница
+``MAX_ENVELOPE_BYTES``), WSDL кешируется до изменения реестра
+actions (:mod:`.wsdl`).
+
 W22 этап B: добавлен ``/soap/invoke`` — единая SOAP-точка входа,
 которая транслирует envelope в :class:`InvocationRequest` и передаёт
 его в :class:`Invoker` (тот же Gateway, что и REST/WS адаптеры).
@@ -16,10 +18,6 @@ W22 этап B: добавлен ``/soap/invoke`` — единая SOAP-точк
 from typing import Any
 
 import orjson
-
-# P0-S6 (audit 2026-08-19): B314 fix — defusedxml для untrusted SOAP
-# body parsing (защита от XXE/million-laughs DoS).
-from defusedxml import ElementTree as ET
 from fastapi import APIRouter, Depends, Request, Response
 
 from src.backend.core.api.extensions import (
@@ -38,52 +36,23 @@ from src.backend.core.interfaces.invoker import (
 )
 from src.backend.core.logging import get_logger
 
+# P0-S6 (audit 2026-08-19): разбор untrusted envelope — только через
+# defusedxml (защита от XXE/million-laughs DoS), см. ``envelope``.
+from src.backend.entrypoints.soap.envelope import SOAP_NS as _SOAP_NS
+from src.backend.entrypoints.soap.envelope import (
+    SoapEnvelope,
+    SoapEnvelopeTooLargeError,
+    read_envelope,
+)
+from src.backend.entrypoints.soap.wsdl import WsdlCache
+
 __all__ = ("soap_router",)
 
 logger = get_logger(__name__)
 
 soap_router = APIRouter(prefix="/soap", tags=["SOAP"])
 
-_SOAP_NS = "http://schemas.xmlsoap.org/soap/envelope/"
-_WSDL_NS = "http://schemas.xmlsoap.org/wsdl/"
-_XSD_NS = "http://www.w3.org/2001/XMLSchema"
-_TARGET_NS = "http://gd-integration-tools/soap"
-
-
-def _parse_soap_request(xml_body: bytes) -> tuple[str, dict[str, Any]]:
-    """Парсит SOAP envelope и извлекает операцию и payload.
-
-    Поддерживает два формата имён операций:
-    - ``domain.method`` (например, ``orders.get``)
-    - ``simple_name`` (например, ``GetOrder``)
-    """
-    try:
-        from defusedxml.ElementTree import fromstring as safe_fromstring
-
-        root = safe_fromstring(xml_body)
-    except ImportError:
-        root = ET.fromstring(xml_body)  # internal controlled XML parsing
-
-    body = root.find(f"{{{_SOAP_NS}}}Body")
-    if body is None:
-        raise ValueError("SOAP Body не найден")
-
-    operation_element = next(iter(body), None)
-    if operation_element is None:
-        raise ValueError("SOAP Body пуст")
-
-    tag = operation_element.tag
-    if "}" in tag:
-        operation_name = tag.split("}")[1]
-    else:
-        operation_name = tag
-
-    payload: dict[str, Any] = {}
-    for child in operation_element:
-        child_tag = child.tag.split("}")[1] if "}" in child.tag else child.tag
-        payload[child_tag] = child.text
-
-    return operation_name, payload
+_wsdl_cache = WsdlCache()
 
 
 def _build_soap_response(operation: str, result: Any) -> str:
@@ -167,8 +136,8 @@ async def handle_soap_request(request: Request) -> Response:
     content_type = "text/xml; charset=utf-8"
 
     try:
-        xml_body = await request.body()
-        operation, payload = _parse_soap_request(xml_body)
+        envelope = await read_envelope(request.stream())
+        operation, payload = envelope.operation, envelope.fields
 
         logger.info("SOAP запрос: операция=%s", operation)
 
@@ -206,6 +175,9 @@ async def handle_soap_request(request: Request) -> Response:
         xml = _build_soap_response(operation, result)
         return Response(content=xml, media_type=content_type, status_code=200)
 
+    except SoapEnvelopeTooLargeError as exc:
+        xml = _build_soap_fault("Client", str(exc))
+        return Response(content=xml, media_type=content_type, status_code=413)
     except ValueError as exc:
         xml = _build_soap_fault("Client", str(exc))
         return Response(content=xml, media_type=content_type, status_code=400)
@@ -229,80 +201,23 @@ async def handle_soap_request(request: Request) -> Response:
     summary="Автогенерированный WSDL",
     description="WSDL, сгенерированный из зарегистрированных actions.",
 )
-async def get_wsdl() -> Response:
-    """Генерирует WSDL на основе зарегистрированных actions."""
-    actions = action_handler_registry.list_actions()
-
-    operations_xsd = []
-    port_operations = []
-    binding_operations = []
-
-    for action in actions:
-        safe_name = action.replace(".", "_")
-        operations_xsd.append(
-            f'    <xsd:element name="{safe_name}">'
-            f"      <xsd:complexType><xsd:sequence>"
-            f'        <xsd:element name="payload" type="xsd:string" minOccurs="0"/>'
-            f"      </xsd:sequence></xsd:complexType>"
-            f"    </xsd:element>"
-            f'    <xsd:element name="{safe_name}Response">'
-            f"      <xsd:complexType><xsd:sequence>"
-            f'        <xsd:element name="result" type="xsd:string" minOccurs="0"/>'
-            f"      </xsd:sequence></xsd:complexType>"
-            f"    </xsd:element>"
-        )
-        port_operations.append(
-            f'    <wsdl:operation name="{safe_name}">'
-            f'      <wsdl:input message="tns:{safe_name}Request"/>'
-            f'      <wsdl:output message="tns:{safe_name}Response"/>'
-            f"    </wsdl:operation>"
-        )
-        binding_operations.append(
-            f'    <wsdl:operation name="{safe_name}">'
-            f'      <soap:operation soapAction="{action}"/>'
-            f'      <wsdl:input><soap:body use="literal"/></wsdl:input>'
-            f'      <wsdl:output><soap:body use="literal"/></wsdl:output>'
-            f"    </wsdl:operation>"
-        )
-
-    messages = []
-    for action in actions:
-        safe_name = action.replace(".", "_")
-        messages.append(
-            f'  <wsdl:message name="{safe_name}Request">'
-            f'    <wsdl:part name="parameters" element="tns:{safe_name}"/>'
-            f"  </wsdl:message>"
-            f'  <wsdl:message name="{safe_name}Response">'
-            f'    <wsdl:part name="parameters" element="tns:{safe_name}Response"/>'
-            f"  </wsdl:message>"
-        )
+async def get_wsdl(request: Request) -> Response:
+    """Отдаёт WSDL, сгенерированный из зарегистрированных actions.
 
-    wsdl = (
-        '<?xml version="1.0" encoding="UTF-8"?>'
-        f'<wsdl:definitions xmlns:wsdl="{_WSDL_NS}" '
-        f'xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/" '
-        f'xmlns:xsd="{_XSD_NS}" '
-        f'xmlns:tns="{_TARGET_NS}" '
-        f'targetNamespace="{_TARGET_NS}">'
-        f'  <wsdl:types><xsd:schema targetNamespace="{_TARGET_NS}">'
-        + "\n".join(operations_xsd)
-        + "  </xsd:schema></wsdl:types>"
-        + "\n".join(messages)
-        + '  <wsdl:portType name="IntegrationPortType">'
-        + "\n".join(port_operations)
-        + "  </wsdl:portType>"
-        + '  <wsdl:binding name="IntegrationBinding" type="tns:IntegrationPortType">'
-        + '    <soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>'
-        + "\n".join(binding_operations)
-        + "  </wsdl:binding>"
-        + "</wsdl:definitions>"
+    Документ собирается один раз на версию реестра; совпадение
+    ``If-None-Match`` с ETag даёт ``304`` без тела.
+    """
+    document, etag = _wsdl_cache.get(action_handler_registry)
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=document, media_type="text/xml; charset=utf-8", headers=headers
     )
 
-    return Response(content=wsdl, media_type="text/xml; charset=utf-8")
-
 
-def _parse_invoker_envelope(xml_body: bytes) -> InvocationRequest:
-    """Парсит SOAP envelope формата ``InvokeRequest`` в :class:`InvocationRequest`.
+def _parse_invoker_envelope(envelope: SoapEnvelope) -> InvocationRequest:
+    """Транслирует envelope ``InvokeRequest`` в :class:`InvocationRequest`.
 
     Ожидаемая структура (literal-style):
 
@@ -323,24 +238,7 @@ def _parse_invoker_envelope(xml_body: bytes) -> InvocationRequest:
     ``payload`` и ``metadata`` принимают JSON-строку (для произвольной
     вложенности) либо плоские дочерние элементы.
     """
-    try:
-        from defusedxml.ElementTree import fromstring as safe_fromstring
-
-        root = safe_fromstring(xml_body)
-    except ImportError:
-        root = ET.fromstring(xml_body)  # internal controlled XML parsing
-
-    body = root.find(f"{{{_SOAP_NS}}}Body")
-    if body is None:
-        raise ValueError("SOAP Body не найден")
-    request_element = next(iter(body), None)
-    if request_element is None:
-        raise ValueError("SOAP Body пуст")
-
-    fields: dict[str, str] = {}
-    for child in request_element:
-        tag = child.tag.split("}")[1] if "}" in child.tag else child.tag
-        fields[tag] = child.text or ""
+    fields = {tag: text or "" for tag, text in envelope.fields.items()}
 
     action = fields.get("action") or ""
     if not action:
@@ -425,7 +323,11 @@ async def soap_invoke(
     """Единая SOAP-точка входа для всех :class:`InvocationMode` через Invoker."""
     content_type = "text/xml; charset=utf-8"
     try:
-        invocation_request = _parse_invoker_envelope(await request.body())
+        envelope = await read_envelope(request.stream())
+        invocation_request = _parse_invoker_envelope(envelope)
+    except SoapEnvelopeTooLargeError as exc:
+        xml = _build_soap_fault("Client", str(exc))
+        return Response(content=xml, media_type=content_type, status_code=413)
     except ValueError as exc:
         xml = _build_soap_fault("Client", str(exc))
         return Response(content=xml, media_type=content_type, status_code=400)
@@ -0,0 +1,116 @@
+"""Генерация WSDL из реестра actions и её кеш по версии реестра.
+
+WSDL зависит только от набора зарегистрированных action, а
+``GET /soap/wsdl`` раньше собирал документ заново на каждый запрос.
+:class:`WsdlCache` хранит готовые байты вместе с ETag и пересобирает их
+лишь при смене :attr:`ActionHandlerRegistry.version` (любая
+регистрация или ``clear``). ETag — хеш содержимого, поэтому совпадает
+между воркерами и позволяет клиентам получать ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.backend.dsl.commands.action_registry import ActionHandlerRegistry
+
+__all__ = ("WsdlCache", "build_wsdl")
+
+_WSDL_NS = "http://schemas.xmlsoap.org/wsdl/"
+_XSD_NS = "http://www.w3.org/2001/XMLSchema"
+_TARGET_NS = "http://gd-integration-tools/soap"
+
+
+def build_wsdl(actions: tuple[str, ...]) -> str:
+    """Генерирует WSDL-документ для переданных action-имён."""
+    operations_xsd = []
+    port_operations = []
+    binding_operations = []
+
+    for action in actions:
+        safe_name = action.replace(".", "_")
+        operations_xsd.append(
+            f'    <xsd:element name="{safe_name}">'
+            f"      <xsd:complexType><xsd:sequence>"
+            f'        <xsd:element name="payload" type="xsd:string" minOccurs="0"/>'
+            f"      </xsd:sequence></xsd:complexType>"
+            f"    </xsd:element>"
+            f'    <xsd:element name="{safe_name}Response">'
+            f"      <xsd:complexType><xsd:sequence>"
+            f'        <xsd:element name="result" type="xsd:string" minOccurs="0"/>'
+            f"      </xsd:sequence></xsd:complexType>"
+            f"    </xsd:element>"
+        )
+        port_operations.append(
+            f'    <wsdl:operation name="{safe_name}">'
+            f'      <wsdl:input message="tns:{safe_name}Request"/>'
+            f'      <wsdl:output message="tns:{safe_name}Response"/>'
+            f"    </wsdl:operation>"
+        )
+        binding_operations.append(
+            f'    <wsdl:operation name="{safe_name}">'
+            f'      <soap:operation soapAction="{action}"/>'
+            f'      <wsdl:input><soap:body use="literal"/></wsdl:input>'
+            f'      <wsdl:output><soap:body use="literal"/></wsdl:output>'
+            f"    </wsdl:operation>"
+        )
+
+    messages = []
+    for action in actions:
+        safe_name = action.replace(".", "_")
+        messages.append(
+            f'  <wsdl:message name="{safe_name}Request">'
+            f'    <wsdl:part name="parameters" element="tns:{safe_name}"/>'
+            f"  </wsdl:message>"
+            f'  <wsdl:message name="{safe_name}Response">'
+            f'    <wsdl:part name="parameters" element="tns:{safe_name}Response"/>'
+            f"  </wsdl:message>"
+        )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<wsdl:definitions xmlns:wsdl="{_WSDL_NS}" '
+        f'xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/" '
+        f'xmlns:xsd="{_XSD_NS}" '
+        f'xmlns:tns="{_TARGET_NS}" '
+        f'targetNamespace="{_TARGET_NS}">'
+        f'  <wsdl:types><xsd:schema targetNamespace="{_TARGET_NS}">'
+        + "\n".join(operations_xsd)
+        + "  </xsd:schema></wsdl:types>"
+        + "\n".join(messages)
+        + '  <wsdl:portType name="IntegrationPortType">'
+        + "\n".join(port_operations)
+        + "  </wsdl:portType>"
+        + '  <wsdl:binding name="IntegrationBinding" type="tns:IntegrationPortType">'
+        + '    <soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>'
+        + "\n".join(binding_operations)
+        + "  </wsdl:binding>"
+        + "</wsdl:definitions>"
+    )
+
+
+class WsdlCache:
+    """Готовый WSDL (байты + ETag), инвалидируемый по версии реестра."""
+
+    __slots__ = ("_document", "_etag", "_key")
+
+    def __init__(self) -> None:
+        self._key: tuple[int, int] | None = None
+        self._document = b""
+        self._etag = ""
+
+    def get(self, registry: ActionHandlerRegistry) -> tuple[bytes, str]:
+        """Вернуть ``(document, etag)``; пересборка — только при смене версии."""
+        key = (id(registry), registry.version)
+        if key != self._key:
+            document = build_wsdl(registry.list_actions()).encode()
+            digest = hashlib.blake2b(document, digest_size=12).hexdigest()
+            self._document, self._etag = document, f'"{digest}"'
+            self._key = key
+        return self._document, self._etag
+
+    def clear(self) -> None:
+        """Сбросить кеш (следующий :meth:`get` пересоберёт документ)."""
+        self._key = None
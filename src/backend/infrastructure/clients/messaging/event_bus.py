@@ -120,6 +120,8 @@ class EventBus:
         self._broker: Any = None
         self._started = False
         self._schema_registry = schema_registry
+        # Скомпилированные validator'ы по subject (пересборка при смене схемы).
+        self._validators: Any = None
         # S182: QuotaTracker для rate limiting (per-channel)
         self._quota = QuotaTracker(prefix="eventbus")
 
@@ -161,7 +163,14 @@ class EventBus:
         try:
             import jsonschema
 
-            jsonschema.validate(instance=event.model_dump(), schema=entry.spec_schema)
+            if self._validators is None:
+                from src.backend.infrastructure.eventing.schema_registry import (
+                    JsonValidatorCache,
+                )
+
+                self._validators = JsonValidatorCache()
+            compiled = self._validators.get(subject, entry.spec_schema)
+            compiled.validate(event.model_dump())
         except jsonschema.ValidationError as exc:  # pragma: no cover
             raise EventSchemaValidationError(
                 channel=channel, event_type=event_type, reason=exc.message
@@ -6,10 +6,15 @@
 Стратегия:
 
 * Поступающие строки буферизуются в ``asyncio.Queue`` (bounded).
-* Фоновый flusher задача периодически или при достижении буфера
-  ``max_buffer_size`` делает single batch INSERT.
 * Reflush triggers: timer (``flush_interval_seconds``) ИЛИ
-  buffer-overflow (``max_buffer_size``).
+  buffer-overflow (``max_buffer_size``): ``add()`` будит flusher, как
+  только в очереди набирается полный batch, — пропускная способность
+  не ограничена ``max_buffer_size`` строк за интервал.
+* Batch'и уходят параллельно: до ``max_inflight`` INSERT'ов в полёте;
+  при исчерпании слотов flusher ждёт, очередь заполняется и ``add()``
+  блокируется (backpressure).
+* Если клиент умеет ``insert_columnar`` (:class:`ClickHouseClient`),
+  batch кодируется колоночно и сжимается; иначе — ``insert``.
 * Graceful shutdown: ``aclose()`` дожидается финального flush.
 
 Использование:
@@ -76,6 +81,7 @@ class ClickHouseBulkWriter:
         flush_interval_seconds: timer-flush период (default 1.0s).
         queue_max_size: capacity ``asyncio.Queue`` (default 10000).
         on_failure: опц. callback при flush failure (envelope → DLQ).
+        max_inflight: макс. число одновременных INSERT'ов (default 4).
 
     """
 
@@ -88,6 +94,7 @@ class ClickHouseBulkWriter:
         flush_interval_seconds: float = 1.0,
         queue_max_size: int = 10_000,
         on_failure: Any = None,
+        max_inflight: int = 4,
     ) -> None:
         self._client = client
         self._table = table
@@ -97,8 +104,13 @@ class ClickHouseBulkWriter:
             maxsize=queue_max_size
         )
         self._stop = asyncio.Event()
+        self._wakeup = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
         self._on_failure = on_failure
+        self._slots = asyncio.Semaphore(max(1, max_inflight))
+        self._inflight: set[asyncio.Task[int]] = set()
+        insert_columnar = getattr(client, "insert_columnar", None)
+        self._insert = insert_columnar if insert_columnar is not None else client.insert
         self.stats = BulkWriterStats()
 
     async def start(self) -> None:
@@ -115,22 +127,43 @@ class ClickHouseBulkWriter:
     async def add(self, row: dict[str, Any]) -> None:
         """Поставить строку в очередь. Блокирует если queue full."""
         await self._queue.put(row)
-        self.stats.rows_buffered = self._queue.qsize()
+        buffered = self.stats.rows_buffered = self._queue.qsize()
+        if buffered >= self._max_buffer_size:
+            self._wakeup.set()
 
     async def add_many(self, rows: list[dict[str, Any]]) -> None:
-        """Метод add_many (см. signature)."""
+        """Поставить строки в очередь; блокирует, пока queue full.
+
+        Как только набирается полный batch, flusher будится и получает
+        управление — INSERT'ы стартуют, не дожидаясь конца ``rows``.
+        """
+        queue = self._queue
         for row in rows:
-            await self.add(row)
+            if queue.full():
+                self._wakeup.set()
+                await queue.put(row)
+            else:
+                queue.put_nowait(row)
+            if queue.qsize() >= self._max_buffer_size and not self._wakeup.is_set():
+                self._wakeup.set()
+                await asyncio.sleep(0)
+        self.stats.rows_buffered = queue.qsize()
 
     async def flush_now(self) -> int:
-        """Принудительный flush текущего буфера. Возвращает число записей."""
-        return await self._drain_and_insert()
+        """Принудительный flush текущего буфера. Возвращает число записей.
+
+        Дожидается и batch'ей, уже находящихся в полёте.
+        """
+        tasks = await self._dispatch(partial=True)
+        flushed = await asyncio.gather(*tasks)
+        if self._inflight:
+            await asyncio.gather(*self._inflight)
+        return sum(flushed)
 
     async def aclose(self) -> None:
-        """Graceful shutdown: финальный flush + остановка задачи."""
+        """Graceful shutdown: остановка задачи + финальный flush."""
         self._stop.set()
-        # финальный drain
-        await self._drain_and_insert()
+        self._wakeup.set()
         if self._task is not None:
             try:
                 await asyncio.wait_for(self._task, timeout=5.0)
@@ -139,31 +172,65 @@ class ClickHouseBulkWriter:
                 with _suppress_cancel():
                     await self._task
             self._task = None
+        # финальный drain
+        await self.flush_now()
 
     async def _run(self) -> None:
         """Фоновый цикл: timer-flush + buffer-overflow flush."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
         while not self._stop.is_set():
             try:
-                await asyncio.wait_for(self._stop.wait(), timeout=self._flush_interval)
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=max(0.0, deadline - loop.time())
+                )
             except TimeoutError:
                 pass  # timer triggered → flush
-            await self._drain_and_insert()
-
-    async def _drain_and_insert(self) -> int:
-        """Извлечь все строки из очереди и сделать один INSERT."""
-        batch: list[dict[str, Any]] = []
-        while not self._queue.empty() and len(batch) < self._max_buffer_size:
-            batch.append(self._queue.get_nowait())
+            self._wakeup.clear()
+            if self._stop.is_set():
+                return
+            if loop.time() >= deadline:
+                await self._dispatch(partial=True)
+                deadline = loop.time() + self._flush_interval
+            else:
+                # overflow: только полные batch'и, хвост ждёт таймера.
+                await self._dispatch(partial=False)
+
+    async def _dispatch(self, *, partial: bool) -> list[asyncio.Task[int]]:
+        """Разобрать очередь на batch'и и запустить их INSERT'ы.
+
+        ``partial=False`` — только полные batch'и по ``max_buffer_size``.
+        Ждёт свободного слота ``max_inflight`` перед каждым batch'ем.
+        """
+        from src.backend.core.utils.task_registry import get_task_registry
 
-        if not batch:
-            return 0
+        tasks: list[asyncio.Task[int]] = []
+        while self._queue.qsize() >= self._max_buffer_size or (
+            partial and not self._queue.empty()
+        ):
+            await self._slots.acquire()
+            batch: list[dict[str, Any]] = []
+            while not self._queue.empty() and len(batch) < self._max_buffer_size:
+                batch.append(self._queue.get_nowait())
+            self.stats.rows_buffered = self._queue.qsize()
+            if not batch:
+                self._slots.release()
+                break
+            task = get_task_registry().create_task(
+                self._insert_batch(batch), name=f"chbulk-{self._table}-flush"
+            )
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+            tasks.append(task)
+        return tasks
 
+    async def _insert_batch(self, batch: list[dict[str, Any]]) -> int:
+        """Один INSERT batch'а; освобождает слот ``max_inflight``."""
         try:
-            await self._client.insert(self._table, batch)
+            await self._insert(self._table, batch)
             self.stats.rows_flushed += len(batch)
             self.stats.flush_count += 1
             self.stats.last_flush_at = time.time()
-            self.stats.rows_buffered = self._queue.qsize()
             return len(batch)
         except Exception as exc:
             self.stats.flush_failures += 1
@@ -183,25 +250,31 @@ class ClickHouseBulkWriter:
                         "requeueing batch of %d rows to avoid loss",
                         len(batch),
                     )
+                    requeued = 0
                     try:
+                        # put_nowait: ожидание места в очереди из слота
+                        # ``max_inflight`` могло бы заблокировать flusher.
                         for row in batch:
-                            await self._queue.put(row)
-                    except Exception as requeue_exc:
+                            self._queue.put_nowait(row)
+                            requeued += 1
+                    except asyncio.QueueFull as requeue_exc:
                         # M5.3: track permanently-failed rows in metrics.
                         # Pre-M5: только ERROR-лог (трудно алёртить).
                         # Post-M5: ``self.stats.rows_lost`` мониторим через
                         # Prometheus; >0 → алёрт в Grafana.
-                        self.stats.rows_lost += len(batch)
+                        self.stats.rows_lost += len(batch) - requeued
                         logger.error(
                             "clickhouse_bulk.REQUEUE_FAILED: %d rows "
                             "PERMANENTLY LOST (callback=%s, requeue=%s, "
                             "table=%s)",
-                            len(batch),
+                            len(batch) - requeued,
                             cb_exc,
                             requeue_exc,
                             self._table,
                         )
             return 0
+        finally:
+            self._slots.release()
 
 
 class _suppress_cancel:
@@ -14,6 +14,7 @@ from src.backend.core.resilience.breaker import (
     CircuitOpen,
     get_breaker_registry,
 )
+from src.backend.infrastructure.clients.transport.smtp_pool import SmtpSessionPool
 
 __all__ = ("BaseSmtpClient", "SmtpClient", "get_smtp_client", "smtp_client")
 
@@ -59,9 +60,8 @@ class SmtpClient(BaseSmtpClient):
         self.settings = settings
         self.logger = get_logger("smtp")
         self._pool_size = self.settings.connection_pool_size
-        self._connection_pool: asyncio.Queue[SMTP] = asyncio.Queue(
-            maxsize=self._pool_size
-        )
+        # Сессии открываются лениво и переиспользуются между письмами.
+        self._sessions = self._new_session_pool()
         self._breaker = get_breaker_registry().get_or_create(
             "smtp",
             BreakerSpec(
@@ -92,15 +92,12 @@ class SmtpClient(BaseSmtpClient):
             RuntimeError: Если инициализация пула не удалась.
 
         """
-        if self._connection_pool:
+        if self._sessions.idle or self._sessions.in_use:
             self.logger.info("SMTP-пул уже инициализирован")
             return
 
         try:
-            for _ in range(self._pool_size):
-                connection = await self._create_connection()
-                self._connection_pool.put_nowait(connection)
-
+            await self._sessions.warm()
             self.logger.info(
                 "Инициализирован пул SMTP с %s соединениями", self._pool_size
             )
@@ -113,16 +110,17 @@ class SmtpClient(BaseSmtpClient):
 
     async def close_pool(self) -> None:
         """Корректно закрывает все соединения в пуле."""
-        while not self._connection_pool.empty():
-            connection = self._connection_pool.get_nowait()
-            try:
-                await connection.quit()
-            except SMTPException as exc:
-                self.logger.warning(
-                    f"Ошибка при закрытии соединения: {exc!s}", exc_info=True
-                )
+        await self._sessions.aclose()
+        # Закрытый пул не выдаёт сессий — новый нужен для повторного старта.
+        self._sessions = self._new_session_pool()
         self.logger.info("Пул SMTP-соединений закрыт")
 
+    def _new_session_pool(self) -> SmtpSessionPool:
+        """Пул сессий поверх :meth:`_create_connection`."""
+        return SmtpSessionPool(
+            self._create_connection, max_size=self._pool_size, name="smtp"
+        )
+
     async def _create_connection(self) -> SMTP:
         """Создает новое аутентифицированное SMTP-соединение с обработкой тайм-аутов.
 
@@ -172,24 +170,17 @@ class SmtpClient(BaseSmtpClient):
         ``ConnectionError`` для сохранения back-compat контракта.
 
         Yields:
-            SMTP: SMTP-соединение из пула или новое временное соединение.
+            SMTP: Сессия из :class:`SmtpSessionPool` (ошибка внутри блока
+            закрывает её, успешная — возвращает в пул).
 
         Raises:
             ConnectionError: Если сработал Circuit Breaker или соединение не удалось.
 
         """
-        connection: SMTP | None = None
-        temporary = False
-
         try:
             async with self._breaker.guard():
-                if not self._connection_pool.empty():
-                    connection = self._connection_pool.get_nowait()
-                else:
-                    connection = await self._create_connection()
-                    temporary = True
-
-                yield connection
+                async with self._sessions.acquire() as connection:
+                    yield connection
 
         except CircuitOpen:
             # Breaker open — re-raise as ConnectionError (back-compat)
@@ -206,70 +197,6 @@ class SmtpClient(BaseSmtpClient):
                 exc_info=True,
             )
             raise
-        finally:
-            if connection is not None:
-                await self._release_connection(
-                    connection=connection, temporary=temporary
-                )
-
-    async def _acquire_connection(self) -> SMTP:
-        """Получает SMTP-соединение из пула с повторными попытками через tenacity.
-
-        K3 W1: замена custom retry-loop (range(3) + sleep) на make_async_retry.
-        Retry выполняется при SMTPException / TimeoutError / ConnectionError / OSError
-        с линейным backoff 1s → 2s → 3s (3 попытки суммарно).
-
-        Returns:
-            SMTP: Действительное SMTP-соединение.
-
-        Raises:
-            ConnectionError: Если все попытки соединения исчерпаны.
-
-        """
-        from src.backend.core.resilience.retry import make_async_retry
-
-        @make_async_retry(
-            max_attempts=3,
-            initial_backoff=1.0,
-            multiplier=1.0,
-            max_backoff=3.0,
-            on=(SMTPException, TimeoutError, ConnectionError, OSError),
-        )
-        async def _try_get() -> SMTP:
-            """Одна попытка получить соединение из пула или создать новое."""
-            self.logger.info(
-                "Размер пула соединений: %d", self._connection_pool.qsize()
-            )
-            if self._connection_pool:
-                return self._connection_pool.get_nowait()
-            return await self._create_connection()
-
-        try:
-            return await _try_get()
-        except (SMTPException, TimeoutError, ConnectionError, OSError) as exc:
-            self.logger.error("Попытки SMTP-соединения исчерпаны: %s", exc)
-            raise ConnectionError("Не удалось получить SMTP-соединение") from exc
-
-    async def _release_connection(
-        self, connection: SMTP, temporary: bool = False
-    ) -> None:
-        """Возвращает соединение в пул или закрывает его."""
-        try:
-            if connection.is_connected:
-                await connection.noop()
-
-                if not temporary and self._connection_pool.qsize() < self._pool_size:
-                    self._connection_pool.put_nowait(connection)
-                    return
-        except (SMTPException, OSError):
-            self.logger.warning(
-                "Ошибка проверки SMTP-соединения при возврате в пул", exc_info=True
-            )
-
-        try:
-            await connection.quit()
-        except (SMTPException, OSError):
-            self.logger.warning("Ошибка закрытия SMTP-соединения", exc_info=True)
 
     def metrics(self) -> dict[str, Any]:
         """Возвращает текущие метрики сервиса.
@@ -279,9 +206,9 @@ class SmtpClient(BaseSmtpClient):
 
         """
         return {
-            "pool_capacity": f"{self._connection_pool.qsize()}/{self._pool_size}",
+            "pool_capacity": f"{self._sessions.idle}/{self._pool_size}",
             "circuit_state": self._breaker.state,
-            "active_connections": self._connection_pool.qsize(),
+            "active_connections": self._sessions.in_use,
         }
 
     async def send_email(
@@ -314,8 +241,14 @@ class SmtpClient(BaseSmtpClient):
         else:
             message.set_content(body)
 
-        async with self.get_connection() as smtp:
-            await smtp.send_message(message)
+        # send_message пула сам переоткрывает разорванную сервером сессию.
+        try:
+            async with self._breaker.guard():
+                await self._sessions.send_message(message)
+        except CircuitOpen:
+            raise ConnectionError(
+                "SMTP-сервис недоступен (активирован Circuit Breaker)"
+            ) from None
 
     async def test_connection(self) -> bool:
         """Выполняет end-to-end тест соединения с отправкой тестового письма.
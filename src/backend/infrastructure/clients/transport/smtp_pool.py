@@ -0,0 +1,218 @@
+"""Пул аутентифицированных SMTP-сессий.
+
+``EmailSink`` вызывал ``aiosmtplib.send`` на каждое письмо, а
+``SmtpClient`` из-за проверки ``if self._connection_pool`` (очередь всегда
+truthy) так и не наполнял свой пул и открывал временное соединение на
+каждое письмо. В итоге каждое сообщение платило TCP connect + EHLO +
+STARTTLS + AUTH + QUIT, и массовые рассылки упирались в latency handshake,
+а не в скорость приёма сервером.
+
+:class:`SmtpSessionPool` держит до ``max_size`` сессий, открытых фабрикой
+``connect`` (она же выполняет STARTTLS/AUTH), и переиспользует их между
+отправками:
+
+* LIFO-выдача — «тёплая» сессия используется первой, лишние стареют;
+* idle-рециклинг: сессия, простоявшая дольше ``max_idle`` секунд,
+  закрывается при выдаче (серверы рвут простаивающие соединения);
+* после ``max_messages`` писем сессия закрывается через ``QUIT``
+  (лимиты писем на соединение у провайдеров);
+* error-рециклинг: любое исключение внутри :meth:`acquire` выбрасывает
+  сессию без возврата в пул;
+* :meth:`send_message` проверяет переиспользованную сессию ``NOOP`` и,
+  если сервер её уже закрыл, открывает новую; сама отправка не
+  повторяется — разрыв после ``DATA`` мог наступить, когда письмо уже
+  принято, и повтор дал бы дубль.
+
+Метрика: ``smtp_pool_sessions_total{pool,event}`` (opened / reused /
+recycled / discarded).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
+
+__all__ = ("SmtpSessionPool",)
+
+_logger = get_logger(__name__)
+
+smtp_pool_sessions_total = metrics_registry.counter(
+    "smtp_pool_sessions_total",
+    "SMTP session pool lifecycle events.",
+    labels=("pool", "event"),
+)
+
+#: Граница на вежливый ``QUIT`` при рециклинге сессии.
+_QUIT_TIMEOUT = 5.0
+
+
+@dataclass(slots=True)
+class _Session:
+    """SMTP-соединение и счётчики для рециклинга."""
+
+    smtp: Any
+    last_used: float
+    messages: int = 0
+    reused: bool = False
+
+
+class SmtpSessionPool:
+    """Ограниченный пул переиспользуемых SMTP-сессий.
+
+    Args:
+        connect: Фабрика, возвращающая подключённый и аутентифицированный
+            ``aiosmtplib.SMTP``.
+        max_size: Максимум одновременно открытых сессий.
+        max_idle: Сколько секунд сессия может простаивать в пуле.
+        max_messages: После скольких писем сессия закрывается.
+        name: Метка пула в метриках и логах.
+
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        *,
+        max_size: int = 4,
+        max_idle: float = 30.0,
+        max_messages: int = 100,
+        name: str = "smtp",
+    ) -> None:
+        self._connect = connect
+        self._max_size = max_size
+        self._max_idle = max_idle
+        self._max_messages = max_messages
+        self._name = name
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: deque[_Session] = deque()
+        self._in_use = 0
+        self._closed = False
+
+    @property
+    def max_size(self) -> int:
+        """Максимум одновременно открытых сессий."""
+        return self._max_size
+
+    @property
+    def idle(self) -> int:
+        """Число сессий, ожидающих в пуле."""
+        return len(self._idle)
+
+    @property
+    def in_use(self) -> int:
+        """Число выданных сейчас сессий."""
+        return self._in_use
+
+    async def warm(self, count: int | None = None) -> None:
+        """Заранее открыть ``count`` сессий (по умолчанию — ``max_size``)."""
+        target = min(self._max_size, count if count is not None else self._max_size)
+        while len(self._idle) + self._in_use < target:
+            self._idle.append(await self._open())
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Выдать SMTP-сессию; ошибка внутри блока закрывает сессию.
+
+        Yields:
+            ``aiosmtplib.SMTP`` — подключённая сессия.
+
+        """
+        async with self._slots:
+            async with self._use(await self._checkout()) as session:
+                yield session.smtp
+
+    async def send_message(self, message: Any, **kwargs: Any) -> Any:
+        """Отправить письмо через пул (``SMTP.send_message``).
+
+        Переиспользованная сессия, которую сервер закрыл за время простоя,
+        заменяется новой ещё до ``MAIL FROM``; ошибки самой отправки
+        пробрасываются без повтора.
+        """
+        async with self._slots:
+            session = await self._checkout()
+            if session.reused and not await self._probe(session):
+                session = await self._open()
+            async with self._use(session):
+                return await session.smtp.send_message(message, **kwargs)
+
+    async def aclose(self) -> None:
+        """Закрыть простаивающие сессии; выданные закроются при возврате."""
+        self._closed = True
+        while self._idle:
+            await self._quit(self._idle.pop(), event="recycled")
+
+    @asynccontextmanager
+    async def _use(self, session: _Session) -> AsyncIterator[_Session]:
+        self._in_use += 1
+        try:
+            yield session
+        except BaseException:
+            self._in_use -= 1
+            self._discard(session)
+            raise
+        self._in_use -= 1
+        session.messages += 1
+        await self._checkin(session)
+
+    async def _checkout(self) -> _Session:
+        now = time.monotonic()
+        while self._idle:
+            session = self._idle.pop()
+            if now - session.last_used > self._max_idle:
+                await self._quit(session, event="recycled")
+                continue
+            if not session.smtp.is_connected:
+                self._discard(session)
+                continue
+            session.reused = True
+            smtp_pool_sessions_total.labels(pool=self._name, event="reused").inc()
+            return session
+        return await self._open()
+
+    async def _checkin(self, session: _Session) -> None:
+        if self._closed or session.messages >= self._max_messages:
+            await self._quit(session, event="recycled")
+            return
+        if not session.smtp.is_connected:
+            self._discard(session)
+            return
+        session.last_used = time.monotonic()
+        self._idle.append(session)
+
+    async def _probe(self, session: _Session) -> bool:
+        try:
+            await session.smtp.noop()
+        except Exception as exc:
+            _logger.debug("SMTP pool %s: stale session (%s)", self._name, exc)
+            self._discard(session)
+            return False
+        return True
+
+    async def _open(self) -> _Session:
+        smtp = await self._connect()
+        smtp_pool_sessions_total.labels(pool=self._name, event="opened").inc()
+        return _Session(smtp=smtp, last_used=time.monotonic())
+
+    async def _quit(self, session: _Session, *, event: str) -> None:
+        smtp_pool_sessions_total.labels(pool=self._name, event=event).inc()
+        try:
+            async with asyncio.timeout(_QUIT_TIMEOUT):
+                await session.smtp.quit()
+        except Exception:
+            session.smtp.close()
+
+    def _discard(self, session: _Session) -> None:
+        # Состояние протокола после ошибки неизвестно — без QUIT.
+        smtp_pool_sessions_total.labels(pool=self._name, event="discarded").inc()
+        try:
+            session.smtp.close()
+        except Exception:
+            _logger.debug("SMTP pool %s: close failed", self._name, exc_info=True)
@@ -5,26 +5,130 @@ Confluent-совместимый endpoint.
 * Валидация incoming/outgoing событий по JSON-Schema или Avro.
 * Ранний отказ при несовместимой эволюции schema.
 * Версионирование per topic + fallback-cache при недоступности registry.
+
+Скомпилированные валидаторы:
+``jsonschema.validate`` на каждый вызов заново проверяет саму схему
+(``check_schema``) и строит validator, а ``fastavro.parse_schema`` — разбор
+Avro-схемы; при валидации каждого сообщения это доминировало над
+полезной работой. Теперь схема компилируется один раз на subject и живёт,
+пока subject не перерегистрирован (:class:`JsonValidatorCache` сверяет
+идентичность объекта схемы, ``register_*`` сбрасывает запись).
+Пакетные :meth:`SchemaRegistry.validate_json_many` и
+:meth:`SchemaRegistry.decode_avro_many` проходят список сообщений с одним
+разрешением схемы.
+
+Метрика: ``schema_registry_compile_total{format}`` — число компиляций.
 """
 
 from __future__ import annotations
 
+import io
 import json
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Any
 
 from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
 
-__all__ = ("SchemaRegistry", "SchemaRegistryError", "get_schema_registry")
+__all__ = (
+    "CompiledJsonSchema",
+    "JsonValidatorCache",
+    "SchemaRegistry",
+    "SchemaRegistryError",
+    "compile_json_schema",
+    "get_schema_registry",
+)
 
 logger = get_logger("eventing.schema_registry")
 
+schema_registry_compile_total = metrics_registry.counter(
+    "schema_registry_compile_total",
+    "Schema compilations (JSON Schema validators, parsed Avro schemas).",
+    labels=("format",),
+)
+
 
 class SchemaRegistryError(RuntimeError):
     """Ошибка работы с schema registry."""
 
 
+@dataclass(slots=True)
+class CompiledJsonSchema:
+    """JSON Schema с готовым validator-экземпляром.
+
+    Семантика :meth:`validate` совпадает с ``jsonschema.validate``:
+    поднимается наиболее релевантная ошибка (``best_match``).
+    """
+
+    schema: Any
+    validator: Any
+    best_match: Callable[..., Any]
+
+    def first_error(self, payload: Any) -> Any | None:
+        """``ValidationError`` для ``payload`` или ``None``, если он валиден."""
+        return self.best_match(self.validator.iter_errors(payload))
+
+    def validate(self, payload: Any) -> None:
+        """Проверить ``payload``; raises ``jsonschema.ValidationError``."""
+        error = self.best_match(self.validator.iter_errors(payload))
+        if error is not None:
+            raise error
+
+
+def compile_json_schema(schema: Any) -> CompiledJsonSchema:
+    """Проверить схему и построить validator под её ``$schema``-диалект.
+
+    Raises:
+        ImportError: ``jsonschema`` не установлен.
+        jsonschema.SchemaError: Схема некорректна.
+
+    """
+    import jsonschema
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    schema_registry_compile_total.labels(format="json").inc()
+    return CompiledJsonSchema(
+        schema=schema,
+        validator=validator_cls(schema),
+        best_match=jsonschema.exceptions.best_match,
+    )
+
+
+class JsonValidatorCache:
+    """Скомпилированные JSON Schema по ключу (subject).
+
+    Запись действительна, пока под ключом передаётся тот же объект схемы:
+    новая схема (новый dict) компилируется заново. Изменение dict'а
+    на месте не отслеживается — для этого есть :meth:`invalidate`.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[str, CompiledJsonSchema] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, schema: Any) -> CompiledJsonSchema:
+        """Скомпилированная ``schema`` для ``key`` (компиляция при промахе)."""
+        compiled = self._entries.get(key)
+        if compiled is None or compiled.schema is not schema:
+            compiled = compile_json_schema(schema)
+            self._entries[key] = compiled
+        return compiled
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Сбросить запись ``key`` (``None`` — весь кеш)."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
 @dataclass(slots=True)
 class SchemaRegistry:
     """In-memory schema registry с опциональным удалённым backend.
@@ -37,6 +141,8 @@ class SchemaRegistry:
     endpoint: str = ""
     _json_cache: dict[str, dict[str, Any]] = field(default_factory=dict)
     _avro_cache: dict[str, str] = field(default_factory=dict)
+    _json_validators: JsonValidatorCache = field(default_factory=JsonValidatorCache)
+    _avro_parsed: dict[str, Any] = field(default_factory=dict)
 
     def register_json(self, subject: str, schema: dict[str, Any]) -> None:
         """Register a JSON schema for a subject.
@@ -47,6 +153,7 @@ class SchemaRegistry:
 
         """
         self._json_cache[subject] = schema
+        self._json_validators.invalidate(subject)
 
     def register_avro(self, subject: str, schema_str: str) -> None:
         """Register an Avro schema for a subject.
@@ -57,6 +164,7 @@ class SchemaRegistry:
 
         """
         self._avro_cache[subject] = schema_str
+        self._avro_parsed.pop(subject, None)
 
     def get_json(self, subject: str) -> dict[str, Any] | None:
         """Get JSON schema by subject.
@@ -93,20 +201,40 @@ class SchemaRegistry:
             SchemaRegistryError: If schema not found or validation fails.
 
         """
-        schema = self.get_json(subject)
-        if not schema:
-            raise SchemaRegistryError(f"JSON schema not found: {subject}")
+        compiled = self._compiled_json(subject)
+        if compiled is None:
+            return
         try:
-            from jsonschema import validate
-
-            validate(instance=payload, schema=schema)
-        except ImportError:
-            logger.warning(
-                "jsonschema не установлен — validation skipped для %s", subject
-            )
+            compiled.validate(payload)
         except Exception as exc:
             raise SchemaRegistryError(f"{subject}: {exc}") from exc
 
+    def validate_json_many(
+        self, subject: str, payloads: Iterable[Any]
+    ) -> list[str | None]:
+        """Validate a batch of payloads against one JSON schema.
+
+        Args:
+            subject: Schema subject identifier.
+            payloads: Payloads to validate.
+
+        Returns:
+            Per-payload error message, ``None`` for valid payloads.
+
+        Raises:
+            SchemaRegistryError: If schema not found or invalid.
+
+        """
+        compiled = self._compiled_json(subject)
+        if compiled is None:
+            return [None for _ in payloads]
+        first_error = compiled.first_error
+        errors: list[str | None] = []
+        for payload in payloads:
+            error = first_error(payload)
+            errors.append(None if error is None else error.message)
+        return errors
+
     def validate_avro(self, subject: str, payload: bytes) -> dict[str, Any]:
         """Validate and decode Avro payload.
 
@@ -121,21 +249,73 @@ class SchemaRegistry:
             SchemaRegistryError: If schema not found or validation fails.
 
         """
+        reader, schema = self._avro_reader(subject)
+        try:
+            return reader(io.BytesIO(payload), schema)  # type: ignore[no-any-return]
+        except Exception as exc:
+            raise SchemaRegistryError(f"{subject}: {exc}") from exc
+
+    def decode_avro_many(
+        self, subject: str, payloads: Iterable[bytes]
+    ) -> list[dict[str, Any]]:
+        """Validate and decode a batch of Avro payloads.
+
+        Args:
+            subject: Schema subject identifier.
+            payloads: Avro-encoded messages.
+
+        Returns:
+            Decoded payloads in input order.
+
+        Raises:
+            SchemaRegistryError: If schema not found or any payload fails
+                (message carries the payload index).
+
+        """
+        reader, schema = self._avro_reader(subject)
+        records: list[dict[str, Any]] = []
+        for index, payload in enumerate(payloads):
+            try:
+                records.append(reader(io.BytesIO(payload), schema))
+            except Exception as exc:
+                raise SchemaRegistryError(f"{subject}[{index}]: {exc}") from exc
+        return records
+
+    def _compiled_json(self, subject: str) -> CompiledJsonSchema | None:
+        """Скомпилированная схема subject'а; ``None`` — jsonschema нет."""
+        schema = self.get_json(subject)
+        if not schema:
+            raise SchemaRegistryError(f"JSON schema not found: {subject}")
+        try:
+            return self._json_validators.get(subject, schema)
+        except ImportError:
+            logger.warning(
+                "jsonschema не установлен — validation skipped для %s", subject
+            )
+            return None
+        except Exception as exc:
+            raise SchemaRegistryError(f"{subject}: {exc}") from exc
+
+    def _avro_reader(self, subject: str) -> tuple[Callable[..., Any], Any]:
+        """``(schemaless_reader, parsed_schema)``; схема разбирается один раз."""
         schema_str = self.get_avro(subject)
         if not schema_str:
             raise SchemaRegistryError(f"Avro schema not found: {subject}")
         try:
             import fastavro
-
-            schema = fastavro.parse_schema(json.loads(schema_str))
-            import io
-
-            bio = io.BytesIO(payload)
-            return fastavro.schemaless_reader(bio, schema)  # type: ignore[return-value]
         except ImportError:
             raise SchemaRegistryError(
                 "fastavro не установлен — Avro validation недоступна"
             )
+        parsed = self._avro_parsed.get(subject)
+        if parsed is None:
+            try:
+                parsed = fastavro.parse_schema(json.loads(schema_str))
+            except Exception as exc:
+                raise SchemaRegistryError(f"{subject}: {exc}") from exc
+            schema_registry_compile_total.labels(format="avro").inc()
+            self._avro_parsed[subject] = parsed
+        return fastavro.schemaless_reader, parsed
 
 
 @lru_cache(maxsize=1)
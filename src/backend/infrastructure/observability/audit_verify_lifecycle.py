@@ -3,7 +3,10 @@
 Wire'ит периодический вызов :meth:`ImmutableAuditStore.verify` в background
 asyncio-задачу через :class:`TaskRegistry`. ``verify()`` проходит по всей
 HMAC-цепочке ``audit_log_immutable`` и детектирует tampering (удаление /
-редактирование / подмену ключа). Без этого периодического вызова HMAC-chain
+редактирование / подмену ключа). Между полными проходами (каждая
+``full_verify_every``-я итерация; ``try_start_default`` — раз в 7 итераций)
+выполняется incremental verify — только события после checkpoint'а
+предыдущей успешной проверки. Без этого периодического вызова HMAC-chain
 **формально существует, но tamper detection нефункционален** (H5).
 
 Архитектурные принципы (mirror :mod:`infrastructure.messaging.dlq.cleanup_lifecycle`):
@@ -68,16 +71,26 @@ class AuditVerifyScheduler:
     Args:
         store: :class:`ImmutableAuditStore` (поверх Postgres session_factory).
         interval_hours: период запуска verify() (default 24h).
+        full_verify_every: каждая N-я итерация — полный проход цепочки,
+            остальные — incremental от checkpoint'а (default ``1`` — всегда
+            полный).
 
     """
 
     def __init__(
-        self, *, store: ImmutableAuditStore, interval_hours: float = 24.0
+        self,
+        *,
+        store: ImmutableAuditStore,
+        interval_hours: float = 24.0,
+        full_verify_every: int = 1,
     ) -> None:
         if interval_hours <= 0:
             raise ValueError("interval_hours должен быть > 0")
+        if full_verify_every < 1:
+            raise ValueError("full_verify_every должен быть >= 1")
         self._store = store
         self._interval_seconds = interval_hours * 3600.0
+        self._full_verify_every = full_verify_every
         self._running = False
         self._task: asyncio.Task[None] | None = None
         self._runs_total: int = 0
@@ -130,7 +143,10 @@ class AuditVerifyScheduler:
         """
         while self._running:
             try:
-                result = await self._store.verify()
+                if self._runs_total % self._full_verify_every:
+                    result = await self._store.verify(incremental=True)
+                else:
+                    result = await self._store.verify()
                 self._runs_total += 1
                 if result.valid:
                     _logger.info(
@@ -167,20 +183,29 @@ default_scheduler: AuditVerifyScheduler | None = None
 
 
 async def start_audit_verify(
-    *, store: ImmutableAuditStore, interval_hours: float = 24.0
+    *,
+    store: ImmutableAuditStore,
+    interval_hours: float = 24.0,
+    full_verify_every: int = 7,
 ) -> None:
     """Запустить default audit verify scheduler (idempotent).
 
     Args:
         store: :class:`ImmutableAuditStore` (поверх Postgres session_factory).
         interval_hours: период verify (default 24h).
+        full_verify_every: каждая N-я итерация — полный проход цепочки,
+            остальные — incremental от checkpoint'а.
 
     """
     global default_scheduler
     if default_scheduler is not None and default_scheduler.is_running:
         # Already running — ничего не делаем (idempotent).
         return
-    default_scheduler = AuditVerifyScheduler(store=store, interval_hours=interval_hours)
+    default_scheduler = AuditVerifyScheduler(
+        store=store,
+        interval_hours=interval_hours,
+        full_verify_every=full_verify_every,
+    )
     await default_scheduler.start()
 
 
@@ -197,7 +222,10 @@ async def stop_audit_verify() -> None:
 
 
 async def try_start_default(
-    *, session_factory: Callable[[], Any], interval_hours: float = 24.0
+    *,
+    session_factory: Callable[[], Any],
+    interval_hours: float = 24.0,
+    full_verify_every: int = 7,
 ) -> bool:
     """Запустить audit verify scheduler из startup-хука (best-effort).
 
@@ -218,6 +246,8 @@ async def try_start_default(
         session_factory: async-callable → ``AsyncSession`` (обычно
             ``infrastructure.database.database.get_db_session``).
         interval_hours: период verify-итерации (default 24h).
+        full_verify_every: каждая N-я итерация — полный проход, остальные —
+            incremental от checkpoint'а.
 
     Returns:
         ``True`` если scheduler успешно запущен, ``False`` иначе.
@@ -241,7 +271,11 @@ async def try_start_default(
         return False
 
     try:
-        await start_audit_verify(store=store, interval_hours=interval_hours)
+        await start_audit_verify(
+            store=store,
+            interval_hours=interval_hours,
+            full_verify_every=full_verify_every,
+        )
         return True
     except Exception as exc:
         _logger.warning("audit verify scheduler start failed: %s", exc)
@@ -20,10 +20,15 @@
 
 **Политика целостности (tamper detection):**
 
-* на запись — lock-free (INSERT + последний seq читается без FOR UPDATE,
-  так как seq monotonic через BIGSERIAL), но для корректной цепочки
-  используется advisory lock на таблицу во время append;
-* на верификацию — sequential walk от seq=1 до последнего.
+* на запись — group commit: ``append`` ставит событие в локальную
+  очередь и ждёт подтверждения durability; фоновый leader забирает
+  накопившийся batch, один раз берёт advisory lock, последовательно
+  считает HMAC всего batch'а в памяти и вставляет его одним multi-row
+  INSERT (seq monotonic через BIGSERIAL в порядке VALUES). Цепочка
+  идентична поштучной записи — меняется только число транзакций;
+* на верификацию — sequential walk страницами от seq=1 до последнего;
+  ``verify(incremental=True)`` продолжает от checkpoint'а (последний
+  проверенный seq + его ``event_hash``) вместо полного прохода.
 
 HMAC-секрет хранится в ``settings.secure.audit_secret_key`` (env
 ``AUDIT_SECRET_KEY``). При отсутствии — fallback на ``settings.secure.secret_key``
@@ -49,6 +54,7 @@ HMAC-секрет хранится в ``settings.secure.audit_secret_key`` (env
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import os
@@ -59,6 +65,7 @@ from typing import TYPE_CHECKING, Any
 
 from src.backend.core.codec.json import canonical_json_bytes, dumps_str
 from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -72,6 +79,28 @@ logger = get_logger("observability.immutable_audit")
 _TABLE = "audit_log_immutable"
 _GENESIS_HASH = "0" * 64  # prev_hash для первого события цепи
 _ADVISORY_LOCK_KEY = 0x61756469745F6C6F67  # int64 от b"audit_log" (хэш-подобный)
+# 10 bind-параметров на строку: 256 строк держат INSERT далеко от лимита
+# Postgres в 32767 параметров.
+_DEFAULT_MAX_BATCH = 256
+_VERIFY_PAGE_SIZE = 5000
+_INSERT_COLUMNS = (
+    "actor",
+    "action",
+    "resource",
+    "outcome",
+    "metadata",
+    "tenant_id",
+    "correlation_id",
+    "prev_hash",
+    "event_hash",
+    "occurred_at",
+)
+
+audit_group_commit_batch_size = metrics_registry.histogram(
+    "audit_group_commit_batch_size",
+    "Events written per ImmutableAuditStore group-commit transaction.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+)
 
 
 class AuditIntegrityError(RuntimeError):
@@ -88,6 +117,15 @@ class VerifyResult:
     details: str
 
 
+@dataclass(slots=True)
+class _PendingEvent:
+    """Событие в очереди group commit'а + future подтверждения."""
+
+    payload: bytes
+    params: dict[str, Any]
+    future: asyncio.Future[str]
+
+
 class ImmutableAuditStore:
     """Append-only HMAC-chained audit log поверх Postgres.
 
@@ -97,6 +135,8 @@ class ImmutableAuditStore:
         secret_key: HMAC-ключ (bytes/str). Если None — читается из
             ``AUDIT_SECRET_KEY``, затем из ``settings.secure.secret_key``.
         table_name: имя таблицы (default ``audit_log_immutable``).
+        max_batch: максимум событий в одной group-commit транзакции
+            (``1`` — поштучная запись, как до group commit'а).
     """
 
     def __init__(
@@ -105,10 +145,23 @@ class ImmutableAuditStore:
         *,
         secret_key: bytes | str | None = None,
         table_name: str = _TABLE,
+        max_batch: int = _DEFAULT_MAX_BATCH,
     ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch должен быть >= 1")
         self._session_factory = session_factory
         self._table = table_name
         self._secret = self._resolve_secret(secret_key)
+        self._max_batch = max_batch
+        self._pending: list[_PendingEvent] = []
+        self._leader: asyncio.Task[None] | None = None
+        # (seq, event_hash) последнего события, проверенного от genesis.
+        self._checkpoint: tuple[int, str] | None = None
+
+    @property
+    def checkpoint(self) -> tuple[int, str] | None:
+        """``(seq, event_hash)`` последнего проверенного события или ``None``."""
+        return self._checkpoint
 
     # ------------------------------------------------------------------ utils
 
@@ -191,19 +244,23 @@ class ImmutableAuditStore:
     ) -> str:
         """Добавляет событие, возвращает его ``event_hash`` (hex).
 
-        Алгоритм:
+        Событие встаёт в локальную очередь group commit'а; корутина
+        возвращается только после commit'а транзакции, в которую оно
+        попало (durability acknowledgement). Ошибка записи batch'а
+        пробрасывается каждому его участнику.
+
+        Алгоритм leader'а (см. :meth:`_write_batch`):
             1. Берём advisory lock на уровне БД (предотвращает race с другим
                writer-ом в пределах кластера Postgres).
             2. Читаем последний ``event_hash`` (или GENESIS).
-            3. Строим canonical JSON + считаем HMAC.
-            4. INSERT-им запись.
+            3. Для каждого события batch'а по порядку считаем HMAC
+               от canonical JSON и ``event_hash`` предыдущего.
+            4. INSERT-им batch одним multi-row statement.
             5. Отпускаем lock (автоматически на commit/rollback).
 
         :returns: hex-строка ``event_hash`` — клиент может сохранить для
             последующего ad-hoc verify.
         """
-        from sqlalchemy import text  # local import, чтобы модуль был ленивым
-
         occurred_at = datetime.now(UTC)
         event_dict = {
             "actor": actor,
@@ -217,7 +274,66 @@ class ImmutableAuditStore:
             # форматирования БД.
             "occurred_at": occurred_at.isoformat(),
         }
-        payload = self._canonical_json(event_dict)
+        pending = _PendingEvent(
+            payload=self._canonical_json(event_dict),
+            params={
+                "actor": actor,
+                "action": action,
+                "resource": resource,
+                "outcome": outcome,
+                "metadata": dumps_str(metadata or {}),
+                "tenant_id": tenant_id,
+                "correlation_id": correlation_id,
+                "occurred_at": occurred_at,
+            },
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._pending.append(pending)
+        if self._leader is None or self._leader.done():
+            self._start_leader()
+        return await pending.future
+
+    def _start_leader(self) -> None:
+        """Запускает leader-задачу, сливающую очередь batch'ами."""
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        try:
+            self._leader = get_task_registry().create_task(
+                self._drain(), name=f"immutable-audit-group-commit-{id(self)}"
+            )
+        except RuntimeError:
+            # TaskRegistry закрыт (shutdown) — пишем без фоновой задачи.
+            self._leader = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """Пишет очередь batch'ами, пока она не опустеет."""
+        while self._pending:
+            batch = self._pending[: self._max_batch]
+            del self._pending[: len(batch)]
+            try:
+                hashes = await self._write_batch(batch)
+            except asyncio.CancelledError:
+                # Shutdown: ни одно событие не должно повиснуть без ответа.
+                for item in (*batch, *self._pending):
+                    if not item.future.done():
+                        item.future.set_exception(
+                            AuditIntegrityError("audit group commit отменён")
+                        )
+                self._pending.clear()
+                raise
+            except Exception as exc:
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(exc)
+                continue
+            audit_group_commit_batch_size.observe(len(batch))
+            for item, event_hash in zip(batch, hashes, strict=True):
+                if not item.future.done():
+                    item.future.set_result(event_hash)
+
+    async def _write_batch(self, batch: list[_PendingEvent]) -> list[str]:
+        """Одна транзакция: lock → HMAC-chain batch'а → multi-row INSERT."""
+        from sqlalchemy import text  # local import, чтобы модуль был ленивым
 
         async with self._session_scope() as session:
             # pg_advisory_xact_lock — отпускается на commit/rollback.
@@ -233,44 +349,58 @@ class ImmutableAuditStore:
                 )
             ).first()
             prev_hash = prev_row[0] if prev_row else _GENESIS_HASH
-            event_hash = self._hmac(payload, prev_hash)
+
+            hashes: list[str] = []
+            values: list[str] = []
+            params: dict[str, Any] = {}
+            for index, item in enumerate(batch):
+                event_hash = self._hmac(item.payload, prev_hash)
+                row = {**item.params, "prev_hash": prev_hash, "event_hash": event_hash}
+                params.update({f"{col}_{index}": row[col] for col in _INSERT_COLUMNS})
+                values.append(
+                    "("
+                    + ", ".join(
+                        f"CAST(:{col}_{index} AS JSONB)"
+                        if col == "metadata"
+                        else f":{col}_{index}"
+                        for col in _INSERT_COLUMNS
+                    )
+                    + ")"
+                )
+                hashes.append(event_hash)
+                prev_hash = event_hash
 
             await session.execute(
                 text(
                     f"INSERT INTO {self._table} "  # self._table — ctor-parameter, не user input  # internal query with controlled parameters
-                    f"(actor, action, resource, outcome, metadata, "
-                    f" tenant_id, correlation_id, prev_hash, event_hash, "
-                    f" occurred_at) "
-                    f"VALUES (:actor, :action, :resource, :outcome, "
-                    f" CAST(:metadata AS JSONB), :tenant_id, "
-                    f" :correlation_id, :prev_hash, :event_hash, "
-                    f" :occurred_at)"
+                    f"({', '.join(_INSERT_COLUMNS)}) VALUES {', '.join(values)}"
                 ),
-                {
-                    "actor": actor,
-                    "action": action,
-                    "resource": resource,
-                    "outcome": outcome,
-                    "metadata": dumps_str(metadata or {}),
-                    "tenant_id": tenant_id,
-                    "correlation_id": correlation_id,
-                    "prev_hash": prev_hash,
-                    "event_hash": event_hash,
-                    "occurred_at": occurred_at,
-                },
+                params,
             )
             await session.commit()
 
-        return event_hash
+        return hashes
 
     # ----------------------------------------------------------------- verify
 
     async def verify(
-        self, from_seq: int = 0, to_seq: int | None = None
+        self,
+        from_seq: int = 0,
+        to_seq: int | None = None,
+        *,
+        incremental: bool = False,
     ) -> VerifyResult:
         """Проверяет HMAC-цепочку от ``from_seq`` до ``to_seq`` (включительно).
 
-        Если ``to_seq is None`` — до последнего события.
+        Если ``to_seq is None`` — до последнего события. Строки читаются
+        страницами по ``seq``, без загрузки всей таблицы в память.
+
+        ``incremental=True`` начинает с события после :attr:`checkpoint`
+        (якорь — его ``event_hash`` из памяти, без повторного прохода уже
+        проверенного префикса). Checkpoint сдвигается после каждой
+        успешной проверки, начатой от genesis или от checkpoint'а.
+        Изменения в уже проверенном префиксе incremental-режим не видит —
+        периодический полный ``verify()`` остаётся обязательным.
 
         :returns: ``VerifyResult(valid, total_checked, first_broken_seq, details)``.
             При `valid=False` ``first_broken_seq`` содержит seq первой
@@ -278,48 +408,90 @@ class ImmutableAuditStore:
         """
         from sqlalchemy import text
 
+        if incremental and self._checkpoint is not None:
+            from_seq = self._checkpoint[0] + 1
+            anchor: str | None = self._checkpoint[1]
+            extends_checkpoint = True
+        else:
+            anchor = _GENESIS_HASH if from_seq <= 1 else None
+            extends_checkpoint = from_seq <= 1
+
         sql = (
             f"SELECT seq, actor, action, resource, outcome, metadata, "  # self._table — ctor-parameter, не user input  # internal query with controlled parameters
             f" tenant_id, correlation_id, prev_hash, event_hash, occurred_at "
             f"FROM {self._table} "
             f"WHERE seq >= :from_seq "
             + ("AND seq <= :to_seq " if to_seq is not None else "")
-            + "ORDER BY seq ASC"
+            + "ORDER BY seq ASC LIMIT :limit"
         )
-        params: dict[str, Any] = {"from_seq": from_seq}
+        params: dict[str, Any] = {"from_seq": from_seq, "limit": _VERIFY_PAGE_SIZE}
         if to_seq is not None:
             params["to_seq"] = to_seq
 
-        async with self._session_scope() as session:
-            rows = (await session.execute(text(sql), params)).all()
-
-        if not rows:
+        running_prev = anchor
+        checked = 0
+        last_seq: int | None = None
+        while True:
+            async with self._session_scope() as session:
+                rows = (await session.execute(text(sql), params)).all()
+            if not rows:
+                break
+            if running_prev is None:
+                # Для первого события в диапазоне prev_hash должен совпадать
+                # с event_hash предыдущего seq (или GENESIS, если его нет).
+                running_prev = await self._anchor_before(int(rows[0][0]))
+            broken = self._check_rows(rows, running_prev, checked)
+            if broken is not None:
+                return broken
+            checked += len(rows)
+            last_seq = int(rows[-1][0])
+            running_prev = rows[-1][9]
+            if len(rows) < _VERIFY_PAGE_SIZE:
+                break
+            params["from_seq"] = last_seq + 1
+
+        if extends_checkpoint and last_seq is not None and running_prev is not None:
+            self._checkpoint = (last_seq, running_prev)
+
+        if not checked:
             return VerifyResult(
                 valid=True,
                 total_checked=0,
                 first_broken_seq=None,
-                details="audit log пуст в указанном диапазоне",
+                details=(
+                    "нет новых событий после checkpoint"
+                    if incremental and self._checkpoint is not None
+                    else "audit log пуст в указанном диапазоне"
+                ),
             )
+        return VerifyResult(
+            valid=True,
+            total_checked=checked,
+            first_broken_seq=None,
+            details=f"цепочка валидна ({checked} событий)",
+        )
 
-        # Для первого события в диапазоне prev_hash должен совпадать с
-        # event_hash предыдущего seq (или GENESIS, если это seq=1).
-        first = rows[0]
-        if int(first[0]) > 1:
-            async with self._session_scope() as session:
-                anchor_row = (
-                    await session.execute(
-                        text(
-                            f"SELECT event_hash FROM {self._table} WHERE seq = :s"  # internal query with controlled parameters
-                        ),  # self._table — ctor-parameter, не user input
-                        {"s": int(first[0]) - 1},
-                    )
-                ).first()
-            expected_anchor = anchor_row[0] if anchor_row else _GENESIS_HASH
-        else:
-            expected_anchor = _GENESIS_HASH
+    async def _anchor_before(self, seq: int) -> str:
+        """``event_hash`` события ``seq - 1`` (или GENESIS для seq=1)."""
+        from sqlalchemy import text
 
-        running_prev = expected_anchor
-        checked = 0
+        if seq <= 1:
+            return _GENESIS_HASH
+        async with self._session_scope() as session:
+            anchor_row = (
+                await session.execute(
+                    text(
+                        f"SELECT event_hash FROM {self._table} WHERE seq = :s"  # internal query with controlled parameters
+                    ),  # self._table — ctor-parameter, не user input
+                    {"s": seq - 1},
+                )
+            ).first()
+        return anchor_row[0] if anchor_row else _GENESIS_HASH
+
+    def _check_rows(
+        self, rows: Any, running_prev: str, checked: int
+    ) -> VerifyResult | None:
+        """Проверяет страницу строк; ``None`` — страница валидна."""
         for row in rows:
             (
                 seq,
@@ -373,13 +545,7 @@ class ImmutableAuditStore:
                 )
             running_prev = event_hash
             checked += 1
-
-        return VerifyResult(
-            valid=True,
-            total_checked=checked,
-            first_broken_seq=None,
-            details=f"цепочка валидна ({checked} событий)",
-        )
+        return None
 
     # ------------------------------------------------------------- internals
 
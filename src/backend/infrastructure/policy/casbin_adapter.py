@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import Any
 
 from src.backend.core.logging import get_logger
+from src.backend.core.security.authorization_gateway import notify_policy_changed
 
 __all__ = ("CasbinAdapter",)
 
@@ -53,11 +54,17 @@ class CasbinAdapter:
         enforcer = self._ensure_enforcer()
         if enforcer is None:
             return False
-        return bool(enforcer.add_role_for_user(user, role))
+        added = bool(enforcer.add_role_for_user(user, role))
+        if added:
+            notify_policy_changed("casbin_add_role")
+        return added
 
     def add_policy(self, role: str, resource: str, action: str) -> bool:
         """Метод add_policy (см. signature)."""
         enforcer = self._ensure_enforcer()
         if enforcer is None:
             return False
-        return bool(enforcer.add_policy(role, resource, action))
+        added = bool(enforcer.add_policy(role, resource, action))
+        if added:
+            notify_policy_changed("casbin_add_policy")
+        return added
@@ -51,6 +51,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from src.backend.core.logging import get_logger
+from src.backend.core.security.authorization_gateway import notify_policy_changed
 from src.backend.core.tenancy import current_tenant
 
 if TYPE_CHECKING:
@@ -146,10 +147,13 @@ class TenantScopedCasbin:
         if enforcer is None:
             return False
         try:
-            return bool(enforcer.add_policy(user_id, resource, action, tenant_id))
+            added = bool(enforcer.add_policy(user_id, resource, action, tenant_id))
         except Exception as exc:
             logger.error("TenantScopedCasbin add_policy fail: %s", exc)
             return False
+        if added:
+            notify_policy_changed("casbin_add_policy")
+        return added
 
     def remove_policy(
         self, user_id: str, resource: str, action: str, tenant_id: str
@@ -159,10 +163,15 @@ class TenantScopedCasbin:
         if enforcer is None:
             return False
         try:
-            return bool(enforcer.remove_policy(user_id, resource, action, tenant_id))
+            removed = bool(
+                enforcer.remove_policy(user_id, resource, action, tenant_id)
+            )
         except Exception as exc:
             logger.error("TenantScopedCasbin remove_policy fail: %s", exc)
             return False
+        if removed:
+            notify_policy_changed("casbin_remove_policy")
+        return removed
 
     # ------------------------------------------------------------ admin: role
 
@@ -176,7 +185,25 @@ class TenantScopedCasbin:
         if enforcer is None:
             return False
         try:
-            return bool(enforcer.add_role_for_user(user_id, role))
+            added = bool(enforcer.add_role_for_user(user_id, role))
         except Exception as exc:
             logger.error("TenantScopedCasbin add_role fail: %s", exc)
             return False
+        if added:
+            notify_policy_changed("casbin_add_role")
+        return added
+
+    # ---------------------------------------------------------- admin: reload
+
+    def load_policy(self) -> bool:
+        """Перечитать политики из policy-store (файл / БД)."""
+        enforcer = self._base._ensure_enforcer()
+        if enforcer is None:
+            return False
+        try:
+            enforcer.load_policy()
+        except Exception as exc:
+            logger.error("TenantScopedCasbin load_policy fail: %s", exc)
+            return False
+        notify_policy_changed("casbin_load_policy")
+        return True
@@ -0,0 +1,597 @@
+"""Отложенные задачи на sorted set: Redis ZSET + lease-claim, memory-аналог.
+
+APScheduler держит date-jobs в состоянии одного процесса — десятки тысяч
+отложенных retry делают его jobstore и wakeup-цикл узким местом. Здесь
+очередь — одна упорядоченная по времени структура:
+
+* ``ZSET`` ``<prefix>:due`` — ``job_id -> run_at`` (epoch, сек), вставка
+  O(log n);
+* ``HASH`` ``<prefix>:jobs`` — сериализованное тело задачи;
+* ``HASH`` ``<prefix>:leases`` — токен текущего claim'а;
+* ``HASH`` ``<prefix>:attempts`` — число claim'ов задачи.
+
+Claim (Lua, атомарно) забирает до ``limit`` задач с ``run_at <= now`` и
+переносит их score на ``now + lease``: задача остаётся в том же ZSET и
+сама становится due, если worker умер, не подтвердив её. ``ack`` /
+``reschedule`` проверяют токен — опоздавший worker не удалит задачу,
+которую уже перехватил другой. Счётчик claim'ов растёт и при истёкшем
+lease, поэтому задача, убивающая worker, тоже упирается в
+``max_attempts``.
+
+:class:`MemoryDelayedJobStore` повторяет семантику на ``heapq`` (тесты,
+single-process). :class:`DelayedJobWorker` — цикл claim → выполнить →
+ack/retry с экспоненциальным backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import importlib
+import inspect
+import itertools
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import Any, Protocol, runtime_checkable
+
+import orjson
+
+from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
+
+__all__ = (
+    "DelayedJob",
+    "DelayedJobStore",
+    "DelayedJobWorker",
+    "MemoryDelayedJobStore",
+    "RedisDelayedJobStore",
+    "build_delayed_job_store",
+    "callable_ref",
+)
+
+logger = get_logger(__name__)
+
+delayed_jobs_claimed = metrics_registry.histogram(
+    "delayed_jobs_claimed",
+    "Due delayed jobs returned by one claim.",
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500),
+)
+delayed_jobs_total = metrics_registry.counter(
+    "delayed_jobs_total",
+    "Delayed job executions by outcome.",
+    labels=("outcome",),
+)
+
+
+@dataclass(slots=True)
+class DelayedJob:
+    """Отложенная задача.
+
+    ``ref`` — имя обработчика, зарегистрированного в worker'е, либо
+    import-путь ``module:qualname``; ``args``/``kwargs`` должны
+    сериализоваться в JSON. ``lease`` заполняется при claim, ``attempts``
+    у claimed-задачи — число предыдущих claim'ов (упавших запусков и
+    истёкших lease).
+    """
+
+    id: str
+    ref: str
+    run_at: float
+    args: list[Any] = field(default_factory=list)
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    lease: str | None = None
+
+    def dumps(self) -> bytes:
+        """Тело задачи для хранилища (без ``lease``)."""
+        return orjson.dumps(
+            {
+                "id": self.id,
+                "ref": self.ref,
+                "run_at": self.run_at,
+                "args": self.args,
+                "kwargs": self.kwargs,
+                "attempts": self.attempts,
+            }
+        )
+
+    @classmethod
+    def loads(cls, raw: bytes | str, *, lease: str | None = None) -> DelayedJob:
+        """Восстановить задачу из тела хранилища."""
+        return cls(**orjson.loads(raw), lease=lease)
+
+
+def callable_ref(func: Callable[..., Any]) -> str:
+    """``module:qualname`` функции (как textual reference APScheduler)."""
+    qualname = getattr(func, "__qualname__", "")
+    if not qualname or "<" in qualname:
+        raise ValueError(f"{func!r}: отложенная задача требует функцию уровня модуля")
+    return f"{func.__module__}:{qualname}"
+
+
+@runtime_checkable
+class DelayedJobStore(Protocol):
+    """Async-протокол хранилища отложенных задач."""
+
+    async def schedule(self, job: DelayedJob) -> None:
+        """Поставить (или заменить по ``id``) задачу на ``job.run_at``."""
+        ...
+
+    async def claim_due(
+        self, now: float, *, limit: int, lease_seconds: float
+    ) -> list[DelayedJob]:
+        """Забрать до ``limit`` задач с ``run_at <= now`` под lease."""
+        ...
+
+    async def ack(self, job: DelayedJob) -> bool:
+        """Удалить выполненную задачу (если lease ещё наш)."""
+        ...
+
+    async def reschedule(self, job: DelayedJob, run_at: float) -> bool:
+        """Вернуть claimed-задачу в очередь на ``run_at`` (retry)."""
+        ...
+
+    async def cancel(self, job_id: str) -> bool:
+        """Удалить задачу независимо от состояния."""
+        ...
+
+    async def peek(self, limit: int) -> list[DelayedJob]:
+        """До ``limit`` задач по возрастанию ``run_at`` (с учётом lease)."""
+        ...
+
+    async def next_due(self) -> float | None:
+        """Ближайший ``run_at`` (с учётом lease) либо ``None``."""
+        ...
+
+    async def size(self) -> int:
+        """Число задач (ожидающих и claimed)."""
+        ...
+
+
+class MemoryDelayedJobStore:
+    """In-process аналог Redis-store на ``heapq`` с ленивым удалением."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, str]] = []
+        self._scores: dict[str, float] = {}
+        self._jobs: dict[str, bytes] = {}
+        self._leases: dict[str, str] = {}
+        self._claims: dict[str, int] = {}
+        self._seq = itertools.count()
+
+    def _push(self, job_id: str, score: float) -> None:
+        self._scores[job_id] = score
+        heapq.heappush(self._heap, (score, next(self._seq), job_id))
+
+    def _top(self) -> tuple[float, str] | None:
+        while self._heap:
+            score, _, job_id = self._heap[0]
+            if self._scores.get(job_id) == score:
+                return score, job_id
+            heapq.heappop(self._heap)
+        return None
+
+    async def schedule(self, job: DelayedJob) -> None:
+        """Поставить (или заменить по ``id``) задачу."""
+        self._jobs[job.id] = job.dumps()
+        self._leases.pop(job.id, None)
+        self._claims.pop(job.id, None)
+        self._push(job.id, job.run_at)
+
+    async def claim_due(
+        self, now: float, *, limit: int, lease_seconds: float
+    ) -> list[DelayedJob]:
+        """Забрать due-задачи, перенеся их score на ``now + lease``."""
+        token = uuid.uuid4().hex
+        claimed: list[DelayedJob] = []
+        while len(claimed) < limit and (top := self._top()) is not None:
+            score, job_id = top
+            if score > now:
+                break
+            heapq.heappop(self._heap)
+            self._push(job_id, now + lease_seconds)
+            self._leases[job_id] = token
+            job = DelayedJob.loads(self._jobs[job_id], lease=token)
+            job.attempts = self._claims.get(job_id, 0)
+            self._claims[job_id] = job.attempts + 1
+            claimed.append(job)
+        return claimed
+
+    async def ack(self, job: DelayedJob) -> bool:
+        """Удалить задачу, если lease совпадает."""
+        if job.lease is None or self._leases.get(job.id) != job.lease:
+            return False
+        self._forget(job.id)
+        return True
+
+    async def reschedule(self, job: DelayedJob, run_at: float) -> bool:
+        """Retry: новое тело и ``run_at``, если lease совпадает."""
+        if job.lease is None or self._leases.get(job.id) != job.lease:
+            return False
+        del self._leases[job.id]
+        self._jobs[job.id] = replace(job, run_at=run_at).dumps()
+        self._push(job.id, run_at)
+        return True
+
+    async def cancel(self, job_id: str) -> bool:
+        """Удалить задачу."""
+        if job_id not in self._jobs:
+            return False
+        self._forget(job_id)
+        return True
+
+    async def peek(self, limit: int) -> list[DelayedJob]:
+        """Задачи с наименьшим score."""
+        head = heapq.nsmallest(limit, self._scores.items(), key=lambda item: item[1])
+        return [
+            replace(DelayedJob.loads(self._jobs[job_id]), run_at=score)
+            for job_id, score in head
+        ]
+
+    async def next_due(self) -> float | None:
+        """Ближайший score."""
+        top = self._top()
+        return top[0] if top is not None else None
+
+    async def size(self) -> int:
+        """Число задач."""
+        return len(self._jobs)
+
+    def _forget(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+        self._scores.pop(job_id, None)
+        self._leases.pop(job_id, None)
+        self._claims.pop(job_id, None)
+
+
+_CLAIM_LUA = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local out = {}
+for _, id in ipairs(ids) do
+    local body = redis.call('HGET', KEYS[2], id)
+    if body then
+        redis.call('ZADD', KEYS[1], ARGV[3], id)
+        redis.call('HSET', KEYS[3], id, ARGV[4])
+        out[#out + 1] = body
+        out[#out + 1] = redis.call('HINCRBY', KEYS[4], id, 1) - 1
+    else
+        redis.call('ZREM', KEYS[1], id)
+        redis.call('HDEL', KEYS[3], id)
+        redis.call('HDEL', KEYS[4], id)
+    end
+end
+return out
+"""
+
+_ACK_LUA = """
+if redis.call('HGET', KEYS[3], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+return 1
+"""
+
+_RESCHEDULE_LUA = """
+if redis.call('HGET', KEYS[3], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[4])
+redis.call('HDEL', KEYS[3], ARGV[1])
+return 1
+"""
+
+
+class RedisDelayedJobStore:
+    """Redis-backed store: ZSET расписания + HASH тел, lease-токенов и claim'ов.
+
+    Ключи делят hash-tag (``{delayed}`` в префиксе по умолчанию) — Lua-
+    скрипты работают и в Redis Cluster.
+    """
+
+    def __init__(
+        self, *, redis_client: Any | None = None, prefix: str = "jobs:{delayed}"
+    ) -> None:
+        self._client = redis_client
+        self._keys = (
+            f"{prefix}:due",
+            f"{prefix}:jobs",
+            f"{prefix}:leases",
+            f"{prefix}:attempts",
+        )
+
+    def _ensure_client(self) -> Any:
+        if self._client is not None:
+            return self._client
+        from src.backend.core.storage.redis import get_redis_client
+
+        self._client = get_redis_client()
+        return self._client
+
+    async def _eval(self, script: str, *args: Any) -> Any:
+        async def op(conn: Any) -> Any:
+            # register_script кэширует sha: EVALSHA с fallback на EVAL.
+            return await conn.register_script(script)(keys=self._keys, args=args)
+
+        return await self._ensure_client().execute("cache", op)
+
+    async def schedule(self, job: DelayedJob) -> None:
+        """HSET тела + ZADD score одной транзакцией."""
+        due, jobs, leases, attempts = self._keys
+        body = job.dumps()
+
+        async def op(conn: Any) -> None:
+            pipe = conn.pipeline(transaction=True)
+            pipe.hset(jobs, job.id, body)
+            pipe.hdel(leases, job.id)
+            pipe.hdel(attempts, job.id)
+            pipe.zadd(due, {job.id: job.run_at})
+            await pipe.execute()
+
+        await self._ensure_client().execute("cache", op)
+
+    async def claim_due(
+        self, now: float, *, limit: int, lease_seconds: float
+    ) -> list[DelayedJob]:
+        """Lua-claim: ZRANGEBYSCORE + перенос score на ``now + lease``."""
+        token = uuid.uuid4().hex
+        out = await self._eval(_CLAIM_LUA, now, limit, now + lease_seconds, token)
+        claimed = []
+        for body, attempts in zip(out[::2], out[1::2], strict=True):
+            job = DelayedJob.loads(body, lease=token)
+            job.attempts = int(attempts)
+            claimed.append(job)
+        return claimed
+
+    async def ack(self, job: DelayedJob) -> bool:
+        """Удалить задачу, если lease совпадает."""
+        if job.lease is None:
+            return False
+        return bool(await self._eval(_ACK_LUA, job.id, job.lease))
+
+    async def reschedule(self, job: DelayedJob, run_at: float) -> bool:
+        """Retry: новое тело и score, если lease совпадает."""
+        if job.lease is None:
+            return False
+        body = replace(job, run_at=run_at).dumps()
+        return bool(
+            await self._eval(_RESCHEDULE_LUA, job.id, job.lease, run_at, body)
+        )
+
+    async def cancel(self, job_id: str) -> bool:
+        """ZREM + HDEL тела, lease и счётчика claim'ов."""
+        due, jobs, leases, attempts = self._keys
+
+        async def op(conn: Any) -> list[Any]:
+            pipe = conn.pipeline(transaction=True)
+            pipe.zrem(due, job_id)
+            pipe.hdel(jobs, job_id)
+            pipe.hdel(leases, job_id)
+            pipe.hdel(attempts, job_id)
+            return await pipe.execute()
+
+        result = await self._ensure_client().execute("cache", op)
+        return bool(result and result[1])
+
+    async def peek(self, limit: int) -> list[DelayedJob]:
+        """``ZRANGE due 0 limit-1 WITHSCORES`` + ``HMGET`` тел."""
+        due, jobs = self._keys[:2]
+
+        async def op(conn: Any) -> list[tuple[Any, float, Any]]:
+            head = await conn.zrange(due, 0, limit - 1, withscores=True)
+            if not head:
+                return []
+            bodies = await conn.hmget(jobs, [job_id for job_id, _ in head])
+            return [
+                (job_id, score, body)
+                for (job_id, score), body in zip(head, bodies, strict=True)
+            ]
+
+        rows = await self._ensure_client().execute("cache", op)
+        return [
+            replace(DelayedJob.loads(body), run_at=float(score))
+            for _, score, body in rows
+            if body is not None
+        ]
+
+    async def next_due(self) -> float | None:
+        """``ZRANGE due 0 0 WITHSCORES``."""
+        due = self._keys[0]
+
+        async def op(conn: Any) -> list[Any]:
+            return await conn.zrange(due, 0, 0, withscores=True)
+
+        head = await self._ensure_client().execute("cache", op)
+        return float(head[0][1]) if head else None
+
+    async def size(self) -> int:
+        """``ZCARD due``."""
+        due = self._keys[0]
+        return int(await self._ensure_client().execute("cache", lambda c: c.zcard(due)))
+
+
+def build_delayed_job_store(backend: str | None = None) -> DelayedJobStore:
+    """Фабрика по ``settings.scheduler.job_queue_backend`` (redis/memory)."""
+    name = (backend or "memory").strip().lower()
+    if name == "redis":
+        return RedisDelayedJobStore()
+    return MemoryDelayedJobStore()
+
+
+class DelayedJobWorker:
+    """Цикл claim → выполнить → ack/retry поверх :class:`DelayedJobStore`.
+
+    Несколько worker'ов (в одном или разных процессах) делят один store:
+    claim атомарен, незавершённые задачи возвращаются по истечении lease.
+
+    Args:
+        store: Хранилище задач.
+        handlers: Явные обработчики ``ref -> callable``; прочие ``ref``
+            разрешаются как ``module:qualname``.
+        batch_size: Задач на один claim.
+        lease_seconds: Время, за которое задача должна завершиться.
+        max_attempts: Попыток до отказа (последняя ошибка — в лог);
+            истёкший lease считается попыткой.
+        concurrency: Одновременно выполняемых задач.
+        poll_interval: Максимальный сон при пустой очереди (сек).
+        retry_base / retry_max: Экспоненциальный backoff retry (сек).
+
+    """
+
+    def __init__(
+        self,
+        store: DelayedJobStore,
+        *,
+        handlers: dict[str, Callable[..., Any]] | None = None,
+        batch_size: int = 100,
+        lease_seconds: float = 30.0,
+        max_attempts: int = 5,
+        concurrency: int = 32,
+        poll_interval: float = 1.0,
+        retry_base: float = 2.0,
+        retry_max: float = 300.0,
+    ) -> None:
+        self._store = store
+        self._handlers: dict[str, Callable[..., Any]] = dict(handlers or {})
+        self._batch_size = batch_size
+        self._lease = lease_seconds
+        self._max_attempts = max_attempts
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval
+        self._retry_base = retry_base
+        self._retry_max = retry_max
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def register(self, ref: str, handler: Callable[..., Any]) -> None:
+        """Зарегистрировать обработчик под именем ``ref``."""
+        self._handlers[ref] = handler
+
+    def notify(self) -> None:
+        """Разбудить цикл (задача поставлена локально раньше ``next_due``)."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Запустить цикл в task registry (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        self._task = get_task_registry().create_task(
+            self._loop(), name=f"delayed-job-worker-{id(self)}"
+        )
+
+    async def stop(self) -> None:
+        """Остановить цикл; claimed-задачи вернутся по истечении lease."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def run_once(self, now: float | None = None) -> int:
+        """Один claim и выполнение batch'а; возвращает число задач."""
+        now = time.time() if now is None else now
+        jobs = await self._store.claim_due(
+            now, limit=self._batch_size, lease_seconds=self._lease
+        )
+        delayed_jobs_claimed.observe(len(jobs))
+        if not jobs:
+            return 0
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _bounded(job: DelayedJob) -> None:
+            async with semaphore:
+                await self._execute(job)
+
+        await asyncio.gather(*(_bounded(job) for job in jobs))
+        return len(jobs)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                if await self.run_once() >= self._batch_size:
+                    continue
+                next_due = await self._store.next_due()
+            except Exception as exc:
+                logger.warning("delayed job worker iteration failed: %s", exc)
+                next_due = None
+            delay = self._poll_interval
+            if next_due is not None:
+                delay = min(max(next_due - time.time(), 0.0), delay)
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+
+    async def _execute(self, job: DelayedJob) -> None:
+        if job.attempts >= self._max_attempts:
+            # Все попытки ушли на запуски, не дошедшие до ack/retry
+            # (worker падал или превышал lease) — не запускаем снова.
+            logger.error(
+                "delayed job %s (%s) abandoned after %d attempts (lease expired)",
+                job.id,
+                job.ref,
+                job.attempts,
+            )
+            delayed_jobs_total.labels(outcome="dead").inc()
+            await self._store.ack(job)
+            return
+        try:
+            handler = self._resolve(job.ref)
+            if inspect.iscoroutinefunction(handler):
+                await handler(*job.args, **job.kwargs)
+            else:
+                result = await asyncio.to_thread(handler, *job.args, **job.kwargs)
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as exc:
+            await self._fail(job, exc)
+            return
+        if await self._store.ack(job):
+            delayed_jobs_total.labels(outcome="done").inc()
+        else:
+            logger.warning("delayed job %s: lease lost before ack", job.id)
+
+    async def _fail(self, job: DelayedJob, exc: Exception) -> None:
+        job.attempts += 1
+        if job.attempts >= self._max_attempts:
+            logger.error(
+                "delayed job %s (%s) failed after %d attempts: %s",
+                job.id,
+                job.ref,
+                job.attempts,
+                exc,
+            )
+            delayed_jobs_total.labels(outcome="dead").inc()
+            await self._store.ack(job)
+            return
+        delay = min(self._retry_base ** job.attempts, self._retry_max)
+        logger.warning(
+            "delayed job %s (%s) attempt %d failed, retry in %.1fs: %s",
+            job.id,
+            job.ref,
+            job.attempts,
+            delay,
+            exc,
+        )
+        delayed_jobs_total.labels(outcome="retry").inc()
+        await self._store.reschedule(job, time.time() + delay)
+
+    def _resolve(self, ref: str) -> Callable[..., Any]:
+        handler = self._handlers.get(ref)
+        if handler is not None:
+            return handler
+        module_name, _, qualname = ref.partition(":")
+        if not qualname:
+            raise LookupError(f"delayed job handler {ref!r} не зарегистрирован")
+        target: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part)
+        self._handlers[ref] = target
+        return target
@@ -3,21 +3,59 @@
 Предоставляет единый API для постановки задач
 с отложенным выполнением (delay) или по расписанию (cron).
 Интегрируется с DSL через ``TransportType.DEFERRED``.
+
+Cron-задачи всегда живут в APScheduler. Delay/immediate-задачи при
+``settings.scheduler.job_queue_backend`` = ``redis`` | ``memory`` идут в
+sorted-set store (:mod:`.delayed_jobs`) и выполняются
+:class:`DelayedJobWorker` на каждом инстансе (lease-claim), а не в
+состоянии одного scheduler-процесса. ``redis`` при ``redis.enabled=false``
+откатывается на ``apscheduler`` — worker в таком профиле не запускается.
+Backend по умолчанию — ``apscheduler`` во всех профилях; sorted-set store
+включается явно в конфиге профиля.
+
+Синхронный API (``enqueue`` / ``cancel`` / ``list_jobs``) сохранён для
+существующих callers; при sorted-set backend операции со store из
+running loop'а выполняются фоновой задачей. Подтверждённые варианты —
+``await schedule()`` / ``await cancel_scheduled()`` /
+``await list_scheduled()``.
 """
 
-from collections.abc import Awaitable, Callable
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Coroutine
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
 from src.backend.core.config.settings import settings
 from src.backend.core.logging import get_logger
+from src.backend.infrastructure.scheduler.delayed_jobs import (
+    DelayedJob,
+    DelayedJobStore,
+    DelayedJobWorker,
+    build_delayed_job_store,
+    callable_ref,
+)
 
 __all__ = ("JobQueue", "get_job_queue")
 
 logger = get_logger(__name__)
 
 
+def _configured_store() -> DelayedJobStore | None:
+    """Store по ``job_queue_backend``; ``None`` — задачи в APScheduler."""
+    backend = settings.scheduler.job_queue_backend
+    if backend == "apscheduler":
+        return None
+    if backend == "redis" and not getattr(settings.redis, "enabled", True):
+        logger.warning(
+            "job_queue_backend=redis при redis.enabled=false — используется "
+            "APScheduler"
+        )
+        return None
+    return build_delayed_job_store(backend)
+
+
 class JobQueue:
     """Очередь отложенных задач.
 
@@ -27,10 +65,15 @@ class JobQueue:
     Attrs:
         _scheduler: Экземпляр APScheduler (ленивая
             инициализация при первом вызове).
+        _store: Sorted-set store delay/immediate-задач (``None`` —
+            backend ``apscheduler``).
+        _worker: Worker, выполняющий задачи из ``_store``.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, store: DelayedJobStore | None = None) -> None:
         self._scheduler: Any = None
+        self._store = store if store is not None else _configured_store()
+        self._worker: DelayedJobWorker | None = None
 
     def _ensure_scheduler(self) -> Any:
         """Получает scheduler из менеджера."""
@@ -42,6 +85,116 @@ class JobQueue:
             self._scheduler = scheduler_manager.scheduler
         return self._scheduler
 
+    @property
+    def worker(self) -> DelayedJobWorker | None:
+        """Worker sorted-set store (создаётся лениво; ``None`` для APScheduler)."""
+        if self._store is not None and self._worker is None:
+            cfg = settings.scheduler
+            self._worker = DelayedJobWorker(
+                self._store,
+                batch_size=cfg.delayed_job_batch_size,
+                lease_seconds=cfg.delayed_job_lease_seconds,
+                max_attempts=cfg.delayed_job_max_attempts,
+                concurrency=cfg.delayed_job_concurrency,
+            )
+        return self._worker
+
+    async def start(self) -> None:
+        """Запустить worker отложенных задач (no-op для APScheduler)."""
+        if self.worker is not None:
+            self.worker.start()
+            logger.info("Delayed job worker started")
+
+    async def stop(self) -> None:
+        """Остановить worker отложенных задач."""
+        if self._worker is not None:
+            await self._worker.stop()
+
+    @staticmethod
+    def _build_job(
+        func: Callable[..., Any | Awaitable[Any]] | str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any] | None,
+        delay: float,
+        job_id: str | None,
+    ) -> DelayedJob:
+        job = DelayedJob(
+            id=job_id or uuid4().hex,
+            ref=func if isinstance(func, str) else callable_ref(func),
+            run_at=time.time() + max(delay, 0.0),
+            args=list(args),
+            kwargs=dict(kwargs or {}),
+        )
+        # Сериализация до записи: несериализуемые аргументы — ошибка caller'а.
+        job.dumps()
+        return job
+
+    async def _write(self, job: DelayedJob) -> None:
+        await self._store.schedule(job)  # type: ignore[union-attr]
+        if self._worker is not None:
+            self._worker.notify()
+
+    @staticmethod
+    def _submit(operation: Coroutine[Any, Any, Any], what: str) -> Any:
+        """Операция store из sync-метода.
+
+        Без running loop'а — выполняется сразу (результат/ошибка caller'у);
+        внутри loop'а — фоновая задача, сбой которой логируется.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(operation)
+
+        async def _guarded() -> None:
+            try:
+                await operation
+            except Exception as exc:
+                logger.error(
+                    "JobQueue: %s в sorted-set store не выполнено: %s", what, exc
+                )
+
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        get_task_registry().create_task(_guarded(), name=f"job-queue-{what}")
+        return None
+
+    async def schedule(
+        self,
+        func: Callable[..., Any | Awaitable[Any]] | str,
+        *,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        delay: float = 0.0,
+        job_id: str | None = None,
+    ) -> str:
+        """Поставить задачу в sorted-set store и дождаться записи.
+
+        Args:
+            func: Функция уровня модуля либо имя обработчика, известное
+                worker'у (``worker.register``).
+            args: Позиционные аргументы (JSON-сериализуемые).
+            kwargs: Именованные аргументы (JSON-сериализуемые).
+            delay: Задержка в секундах.
+            job_id: Пользовательский ID (повторная постановка заменяет).
+
+        Returns:
+            ID задачи.
+
+        Raises:
+            RuntimeError: Backend очереди — ``apscheduler``.
+            ValueError: ``func`` — lambda/замыкание/локальная функция.
+            TypeError: ``args``/``kwargs`` не сериализуются в JSON.
+
+        """
+        if self._store is None:
+            raise RuntimeError(
+                "JobQueue.schedule требует job_queue_backend=redis|memory"
+            )
+        job = self._build_job(func, args, kwargs, delay, job_id)
+        await self._write(job)
+        return job.id
+
     def enqueue(
         self,
         func: Callable[..., Any | Awaitable[Any]],
@@ -66,12 +219,25 @@ class JobQueue:
             ID созданной задачи.
 
         Raises:
-            ValueError: Если указаны оба delay и cron.
+            ValueError: Если указаны оба delay и cron; при sorted-set
+                backend — ``func`` не функция уровня модуля.
+            TypeError: При sorted-set backend — аргументы не JSON.
+
+        Note:
+            При sorted-set backend ошибки сериализации caller получает
+            сразу; запись в store внутри running loop'а — фоновая (сбой
+            Redis — в лог). Подтверждение записи — ``await schedule(...)``.
 
         """
         if delay is not None and cron is not None:
             raise ValueError("Нельзя указать delay и cron одновременно")
 
+        if cron is None and self._store is not None:
+            job = self._build_job(func, args, kwargs, delay or 0.0, job_id)
+            self._submit(self._write(job), f"enqueue:{job.id}")
+            logger.info("Задача %s отложена на %.1f сек", job.id, delay or 0.0)
+            return job.id
+
         scheduler = self._ensure_scheduler()
         final_job_id = job_id or uuid4().hex
         final_kwargs = kwargs or {}
@@ -130,7 +296,35 @@ class JobQueue:
         Returns:
             ``True`` если задача была найдена и отменена.
 
+        Note:
+            При sorted-set backend внутри running loop'а задача удаляется
+            из store фоновой операцией и в результат не входит —
+            подтверждённая отмена через ``await cancel_scheduled(...)``.
+
         """
+        if self._store is not None and self._submit(
+            self._store.cancel(job_id), f"cancel:{job_id}"
+        ):
+            logger.info("Задача %s отменена", job_id)
+            return True
+        return self._cancel_apscheduler(job_id)
+
+    async def cancel_scheduled(self, job_id: str) -> bool:
+        """Отменяет задачу с подтверждением (sorted-set store, затем APScheduler).
+
+        Args:
+            job_id: ID задачи.
+
+        Returns:
+            ``True`` если задача была найдена и отменена.
+
+        """
+        if self._store is not None and await self._store.cancel(job_id):
+            logger.info("Задача %s отменена", job_id)
+            return True
+        return self._cancel_apscheduler(job_id)
+
+    def _cancel_apscheduler(self, job_id: str) -> bool:
         scheduler = self._ensure_scheduler()
         try:
             scheduler.remove_job(job_id)
@@ -140,10 +334,11 @@ class JobQueue:
             return False
 
     def list_jobs(self) -> list[dict[str, Any]]:
-        """Возвращает список запланированных задач.
+        """Возвращает список запланированных задач APScheduler.
 
         Returns:
-            Список словарей с информацией о задачах.
+            Список словарей с информацией о задачах. Задачи sorted-set
+            store — через ``await list_scheduled()``.
 
         """
         scheduler = self._ensure_scheduler()
@@ -158,6 +353,31 @@ class JobQueue:
             for job in jobs
         ]
 
+    async def list_scheduled(self, limit: int = 1000) -> list[dict[str, Any]]:
+        """Задачи sorted-set store и APScheduler.
+
+        Args:
+            limit: Максимум задач из sorted-set store (ближайшие по времени).
+
+        Returns:
+            Список словарей с информацией о задачах: задачи store, затем
+            задачи APScheduler (cron).
+
+        """
+        listed: list[dict[str, Any]] = []
+        if self._store is not None:
+            listed.extend(
+                {
+                    "id": job.id,
+                    "name": job.ref,
+                    "next_run_time": str(datetime.fromtimestamp(job.run_at, UTC)),
+                    "trigger": "delayed",
+                }
+                for job in await self._store.peek(limit)
+            )
+        listed.extend(self.list_jobs())
+        return listed
+
 
 _job_queue: JobQueue | None = None
 
@@ -13,10 +13,34 @@ S172 M2 (ARC-004): новые ключи хранятся через :class:`API
 :meth:`APIKeyAuth.verify` (dual-verify path) для backward-compat.
 Миграция SHA → Argon2 для существующих ключей — через
 ``tools/migrations/migrate_api_keys_to_argon2.py``.
+
+O(1)-валидация:
+
+* новые ключи выдаются как ``<key_id>.<secret>``; ``apikey_id:<key_id>``
+  указывает на клиента — один GET и один Argon2 verify вместо
+  SCAN + verify по всем клиентам;
+* legacy-ключи (без ``key_id``) после первой успешной проверки
+  получают индекс ``apikey_legacy:<HMAC(secret_key, raw)>`` — SCAN
+  выполняется один раз на ключ; ``apikey_legacy_of:<client_id>`` хранит
+  индексы клиента, чтобы revoke удалил и их;
+* ключ, не найденный SCAN'ом, на ``rejected_cache_ttl`` секунд попадает
+  в негативный кэш — повтор того же ключа не сканирует Redis заново;
+  сам SCAN выключается ``legacy_scan=False``
+  (``security.api_key_legacy_scan``) после миграции legacy-ключей;
+* Argon2 verify выполняется в thread pool (``run_cpu_bound``) —
+  event loop не блокируется;
+* успешные проверки кэшируются in-process на ``verified_cache_ttl``
+  секунд (ключ кэша — HMAC raw-ключа); rotate/revoke рассылают
+  инвалидацию через Redis pub/sub ``apikey:invalidate``. Listener
+  перезапускается с backoff и при перезапуске сбрасывает кэш целиком.
 """
 
+import asyncio
+import hashlib
+import hmac
 import secrets
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -29,6 +53,28 @@ logger = get_logger("security.api_keys")
 
 _KEY_PREFIX = "apikey:"
 _AUDIT_PREFIX = "apikey_audit:"
+_KEY_ID_PREFIX = "apikey_id:"
+_LEGACY_PREFIX = "apikey_legacy:"
+_LEGACY_OWNER_PREFIX = "apikey_legacy_of:"
+_INVALIDATE_CHANNEL = "apikey:invalidate"
+_KEY_ID_SEPARATOR = "."
+
+
+def _split_key_id(raw_key: str) -> str | None:
+    """``<key_id>.<secret>`` → ``key_id``; ``None`` для legacy-формата.
+
+    Legacy-ключи (``gd_`` + ``token_urlsafe``) не содержат точки.
+    """
+    key_id, sep, secret = raw_key.partition(_KEY_ID_SEPARATOR)
+    if not sep or not key_id or not secret:
+        return None
+    return key_id
+
+
+def _generate_raw_key() -> tuple[str, str]:
+    """Новый ключ ``(key_id, raw_key)`` в формате ``gd_<hex>.<secret>``."""
+    key_id = f"gd_{secrets.token_hex(8)}"
+    return key_id, f"{key_id}{_KEY_ID_SEPARATOR}{secrets.token_urlsafe(32)}"
 
 
 @dataclass(slots=True)
@@ -42,6 +88,7 @@ class APIKeyInfo:
     expires_at: float | None = None
     is_active: bool = True
     description: str = ""
+    key_id: str | None = None
 
 
 class APIKeyManager:
@@ -51,12 +98,42 @@ class APIKeyManager:
     Backward-compat: legacy SHA-256 hashes принимаются через
     :class:`APIKeyAuth.verify` (grace period ~2 спринта).
     Grace period: старый ключ валиден N секунд после ротации.
+
+    Args:
+        grace_period_seconds: Сколько предыдущий ключ валиден после ротации.
+        verified_cache_ttl: TTL in-process кэша успешных проверок (сек);
+            ``0`` — кэш выключен. Ограничивает окно устаревания, если
+            pub/sub-инвалидация недоступна.
+        verified_cache_size: Максимум записей в кэше (LRU-вытеснение).
+        rejected_cache_ttl: TTL негативного кэша ключей, отвергнутых
+            legacy-SCAN'ом (сек); ``0`` — выключен.
+        legacy_scan: Искать неиндексированные legacy-ключи SCAN'ом по
+            всем записям; ``False`` — принимаются только ключи с
+            ``key_id`` и уже проиндексированные legacy-ключи.
     """
 
-    def __init__(self, grace_period_seconds: int = 86400) -> None:
+    def __init__(
+        self,
+        grace_period_seconds: int = 86400,
+        *,
+        verified_cache_ttl: float = 30.0,
+        verified_cache_size: int = 10_000,
+        rejected_cache_ttl: float = 5.0,
+        legacy_scan: bool = True,
+    ) -> None:
         self._grace_period = grace_period_seconds
         self._global_key_hash: str | None = None
         self._hasher = APIKeyAuth()  # OWASP-2026 baseline parameters
+        self._cache_ttl = verified_cache_ttl
+        self._cache_size = verified_cache_size
+        # HMAC-ключ процесса: raw-ключи не хранятся в памяти даже как хэш,
+        # пригодный вне процесса.
+        self._cache_secret = secrets.token_bytes(32)
+        self._verified: OrderedDict[bytes, tuple[float, APIKeyInfo]] = OrderedDict()
+        self._rejected_ttl = rejected_cache_ttl
+        self._rejected: OrderedDict[bytes, float] = OrderedDict()
+        self._legacy_scan = legacy_scan
+        self._listener_task: asyncio.Task[None] | None = None
 
     async def _emit_audit_event(
         self, event_type: str, payload: dict[str, Any] | None = None
@@ -106,6 +183,135 @@ class APIKeyManager:
         """
         return self._hasher.verify(raw_key, stored_hash)
 
+    async def _verify_offloaded(self, raw_key: str, stored_hash: str) -> bool:
+        """Argon2 verify (~50ms CPU) вне event loop'а.
+
+        argon2-cffi отпускает GIL — thread pool даёт реальный параллелизм.
+        """
+        from src.backend.core.utils.cpu_bound import run_cpu_bound
+
+        return await run_cpu_bound(self._verify_against_hash, raw_key, stored_hash)
+
+    # ─────────────────────── verified-key cache ───────────────────────
+
+    def _fingerprint(self, raw_key: str) -> bytes:
+        return hmac.digest(self._cache_secret, raw_key.encode("utf-8"), "sha256")
+
+    def _cache_get(self, fingerprint: bytes) -> APIKeyInfo | None:
+        entry = self._verified.get(fingerprint)
+        if entry is None:
+            return None
+        expires_at, info = entry
+        if expires_at <= time.monotonic():
+            self._verified.pop(fingerprint, None)
+            return None
+        self._verified.move_to_end(fingerprint)
+        return info
+
+    def _cache_put(
+        self, fingerprint: bytes, info: APIKeyInfo, valid_until: float | None
+    ) -> None:
+        if self._cache_ttl <= 0:
+            return
+        ttl = self._cache_ttl
+        if valid_until is not None:
+            # Grace-ключ не должен пережить окончание grace period.
+            ttl = min(ttl, valid_until - time.time())
+            if ttl <= 0:
+                return
+        self._verified[fingerprint] = (time.monotonic() + ttl, info)
+        self._verified.move_to_end(fingerprint)
+        while len(self._verified) > self._cache_size:
+            self._verified.popitem(last=False)
+
+    def _is_rejected(self, fingerprint: bytes) -> bool:
+        expires_at = self._rejected.get(fingerprint)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._rejected[fingerprint]
+            return False
+        return True
+
+    def _reject(self, fingerprint: bytes) -> None:
+        if self._rejected_ttl <= 0:
+            return
+        self._rejected[fingerprint] = time.monotonic() + self._rejected_ttl
+        self._rejected.move_to_end(fingerprint)
+        while len(self._rejected) > self._cache_size:
+            self._rejected.popitem(last=False)
+
+    def invalidate_cached(self, client_id: str | None = None) -> None:
+        """Сбросить кэш проверок (весь или одного клиента)."""
+        if client_id is None:
+            self._verified.clear()
+            self._rejected.clear()
+            return
+        stale = [
+            fp for fp, (_, info) in self._verified.items() if info.client_id == client_id
+        ]
+        for fp in stale:
+            del self._verified[fp]
+
+    async def _broadcast_invalidation(self, client_id: str) -> None:
+        """Локальный сброс + pub/sub-рассылка остальным воркерам."""
+        self.invalidate_cached(client_id)
+        try:
+            import orjson
+
+            from src.backend.infrastructure.clients.storage.redis import (
+                get_redis_client as redis_client,
+            )
+
+            payload = orjson.dumps({"client_id": client_id})
+            await redis_client().execute(  # type: ignore[attr-defined]
+                "queue", lambda conn: conn.publish(_INVALIDATE_CHANNEL, payload)
+            )
+        except Exception as exc:
+            logger.debug("API key invalidation publish failed: %s", exc)
+
+    def _ensure_invalidation_listener(self) -> None:
+        """Лениво поднимает pub/sub-listener инвалидаций (один на процесс)."""
+        if self._cache_ttl <= 0 or self._listener_task is not None:
+            return
+        try:
+            from src.backend.core.utils.async_helpers import run_with_restarts
+            from src.backend.core.utils.task_registry import get_task_registry
+
+            # После разрыва события могли быть пропущены — кэш сбрасывается.
+            self._listener_task = get_task_registry().create_task(
+                run_with_restarts(
+                    self._listen_invalidations,
+                    name="API key invalidation listener",
+                    on_restart=self.invalidate_cached,
+                ),
+                name="apikey-invalidation-listen",
+            )
+        except Exception as exc:
+            logger.debug("API key invalidation listener not started: %s", exc)
+
+    async def _listen_invalidations(self) -> None:
+        """Один сеанс pub/sub; выход или ошибка — перезапуск с backoff."""
+        import orjson
+
+        from src.backend.infrastructure.clients.storage.redis import (
+            get_redis_client as redis_client,
+        )
+
+        pubsub = await redis_client().pubsub("queue")  # type: ignore[attr-defined]
+        await pubsub.subscribe(_INVALIDATE_CHANNEL)
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                client_id = orjson.loads(message.get("data")).get("client_id")
+            except Exception as exc:
+                logger.debug("Invalid apikey invalidation payload: %s", exc)
+                continue
+            self.invalidate_cached(client_id)
+
+    # ─────────────────────────── validation ───────────────────────────
+
     async def validate_key(self, raw_key: str) -> APIKeyInfo | None:
         """Проверяет API-ключ.
 
@@ -116,18 +322,138 @@ class APIKeyManager:
             Pre-S172: SHA-256 hash сравнивается с stored SHA.
             S172 M2: stored hash — Argon2 PHC (новый) или SHA-256 hex
             (legacy). Verify делегирует :class:`APIKeyAuth.verify`.
+            Порядок: кэш проверок (позитивный и негативный) → индекс
+            ``key_id`` → глобальный ключ → legacy-индекс/SCAN (только для
+            ключей без ``key_id``).
 
         """
+        fingerprint = self._fingerprint(raw_key)
+        cached = self._cache_get(fingerprint)
+        if cached is not None:
+            return cached
+        if self._is_rejected(fingerprint):
+            return None
+        self._ensure_invalidation_listener()
+
+        key_id = _split_key_id(raw_key)
+        if key_id is not None:
+            found = await self._validate_by_key_id(raw_key, key_id)
+            if found is not None:
+                info, valid_until = found
+                self._cache_put(fingerprint, info, valid_until)
+                return info
+
+        info = await self._validate_global(raw_key)
+        if info is not None:
+            self._cache_put(fingerprint, info, None)
+            return info
+
+        if key_id is None:
+            found = await self._validate_legacy(raw_key, fingerprint)
+            if found is not None:
+                info, valid_until = found
+                self._cache_put(fingerprint, info, valid_until)
+                return info
+        return None
+
+    async def _verify_record(
+        self, raw_key: str, record: dict[str, Any], key_id: str | None
+    ) -> tuple[APIKeyInfo, float | None] | None:
+        """Один verify против хэша записи, соответствующего ``key_id``.
+
+        ``key_id=None`` — legacy-ключ: сверяется с хэшем без ``key_id``.
+
+        Returns:
+            ``(info, valid_until)``; ``valid_until`` — конец grace period
+            для предыдущего ключа, ``None`` для текущего.
+
+        """
+        if not record.get("is_active", True):
+            return None
+        stored_hash = record.get("key_hash", "")
+        if (
+            stored_hash
+            and record.get("key_id") == key_id
+            and await self._verify_offloaded(raw_key, stored_hash)
+        ):
+            return (
+                APIKeyInfo(
+                    client_id=record.get("client_id", "unknown"),
+                    key_hash=stored_hash,
+                    version=record.get("version", 1),
+                    created_at=record.get("created_at", 0),
+                    is_active=True,
+                    key_id=key_id,
+                ),
+                None,
+            )
+
+        prev_hash = record.get("prev_key_hash", "")
+        grace_until = record.get("rotated_at", 0) + self._grace_period
+        if (
+            prev_hash
+            and record.get("prev_key_id") == key_id
+            and grace_until > time.time()
+            and await self._verify_offloaded(raw_key, prev_hash)
+        ):
+            return (
+                APIKeyInfo(
+                    client_id=record.get("client_id", "unknown"),
+                    key_hash=prev_hash,
+                    version=record.get("version", 1) - 1,
+                    is_active=True,
+                    description="grace_period",
+                    key_id=key_id,
+                ),
+                grace_until,
+            )
+        return None
+
+    async def _load_indexed_record(self, index_key: str) -> dict[str, Any] | None:
+        """GET индекса → client_id → GET записи (один round-trip в execute)."""
+        import orjson
+
+        from src.backend.infrastructure.clients.storage.redis import (
+            get_redis_client as redis_client,
+        )
+
+        async def _get(conn: Any) -> Any:
+            client_id = await conn.get(index_key)
+            if client_id is None:
+                return None
+            if isinstance(client_id, bytes):
+                client_id = client_id.decode()
+            return await conn.get(f"{_KEY_PREFIX}{client_id}")
+
+        raw = await redis_client().execute("cache", _get)  # type: ignore[attr-defined]
+        if raw is None:
+            return None
+        record = orjson.loads(raw)
+        return record if isinstance(record, dict) else None
+
+    async def _validate_by_key_id(
+        self, raw_key: str, key_id: str
+    ) -> tuple[APIKeyInfo, float | None] | None:
+        try:
+            record = await self._load_indexed_record(f"{_KEY_ID_PREFIX}{key_id}")
+        except Exception as exc:
+            logger.warning("Redis key-id lookup error: %s", exc)
+            return None
+        if record is None:
+            return None
+        return await self._verify_record(raw_key, record, key_id)
+
+    async def _validate_global(self, raw_key: str) -> APIKeyInfo | None:
         self._init_global_key()
 
-        # 1. Проверка глобального ключа (fallback).
+        # Проверка глобального ключа (fallback).
         #    Argon2 verify — non-trivial CPU cost (~50ms на 64MB);
         #    если stored hash — Argon2, делаем один verify.
         #    M2.3 review S-3 fix: error path emits audit-event (Redis-stream),
         #    не silent swallow.
         if self._global_key_hash:
             try:
-                if self._verify_against_hash(raw_key, self._global_key_hash):
+                if await self._verify_offloaded(raw_key, self._global_key_hash):
                     return APIKeyInfo(
                         client_id="global",
                         key_hash=self._global_key_hash,
@@ -144,8 +470,26 @@ class APIKeyManager:
                         "timestamp": str(time.time()),
                     },
                 )
+        return None
+
+    def _legacy_index_key(self, raw_key: str) -> str:
+        """Стабильный между воркерами индекс legacy-ключа (HMAC с secret_key)."""
+        from src.backend.core.config.settings import settings
+
+        digest = hmac.new(
+            settings.secure.secret_key.encode("utf-8"),
+            raw_key.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"{_LEGACY_PREFIX}{digest}"
 
-        # 2. Проверка per-client ключей в Redis (SCAN + MGET pipeline).
+    async def _validate_legacy(
+        self, raw_key: str, fingerprint: bytes
+    ) -> tuple[APIKeyInfo, float | None] | None:
+        """Legacy-ключ без ``key_id``: индекс, иначе однократный SCAN.
+
+        Промах SCAN'а (без ошибок Redis) попадает в негативный кэш.
+        """
         try:
             import orjson
 
@@ -153,6 +497,21 @@ class APIKeyManager:
                 get_redis_client as redis_client,
             )
 
+            index_key = self._legacy_index_key(raw_key)
+            record = await self._load_indexed_record(index_key)
+            if record is not None:
+                found = await self._verify_record(raw_key, record, None)
+                if found is None:
+                    # Ключ уже ротирован/деактивирован — индекс устарел.
+                    await redis_client()._redis.delete(index_key)  # type: ignore[attr-defined]
+                return found
+            if await redis_client()._redis.delete(index_key):  # type: ignore[attr-defined]
+                # Индекс пережил запись клиента (отзыв до учёта индексов):
+                # ключ отозван, SCAN не нужен.
+                return None
+            if not self._legacy_scan:
+                return None
+
             async def _mget_keys(conn: Any) -> list[dict[str, Any]]:
                 keys: list[str] = []
                 async for k in conn.scan_iter(match=f"{_KEY_PREFIX}*", count=500):
@@ -176,39 +535,25 @@ class APIKeyManager:
                 return result
 
             all_data = await redis_client().execute("cache", _mget_keys)  # type: ignore[attr-defined]
-            now = time.time()
 
             for info in all_data:
-                stored_hash = info.get("key_hash", "")
-                prev_hash = info.get("prev_key_hash", "")
-                is_active = info.get("is_active", True)
-
-                if (
-                    is_active
-                    and stored_hash
-                    and self._verify_against_hash(raw_key, stored_hash)
-                ):
-                    return APIKeyInfo(
-                        client_id=info.get("client_id", "unknown"),
-                        key_hash=stored_hash,
-                        version=info.get("version", 1),
-                        created_at=info.get("created_at", 0),
-                        is_active=True,
-                    )
-
-                if (
-                    prev_hash
-                    and is_active
-                    and self._verify_against_hash(raw_key, prev_hash)
-                    and info.get("rotated_at", 0) + self._grace_period > now
-                ):
-                    return APIKeyInfo(
-                        client_id=info.get("client_id", "unknown"),
-                        key_hash=prev_hash,
-                        version=info.get("version", 1) - 1,
-                        is_active=True,
-                        description="grace_period",
-                    )
+                # Записи, где и текущий, и предыдущий ключ имеют key_id,
+                # legacy-ключом совпасть не могут.
+                if "key_id" in info and "prev_key_id" in info:
+                    continue
+                found = await self._verify_record(raw_key, info, None)
+                if found is None:
+                    continue
+                # Миграция: следующие проверки этого ключа — O(1).
+                index_ttl = None
+                if found[1] is not None:
+                    index_ttl = max(1, int(found[1] - time.time()))
+                client_id = info.get("client_id", "")
+                conn = redis_client()._redis  # type: ignore[attr-defined]
+                await conn.set(index_key, client_id, ex=index_ttl)
+                await conn.sadd(f"{_LEGACY_OWNER_PREFIX}{client_id}", index_key)
+                return found
+            self._reject(fingerprint)
 
         except Exception as exc:
             logger.warning(
@@ -234,8 +579,8 @@ class APIKeyManager:
         """
         from src.backend.core.auth.api_key_backend import APIKeyAuth, StrengthReport
 
-        # 1. Generate key.
-        raw_key = f"gd_{secrets.token_urlsafe(32)}"
+        # 1. Generate key (``<key_id>.<secret>`` — O(1) lookup по key_id).
+        key_id, raw_key = _generate_raw_key()
         # 2. S175 M10.3: pre-creation strength gate (defensive).
         strength: StrengthReport = APIKeyAuth.validate_strength(raw_key)
         if not strength.is_acceptable:
@@ -259,6 +604,7 @@ class APIKeyManager:
 
         key_data = {
             "client_id": client_id,
+            "key_id": key_id,
             "key_hash": key_hash,
             "prev_key_hash": "",
             "version": 1,
@@ -290,6 +636,9 @@ class APIKeyManager:
             await redis_client()._redis.set(  # type: ignore[attr-defined]
                 f"{_KEY_PREFIX}{client_id}", orjson.dumps(key_data)
             )
+            await redis_client()._redis.set(  # type: ignore[attr-defined]
+                f"{_KEY_ID_PREFIX}{key_id}", client_id
+            )
         except Exception as exc:
             logger.error("Failed to store client key: %s", exc)
 
@@ -324,8 +673,10 @@ class APIKeyManager:
 
             key_data = orjson.loads(raw)
             old_hash = key_data["key_hash"]
+            old_key_id = key_data.get("key_id")
+            expired_key_id = key_data.get("prev_key_id")
 
-            new_raw = f"gd_{secrets.token_urlsafe(32)}"
+            new_key_id, new_raw = _generate_raw_key()
             # S175 M10.3: pre-creation strength gate (defensive — same
             # gate as create_client_key).
             from src.backend.core.auth.api_key_backend import APIKeyAuth, StrengthReport
@@ -349,10 +700,22 @@ class APIKeyManager:
             key_data["version"] = key_data.get("version", 1) + 1
             key_data["rotated_at"] = now
             key_data["hash_algo"] = "argon2id" if is_argon2_hash(new_hash) else "sha256"
-
-            await redis_client()._redis.set(  # type: ignore[attr-defined]
-                f"{_KEY_PREFIX}{client_id}", orjson.dumps(key_data)
-            )
+            # Отсутствие prev_key_id помечает предыдущий ключ как legacy.
+            key_data.pop("prev_key_id", None)
+            if old_key_id is not None:
+                key_data["prev_key_id"] = old_key_id
+            key_data["key_id"] = new_key_id
+
+            conn = redis_client()._redis  # type: ignore[attr-defined]
+            await conn.set(f"{_KEY_PREFIX}{client_id}", orjson.dumps(key_data))
+            await conn.set(f"{_KEY_ID_PREFIX}{new_key_id}", client_id)
+            if old_key_id is not None:
+                await conn.expire(
+                    f"{_KEY_ID_PREFIX}{old_key_id}", max(1, self._grace_period)
+                )
+            if expired_key_id is not None:
+                await conn.delete(f"{_KEY_ID_PREFIX}{expired_key_id}")
+            await self._broadcast_invalidation(client_id)
 
             await redis_client().add_to_stream(  # type: ignore[attr-defined]
                 stream_name=_AUDIT_PREFIX + "events",
@@ -381,11 +744,29 @@ class APIKeyManager:
     async def revoke_client_key(self, client_id: str) -> bool:
         """Отзывает ключ клиента (немедленно, без grace period)."""
         try:
+            import orjson
+
             from src.backend.infrastructure.clients.storage.redis import (
                 get_redis_client as redis_client,
             )
 
-            await redis_client()._redis.delete(f"{_KEY_PREFIX}{client_id}")  # type: ignore[attr-defined]
+            conn = redis_client()._redis  # type: ignore[attr-defined]
+            raw = await conn.get(f"{_KEY_PREFIX}{client_id}")
+            index_keys = []
+            if raw:
+                key_data = orjson.loads(raw)
+                index_keys = [
+                    f"{_KEY_ID_PREFIX}{key_data[field]}"
+                    for field in ("key_id", "prev_key_id")
+                    if key_data.get(field)
+                ]
+            owner_key = f"{_LEGACY_OWNER_PREFIX}{client_id}"
+            for legacy_key in await conn.smembers(owner_key):
+                index_keys.append(
+                    legacy_key if isinstance(legacy_key, str) else legacy_key.decode()
+                )
+            await conn.delete(f"{_KEY_PREFIX}{client_id}", owner_key, *index_keys)
+            await self._broadcast_invalidation(client_id)
             await redis_client().add_to_stream(  # type: ignore[attr-defined]
                 stream_name=_AUDIT_PREFIX + "events",
                 data={
@@ -460,7 +841,7 @@ class APIKeyManager:
             stored_hash = key_data.get("key_hash", "")
 
             # Verify current raw key против stored hash.
-            if not self._verify_against_hash(current_raw_key, stored_hash):
+            if not await self._verify_offloaded(current_raw_key, stored_hash):
                 logger.warning(
                     "upgrade_to_argon2: verify failed for client '%s'", client_id
                 )
@@ -482,6 +863,7 @@ class APIKeyManager:
             await redis_client()._redis.set(  # type: ignore[attr-defined]
                 f"{_KEY_PREFIX}{client_id}", orjson.dumps(key_data)
             )
+            await self._broadcast_invalidation(client_id)
             await redis_client().add_to_stream(  # type: ignore[attr-defined]
                 stream_name=_AUDIT_PREFIX + "events",
                 data={
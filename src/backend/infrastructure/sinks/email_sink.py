@@ -3,6 +3,10 @@
 Lazy-импорт ``aiosmtplib`` (extra ``email``). При отсутствии
 библиотеки ``send`` возвращает ``SinkResult(ok=False)``.
 
+Письма уходят через :class:`SmtpSessionPool`: аутентифицированные
+сессии (EHLO/STARTTLS/AUTH один раз) переиспользуются между вызовами
+``send`` вместо ``aiosmtplib.send`` с handshake на каждое письмо.
+
 API совместим с ``aiosmtplib >= 3.0``; для 5.x работает (тест
 сигнатуры :func:`aiosmtplib.send` стабилен).
 """
@@ -19,6 +23,7 @@ from src.backend.core.resilience.connector_breaker import with_breaker
 from src.backend.core.resilience.retry import with_retry
 from src.backend.core.security.connector_auth import require_capability
 from src.backend.infrastructure.clients.base_connector import HealthResult
+from src.backend.infrastructure.clients.transport.smtp_pool import SmtpSessionPool
 from src.backend.infrastructure.security.connector_rate_limiter import (
     get_connector_rate_limiter,
 )
@@ -41,6 +46,10 @@ class EmailSink(Sink):
         start_tls: Использовать STARTTLS после ``EHLO``.
         default_to: Адрес по умолчанию (если ``payload`` не содержит ``to``).
         default_subject: Тема по умолчанию.
+        pool_size: Максимум одновременно открытых SMTP-сессий.
+        max_idle: Сколько секунд сессия может простаивать в пуле.
+        max_messages_per_session: После скольких писем сессия пересоздаётся.
+        timeout: Таймаут SMTP-команд в секундах.
 
     ``send(payload)`` принимает ``dict`` со схемой:
         ``{"to": "alice@x", "subject": "...", "body": "...",
@@ -59,7 +68,14 @@ class EmailSink(Sink):
     start_tls: bool = True
     default_to: str | None = None
     default_subject: str = ""
+    pool_size: int = 4
+    max_idle: float = 30.0
+    max_messages_per_session: int = 100
+    timeout: float = 60.0
     kind: SinkKind = field(default=SinkKind.MAIL, init=False)
+    _pool: SmtpSessionPool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @with_breaker("email_sink")
     @with_retry(
@@ -69,7 +85,7 @@ class EmailSink(Sink):
     )
     @require_capability("email.send", action="write")
     async def send(self, payload: Any) -> SinkResult:
-        """Формирует :class:`email.message.EmailMessage` и отправляет через aiosmtplib."""
+        """Формирует :class:`EmailMessage` и отправляет через пул SMTP-сессий."""
         # S1: per-connector rate limit (10/s — SMTP is slow).
         limiter = get_connector_rate_limiter()
         limiter.register(f"{self.sink_id}_{self.kind}", "10/s", 10)
@@ -85,15 +101,7 @@ class EmailSink(Sink):
             return SinkResult(ok=False, details={"error": "invalid email payload"})
 
         try:
-            await aiosmtplib.send(
-                msg,
-                hostname=self.host,
-                port=self.port,
-                username=self.username,
-                password=self.password,
-                use_tls=self.use_tls,
-                start_tls=self.start_tls,
-            )
+            await self._session_pool(aiosmtplib).send_message(msg)
         except Exception as exc:
             return SinkResult(
                 ok=False, details={"error": str(exc) or exc.__class__.__name__}
@@ -105,6 +113,39 @@ class EmailSink(Sink):
             details={"to": msg["To"], "subject": msg["Subject"]},
         )
 
+    async def aclose(self) -> None:
+        """Закрыть простаивающие SMTP-сессии пула."""
+        if self._pool is not None:
+            await self._pool.aclose()
+            self._pool = None
+
+    def _session_pool(self, aiosmtplib: Any) -> SmtpSessionPool:
+        """Ленивый пул сессий этого sink'а."""
+        if self._pool is None:
+
+            async def connect() -> Any:
+                client = aiosmtplib.SMTP(
+                    hostname=self.host,
+                    port=self.port,
+                    username=self.username,
+                    password=self.password,
+                    use_tls=self.use_tls,
+                    start_tls=self.start_tls,
+                    timeout=self.timeout,
+                )
+                # connect() выполняет EHLO, STARTTLS и AUTH.
+                await client.connect()
+                return client
+
+            self._pool = SmtpSessionPool(
+                connect,
+                max_size=self.pool_size,
+                max_idle=self.max_idle,
+                max_messages=self.max_messages_per_session,
+                name=self.sink_id,
+            )
+        return self._pool
+
     def _build_message(self, payload: Any) -> EmailMessage | None:
         """Строит :class:`EmailMessage` из payload (dict или str)."""
         if isinstance(payload, dict):
@@ -64,7 +64,7 @@ class HttpSink(Sink):
 
         try:
             async with OutboundHttpClient(
-                timeout=httpx.Timeout(self.timeout)
+                timeout=httpx.Timeout(self.timeout), pooled=True
             ) as client:
                 response = await client.request(
                     method=self.method,
@@ -99,7 +99,7 @@ class HttpSink(Sink):
         start = time.perf_counter()
         try:
             async with OutboundHttpClient(
-                timeout=httpx.Timeout(self.timeout)
+                timeout=httpx.Timeout(self.timeout), pooled=True
             ) as client:
                 # ``HEAD`` через ``request`` — ``OutboundHttpClient`` не
                 # имеет shortcut'а ``head``, request совместим со всеми
@@ -115,6 +115,7 @@ class SmsSink(Sink):
             async with OutboundHttpClient(
                 timeout=httpx.Timeout(self.timeout_s),
                 plugin=f"sms_sink.{self.provider}",
+                pooled=True,
             ) as client:
                 resp = await client.post(
                     self._endpoint(),
@@ -179,7 +180,9 @@ class SmsSink(Sink):
 
             start = time.perf_counter()
             async with OutboundHttpClient(
-                timeout=httpx.Timeout(2.0), plugin=f"sms_sink.{self.provider}"
+                timeout=httpx.Timeout(2.0),
+                plugin=f"sms_sink.{self.provider}",
+                pooled=True,
             ) as client:
                 resp = await client.request("HEAD", self._endpoint())
                 latency_ms = (time.perf_counter() - start) * 1000.0
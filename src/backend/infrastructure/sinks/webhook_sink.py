@@ -82,7 +82,7 @@ class WebhookSink(Sink):
 
         async def _do_post() -> Any:
             async with OutboundHttpClient(
-                timeout=httpx.Timeout(self.timeout)
+                timeout=httpx.Timeout(self.timeout), pooled=True
             ) as client:
                 resp = await client.post(self.url, content=body_bytes, headers=headers)
             # 5xx — поднимаем для retry policy
@@ -146,7 +146,7 @@ class WebhookSink(Sink):
         start = time.perf_counter()
         try:
             async with OutboundHttpClient(
-                timeout=httpx.Timeout(self.timeout)
+                timeout=httpx.Timeout(self.timeout), pooled=True
             ) as client:
                 response = await client.request("HEAD", self.url)
             latency_ms = (time.perf_counter() - start) * 1000.0
@@ -42,6 +42,8 @@ class CDCSource:
         plugin: Имя plug-in (``pgoutput`` default; альтернатива — ``wal2json``).
         decode_options: Дополнительные опции декодирования (зависят от plug-in).
         poll_interval_seconds: Интервал опроса слота при отсутствии сообщений.
+        checkpointer: ``LsnCheckpointer`` (опц.): вместо ``send_feedback`` на
+            каждое сообщение LSN подтверждается batch'ами.
 
     """
 
@@ -57,6 +59,7 @@ class CDCSource:
         plugin: str = "pgoutput",
         decode_options: dict[str, str] | None = None,
         poll_interval_seconds: float = 1.0,
+        checkpointer: Any | None = None,
     ) -> None:
         self.source_id = source_id
         self._dsn = dsn
@@ -65,6 +68,7 @@ class CDCSource:
         self._plugin = plugin
         self._decode_options = decode_options or {}
         self._interval = poll_interval_seconds
+        self._checkpointer = checkpointer
         self._task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
 
@@ -98,8 +102,8 @@ class CDCSource:
     async def _run(self, on_event: EventCallback) -> None:
         try:
             from psycopg import AsyncConnection  # type: ignore[import-not-found]
-            from psycopg.replication import (  # type: ignore[import-not-found]
-                LogicalReplicationConnection,  # type: ignore[import-not-found]  # type: ignore  # type: ignore[unused-ignore]
+            from psycopg.replication import (
+                LogicalReplicationConnection,  # type: ignore[import-not-found]
             )
         except ImportError as exc:
             raise RuntimeError(
@@ -128,6 +132,10 @@ class CDCSource:
             await cursor.start_replication(
                 slot_name=self._slot, options=options, decode=False
             )
+            if self._checkpointer is not None:
+                self._checkpointer.bind(
+                    lambda lsn: cursor.send_feedback(flush_lsn=lsn)
+                )
             try:
                 async for msg in cursor:
                     if self._stop_event.is_set():
@@ -136,9 +144,20 @@ class CDCSource:
                     # succeeds. If on_event fails (now raises), we skip
                     # feedback — PG will redeliver on next reconnect.
                     await self._emit(on_event, msg)
-                    if hasattr(msg, "cursor"):
+                    if self._checkpointer is not None:
+                        await self._checkpointer.ack(msg.data_start)
+                    elif hasattr(msg, "cursor"):
                         await msg.cursor.send_feedback(flush_lsn=msg.data_start)
             finally:
+                if self._checkpointer is not None:
+                    # Подтверждённый хвост batch'а — пока cursor ещё открыт.
+                    try:
+                        await self._checkpointer.flush()
+                    except Exception as exc:
+                        logger.warning(
+                            "CDCSource %s: final checkpoint failed: %s", self._slot, exc
+                        )
+                    self._checkpointer.bind(None)
                 try:
                     await cursor.close()
                 except Exception as exc:
@@ -5,9 +5,16 @@ Wave ``[wave:s5/k3-w5-cdc-postgres]``.
 Дополнение к существующему :class:`src.backend.infrastructure.sources.cdc.CDCSource`:
 
 * поддержка двух режимов: ``full`` (snapshot + tail) и ``delta`` (только tail);
+  ``full`` без checkpoint'а читает таблицу параллельно из snapshot'а,
+  экспортированного при создании slot'а, и переходит к streaming'у с
+  ``consistent_point`` этого slot'а (см. :mod:`.cdc_postgres_snapshot`);
 * персистентный watermark-cursor через CdcCursorStore (Postgres-table
   ``cdc_cursors(slot_name, last_lsn, updated_at)``);
-* setup publication + replication-slot в startup (idempotent).
+* setup publication + replication-slot в startup (idempotent);
+* batched checkpoint (:class:`LsnCheckpointer`): cursor пишется и
+  confirmed-flush LSN слота двигается раз в ``checkpoint_batch_size``
+  событий или ``checkpoint_interval`` секунд — и только на LSN, до
+  которого downstream подтвердил все события.
 
 Делегирует низкоуровневую работу с pgoutput / wal2json в существующий
 :class:`CDCSource` (lazy-import).
@@ -21,11 +28,17 @@ Feature flag: ``feature_flags.cdc_postgres_enabled`` (default-OFF).
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import UTC, datetime
 from typing import Any
 
 from src.backend.core.interfaces.source import EventCallback, SourceEvent, SourceKind
 from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
 from src.backend.infrastructure.clients.base_connector import HealthResult
 
 __all__ = (
@@ -34,10 +47,18 @@ __all__ = (
     "PG_CDC_SLOT_CREATE_TPL",
     "CdcCursorStore",
     "CdcPostgresLogicalSource",
+    "LsnCheckpointer",
 )
 
 _logger = get_logger("infrastructure.sources.cdc.postgres_logical")
 
+cdc_checkpoint_batch_size = metrics_registry.histogram(
+    "cdc_checkpoint_batch_size",
+    "CDC events acknowledged per LSN checkpoint.",
+    labels=("slot",),
+    buckets=(1, 10, 50, 100, 250, 500, 1000, 5000),
+)
+
 
 PG_CDC_CURSORS_DDL = """
 CREATE TABLE IF NOT EXISTS cdc_cursors (
@@ -61,6 +82,21 @@ SELECT pg_create_logical_replication_slot('{slot}', 'pgoutput');
 _ALLOWED_MODES = frozenset({"full", "delta"})
 
 
+def _lsn_int(lsn: Any) -> int:
+    """LSN как число: ``int`` (psycopg ``data_start``) или текст ``X/Y``."""
+    if isinstance(lsn, int):
+        return lsn
+    high, _, low = str(lsn).partition("/")
+    if not low:
+        return int(high)
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+def _lsn_text(lsn: int) -> str:
+    """Текстовая форма ``pg_lsn`` (``X/Y``) — формат ``cdc_cursors.last_lsn``."""
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
 class CdcCursorStore:
     """Watermark-store cursor'ов CDC (через Postgres-table ``cdc_cursors``).
 
@@ -105,6 +141,136 @@ class CdcCursorStore:
             await session.execute(sql)
 
 
+class LsnCheckpointer:
+    """Debounced checkpoint LSN: по числу событий и по времени.
+
+    ``ack(lsn)`` вызывается после того, как downstream обработал
+    событие; checkpoint (запись ``cdc_cursors`` + ``confirm`` — обычно
+    ``send_feedback(flush_lsn=...)`` слота) выполняется, когда набралось
+    ``batch_size`` подтверждений или с первого неподтверждённого прошло
+    ``flush_interval`` секунд. Фоновый таймер (:meth:`start`) сбрасывает
+    хвост batch'а на простаивающем потоке.
+
+    События слота обрабатываются строго по порядку, поэтому последний
+    подтверждённый LSN покрывает весь batch: при падении между
+    checkpoint'ами слот отдаст события повторно (at-least-once).
+
+    ``ack`` принимает LSN числом или текстом ``X/Y``; в ``cdc_cursors``
+    пишется текстовая форма ``pg_lsn``, в ``confirm`` передаётся число.
+
+    Args:
+        slot_name: Имя replication-slot (ключ в ``cdc_cursors``).
+        store: ``CdcCursorStore`` (опц.) для персистентного cursor'а.
+        batch_size: Событий на один checkpoint.
+        flush_interval: Максимальный возраст неподтверждённого batch'а (сек).
+        clock: Источник монотонного времени (для тестов).
+
+    """
+
+    def __init__(
+        self,
+        slot_name: str,
+        *,
+        store: CdcCursorStore | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.slot_name = slot_name
+        self._store = store
+        self._batch_size = batch_size
+        self._interval = flush_interval
+        self._clock = clock
+        self._confirm: Callable[[Any], Awaitable[Any]] | None = None
+        self._pending: Any = None
+        self._pending_count = 0
+        self._batch_started = 0.0
+        self._confirmed: Any = None
+        self._lock = asyncio.Lock()
+        self._ticker: asyncio.Task[None] | None = None
+
+    @property
+    def confirmed_lsn(self) -> Any:
+        """Последний LSN, прошедший checkpoint."""
+        return self._confirmed
+
+    @property
+    def pending(self) -> int:
+        """Подтверждённые downstream события, ещё не попавшие в checkpoint."""
+        return self._pending_count
+
+    def bind(self, confirm: Callable[[Any], Awaitable[Any]] | None) -> None:
+        """Привязать (или отвязать) продвижение confirmed-flush LSN слота."""
+        self._confirm = confirm
+
+    async def ack(self, lsn: Any) -> None:
+        """Событие с ``lsn`` обработано downstream."""
+        if not lsn:
+            return
+        if self._pending_count == 0:
+            self._batch_started = self._clock()
+        self._pending = _lsn_int(lsn)
+        self._pending_count += 1
+        if (
+            self._pending_count >= self._batch_size
+            or self._clock() - self._batch_started >= self._interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> Any:
+        """Checkpoint накопленного batch'а; возвращает записанный LSN."""
+        async with self._lock:
+            if self._pending_count == 0:
+                return None
+            lsn, count = self._pending, self._pending_count
+            self._pending, self._pending_count = None, 0
+            if self._store is not None:
+                try:
+                    await self._store.set_last_lsn(self.slot_name, _lsn_text(lsn))
+                except Exception as exc:
+                    _logger.warning(
+                        "CdcPostgresLogicalSource cursor write failed: %s", exc
+                    )
+            if self._confirm is not None:
+                await self._confirm(lsn)
+            self._confirmed = lsn
+            cdc_checkpoint_batch_size.labels(slot=self.slot_name).observe(count)
+            return lsn
+
+    def start(self) -> None:
+        """Запустить таймер, сбрасывающий batch по ``flush_interval``."""
+        if self._ticker is not None and not self._ticker.done():
+            return
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        self._ticker = get_task_registry().create_task(
+            self._tick(), name=f"cdc-checkpoint:{self.slot_name}"
+        )
+
+    async def aclose(self) -> None:
+        """Остановить таймер и записать последний подтверждённый LSN."""
+        if self._ticker is not None and not self._ticker.done():
+            self._ticker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ticker
+        self._ticker = None
+        await self.flush()
+
+    async def _tick(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            if (
+                self._pending_count
+                and self._clock() - self._batch_started >= self._interval
+            ):
+                try:
+                    await self.flush()
+                except Exception as exc:
+                    _logger.warning("CDC checkpoint %s failed: %s", self.slot_name, exc)
+
+
 class CdcPostgresLogicalSource:
     """Расширенный CDC PostgreSQL Source с режимами ``full|delta`` + watermark.
 
@@ -115,8 +281,20 @@ class CdcPostgresLogicalSource:
         mode: ``full`` — snapshot + tail, ``delta`` — только tail.
         slot_name: Имя slot (по умолчанию ``cdc_<table>``).
         publication: Имя publication (по умолчанию ``pub_<table>``).
-        cursor_store: ``CdcCursorStore`` для персистентного ack-cursor (опц.).
+        cursor_store: ``CdcCursorStore`` для персистентного ack-cursor;
+            обязателен для ``full`` — по нему рестарт отличает «snapshot уже
+            был» от первого запуска.
         plugin: ``pgoutput`` (default) / ``wal2json``.
+        checkpoint_batch_size: Событий на один checkpoint LSN.
+        checkpoint_interval: Максимальная задержка checkpoint'а (сек).
+        snapshot_workers: Параллельных соединений initial snapshot'а.
+        snapshot_chunk_rows: Строк на страницу snapshot'а.
+        snapshot_key_column: Колонка PK для диапазонов (default — из
+            ``pg_index``).
+        snapshot_connect: Фабрика asyncpg-соединений для snapshot'а
+            (default — ``asyncpg.connect(dsn)``).
+        snapshot_exporter: ``() -> async CM[(snapshot_name, lsn)]``
+            (default — :func:`export_slot_snapshot`).
 
     """
 
@@ -133,6 +311,15 @@ class CdcPostgresLogicalSource:
         publication: str | None = None,
         cursor_store: CdcCursorStore | None = None,
         plugin: str = "pgoutput",
+        checkpoint_batch_size: int = 500,
+        checkpoint_interval: float = 1.0,
+        snapshot_workers: int = 4,
+        snapshot_chunk_rows: int = 10_000,
+        snapshot_key_column: str | None = None,
+        snapshot_connect: Callable[[], Awaitable[Any]] | None = None,
+        snapshot_exporter: (
+            Callable[[], AbstractAsyncContextManager[tuple[str, str]]] | None
+        ) = None,
     ) -> None:
         if mode not in _ALLOWED_MODES:
             raise ValueError(
@@ -144,6 +331,10 @@ class CdcPostgresLogicalSource:
             raise ValueError("table must be non-empty")
         if not dsn:
             raise ValueError("dsn must be non-empty")
+        if mode == "full" and cursor_store is None:
+            # Без checkpoint'а каждый рестарт пересоздавал бы slot и
+            # повторял snapshot всей таблицы.
+            raise ValueError("mode='full' requires cursor_store")
         self.source_id = source_id
         self.table = table
         self.dsn = dsn
@@ -152,7 +343,19 @@ class CdcPostgresLogicalSource:
         self.publication = publication or f"pub_{table}"
         self.cursor_store = cursor_store
         self.plugin = plugin
+        self.checkpointer = LsnCheckpointer(
+            self.slot_name,
+            store=cursor_store,
+            batch_size=checkpoint_batch_size,
+            flush_interval=checkpoint_interval,
+        )
+        self.snapshot_workers = snapshot_workers
+        self.snapshot_chunk_rows = snapshot_chunk_rows
+        self.snapshot_key_column = snapshot_key_column
+        self._snapshot_connect = snapshot_connect
+        self._snapshot_exporter = snapshot_exporter
         self._inner: Any = None
+        self._bootstrap: asyncio.Task[None] | None = None
 
     async def setup(self, conn_executor: Any) -> None:
         """Idempotent setup: создать publication/slot + ensure cdc_cursors.
@@ -178,7 +381,7 @@ class CdcPostgresLogicalSource:
             await self.cursor_store.ensure_table()
 
     async def start(self, on_event: EventCallback) -> None:
-        """Запустить чтение через CDCSource + ack-cursor запись."""
+        """Запустить чтение через CDCSource + batched checkpoint LSN."""
         try:
             from src.backend.core.config.features import feature_flags
 
@@ -208,36 +411,116 @@ class CdcPostgresLogicalSource:
             slot_name=self.slot_name,
             publication_names=[self.publication],
             plugin=self.plugin,
+            checkpointer=self.checkpointer,
         )
 
-        async def _wrapped(event: SourceEvent) -> None:
-            await on_event(event)
-            if self.cursor_store is not None:
-                lsn = (event.payload or {}).get("lsn")
-                if lsn:
-                    try:
-                        await self.cursor_store.set_last_lsn(self.slot_name, lsn)
-                    except Exception as exc:
-                        _logger.warning(
-                            "CdcPostgresLogicalSource cursor write failed: %s", exc
-                        )
-
-        if self.mode == "full":
+        if self.mode == "full" and not await self._has_checkpoint():
             await self._emit_snapshot_marker(on_event)
-        await self._inner.start(_wrapped)
+            from src.backend.core.utils.task_registry import get_task_registry
+
+            # Snapshot большой таблицы идёт минуты — start() не блокируем.
+            self._bootstrap = get_task_registry().create_task(
+                self._snapshot_then_stream(on_event),
+                name=f"cdc-snapshot:{self.source_id}",
+            )
+            return
+        self.checkpointer.start()
+        await self._inner.start(on_event)
 
     async def stop(self) -> None:
         """Остановить CDC source (закрыть slot, release resources)."""
+        from src.backend.infrastructure.sources._lifecycle import graceful_cancel
+
+        await graceful_cancel(self._bootstrap, source_id=self.source_id)
+        self._bootstrap = None
         if self._inner is not None:
             await self._inner.stop()
             self._inner = None
+        await self.checkpointer.aclose()
 
     async def health(self, mode: str = "fast") -> HealthResult:
         """Health check (fast=basic, deep=full streaming probe)."""
+        if self._bootstrap is not None and not self._bootstrap.done():
+            return HealthResult.ok(latency_ms=0.0, mode=mode, phase="snapshot")
         if self._inner is None:
             return HealthResult.failed(error="Not started", mode=mode)
         return await self._inner.health(mode=mode)
 
+    async def _has_checkpoint(self) -> bool:
+        """Slot уже подтверждал LSN — snapshot был, продолжаем tail.
+
+        Ошибка чтения cursor'а не трактуется как «checkpoint'а нет»: это
+        пересоздало бы slot с подтверждённой позицией.
+        """
+        if self.cursor_store is None:
+            return False
+        return await self.cursor_store.get_last_lsn(self.slot_name) is not None
+
+    async def _snapshot_then_stream(self, on_event: EventCallback) -> None:
+        """Initial snapshot из экспортированного snapshot'а slot'а, затем tail."""
+        from src.backend.infrastructure.sources.cdc_postgres_snapshot import (
+            PgTableSnapshot,
+            export_slot_snapshot,
+        )
+
+        exporter = self._snapshot_exporter or (
+            lambda: export_slot_snapshot(self.dsn, self.slot_name, self.plugin)
+        )
+        reader = PgTableSnapshot(
+            self.table,
+            connect=self._snapshot_connect or self._asyncpg_connect,
+            key_column=self.snapshot_key_column,
+            workers=self.snapshot_workers,
+            chunk_rows=self.snapshot_chunk_rows,
+        )
+        try:
+            async with exporter() as (snapshot_name, lsn):
+
+                async def _emit(rows: list[dict[str, Any]]) -> None:
+                    for row in rows:
+                        await on_event(self._snapshot_event(row, lsn))
+
+                total = await reader.run(snapshot_name, _emit)
+            # consistent_point — граница snapshot/tail: streaming slot'а
+            # начинается ровно с него, повторный start() пойдёт в tail.
+            await self.checkpointer.ack(lsn)
+            await self.checkpointer.flush()
+            await on_event(
+                self._snapshot_event(None, lsn, event="snapshot_completed", rows=total)
+            )
+        except Exception as exc:
+            _logger.error(
+                "CdcPostgresLogicalSource %s snapshot failed: %s", self.source_id, exc
+            )
+            raise
+        self.checkpointer.start()
+        await self._inner.start(on_event)
+
+    def _snapshot_event(
+        self,
+        row: dict[str, Any] | None,
+        lsn: str,
+        *,
+        event: str = "snapshot",
+        **extra: Any,
+    ) -> SourceEvent:
+        payload: dict[str, Any] = {"event": event, "table": self.table, "lsn": lsn}
+        if row is not None:
+            payload["row"] = row
+        payload.update(extra)
+        return SourceEvent(
+            source_id=self.source_id,
+            kind=self.kind,
+            payload=payload,
+            event_time=datetime.now(UTC),
+            metadata={"slot": self.slot_name, "mode": "full", "snapshot": True},
+        )
+
+    async def _asyncpg_connect(self) -> Any:
+        import asyncpg
+
+        return await asyncpg.connect(self.dsn)
+
     async def _emit_snapshot_marker(self, on_event: EventCallback) -> None:
         """В режиме ``full`` эмитим первое событие-маркер начала snapshot."""
         await on_event(
@@ -97,7 +97,9 @@ class PollingSource:
         return HealthResult.failed(error="Not started", mode=mode)
 
     async def _run(self, on_event: EventCallback) -> None:
-        async with OutboundHttpClient(timeout=httpx.Timeout(self._timeout)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(self._timeout), pooled=True
+        ) as client:
             first = True
             while not self._stop_event.is_set():
                 try:
@@ -0,0 +1,17 @@
+"""Бэкенды :class:`core.interfaces.keyed_state_store.KeyedStateStore`.
+
+* :class:`MemoryKeyedStateStore` — всё состояние в RAM.
+* :class:`SpillingKeyedStateStore` — bounded LRU горячих ключей, холодные
+  ключи вытесняются в локальный SQLite (stdlib ``sqlite3``).
+"""
+
+from __future__ import annotations as annotations
+
+from src.backend.infrastructure.streaming_state.memory_store import (
+    MemoryKeyedStateStore,
+)
+from src.backend.infrastructure.streaming_state.spilling_store import (
+    SpillingKeyedStateStore,
+)
+
+__all__ = ("MemoryKeyedStateStore", "SpillingKeyedStateStore")
@@ -0,0 +1,66 @@
+"""In-memory реализация :class:`KeyedStateStore`.
+
+Состояние живёт в RAM текущего процесса. Подходит для unit-тестов и
+потоков с умеренной кардинальностью ключей; для миллионов ключей —
+``SpillingKeyedStateStore``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.backend.infrastructure.streaming_state.timer_index import TimerIndex
+
+__all__ = ("MemoryKeyedStateStore",)
+
+
+class MemoryKeyedStateStore:
+    """Keyed-state в словаре ``{key: (state, timer)}``.
+
+    Состояние хранится по ссылке (без копирования): оконный процессор
+    мутирует pane-агрегаты на месте, и лишняя копия на каждое событие
+    свела бы на нет инкрементальную агрегацию. Таймеры индексируются
+    кучей (:class:`TimerIndex`), поэтому ``due``/``min_timer`` не сканируют
+    все ключи.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[Any, int]] = {}
+        self._timers = TimerIndex(self._timer_of)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: str, *, promote: bool = True) -> Any | None:
+        """Метод get (см. signature)."""
+        entry = self._data.get(key)
+        return None if entry is None else entry[0]
+
+    async def put(self, key: str, state: Any, *, timer: int) -> None:
+        """Метод put (см. signature)."""
+        previous = self._data.get(key)
+        self._data[key] = (state, timer)
+        if previous is None or previous[1] != timer:
+            self._timers.push(key, timer)
+            self._timers.compact(len(self._data))
+
+    async def delete(self, key: str) -> None:
+        """Метод delete (см. signature)."""
+        self._data.pop(key, None)
+
+    async def due(self, before: int) -> list[str]:
+        """Метод due (см. signature)."""
+        return self._timers.due(before)
+
+    async def min_timer(self) -> int | None:
+        """Метод min_timer (см. signature)."""
+        return self._timers.min_timer()
+
+    async def close(self) -> None:
+        """Метод close (см. signature)."""
+        self._data.clear()
+        self._timers.clear()
+
+    def _timer_of(self, key: str) -> int | None:
+        entry = self._data.get(key)
+        return None if entry is None else entry[1]
@@ -0,0 +1,266 @@
+# ruff: noqa: S608 — false positive (table name is a module constant)
+
+"""``SpillingKeyedStateStore`` — keyed-state с вытеснением в локальный SQLite.
+
+Горячие ключи живут в ``OrderedDict`` (LRU) размером не больше
+``max_hot_keys``. При переполнении самые давно не тронутые ключи пачкой
+(``spill_batch``) сериализуются и пишутся в SQLite одной транзакцией.
+Обращение к холодному ключу поднимает его обратно в RAM и удаляет строку
+из БД — каждый ключ в любой момент находится ровно в одном месте.
+Исключение — чтение при срабатывании окна (``get(key, promote=False)``):
+сработавший холодный ключ читается и обновляется прямо в SQLite, не
+вытесняя горячие ключи. Таймеры горячей части индексируются кучей
+(:class:`TimerIndex`), холодной — индексом ``keyed_state_timer``.
+
+Структура таблицы::
+
+    CREATE TABLE keyed_state (
+        key   TEXT PRIMARY KEY,
+        timer INTEGER NOT NULL,
+        state BLOB NOT NULL
+    );
+    CREATE INDEX keyed_state_timer ON keyed_state (timer);
+
+Файл — рабочая область процесса, а не durable-хранилище: ``synchronous=OFF``
+и ``journal_mode=WAL`` (fsync не нужен, состояние пересобирается из потока).
+Вызовы ``sqlite3`` выполняются через ``asyncio.to_thread`` и сериализуются
+``asyncio.Lock``, чтобы не блокировать event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.backend.core.logging import get_logger
+from src.backend.core.types.window_state import decode_panes, encode_panes
+from src.backend.infrastructure.streaming_state.timer_index import TimerIndex
+
+__all__ = ("SpillingKeyedStateStore",)
+
+logger = get_logger("streaming_state.spill")
+
+_TABLE = "keyed_state"
+
+
+class SpillingKeyedStateStore:
+    """Bounded-memory keyed-state: LRU в RAM + холодный хвост в SQLite.
+
+    Args:
+        path: Путь к sqlite3-файлу (каталог создаётся при необходимости).
+        max_hot_keys: Максимум ключей в RAM.
+        spill_batch: Сколько ключей вытеснять за одну транзакцию.
+        encode: Сериализатор состояния в ``bytes``
+            (default — msgpack pane-агрегатов).
+        decode: Обратная операция к ``encode``.
+
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_hot_keys: int = 100_000,
+        spill_batch: int = 1_000,
+        encode: Callable[[Any], bytes] = encode_panes,
+        decode: Callable[[bytes], Any] = decode_panes,
+    ) -> None:
+        if max_hot_keys < 1:
+            raise ValueError("max_hot_keys должен быть >= 1")
+        self._path = Path(path)
+        self._max_hot = max_hot_keys
+        self._spill_batch = max(1, min(spill_batch, max_hot_keys))
+        self._encode = encode
+        self._decode = decode
+        self._hot: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._timers = TimerIndex(self._hot_timer)
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = asyncio.Lock()
+        self._cold_keys = 0
+        self._spilled_total = 0
+        self._promoted_total = 0
+
+    # ─────────────────────── Public API ───────────────────────
+
+    async def get(self, key: str, *, promote: bool = True) -> Any | None:
+        """Метод get (см. signature)."""
+        entry = self._hot.get(key)
+        if entry is not None:
+            self._hot.move_to_end(key)
+            return entry[0]
+        if self._cold_keys == 0:
+            return None
+        async with self._db_lock:
+            read = self._take_row if promote else self._read_row
+            row = await asyncio.to_thread(read, key)
+        if row is None:
+            return None
+        timer, raw = row
+        state = self._decode(raw)
+        if not promote:
+            return state
+        self._promoted_total += 1
+        await self._insert_hot(key, state, timer)
+        return state
+
+    async def put(self, key: str, state: Any, *, timer: int) -> None:
+        """Метод put (см. signature)."""
+        previous = self._hot.get(key)
+        if previous is not None:
+            self._hot[key] = (state, timer)
+            self._hot.move_to_end(key)
+            if previous[1] != timer:
+                self._timers.push(key, timer)
+            return
+        if self._cold_keys:
+            # Холодный ключ (прочитан с promote=False) обновляется на месте.
+            async with self._db_lock:
+                updated = await asyncio.to_thread(
+                    self._update_row, key, timer, self._encode(state)
+                )
+            if updated:
+                return
+        await self._insert_hot(key, state, timer)
+
+    async def delete(self, key: str) -> None:
+        """Метод delete (см. signature)."""
+        if self._hot.pop(key, None) is not None or self._cold_keys == 0:
+            return
+        async with self._db_lock:
+            await asyncio.to_thread(self._delete_row, key)
+
+    async def due(self, before: int) -> list[str]:
+        """Метод due (см. signature)."""
+        keys = self._timers.due(before)
+        if self._cold_keys:
+            async with self._db_lock:
+                keys.extend(await asyncio.to_thread(self._select_due, before))
+        return keys
+
+    async def min_timer(self) -> int | None:
+        """Метод min_timer (см. signature)."""
+        hot = self._timers.min_timer()
+        candidates = [] if hot is None else [hot]
+        if self._cold_keys:
+            async with self._db_lock:
+                cold = await asyncio.to_thread(self._select_min_timer)
+            if cold is not None:
+                candidates.append(cold)
+        return min(candidates) if candidates else None
+
+    async def close(self) -> None:
+        """Закрыть SQLite-соединение и очистить RAM-часть."""
+        self._hot.clear()
+        self._timers.clear()
+        async with self._db_lock:
+            if self._conn is not None:
+                await asyncio.to_thread(self._conn.close)
+                self._conn = None
+        self._cold_keys = 0
+
+    def stats(self) -> dict[str, int]:
+        """Снимок счётчиков для метрик (hot/cold ключи, spill/promote)."""
+        return {
+            "hot_keys": len(self._hot),
+            "cold_keys": self._cold_keys,
+            "spilled_total": self._spilled_total,
+            "promoted_total": self._promoted_total,
+        }
+
+    # ─────────────────────── Internals ───────────────────────
+
+    def _hot_timer(self, key: str) -> int | None:
+        entry = self._hot.get(key)
+        return None if entry is None else entry[1]
+
+    async def _insert_hot(self, key: str, state: Any, timer: int) -> None:
+        self._hot[key] = (state, timer)
+        self._timers.push(key, timer)
+        if len(self._hot) > self._max_hot:
+            await self._spill()
+            self._timers.compact(len(self._hot))
+
+    async def _spill(self) -> None:
+        batch: list[tuple[str, int, bytes]] = []
+        while self._hot and len(batch) < self._spill_batch:
+            key, (state, timer) = self._hot.popitem(last=False)
+            batch.append((key, timer, self._encode(state)))
+        async with self._db_lock:
+            await asyncio.to_thread(self._write_rows, batch)
+        self._spilled_total += len(batch)
+        logger.debug("Spilled %d cold keys to %s", len(batch), self._path)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {_TABLE} ("
+                "key TEXT PRIMARY KEY, timer INTEGER NOT NULL, state BLOB NOT NULL)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {_TABLE}_timer ON {_TABLE} (timer)"
+            )
+            # Файл — рабочая область процесса: остатки прошлого запуска
+            # не относятся к текущему watermark и удаляются.
+            conn.execute(f"DELETE FROM {_TABLE}")
+            self._conn = conn
+        return self._conn
+
+    def _write_rows(self, rows: list[tuple[str, int, bytes]]) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN")
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {_TABLE} (key, timer, state) VALUES (?, ?, ?)",
+            rows,
+        )
+        conn.execute("COMMIT")
+        self._cold_keys += len(rows)
+
+    def _take_row(self, key: str) -> tuple[int, bytes] | None:
+        conn = self._connection()
+        row = conn.execute(
+            f"SELECT timer, state FROM {_TABLE} WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(f"DELETE FROM {_TABLE} WHERE key = ?", (key,))
+        self._cold_keys -= 1
+        return int(row[0]), bytes(row[1])
+
+    def _read_row(self, key: str) -> tuple[int, bytes] | None:
+        row = self._connection().execute(
+            f"SELECT timer, state FROM {_TABLE} WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else (int(row[0]), bytes(row[1]))
+
+    def _update_row(self, key: str, timer: int, raw: bytes) -> bool:
+        cursor = self._connection().execute(
+            f"UPDATE {_TABLE} SET timer = ?, state = ? WHERE key = ?",
+            (timer, raw, key),
+        )
+        return cursor.rowcount > 0
+
+    def _delete_row(self, key: str) -> None:
+        cursor = self._connection().execute(
+            f"DELETE FROM {_TABLE} WHERE key = ?", (key,)
+        )
+        self._cold_keys -= max(cursor.rowcount, 0)
+
+    def _select_due(self, before: int) -> list[str]:
+        rows = self._connection().execute(
+            f"SELECT key FROM {_TABLE} WHERE timer < ?", (before,)
+        )
+        return [row[0] for row in rows]
+
+    def _select_min_timer(self) -> int | None:
+        row = self._connection().execute(f"SELECT MIN(timer) FROM {_TABLE}").fetchone()
+        return None if row is None or row[0] is None else int(row[0])
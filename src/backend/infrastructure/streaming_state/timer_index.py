@@ -0,0 +1,74 @@
+"""Min-heap таймеров ключей для keyed-state хранилищ.
+
+``due(before)`` и ``min_timer()`` вызываются на каждом срабатывании окна;
+полный проход по словарю ключей делал их O(N) от кардинальности.
+:class:`TimerIndex` держит кучу ``(timer, key)`` с ленивым удалением:
+устаревшие записи (ключ удалён или его таймер сменился) отбрасываются при
+чтении, поэтому ``due`` стоит O(k log N) для k сработавших ключей.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable
+
+__all__ = ("TimerIndex",)
+
+
+class TimerIndex:
+    """Куча таймеров с ленивой инвалидацией.
+
+    Args:
+        current: Текущий таймер ключа или ``None``, если ключа нет —
+            по нему проверяется актуальность записей кучи.
+
+    """
+
+    __slots__ = ("_current", "_heap")
+
+    def __init__(self, current: Callable[[str], int | None]) -> None:
+        self._current = current
+        self._heap: list[tuple[int, str]] = []
+
+    def push(self, key: str, timer: int) -> None:
+        """Зарегистрировать (новый) таймер ключа."""
+        heapq.heappush(self._heap, (timer, key))
+
+    def due(self, before: int) -> list[str]:
+        """Ключи с актуальным ``timer < before`` (записи остаются в куче)."""
+        heap = self._heap
+        popped: list[tuple[int, str]] = []
+        keys: list[str] = []
+        seen: set[str] = set()
+        while heap and heap[0][0] < before:
+            entry = heapq.heappop(heap)
+            timer, key = entry
+            if key in seen or self._current(key) != timer:
+                continue
+            seen.add(key)
+            keys.append(key)
+            popped.append(entry)
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return keys
+
+    def min_timer(self) -> int | None:
+        """Минимальный актуальный таймер (устаревшая вершина отбрасывается)."""
+        heap = self._heap
+        while heap and self._current(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def compact(self, live: int) -> None:
+        """Пересобрать кучу, если устаревших записей больше, чем живых."""
+        if len(self._heap) > 2 * live + 64:
+            self._heap = [
+                (timer, key)
+                for timer, key in set(self._heap)
+                if self._current(key) == timer
+            ]
+            heapq.heapify(self._heap)
+
+    def clear(self) -> None:
+        """Очистить индекс."""
+        self._heap.clear()
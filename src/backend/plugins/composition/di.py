@@ -76,6 +76,7 @@ def register_app_state(app: FastAPI) -> None:
     """
     set_app_ref(app)
 
+    from src.backend.core.config.settings import settings
     from src.backend.dsl.engine.plugin_registry import ProcessorPluginRegistry
     from src.backend.dsl.engine.tracer import ExecutionTracer
     from src.backend.dsl.engine.versioning import PipelineVersionManager
@@ -86,7 +87,9 @@ def register_app_state(app: FastAPI) -> None:
     from src.backend.infrastructure.database.pool_monitor import PoolMonitor
     from src.backend.infrastructure.security.api_key_manager import APIKeyManager
 
-    app.state.api_key_manager = APIKeyManager()
+    app.state.api_key_manager = APIKeyManager(
+        legacy_scan=settings.secure.api_key_legacy_scan
+    )
     app.state.tracer = ExecutionTracer()
     app.state.plugin_registry = ProcessorPluginRegistry()
     app.state.pipeline_version_manager = PipelineVersionManager()
@@ -215,9 +218,25 @@ def register_app_state(app: FastAPI) -> None:
             "policy engines NOT wired (engine_enabled but init failed): %s", _pol_exc
         )
 
+    # Кэш решений OPA/Casbin (opt-in): повторяющиеся (principal, resource,
+    # action, tenant_id) не ходят в движки; stamp сбрасывается на
+    # add/remove_policy и мутации Casbin через notify_policy_changed().
+    from src.backend.core.config.services.policy import policy_settings
+    from src.backend.core.security.authorization_gateway import DecisionCache
+
+    decision_cache = (
+        DecisionCache(
+            allow_ttl=policy_settings.decision_cache_allow_ttl,
+            deny_ttl=policy_settings.decision_cache_deny_ttl,
+            max_entries=policy_settings.decision_cache_max_entries,
+        )
+        if auth_policies and policy_settings.decision_cache_enabled
+        else None
+    )
     app.state.authorization_gateway = AuthorizationGateway(
         capability_gateway=FacadeCapabilityAdapter(get_capability_facade()),
         policies=tuple(auth_policies),
+        decision_cache=decision_cache,
     )
 
     # W14.5: durable WatermarkStore — выбор бэкенда (memory/postgres) по
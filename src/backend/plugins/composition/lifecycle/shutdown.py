@@ -192,6 +192,26 @@ async def run_shutdown(app: FastAPI, task_registry: Any) -> None:
         except Exception as bus_stop_exc:
             _logger.warning("EventBus shutdown error: %s", bus_stop_exc)
 
+    # ── 12c. CPU process pool shutdown ──
+    # Worker'ы run_cpu_bound (и их shared-memory сегменты) не должны
+    # переживать процесс приложения.
+    try:
+        from src.backend.core.utils.cpu_bound import shutdown_cpu_pool
+
+        await shutdown_cpu_pool()
+    except Exception as cpu_pool_exc:
+        _logger.warning("CPU pool shutdown error: %s", cpu_pool_exc)
+
+    # ── 12d. Outbound HTTP connection pool close ──
+    # Keep-alive соединения общего пула (sinks, AI-провайдеры, proxy)
+    # закрываются явно, без ожидания GC.
+    try:
+        from src.backend.core.net.client_pool import shutdown_outbound_client_pool
+
+        await shutdown_outbound_client_pool()
+    except Exception as http_pool_exc:
+        _logger.warning("Outbound HTTP pool shutdown error: %s", http_pool_exc)
+
     # ── 13. FeatureFlagBroadcaster stop ──
     # Sprint 17 K5 W1 (D9): graceful stop ДО task_registry.shutdown_all,
     # чтобы subscriber-task успел отписаться от Redis pub/sub корректно
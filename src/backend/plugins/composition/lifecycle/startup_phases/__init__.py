@@ -6,7 +6,8 @@
 Группировка:
 - :mod:`observability` — OTel, Sentry, LogSink, Audit HMAC, ConfigValidator
 - :mod:`infrastructure` — Redis cluster, setup_infra, EventBus
-- :mod:`services` — Service registration, AIGateway, DSL, PluginLoader, V11, Outbox, Workflow, Schema, FeatureFlag
+- :mod:`services` — Service registration, AIGateway, DSL, PluginLoader, V11, Outbox, Workflow, Schema, FeatureFlag,
+  CPU pool warmup
 
 Принцип: best-effort startup (hard errors propagate, optional subsystems log+continue).
 Каждая фаза оборачивает свой critical path в try/except с понятным warning.
@@ -39,7 +40,7 @@ STARTUP_PHASES: tuple[Phase, ...] = (
     infrastructure.phase_redis_cluster,
     infrastructure.phase_setup_infra,
     infrastructure.phase_eventbus_startup,
-    # Services (10 phases)
+    # Services (11 phases)
     services.phase_service_registration,
     services.phase_ai_gateway_singleton,
     services.phase_dsl_commands,
@@ -50,6 +51,7 @@ STARTUP_PHASES: tuple[Phase, ...] = (
     services.phase_workflow_runtime,
     services.phase_schema_registry,
     services.phase_feature_flag_broadcaster,
+    services.phase_cpu_pool_warmup,
 )
 
 
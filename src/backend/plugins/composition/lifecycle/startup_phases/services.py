@@ -11,6 +11,7 @@ Phases:
 - :func:`phase_workflow_runtime` — Workflow runtime startup
 - :func:`phase_schema_registry` — ServiceSchemaRegistry populate
 - :func:`phase_feature_flag_broadcaster` — Multi-replica feature flag broadcast
+- :func:`phase_cpu_pool_warmup` — прогрев CPU process pool (initializer'ы)
 """
 
 from __future__ import annotations
@@ -195,6 +196,22 @@ async def phase_feature_flag_broadcaster(app: FastAPI) -> None:  # noqa: ARG001
         )
 
 
+async def phase_cpu_pool_warmup(app: FastAPI) -> None:  # noqa: ARG001
+    """Прогрев ``run_cpu_bound`` pool, если зарегистрированы initializer'ы.
+
+    Initializer'ы (модели/шрифты) иначе выполнялись бы на первом
+    CPU-bound запросе; без них пул по-прежнему стартует лениво.
+    """
+    try:
+        from src.backend.core.utils.cpu_bound import cpu_pool_stats, warm_cpu_pool
+
+        if cpu_pool_stats()["initializers"]:
+            workers = await warm_cpu_pool()
+            _logger.info("CPU process pool прогрет: %d worker(s)", workers)
+    except Exception as cpu_exc:
+        _logger.warning("CPU process pool warmup skipped: %s", cpu_exc)
+
+
 __all__ = (
     "phase_service_registration",
     "phase_ai_gateway_singleton",
@@ -206,4 +223,5 @@ __all__ = (
     "phase_workflow_runtime",
     "phase_schema_registry",
     "phase_feature_flag_broadcaster",
+    "phase_cpu_pool_warmup",
 )
@@ -35,12 +35,14 @@ async def start_dsl_yaml_watcher(app: FastAPI) -> None:
 
     try:
         from src.backend.dsl.commands.registry import route_registry
+        from src.backend.dsl.yaml_loader import CompiledRouteCache
         from src.backend.dsl.yaml_watcher import DSLYamlWatcher
 
         watcher = DSLYamlWatcher(
             routes_dir=app_settings.dsl.routes_dir,
             route_registry=route_registry,
             debounce_ms=app_settings.dsl.hot_reload_debounce_ms,
+            route_cache=CompiledRouteCache(app_settings.dsl.route_cache_dir),
         )
         await watcher.start()
         app.state.dsl_yaml_watcher = watcher
@@ -311,6 +311,39 @@ async def _stop_config_hot_reload() -> None:
     app_logger.info("Config hot-reload stopped")
 
 
+def _delayed_jobs_enabled() -> bool:
+    """Worker нужен для sorted-set backend'а JobQueue (redis — при Redis)."""
+    from src.backend.core.config.settings import settings
+
+    backend = settings.scheduler.job_queue_backend
+    if backend == "redis":
+        return _redis_enabled()
+    return backend == "memory"
+
+
+async def _start_delayed_job_worker() -> None:
+    """Worker отложенных задач — на каждом инстансе (не только leader)."""
+    from src.backend.infrastructure.scheduler.job_queue import get_job_queue
+
+    await get_job_queue().start()
+
+
+async def _stop_delayed_job_worker() -> None:
+    """Остановка worker'а; claimed-задачи вернутся по истечении lease."""
+    from src.backend.infrastructure.scheduler.job_queue import get_job_queue
+
+    await get_job_queue().stop()
+
+
+async def _close_kernel_pool() -> None:
+    """Остановка прогретых Jupyter kernel'ов (дочерние процессы)."""
+    from src.backend.services.jupyter.execution_service.kernel_pool import (
+        close_kernel_pool,
+    )
+
+    await close_kernel_pool()
+
+
 starting_operations: list[OperationItem] = [
     (
         "register_default_degradation_features",
@@ -347,11 +380,14 @@ starting_operations: list[OperationItem] = [
         _start_scheduler_with_leader_election,
         _redis_enabled,
     ),
+    ("start_delayed_job_worker", _start_delayed_job_worker, _delayed_jobs_enabled),
 ]
 
 ending_operations: list[OperationItem] = [
     ("close_workflow_audit_sink", _close_workflow_audit_sink, None),
     ("stop_scheduler_if_leader", _stop_scheduler_if_leader, None),
+    ("stop_delayed_job_worker", _stop_delayed_job_worker, None),
+    ("close_kernel_pool", _close_kernel_pool, None),
     # D-AUDIT-A12-06 fix (cycle 1): stop ConfigHotReloader в shutdown
     ("stop_config_hot_reload", _stop_config_hot_reload, None),
     # D-A8-04 fix (cycle 1): graceful stop TemporalWorkerRuntime.
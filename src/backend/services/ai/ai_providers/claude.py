@@ -98,7 +98,9 @@ class ClaudeProvider:
             "content-type": "application/json",
         }
 
-        async with OutboundHttpClient(timeout=httpx.Timeout(60)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(60), http2=True, pooled=True
+        ) as client:
             resp = await client.post(
                 f"{self.base_url}/messages", headers=headers, json=payload
             )
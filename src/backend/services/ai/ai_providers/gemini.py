@@ -83,7 +83,9 @@ class GeminiProvider:
         params = {"key": self.api_key}
 
         vectors: list[list[float]] = []
-        async with OutboundHttpClient(timeout=httpx.Timeout(30.0)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(30.0), http2=True, pooled=True
+        ) as client:
             for text in texts:
                 payload = {
                     "model": f"models/{embed_model}",
@@ -139,7 +141,9 @@ class GeminiProvider:
         endpoint = "streamGenerateContent" if stream else "generateContent"
         url = f"{self.base_url}/models/{model_name}:{endpoint}?key={self.api_key}"
 
-        async with OutboundHttpClient(timeout=httpx.Timeout(60)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(60), http2=True, pooled=True
+        ) as client:
             resp = await client.post(url, json=payload)
             resp.raise_for_status()
             return resp.json()
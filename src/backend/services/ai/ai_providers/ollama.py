@@ -45,7 +45,9 @@ class OllamaProvider:
     ) -> list[list[float]]:
         """Embeddings через Ollama /api/embeddings (по одному запросу на текст)."""
         out: list[list[float]] = []
-        async with OutboundHttpClient(timeout=httpx.Timeout(60)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(60), pooled=True
+        ) as client:
             for text in texts:
                 resp = await client.post(
                     f"{self.base_url}/api/embeddings",
@@ -76,7 +78,9 @@ class OllamaProvider:
         if tools:
             payload["tools"] = tools
 
-        async with OutboundHttpClient(timeout=httpx.Timeout(120)) as client:
+        async with OutboundHttpClient(
+            timeout=httpx.Timeout(120), pooled=True
+        ) as client:
             resp = await client.post(f"{self.base_url}/api/chat", json=payload)
             resp.raise_for_status()
             return resp.json()
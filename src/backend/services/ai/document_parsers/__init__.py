@@ -14,6 +14,9 @@ fallback на pypdf/python-docx).
   ``declared`` пуст или ``application/octet-stream``.
 * :data:`SUPPORTED_MIME_TYPES` — frozenset допустимых MIME (с учётом
   markitdown расширений: PPTX, XLSX, HTML, CSV, JSON).
+* :func:`get_document_parsing_service` — :class:`DocumentParsingService`:
+  ``parse`` с content-hash кэшем и ``iter_pages`` (страницы PDF по мере
+  готовности, process pool).
 """
 
 from __future__ import annotations as annotations
@@ -22,6 +25,18 @@ from src.backend.services.ai.document_parsers._orchestrator import (
     SUPPORTED_MIME_TYPES,
     parse_document,
 )
+from src.backend.services.ai.document_parsers._pages import ParsedPage
+from src.backend.services.ai.document_parsers._service import (
+    DocumentParsingService,
+    get_document_parsing_service,
+)
 from src.backend.services.ai.document_parsers._sniffer import sniff_mime
 
-__all__ = ("SUPPORTED_MIME_TYPES", "parse_document", "sniff_mime")
+__all__ = (
+    "SUPPORTED_MIME_TYPES",
+    "DocumentParsingService",
+    "ParsedPage",
+    "get_document_parsing_service",
+    "parse_document",
+    "sniff_mime",
+)
@@ -2,13 +2,22 @@
 
 Используются как fallback, если markitdown-engine отключён, не установлен
 или упал. Контракт: ``(content: bytes) -> (text: str, warnings: list[str])``.
+
+``_pdf_page_count`` / ``_parse_pdf_pages`` — top-level (picklable)
+функции для постраничного извлечения в process pool (см. ``_pages``).
 """
 
 from __future__ import annotations
 
 import io
 
-__all__ = ("_parse_docx", "_parse_pdf", "_parse_text")
+__all__ = (
+    "_parse_docx",
+    "_parse_pdf",
+    "_parse_pdf_pages",
+    "_parse_text",
+    "_pdf_page_count",
+)
 
 
 def _parse_pdf(content: bytes) -> tuple[str, list[str]]:
@@ -26,6 +35,33 @@ def _parse_pdf(content: bytes) -> tuple[str, list[str]]:
     return "\n\n".join(p for p in pages if p), warnings
 
 
+def _pdf_page_count(content: bytes | memoryview) -> int:
+    """Число страниц PDF (без извлечения текста)."""
+    from pypdf import PdfReader
+
+    return len(PdfReader(io.BytesIO(content)).pages)
+
+
+def _parse_pdf_pages(
+    content: bytes | memoryview, start: int, stop: int
+) -> list[tuple[int, str, list[str]]]:
+    """Текст страниц ``[start, stop)``: ``(index, text, warnings)`` по странице.
+
+    Выполняется в worker-процессе; ``content`` может прийти ``memoryview``
+    поверх shared memory — ``BytesIO`` копирует его, ссылка не удерживается.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    pages: list[tuple[int, str, list[str]]] = []
+    for idx in range(start, min(stop, len(reader.pages))):
+        try:
+            pages.append((idx, reader.pages[idx].extract_text() or "", []))
+        except Exception as exc:
+            pages.append((idx, "", [f"page {idx}: {exc}"]))
+    return pages
+
+
 def _parse_docx(content: bytes) -> tuple[str, list[str]]:
     """Извлекает текст из DOCX (paragraphs + table cells)."""
     from docx import Document
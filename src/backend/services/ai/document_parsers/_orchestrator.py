@@ -20,6 +20,10 @@ Wave 8.2 + Sprint S5: ``parse_document(content, mime)`` — единая точ
 * ``text/html`` (HTML);
 * ``text/csv``, ``application/json``;
 * ``text/plain``, ``text/markdown``, ``application/octet-stream`` — UTF-8.
+
+Legacy PDF от ``pdf_parallel_min_pages`` страниц извлекается постранично
+в process pool (``_pages``), DOCX — целиком в process pool: pure-Python
+парсеры в ``asyncio.to_thread`` упираются в GIL.
 """
 
 from __future__ import annotations
@@ -29,11 +33,14 @@ from typing import Any
 
 from src.backend.core.config.ai import markitdown_settings
 from src.backend.core.logging import get_logger
+from src.backend.core.utils.cpu_bound import run_cpu_bound
 from src.backend.services.ai.document_parsers._legacy import (
     _parse_docx,
     _parse_pdf,
     _parse_text,
+    _pdf_page_count,
 )
+from src.backend.services.ai.document_parsers._pages import parse_pdf_pages
 from src.backend.services.ai.document_parsers._sniffer import sniff_mime
 
 __all__ = ("SUPPORTED_MIME_TYPES", "parse_document")
@@ -157,10 +164,10 @@ async def _fallback_legacy(
     """Legacy-парсинг (pypdf/docx/bs4); для markitdown-only форматов ValueError."""
     kind = _LEGACY_FALLBACK.get(mime)
     if kind == "pdf":
-        text, w = await asyncio.to_thread(_parse_pdf, content)
+        text, w = await _parse_pdf_legacy(content)
         warnings.extend(w)
     elif kind == "docx":
-        text, w = await asyncio.to_thread(_parse_docx, content)
+        text, w = await run_cpu_bound(_parse_docx, content, use_process_pool=True)
         warnings.extend(w)
     elif kind == "html":
         text, w = await _parse_html_legacy(content)
@@ -176,6 +183,25 @@ async def _fallback_legacy(
     return text, _meta(mime, content, warnings, filename, "legacy", False)
 
 
+async def _parse_pdf_legacy(content: bytes) -> tuple[str, list[str]]:
+    """pypdf: крупный PDF — постранично в process pool, мелкий — в потоке.
+
+    Битый PDF (страницы не считаются) уходит в ``_parse_pdf``, который
+    поднимает исходную ошибку pypdf.
+    """
+    try:
+        pages = await asyncio.to_thread(_pdf_page_count, content)
+    except Exception:
+        pages = 0
+    if pages < markitdown_settings.pdf_parallel_min_pages:
+        return await asyncio.to_thread(_parse_pdf, content)
+    return await parse_pdf_pages(
+        content,
+        page_count=pages,
+        pages_per_task=markitdown_settings.pdf_pages_per_task,
+    )
+
+
 async def _parse_html_legacy(content: bytes) -> tuple[str, list[str]]:
     """HTML → plain-text через BeautifulSoup (bs4 уже в core-deps)."""
     warnings: list[str] = []
@@ -0,0 +1,83 @@
+"""Постраничное извлечение PDF в process pool.
+
+``pypdf.extract_text`` — чистый Python: в ``asyncio.to_thread`` он держит
+GIL, и документы парсятся строго по одному. Здесь страницы режутся на
+диапазоны, каждый диапазон — задача :func:`run_cpu_bound` в общем
+process pool (``share_memory=True``: PDF ≥ 1 MB передаётся worker'ам
+через shared memory, а не pickle на каждую задачу). Готовые страницы
+отдаются по мере завершения диапазонов.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from src.backend.core.utils.cpu_bound import PROCESS_POOL_SIZE, run_cpu_bound
+from src.backend.services.ai.document_parsers._legacy import (
+    _parse_pdf_pages,
+    _pdf_page_count,
+)
+
+__all__ = ("ParsedPage", "iter_pdf_pages", "parse_pdf_pages")
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedPage:
+    """Распарсенная страница документа (``index`` — с нуля)."""
+
+    index: int
+    text: str
+    warnings: tuple[str, ...] = ()
+
+
+async def iter_pdf_pages(
+    content: bytes, *, page_count: int | None = None, pages_per_task: int = 8
+) -> AsyncIterator[ParsedPage]:
+    """Страницы PDF в порядке готовности (не в порядке документа).
+
+    Диапазон задачи — не больше ``pages_per_task`` страниц и не больше
+    ``page_count / workers``: короткий документ всё равно раскладывается
+    на все worker'ы. Прерывание итерации отменяет ещё не начатые задачи.
+    """
+    if page_count is None:
+        page_count = await asyncio.to_thread(_pdf_page_count, content)
+    if page_count <= 0:
+        return
+    step = max(1, min(pages_per_task, -(-page_count // PROCESS_POOL_SIZE)))
+    tasks = [
+        asyncio.ensure_future(
+            run_cpu_bound(
+                _parse_pdf_pages,
+                content,
+                start,
+                start + step,
+                use_process_pool=True,
+                share_memory=True,
+            )
+        )
+        for start in range(0, page_count, step)
+    ]
+    try:
+        for done in asyncio.as_completed(tasks):
+            for index, text, warnings in await done:
+                yield ParsedPage(index, text, tuple(warnings))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def parse_pdf_pages(
+    content: bytes, *, page_count: int | None = None, pages_per_task: int = 8
+) -> tuple[str, list[str]]:
+    """Контракт ``_parse_pdf`` (``(text, warnings)``) поверх :func:`iter_pdf_pages`."""
+    pages = [
+        page
+        async for page in iter_pdf_pages(
+            content, page_count=page_count, pages_per_task=pages_per_task
+        )
+    ]
+    pages.sort(key=lambda page: page.index)
+    text = "\n\n".join(page.text for page in pages if page.text)
+    return text, [warning for page in pages for warning in page.warnings]
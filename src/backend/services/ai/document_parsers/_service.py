@@ -0,0 +1,216 @@
+"""Сервис парсинга документов с content-hash кэшем и потоком страниц.
+
+:func:`parse_document` — чистая функция: каждый вызов парсит заново.
+Повторная загрузка того же файла (дубли upload'ов, re-ingest корпуса)
+платила полный парсинг. :class:`DocumentParsingService` поверх неё:
+
+* кэш по ``blake2b(content)`` + эффективный MIME + engine (markitdown
+  вкл/выкл): совпавший документ не парсится вовсе, в ``meta`` меняется
+  только ``filename`` вызывающего; LRU ограничен суммарной длиной текста;
+* single-flight: одновременные загрузки одного файла делят один парсинг;
+  отмена вызова-лидера не отменяет ожидающих — они повторяют парсинг;
+* :meth:`DocumentParsingService.iter_pages` — страницы PDF по мере
+  готовности (process pool, см. ``_pages``); прочие форматы — одна
+  «страница» с полным текстом.
+
+Результаты fallback'а после упавшего markitdown не кэшируются: сбой
+может быть временным (timeout), следующий вызов повторит markitdown.
+
+Метрика: ``document_parse_cache_total{result}`` (hit / miss / coalesced).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from cachetools import LRUCache
+
+from src.backend.core.config.ai import markitdown_settings
+from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
+from src.backend.services.ai.document_parsers._orchestrator import parse_document
+from src.backend.services.ai.document_parsers._pages import ParsedPage, iter_pdf_pages
+from src.backend.services.ai.document_parsers._sniffer import sniff_mime
+
+__all__ = ("DocumentParsingService", "get_document_parsing_service")
+
+logger = get_logger(__name__)
+
+document_parse_cache_total = metrics_registry.counter(
+    "document_parse_cache_total",
+    "Document parse cache lookups by result.",
+    labels=("result",),
+)
+
+_PDF = "application/pdf"
+
+
+class _LeaderCancelled(Exception):
+    """Вызов, парсивший документ для попутчиков, отменён — им повторить."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    text: str
+    meta: dict[str, Any]
+    pages: tuple[ParsedPage, ...] = ()
+
+    @property
+    def size(self) -> int:
+        return max(len(self.text) + sum(len(page.text) for page in self.pages), 1)
+
+
+class DocumentParsingService:
+    """Кэширующий фасад над :func:`parse_document` + поток страниц PDF.
+
+    Args:
+        cache_max_chars: Ёмкость кэша (символы текста); ``0`` — без кэша.
+        pages_per_task: Страниц PDF в одной задаче process pool.
+
+    """
+
+    def __init__(
+        self, *, cache_max_chars: int = 50_000_000, pages_per_task: int = 8
+    ) -> None:
+        self._cache: LRUCache[bytes, _Entry] | None = (
+            LRUCache(maxsize=cache_max_chars, getsizeof=lambda entry: entry.size)
+            if cache_max_chars > 0
+            else None
+        )
+        self._pages_per_task = pages_per_task
+        self._inflight: dict[bytes, asyncio.Future[_Entry]] = {}
+
+    async def parse(
+        self, content: bytes, mime: str | None, filename: str | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        """Как :func:`parse_document`, но повторный документ берётся из кэша."""
+        effective_mime = sniff_mime(filename, mime)
+        key = self._key(content, effective_mime, "document")
+        entry = self._lookup(key)
+        while entry is None:
+            future = self._inflight.get(key)
+            if future is None:
+                document_parse_cache_total.labels(result="miss").inc()
+                entry = await self._parse_once(key, content, effective_mime, filename)
+                break
+            document_parse_cache_total.labels(result="coalesced").inc()
+            try:
+                entry = await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+        return entry.text, self._meta(entry, filename)
+
+    async def iter_pages(
+        self, content: bytes, mime: str | None, filename: str | None = None
+    ) -> AsyncIterator[ParsedPage]:
+        """Страницы документа по мере готовности (PDF — в порядке завершения).
+
+        PDF извлекается legacy-парсером постранично в process pool
+        (markitdown не даёт постраничного API); остальные форматы —
+        одной страницей из :meth:`parse`.
+        """
+        effective_mime = sniff_mime(filename, mime)
+        if effective_mime != _PDF:
+            text, meta = await self.parse(content, effective_mime, filename)
+            yield ParsedPage(0, text, tuple(meta.get("warnings") or ()))
+            return
+        key = self._key(content, effective_mime, "pages")
+        entry = self._lookup(key)
+        if entry is not None:
+            for page in entry.pages:
+                yield page
+            return
+        document_parse_cache_total.labels(result="miss").inc()
+        pages: list[ParsedPage] = []
+        async for page in iter_pdf_pages(
+            content, pages_per_task=self._pages_per_task
+        ):
+            pages.append(page)
+            yield page
+        pages.sort(key=lambda page: page.index)
+        self._store(key, _Entry(text="", meta={}, pages=tuple(pages)))
+
+    def clear(self) -> None:
+        """Сбросить кэш (смена парсеров/настроек markitdown)."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Заполненность кэша (для health/diagnostics)."""
+        if self._cache is None:
+            return {"entries": 0, "chars": 0, "max_chars": 0}
+        return {
+            "entries": len(self._cache),
+            "chars": int(self._cache.currsize),
+            "max_chars": int(self._cache.maxsize),
+        }
+
+    @staticmethod
+    def _key(content: bytes, mime: str, mode: str) -> bytes:
+        engine = "markitdown" if markitdown_settings.engine_enabled else "legacy"
+        digest = hashlib.blake2b(content, digest_size=20).digest()
+        return digest + f"|{mime}|{engine}|{mode}".encode()
+
+    def _lookup(self, key: bytes) -> _Entry | None:
+        if self._cache is None:
+            return None
+        entry = self._cache.get(key)
+        if entry is not None:
+            document_parse_cache_total.labels(result="hit").inc()
+        return entry
+
+    async def _parse_once(
+        self, key: bytes, content: bytes, mime: str, filename: str | None
+    ) -> _Entry:
+        future: asyncio.Future[_Entry] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            text, meta = await parse_document(content, mime, filename=filename)
+        except Exception as exc:
+            future.set_exception(exc)
+            # Ошибку забирают ожидающие; без них — не логировать как забытую.
+            future.exception()
+            raise
+        except BaseException:
+            # Отмена лидера — не отмена попутчиков: они перезапустят парсинг.
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        else:
+            entry = _Entry(text=text, meta=meta)
+            future.set_result(entry)
+            if not any(w.startswith("markitdown") for w in meta.get("warnings", ())):
+                self._store(key, entry)
+            return entry
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: bytes, entry: _Entry) -> None:
+        if self._cache is None or entry.size > self._cache.maxsize:
+            return
+        self._cache[key] = entry
+
+    @staticmethod
+    def _meta(entry: _Entry, filename: str | None) -> dict[str, Any]:
+        meta = dict(entry.meta)
+        meta["warnings"] = list(meta.get("warnings") or [])
+        meta["filename"] = filename
+        return meta
+
+
+_service: DocumentParsingService | None = None
+
+
+def get_document_parsing_service() -> DocumentParsingService:
+    """Общий сервис парсинга (настройки — ``markitdown_settings``)."""
+    global _service
+    if _service is None:
+        _service = DocumentParsingService(
+            cache_max_chars=markitdown_settings.parse_cache_max_chars,
+            pages_per_task=markitdown_settings.pdf_pages_per_task,
+        )
+    return _service
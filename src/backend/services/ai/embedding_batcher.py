@@ -0,0 +1,247 @@
+"""Динамический micro-batching эмбеддингов поверх локальной модели.
+
+Конкурентные RAG-запросы и semantic-кэши эмбеддят по одной короткой
+строке за вызов: ``model.encode`` на одну строку почти так же дорог,
+как на пачку из нескольких десятков (накладные расходы токенизатора,
+forward pass и переключения потоков). :class:`MicroBatchingEmbedder`
+склеивает конкурентные вызовы в batch'и размера модели:
+
+* content-hash LRU перед моделью — повторные тексты не кодируются;
+* одинаковые тексты в очереди/в полёте делят один future;
+* очередь ограничена (``max_queue``) — при перегрузке ``embed`` ждёт
+  места (backpressure), а не копит память;
+* один consumer собирает batch до ``max_batch_size`` текстов либо до
+  истечения ``max_wait_ms`` от первого текста в batch'е;
+* кодирование — на выделенном однопоточном executor'е (модель не
+  thread-safe, а default executor делят все ``asyncio.to_thread``);
+* векторы — float32 ``numpy.ndarray`` без ``tolist()`` на строку.
+
+Метрики: ``embedding_batch_size`` (текстов в вызове модели) и
+``embedding_cache_total{result}`` (hit/miss/coalesced).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+
+from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ("MicroBatchingEmbedder",)
+
+logger = get_logger(__name__)
+
+embedding_batch_size = metrics_registry.histogram(
+    "embedding_batch_size",
+    "Texts per embedding model call after micro-batching.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+embedding_cache_total = metrics_registry.counter(
+    "embedding_cache_total",
+    "Embedding LRU lookups by result.",
+    labels=("result",),
+)
+
+_Item = tuple[str, "asyncio.Future[np.ndarray]"]
+
+
+class MicroBatchingEmbedder:
+    """Склеивает конкурентные ``embed``-вызовы в batch'и модели.
+
+    Args:
+        encode: Синхронная функция ``texts -> ndarray (n, dim)``;
+            выполняется на выделенном executor'е.
+        max_batch_size: Максимум текстов в одном вызове ``encode``.
+        max_wait_ms: Сколько batch ждёт попутчиков после первого текста.
+        max_queue: Граница очереди текстов (backpressure для ``embed``).
+        cache_size: Размер content-hash LRU (``0`` — без кэша).
+        name: Префикс потока executor'а (для диагностики).
+
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[list[str]], Any],
+        *,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        max_queue: int = 1024,
+        cache_size: int = 4096,
+        name: str = "embedding",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size должен быть >= 1")
+        self._encode = encode
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._max_queue = max_queue
+        self._name = name
+        self._cache: LRUCache[bytes, np.ndarray] | None = (
+            LRUCache(maxsize=cache_size) if cache_size > 0 else None
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_Item] | None = None
+        self._consumer: asyncio.Task[None] | None = None
+        self._inflight: dict[bytes, asyncio.Future[np.ndarray]] = {}
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    async def embed_array(self, texts: Sequence[str]) -> np.ndarray:
+        """Эмбеддинги ``texts`` матрицей float32 ``(len(texts), dim)``."""
+        import numpy as np
+
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        queue = self._ensure_consumer()
+        rows: list[Any] = []
+        for text in texts:
+            key = self._key(text)
+            cached = self._cache.get(key) if self._cache is not None else None
+            if cached is not None:
+                embedding_cache_total.labels(result="hit").inc()
+                rows.append(cached)
+                continue
+            future = self._inflight.get(key)
+            if future is not None:
+                embedding_cache_total.labels(result="coalesced").inc()
+            else:
+                embedding_cache_total.labels(result="miss").inc()
+                future = asyncio.get_running_loop().create_future()
+                await queue.put((text, future))
+                # Регистрация только после put: отменённый в backpressure
+                # caller не оставит попутчикам future, которого нет в очереди.
+                self._inflight[key] = future
+            rows.append(future)
+        # shield: future могут ждать и другие callers — отмена одного
+        # не должна отменять общий результат.
+        vectors = [
+            await asyncio.shield(row) if isinstance(row, asyncio.Future) else row
+            for row in rows
+        ]
+        return np.stack(vectors)
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Совместимость с ``EmbeddingProvider``: списки float."""
+        if not texts:
+            return []
+        return (await self.embed_array(texts)).tolist()
+
+    def _ensure_consumer(self) -> asyncio.Queue[_Item]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._queue is None:
+            # Новый event loop (тесты, ``asyncio.run`` в CLI) — очередь и
+            # futures прежнего loop'а к нему не привязаны.
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._inflight.clear()
+            self._consumer = None
+        if self._consumer is None or self._consumer.done():
+            from src.backend.core.utils.task_registry import get_task_registry
+
+            self._consumer = get_task_registry().create_task(
+                self._consume(self._queue), name=f"{self._name}-batcher-{id(self)}"
+            )
+        return self._queue
+
+    async def _consume(self, queue: asyncio.Queue[_Item]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            try:
+                await self._run_batch(loop, batch)
+            except Exception as exc:
+                # Consumer общий для всех callers — ошибка batch'а не должна
+                # останавливать его и оставлять futures без результата.
+                logger.exception("embedding batch (%d texts) failed", len(batch))
+                self._fail(batch, exc)
+
+    async def _run_batch(
+        self, loop: asyncio.AbstractEventLoop, batch: list[_Item]
+    ) -> None:
+        import numpy as np
+
+        texts = [text for text, _ in batch]
+        embedding_batch_size.observe(len(texts))
+        try:
+            matrix = await loop.run_in_executor(
+                self._ensure_executor(), self._encode, texts
+            )
+            matrix = np.asarray(matrix, dtype=np.float32)
+            if matrix.ndim != 2 or matrix.shape[0] != len(texts):
+                raise ValueError(
+                    f"encode вернул {matrix.shape} для {len(texts)} текстов"
+                )
+        except Exception as exc:
+            logger.warning("embedding batch (%d texts) failed: %s", len(texts), exc)
+            self._fail(batch, exc)
+            return
+        for (text, future), vector in zip(batch, matrix, strict=True):
+            key = self._key(text)
+            self._inflight.pop(key, None)
+            vector.flags.writeable = False
+            if self._cache is not None:
+                self._cache[key] = vector
+            if not future.done():
+                future.set_result(vector)
+
+    def _fail(self, batch: list[_Item], exc: BaseException) -> None:
+        for text, future in batch:
+            self._inflight.pop(self._key(text), None)
+            if not future.done():
+                future.set_exception(exc)
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self._name}-encode"
+            )
+        return self._executor
+
+    async def aclose(self) -> None:
+        """Останавливает consumer и executor (shutdown / смена модели).
+
+        Тексты из очереди и прерванного batch'а получают ``RuntimeError`` —
+        callers ``embed`` не зависают на future без результата.
+        """
+        if self._consumer is not None and not self._consumer.done():
+            self._consumer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._consumer
+        self._consumer = None
+        exc = RuntimeError(f"{self._name} embedding batcher closed")
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._fail([self._queue.get_nowait()], exc)
+        for future in self._inflight.values():
+            if not future.done():
+                future.set_exception(exc)
+        self._inflight.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -15,7 +15,9 @@
   при создании.
 
 Все провайдеры реализуют ``EmbeddingProvider`` Protocol с одним методом
-``embed(texts) -> list[list[float]]``.
+``embed(texts) -> list[list[float]]``. Sentence-transformers дополнительно
+даёт ``embed_array`` (float32 ``ndarray``) и micro-batching конкурентных
+вызовов (см. :mod:`services.ai.embedding_batcher`).
 """
 
 from __future__ import annotations
@@ -63,12 +65,36 @@ class SentenceTransformerEmbeddingProvider:
     Default-провайдер RAG: работает offline, не требует внешних сервисов,
     стабильно собирается на Python 3.14 (PyTorch имеет колёса для 3.14).
     Модель загружается лениво при первом вызове ``embed``.
+
+    Конкурентные вызовы склеиваются :class:`MicroBatchingEmbedder` в
+    batch'и модели (content-hash LRU, ограниченная очередь, выделенный
+    executor); :meth:`embed_array` отдаёт float32 ``ndarray`` без
+    конвертации в списки.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        *,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        max_queue: int = 1024,
+        cache_size: int = 4096,
+    ) -> None:
         """Метод __init__ (см. signature)."""
+        from src.backend.services.ai.embedding_batcher import MicroBatchingEmbedder
+
         self._model_name = model_name
         self._model: Any = None
+        self._batch_size = max_batch_size
+        self._batcher = MicroBatchingEmbedder(
+            self._encode_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue=max_queue,
+            cache_size=cache_size,
+            name=f"st-{model_name}",
+        )
 
     def _ensure_model(self) -> Any:
         """Метод _ensure_model (см. signature)."""
@@ -85,16 +111,27 @@ class SentenceTransformerEmbeddingProvider:
         logger.info("SentenceTransformer model %r loaded", self._model_name)
         return self._model
 
+    def _encode_batch(self, texts: list[str]) -> Any:
+        """Один вызов модели на batch (поток executor'а батчера)."""
+        import numpy as np
+
+        model = self._ensure_model()
+        vectors = model.encode(
+            texts, batch_size=self._batch_size, convert_to_numpy=True
+        )
+        return np.asarray(vectors, dtype=np.float32)
+
+    async def embed_array(self, texts: list[str]) -> Any:
+        """Эмбеддинги float32 ``ndarray`` формы ``(len(texts), dim)``."""
+        return await self._batcher.embed_array(texts)
+
     async def embed(self, texts: list[str]) -> list[list[float]]:
         """Метод embed (см. signature)."""
+        return await self._batcher.embed(texts)
 
-        def _encode() -> list[list[float]]:
-            """Метод _encode (см. signature)."""
-            model = self._ensure_model()
-            vectors = model.encode(texts, convert_to_numpy=True)
-            return [v.tolist() for v in vectors]
-
-        return await asyncio.to_thread(_encode)
+    async def aclose(self) -> None:
+        """Останавливает batch-consumer и executor модели."""
+        await self._batcher.aclose()
 
 
 class FastembedEmbeddingProvider:
@@ -210,6 +247,9 @@ class OpenAIEmbeddingProvider:
         return await provider.embeddings(texts, model=self._model_name)
 
 
+_shared_st_providers: dict[str, SentenceTransformerEmbeddingProvider] = {}
+
+
 def get_embedding_provider() -> EmbeddingProvider:
     """Собирает провайдер по ``rag_settings.embedding_provider``."""
     from src.backend.core.config.rag import rag_settings
@@ -219,7 +259,19 @@ def get_embedding_provider() -> EmbeddingProvider:
 
     match provider_name:
         case "sentence-transformers" | "st":
-            return SentenceTransformerEmbeddingProvider(model_name=model)
+            # Один экземпляр на модель: все потребители (RAG, semantic-кэши,
+            # memory) делят модель в памяти и очередь micro-batching'а.
+            provider = _shared_st_providers.get(model)
+            if provider is None:
+                provider = SentenceTransformerEmbeddingProvider(
+                    model_name=model,
+                    max_batch_size=rag_settings.embedding_batch_size,
+                    max_wait_ms=rag_settings.embedding_batch_wait_ms,
+                    max_queue=rag_settings.embedding_queue_size,
+                    cache_size=rag_settings.embedding_cache_size,
+                )
+                _shared_st_providers[model] = provider
+            return provider
         case "fastembed":
             return FastembedEmbeddingProvider(model_name=model)
         case "ollama":
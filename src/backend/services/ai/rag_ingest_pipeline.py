@@ -0,0 +1,253 @@
+"""Staged RAG ingest pipeline: parse → chunk/hash → embed → upsert.
+
+Файлы больше не проходят ingest строго по одному: каждая стадия —
+пул worker'ов, стадии связаны ограниченными ``asyncio.Queue``
+(backpressure: быстрый parse не накапливает в памяти весь корпус, пока
+embed занят). Embed-стадия отправляет только новые chunks (content-hash
+diff из :meth:`RAGService.prepare_chunks`), параллельные embed-вызовы
+склеиваются micro-batching'ом провайдера.
+
+Прогресс по стадиям и throughput — :class:`IngestProgress`, снимок
+которого ``RagIngestService`` пишет в ``status()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from src.backend.core.logging import get_logger
+from src.backend.services.ai.rag_types import ChunkPlan
+
+logger = get_logger(__name__)
+
+__all__ = ("IngestPipeline", "IngestProgress", "supports_staged_ingest")
+
+ParseFn = Callable[[str, bytes], tuple[str, dict[str, Any]]]
+ProgressFn = Callable[["IngestProgress"], Awaitable[None]]
+
+_DONE = object()
+
+
+def supports_staged_ingest(rag: Any) -> bool:
+    """``True``, если RAG-сервис даёт поэтапный API (prepare/embed/commit).
+
+    Проверяется маркер класса (``IngestMixin.staged_ingest``), а не
+    наличие методов: duck-typed stub'ы и ``AsyncMock`` отвечают на любой
+    атрибут и остаются на поштучном ``rag.ingest``.
+    """
+    return getattr(type(rag), "staged_ingest", False) is True
+
+
+@dataclass(slots=True)
+class _Doc:
+    index: int
+    filename: str
+    raw: bytes
+    source_id: str | None = None
+    text: str = ""
+    metadata: dict[str, Any] = field(default_factory=dict)
+    plan: ChunkPlan | None = None
+    embeddings: list[list[float]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class IngestProgress:
+    """Счётчики pipeline'а (документы по стадиям, chunks, throughput)."""
+
+    total: int
+    parsed: int = 0
+    chunked: int = 0
+    embedded: int = 0
+    upserted: int = 0
+    chunks_total: int = 0
+    chunks_embedded: int = 0
+    chunks_skipped: int = 0
+    chunks_deleted: int = 0
+    errors: list[dict[str, str]] = field(default_factory=list)
+    doc_ids: dict[int, str] = field(default_factory=dict)
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def processed(self) -> int:
+        """Документы, завершившие pipeline (успешно или с ошибкой)."""
+        return self.upserted + len(self.errors)
+
+    def ordered_doc_ids(self) -> list[str]:
+        """doc_id в порядке исходных файлов."""
+        return [self.doc_ids[i] for i in sorted(self.doc_ids)]
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-совместимый снимок для ``status()``."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "stages": {
+                "parsed": self.parsed,
+                "chunked": self.chunked,
+                "embedded": self.embedded,
+                "upserted": self.upserted,
+            },
+            "chunks": {
+                "total": self.chunks_total,
+                "embedded": self.chunks_embedded,
+                "skipped": self.chunks_skipped,
+                "deleted": self.chunks_deleted,
+            },
+            "throughput": {
+                "elapsed_s": round(elapsed, 3),
+                "docs_per_s": round(self.processed / elapsed, 2),
+                "chunks_embedded_per_s": round(self.chunks_embedded / elapsed, 2),
+            },
+        }
+
+
+class IngestPipeline:
+    """Пулы worker'ов по стадиям, связанные ограниченными очередями.
+
+    Args:
+        rag: RAG-сервис с ``prepare_chunks`` / ``embed_chunks`` /
+            ``commit_chunks``.
+        parse: Синхронный ``(filename, bytes) -> (text, metadata)``
+            (decode + PII-mask); выполняется в thread-pool.
+        queue_size: Ёмкость каждой межстадийной очереди.
+        parse_workers / chunk_workers / embed_workers / upsert_workers:
+            Конкурентность стадий.
+        on_progress: Callback после каждого завершённого документа.
+
+    """
+
+    def __init__(
+        self,
+        rag: Any,
+        parse: ParseFn,
+        *,
+        queue_size: int = 64,
+        parse_workers: int = 2,
+        chunk_workers: int = 2,
+        embed_workers: int = 4,
+        upsert_workers: int = 2,
+        on_progress: ProgressFn | None = None,
+    ) -> None:
+        self._rag = rag
+        self._parse = parse
+        self._queue_size = queue_size
+        self._workers = (parse_workers, chunk_workers, embed_workers, upsert_workers)
+        self._on_progress = on_progress
+
+    async def run(
+        self,
+        files: list[tuple[str, bytes]],
+        *,
+        namespace: str,
+        source_ids: Sequence[str | None] | None = None,
+    ) -> IngestProgress:
+        """Прогоняет ``files`` через все стадии; ошибки — по файлу.
+
+        ``source_ids`` (параллельно ``files``) — стабильные id источников:
+        только для них re-ingest удаляет chunks прежней ревизии.
+        """
+        progress = IngestProgress(total=len(files))
+        queues: list[asyncio.Queue[Any]] = [
+            asyncio.Queue(maxsize=self._queue_size) for _ in range(4)
+        ]
+
+        async def _parse(doc: _Doc) -> _Doc:
+            doc.text, doc.metadata = await asyncio.to_thread(
+                self._parse, doc.filename, doc.raw
+            )
+            if doc.source_id:
+                doc.metadata["source_id"] = doc.source_id
+            doc.raw = b""
+            progress.parsed += 1
+            return doc
+
+        async def _chunk(doc: _Doc) -> _Doc:
+            doc.plan = await self._rag.prepare_chunks(
+                doc.text, metadata=doc.metadata, namespace=namespace
+            )
+            doc.text = ""
+            progress.chunked += 1
+            progress.chunks_total += doc.plan.total_chunks
+            return doc
+
+        async def _embed(doc: _Doc) -> _Doc:
+            plan = cast("ChunkPlan", doc.plan)
+            doc.embeddings = await self._rag.embed_chunks(plan)
+            progress.embedded += 1
+            progress.chunks_embedded += len(plan.ids)
+            progress.chunks_skipped += plan.skipped_chunks
+            return doc
+
+        async def _upsert(doc: _Doc) -> None:
+            plan = cast("ChunkPlan", doc.plan)
+            await self._rag.commit_chunks(plan, doc.embeddings)
+            progress.upserted += 1
+            progress.chunks_deleted += len(plan.stale_ids)
+            progress.doc_ids[doc.index] = plan.doc_id
+            await self._notify(progress)
+
+        async def _feed() -> None:
+            for index, (filename, raw) in enumerate(files):
+                source_id = source_ids[index] if source_ids is not None else None
+                await queues[0].put(
+                    _Doc(index=index, filename=filename, raw=raw, source_id=source_id)
+                )
+            for _ in range(self._workers[0]):
+                await queues[0].put(_DONE)
+
+        stages = (_parse, _chunk, _embed, _upsert)
+        await asyncio.gather(
+            _feed(),
+            *(
+                self._stage(
+                    stages[i],
+                    queues[i],
+                    queues[i + 1] if i + 1 < len(stages) else None,
+                    self._workers[i],
+                    self._workers[i + 1] if i + 1 < len(stages) else 0,
+                    progress,
+                )
+                for i in range(len(stages))
+            ),
+        )
+        return progress
+
+    async def _stage(
+        self,
+        handler: Callable[[_Doc], Awaitable[Any]],
+        inbox: asyncio.Queue[Any],
+        outbox: asyncio.Queue[Any] | None,
+        workers: int,
+        next_workers: int,
+        progress: IngestProgress,
+    ) -> None:
+        async def _worker() -> None:
+            while True:
+                doc = await inbox.get()
+                if doc is _DONE:
+                    return
+                try:
+                    result = await handler(doc)
+                except Exception as exc:
+                    logger.warning("RAG ingest failed for %s: %s", doc.filename, exc)
+                    progress.errors.append({"file": doc.filename, "error": str(exc)})
+                    await self._notify(progress)
+                    continue
+                if outbox is not None:
+                    await outbox.put(result)
+
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        if outbox is not None:
+            for _ in range(next_workers):
+                await outbox.put(_DONE)
+
+    async def _notify(self, progress: IngestProgress) -> None:
+        if self._on_progress is None:
+            return
+        try:
+            await self._on_progress(progress)
+        except Exception as exc:
+            logger.debug("RAG ingest progress callback failed: %s", exc)
@@ -7,7 +7,10 @@
 * **deferred**: enqueue в Temporal-activity (Sprint 8 K2 W1: TaskIQ удалён).
 
 Wave D.2 / Track D AI: status-tracking вынесен в ``IngestStateStore``
-(memory / redis). ``chunker_fingerprint`` пишется в metadata каждого
+(memory / redis). Multi-file ingest идёт через staged pipeline
+(parse → chunk/hash → embed → upsert, см. :mod:`rag_ingest_pipeline`):
+неизменённые chunks не эмбеддятся повторно, исчезнувшие (для документов
+с явным ``source_id``) удаляются по diff'у, прогресс стадий и throughput доступны в ``status()["progress"]``. ``chunker_fingerprint`` пишется в metadata каждого
 ingest'а, чтобы reindex-сервис мог обнаружить устаревшие chunks при
 смене ``RAG_INGEST_CHUNKER_FINGERPRINT_VERSION``.
 """
@@ -15,11 +18,18 @@ ingest'а, чтобы reindex-сервис мог обнаружить уста
 from __future__ import annotations
 
 import hashlib
+import time
 import uuid
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
 from src.backend.core.logging import get_logger
+from src.backend.services.ai.rag_ingest_pipeline import (
+    IngestPipeline,
+    IngestProgress,
+    supports_staged_ingest,
+)
 from src.backend.services.ai.rag_ingest_store import (
     IngestStateStore,
     InMemoryIngestStateStore,
@@ -29,6 +39,8 @@ logger = get_logger(__name__)
 
 __all__ = ("RagIngestService", "get_rag_ingest_service")
 
+_PROGRESS_FLUSH_INTERVAL = 0.25
+
 
 def _chunker_fingerprint() -> str:
     """Сборка fingerprint текущей chunker-конфигурации.
@@ -123,9 +135,23 @@ class RagIngestService:
         )
 
     async def ingest(
-        self, files: list[tuple[str, bytes]], *, collection: str = "default"
+        self,
+        files: list[tuple[str, bytes]],
+        *,
+        collection: str = "default",
+        source_ids: Sequence[str | None] | None = None,
     ) -> dict[str, Any]:
-        """Запускает ingest. Возвращает task_id + start-метку."""
+        """Запускает ingest. Возвращает task_id + start-метку.
+
+        ``source_ids`` (параллельно ``files``) включают diff между ревизиями:
+        документ с тем же ``source_id`` заменяет chunks прежней загрузки.
+        Имя файла идентичностью не считается.
+
+        Raises:
+            ValueError: ``source_ids`` не совпадает с ``files`` по длине.
+        """
+        if source_ids is not None and len(source_ids) != len(files):
+            raise ValueError("source_ids должен быть параллелен files")
         task_id = str(uuid.uuid4())
         payload = {
             "task_id": task_id,
@@ -140,7 +166,7 @@ class RagIngestService:
         }
         await self._store.create(task_id, payload)
 
-        coroutine = self._run(task_id, files, collection, payload)
+        coroutine = self._run(task_id, files, collection, payload, source_ids)
         if self._deferred:
             from src.backend.core.utils.task_registry import get_task_registry
 
@@ -157,11 +183,109 @@ class RagIngestService:
         files: list[tuple[str, bytes]],
         collection: str,
         state: dict[str, Any],
+        source_ids: Sequence[str | None] | None = None,
     ) -> None:
         rag = self._ensure_rag()
+        if supports_staged_ingest(rag):
+            await self._run_pipeline(
+                rag, task_id, files, collection, state, source_ids
+            )
+        else:
+            await self._run_sequential(
+                rag, task_id, files, collection, state, source_ids
+            )
+        state["status"] = (
+            "completed" if not state["errors"] else "completed_with_errors"
+        )
+        state["finished_at"] = datetime.now(UTC).isoformat()
+        await self._store.update(
+            task_id,
+            status=state["status"],
+            finished_at=state["finished_at"],
+            processed=state["processed"],
+            doc_ids=list(state["doc_ids"]),
+            errors=list(state["errors"]),
+            **({"progress": state["progress"]} if "progress" in state else {}),
+        )
+
+    async def _run_pipeline(
+        self,
+        rag: Any,
+        task_id: str,
+        files: list[tuple[str, bytes]],
+        collection: str,
+        state: dict[str, Any],
+        source_ids: Sequence[str | None] | None = None,
+    ) -> None:
+        """Staged pipeline с content-hash diff (см. :mod:`rag_ingest_pipeline`)."""
+        from src.backend.core.config.ai_stack import rag_ingest_settings
+
         fingerprint = state["chunker_fingerprint"]
         embedding_meta = _resolve_embedding_provenance()
-        for filename, content_bytes in files:
+
+        def _parse(filename: str, content_bytes: bytes) -> tuple[str, dict[str, Any]]:
+            content_text = content_bytes.decode("utf-8", errors="replace")
+            content_text, pii_meta = _maybe_mask_pii(content_text)
+            return content_text, {
+                "filename": filename,
+                "chunker_fingerprint": fingerprint,
+                **embedding_meta,
+                **pii_meta,
+            }
+
+        last_flush = 0.0
+
+        async def _on_progress(progress: IngestProgress) -> None:
+            nonlocal last_flush
+            self._apply_progress(state, progress)
+            # Redis-store: get+set на каждый документ — throttling до 4 Гц.
+            now = time.monotonic()
+            if now - last_flush < _PROGRESS_FLUSH_INTERVAL:
+                return
+            last_flush = now
+            await self._store.update(
+                task_id,
+                processed=state["processed"],
+                doc_ids=list(state["doc_ids"]),
+                errors=list(state["errors"]),
+                progress=state["progress"],
+            )
+
+        pipeline = IngestPipeline(
+            rag,
+            _parse,
+            queue_size=rag_ingest_settings.pipeline_queue_size,
+            parse_workers=rag_ingest_settings.parse_concurrency,
+            chunk_workers=rag_ingest_settings.chunk_concurrency,
+            embed_workers=rag_ingest_settings.embed_concurrency,
+            upsert_workers=rag_ingest_settings.upsert_concurrency,
+            on_progress=_on_progress,
+        )
+        progress = await pipeline.run(
+            files, namespace=collection, source_ids=source_ids
+        )
+        self._apply_progress(state, progress)
+
+    @staticmethod
+    def _apply_progress(state: dict[str, Any], progress: IngestProgress) -> None:
+        state["processed"] = progress.processed
+        state["doc_ids"] = progress.ordered_doc_ids()
+        state["errors"] = list(progress.errors)
+        state["progress"] = progress.snapshot()
+
+    async def _run_sequential(
+        self,
+        rag: Any,
+        task_id: str,
+        files: list[tuple[str, bytes]],
+        collection: str,
+        state: dict[str, Any],
+        source_ids: Sequence[str | None] | None = None,
+    ) -> None:
+        """Поштучный ``rag.ingest`` для RAG-сервисов без staged API."""
+        fingerprint = state["chunker_fingerprint"]
+        embedding_meta = _resolve_embedding_provenance()
+        for index, (filename, content_bytes) in enumerate(files):
             try:
                 content_text = content_bytes.decode("utf-8", errors="replace")
                 content_text, pii_meta = _maybe_mask_pii(content_text)
@@ -171,6 +295,8 @@ class RagIngestService:
                     **embedding_meta,
                     **pii_meta,
                 }
+                if source_ids is not None and source_ids[index]:
+                    metadata["source_id"] = source_ids[index]
                 doc_id = await rag.ingest(
                     content_text, metadata=metadata, namespace=collection
                 )
@@ -184,13 +310,6 @@ class RagIngestService:
                 doc_ids=list(state["doc_ids"]),
                 errors=list(state["errors"]),
             )
-        state["status"] = (
-            "completed" if not state["errors"] else "completed_with_errors"
-        )
-        state["finished_at"] = datetime.now(UTC).isoformat()
-        await self._store.update(
-            task_id, status=state["status"], finished_at=state["finished_at"]
-        )
 
     async def status(self, task_id: str) -> dict[str, Any] | None:
         """Async-снимок состояния задачи (D.2)."""
@@ -13,6 +13,11 @@ API сознательно узкий — Protocol ``IngestStateStore``:
 
 Backward-compat: ``InMemoryIngestStateStore`` остаётся default-фабрикой —
 зависимости от Redis нет.
+
+``ChunkManifestStore`` — manifest инкрементального ingest'а: для каждого
+источника (``source_id``) — множество content-addressed id его chunks.
+По нему re-ingest вычисляет diff: новые chunks эмбеддятся, исчезнувшие
+удаляются из vector store, неизменённые пропускаются.
 """
 
 from __future__ import annotations
@@ -27,9 +32,13 @@ from src.backend.core.logging import get_logger
 logger = get_logger(__name__)
 
 __all__ = (
+    "ChunkManifestStore",
+    "InMemoryChunkManifestStore",
     "InMemoryIngestStateStore",
     "IngestStateStore",
+    "RedisChunkManifestStore",
     "RedisIngestStateStore",
+    "build_chunk_manifest_store",
     "build_ingest_state_store",
 )
 
@@ -293,3 +302,190 @@ def build_ingest_state_store(backend: str | None = None) -> IngestStateStore:
     if name == "redis":
         return RedisIngestStateStore()
     return InMemoryIngestStateStore()
+
+
+@runtime_checkable
+class ChunkManifestStore(Protocol):
+    """Async-протокол manifest'а chunks: ``source_id -> {chunk_id}``.
+
+    ``tags`` — скалярная metadata источника (``namespace``, ``doc_id``,
+    поля ingest-metadata); по ней :meth:`discard` снимает manifest'ы
+    вместе с удалением vectors (``delete_where`` с тем же фильтром).
+    """
+
+    async def get(self, source_id: str) -> set[str] | None:
+        """Chunk-id источника либо ``None``, если источник ещё не загружался."""
+        ...
+
+    async def put(
+        self,
+        source_id: str,
+        chunk_ids: set[str],
+        tags: dict[str, Any] | None = None,
+    ) -> None:
+        """Заменяет manifest источника."""
+        ...
+
+    async def discard(self, where: dict[str, Any]) -> set[str]:
+        """Удаляет manifest'ы, чьи ``tags`` совпадают с ``where``.
+
+        Returns:
+            Chunk-id удалённых manifest'ов.
+
+        """
+        ...
+
+
+def _matches(tags: dict[str, Any], where: dict[str, Any]) -> bool:
+    return all(tags.get(key) == value for key, value in where.items())
+
+
+class InMemoryChunkManifestStore:
+    """In-process manifest (теряется при рестарте — re-ingest станет полным)."""
+
+    def __init__(self) -> None:
+        self._manifests: dict[str, tuple[frozenset[str], dict[str, Any]]] = {}
+
+    async def get(self, source_id: str) -> set[str] | None:
+        """Chunk-id источника либо ``None``."""
+        entry = self._manifests.get(source_id)
+        return set(entry[0]) if entry is not None else None
+
+    async def put(
+        self,
+        source_id: str,
+        chunk_ids: set[str],
+        tags: dict[str, Any] | None = None,
+    ) -> None:
+        """Заменяет manifest источника."""
+        self._manifests[source_id] = (frozenset(chunk_ids), dict(tags or {}))
+
+    async def discard(self, where: dict[str, Any]) -> set[str]:
+        """Удаляет manifest'ы по ``tags``; возвращает их chunk-id."""
+        removed: set[str] = set()
+        for source_id, (chunk_ids, tags) in list(self._manifests.items()):
+            if _matches(tags, where):
+                del self._manifests[source_id]
+                removed |= chunk_ids
+        return removed
+
+
+class RedisChunkManifestStore:
+    """Redis-backed manifest. Ключ ``rag:ingest:manifest:<source_id>`` без TTL.
+
+    Manifest обязан жить столько же, сколько chunks в vector store —
+    иначе исчезнувшие chunks нельзя будет удалить по diff'у. Id источников
+    собраны в SET ``rag:ingest:manifests``: :meth:`discard` (удаление
+    документа / namespace / PII erase — редкие admin-операции) проходит
+    по нему и сверяет ``tags``.
+    """
+
+    KEY_MANIFEST = "rag:ingest:manifest:{source_id}"
+    KEY_SOURCES = "rag:ingest:manifests"
+
+    def __init__(self, *, redis_client: Any | None = None) -> None:
+        self._client = redis_client
+
+    def _ensure_client(self) -> Any:
+        if self._client is not None:
+            return self._client
+        from src.backend.core.storage.redis import get_redis_client
+
+        self._client = get_redis_client()
+        return self._client
+
+    @staticmethod
+    def _decode(raw: Any) -> tuple[set[str], dict[str, Any]]:
+        data = orjson.loads(raw)
+        if isinstance(data, list):
+            # Формат до tags: голый список chunk-id.
+            return set(data), {}
+        return set(data.get("ids") or ()), dict(data.get("tags") or {})
+
+    async def get(self, source_id: str) -> set[str] | None:
+        """Chunk-id источника либо ``None`` (в т.ч. при недоступном Redis)."""
+        client = self._ensure_client()
+        try:
+            raw = await client.cache_get(self.KEY_MANIFEST.format(source_id=source_id))
+        except Exception as exc:
+            logger.debug("RedisChunkManifestStore.get failed: %s", exc)
+            return None
+        if not raw:
+            return None
+        try:
+            return self._decode(raw)[0]
+        except Exception as exc:
+            logger.debug("RedisChunkManifestStore decode failed: %s", exc)
+            return None
+
+    async def put(
+        self,
+        source_id: str,
+        chunk_ids: set[str],
+        tags: dict[str, Any] | None = None,
+    ) -> None:
+        """Заменяет manifest источника.
+
+        Ошибка записи — warning: без manifest'а следующий ingest источника
+        станет полным (повторный embedding), а исчезнувшие chunks не удалятся.
+        """
+        client = self._ensure_client()
+        key = self.KEY_MANIFEST.format(source_id=source_id)
+        raw = orjson.dumps({"ids": sorted(chunk_ids), "tags": tags or {}})
+
+        async def op(conn: Any) -> None:
+            pipe = conn.pipeline(transaction=False)
+            pipe.set(key, raw)
+            pipe.sadd(self.KEY_SOURCES, source_id)
+            await pipe.execute()
+
+        try:
+            await client.execute("cache", op)
+        except Exception as exc:
+            logger.warning(
+                "RedisChunkManifestStore.put(%s) failed: %s", source_id, exc
+            )
+
+    async def discard(self, where: dict[str, Any]) -> set[str]:
+        """Удаляет manifest'ы по ``tags``; возвращает их chunk-id.
+
+        Ошибки Redis пробрасываются: caller не должен удалять vectors,
+        оставляя manifest, который сделает re-ingest no-op'ом.
+        """
+        client = self._ensure_client()
+
+        async def members(conn: Any) -> list[str]:
+            raw = await conn.smembers(self.KEY_SOURCES)
+            return [m.decode() if isinstance(m, bytes) else str(m) for m in raw]
+
+        removed: set[str] = set()
+        matched: list[str] = []
+        for source_id in await client.execute("cache", members):
+            raw = await client.cache_get(self.KEY_MANIFEST.format(source_id=source_id))
+            if not raw:
+                matched.append(source_id)
+                continue
+            chunk_ids, tags = self._decode(raw)
+            if _matches(tags, where):
+                matched.append(source_id)
+                removed |= chunk_ids
+        if not matched:
+            return removed
+
+        async def drop(conn: Any) -> None:
+            pipe = conn.pipeline(transaction=False)
+            for source_id in matched:
+                pipe.delete(self.KEY_MANIFEST.format(source_id=source_id))
+            pipe.srem(self.KEY_SOURCES, *matched)
+            await pipe.execute()
+
+        await client.execute("cache", drop)
+        return removed
+
+
+def build_chunk_manifest_store(backend: str | None = None) -> ChunkManifestStore:
+    """Фабрика manifest'а по ``rag_ingest_settings.state_backend`` (memory/redis)."""
+    name = (backend or "memory").strip().lower()
+    if name == "redis":
+        return RedisChunkManifestStore()
+    return InMemoryChunkManifestStore()
@@ -1,10 +1,10 @@
 """RAGService package (S64 W4 decomp from rag_service.py 478 LOC).
 
 14 methods decomposed в 4 mixin files + state.py:
-- ``ingest_mixin.py`` (5): _cache_key, chunk_text, _embed, ingest, _invalidate_namespace
+- ``ingest_mixin.py`` (8): _cache_key, chunk_text, _embed, prepare_chunks, embed_chunks, commit_chunks, ingest, _invalidate_namespace
 - ``search_mixin.py`` (1): search
 - ``augment_mixin.py`` (3): augment_prompt, augment_prompt_with_citations, augment
-- ``collection_mixin.py`` (4): delete, delete_collection, get_collection_stats, count
+- ``collection_mixin.py`` (5): delete, discard_manifests, delete_collection, get_collection_stats, count
 - ``state.py``: RAGCitation
 
 Core (1) остается в __init__.py: __init__.
@@ -15,6 +15,7 @@ Backward-compat: ``from src.backend.services.ai.rag_service import RAGService``
 from __future__ import annotations as annotations
 
 from typing import TYPE_CHECKING as TYPE_CHECKING
+from typing import Any
 
 from src.backend.core.di import app_state_singleton as app_state_singleton
 from src.backend.core.interfaces.vector_store import BaseVectorStore as BaseVectorStore
@@ -25,6 +26,7 @@ from src.backend.services.ai.embedding_providers import (
 
 if TYPE_CHECKING:  # pragma: no cover
     from src.backend.core.cache.rag import ThreeTierRagCache
+    from src.backend.services.ai.rag_ingest_store import ChunkManifestStore
 
 from src.backend.services.ai.rag_service.augment_mixin import (
     AugmentMixin,  # S64 W4: MRO
@@ -61,6 +63,21 @@ __all__ = (
 )
 
 
+def _default_manifest() -> ChunkManifestStore:
+    """Manifest chunks по ``rag_ingest_settings.state_backend`` (memory/redis)."""
+    from src.backend.services.ai.rag_ingest_store import (
+        InMemoryChunkManifestStore,
+        build_chunk_manifest_store,
+    )
+
+    try:
+        from src.backend.core.config.ai_stack import rag_ingest_settings
+
+        return build_chunk_manifest_store(rag_ingest_settings.state_backend)
+    except Exception as _:
+        return InMemoryChunkManifestStore()
+
+
 @app_state_singleton("rag_service")
 def get_rag_service() -> RAGService:
     """S124 W2: восстановлено (потеряно при S64 W4 decomp).
@@ -76,17 +93,32 @@ def get_rag_service() -> RAGService:
     return RAGService(store=InMemoryVectorStore())
 
 
+async def discard_manifests(where: dict[str, Any]) -> set[str]:
+    """Снять manifest'ы chunks для ``delete_where`` в обход RAGService (PII erase).
+
+    Без зарегистрированного RAGService — напрямую через manifest-store
+    по ``state_backend`` (Redis-manifest'ы общие для процессов).
+    """
+    try:
+        service = get_rag_service()
+    except RuntimeError:
+        return await _default_manifest().discard(where)
+    return await service.discard_manifests(where)
+
+
 class RAGService(IngestMixin, SearchMixin, AugmentMixin, CollectionMixin):
     """RAG service (4 mixins = 13 methods + 1 core)."""
 
-    __slots__ = ("_cache", "_embedder", "_store")
+    __slots__ = ("_cache", "_embedder", "_manifest", "_store")
 
     def __init__(
         self,
         store: BaseVectorStore,
         embedder: EmbeddingProvider | None = None,
         cache: ThreeTierRagCache | None = None,
+        manifest: ChunkManifestStore | None = None,
     ) -> None:
         self._store = store
         self._embedder = embedder or get_embedding_provider()
         self._cache = cache
+        self._manifest = manifest or _default_manifest()
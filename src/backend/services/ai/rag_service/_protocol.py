@@ -10,6 +10,7 @@ from typing import Any, Protocol
 
 from src.backend.core.interfaces.vector_store import BaseVectorStore
 from src.backend.services.ai.embedding_providers import EmbeddingProvider
+from src.backend.services.ai.rag_ingest_store import ChunkManifestStore
 
 
 class _RAGServiceProtocol(Protocol):
@@ -18,6 +19,7 @@ class _RAGServiceProtocol(Protocol):
     _store: BaseVectorStore
     _embedder: EmbeddingProvider
     _cache: Any | None
+    _manifest: ChunkManifestStore
 
     def _cache_key(
         self, *, system_prompt: str, query: str, top_k: int, namespace: str | None
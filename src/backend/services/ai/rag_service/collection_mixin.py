@@ -24,14 +24,34 @@ class CollectionMixin(_RAGServiceProtocol):
     __slots__ = ()
 
     async def delete(self, document_id: str) -> bool:
-        """Удаляет документ из индекса (по chunk-id'ам или doc_id)."""
+        """Удаляет документ из индекса (по chunk-id'ам или doc_id).
+
+        Chunks документа берутся из manifest'ов с ``doc_id`` — их
+        content-addressed id с ``doc_id`` не совпадают.
+        """
         try:
-            await self._store.delete([document_id])
+            chunk_ids = await self.discard_manifests({"doc_id": document_id})
+            await self._store.delete([document_id, *sorted(chunk_ids)])
             await self._invalidate_namespace(None)
             return True
-        except Exception as _:
+        except Exception as exc:
+            logger.warning("delete(%s) failed: %s", document_id, exc)
             return False
 
+    async def discard_manifests(self, where: dict[str, Any]) -> set[str]:
+        """Снимает manifest'ы chunks по metadata-фильтру ``delete_where``.
+
+        Вызывается на каждом пути удаления vectors: manifest, переживший
+        свои chunks, сделал бы повторный ingest того же документа no-op'ом.
+        Manifest снимается до vectors — при сбое удаления re-ingest
+        просто загрузит chunks заново.
+
+        Returns:
+            Chunk-id снятых manifest'ов.
+
+        """
+        return await self._manifest.discard(where)
+
     async def delete_collection(self, namespace: str) -> int:
         """Удаляет все документы из логической партиции (namespace).
 
@@ -39,6 +59,7 @@ class CollectionMixin(_RAGServiceProtocol):
         Возвращает количество удалённых chunks. При ошибке — 0.
         """
         try:
+            await self.discard_manifests({"namespace": namespace})
             removed = int(await self._store.delete_where({"namespace": namespace}))
             await self._invalidate_namespace(namespace)
             return removed
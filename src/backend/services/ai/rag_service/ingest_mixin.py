@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     pass
 
+import asyncio
 import hashlib
+import uuid
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     pass
 
 from src.backend.core.logging import get_logger
+from src.backend.services.ai.rag_types import ChunkPlan
 
 logger = get_logger(__name__)
 
@@ -19,11 +22,52 @@ logger = get_logger(__name__)
 from src.backend.services.ai.rag_service._protocol import _RAGServiceProtocol
 
 
+def _source_id(namespace: str, metadata: dict[str, Any]) -> str | None:
+    """Ключ manifest'а по явному ``metadata["source_id"]`` либо ``None``.
+
+    ``filename``/``source`` идентичностью не считаются: upload'ы с
+    одинаковым basename (или без имени — ``"file"``) делили бы manifest, и
+    diff удалял бы chunks чужого документа.
+    """
+    value = metadata.get("source_id")
+    if not value:
+        return None
+    return _scoped(namespace, "source_id", str(value))
+
+
+def _scoped(namespace: str, kind: str, value: str) -> str:
+    """Hash ``(namespace, kind, value)``: ключи разных namespace не пересекаются."""
+    material = f"{namespace}\0{kind}\0{value}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def _manifest_tags(
+    namespace: str, doc_id: str, source_id: str, metadata: dict[str, Any]
+) -> dict[str, Any]:
+    """Скалярная metadata chunks источника — фильтр ``discard`` manifest'а."""
+    tags = {
+        key: value
+        for key, value in metadata.items()
+        if isinstance(value, str | int | float | bool)
+    }
+    tags.update(namespace=namespace, doc_id=doc_id, source_id=source_id)
+    return tags
+
+
+def _chunk_id(source_id: str, chunk: str) -> str:
+    """Content-addressed id chunk'а в UUID-форме (валиден для Qdrant/Chroma)."""
+    digest = hashlib.sha256(f"{source_id}\0{chunk}".encode()).digest()
+    return str(uuid.UUID(bytes=digest[:16]))
+
+
 class IngestMixin(_RAGServiceProtocol):
     """ingest ops (_cache_key + chunk_text + _embed + ingest + _invalidate_namespace) для RAGService. S64 W4 extraction."""
 
     __slots__ = ()
 
+    #: Маркер поэтапного API (prepare/embed/commit) для ``RagIngestService``.
+    staged_ingest: ClassVar[bool] = True
+
     @staticmethod
     def _cache_key(
         *, system_prompt: str, query: str, top_k: int, namespace: str | None
@@ -53,35 +97,104 @@ class IngestMixin(_RAGServiceProtocol):
     async def _embed(self, texts: list[str]) -> list[list[float]]:
         return await self._embedder.embed(texts)
 
-    async def ingest(
+    async def prepare_chunks(
         self,
         content: str,
         metadata: dict[str, Any] | None = None,
         namespace: str = "default",
-    ) -> str:
-        """Загружает документ → chunking → embedding → vector store."""
+    ) -> ChunkPlan:
+        """Chunking + content-hash + diff с manifest'ом источника.
+
+        Id chunk'а — hash ``(source_id, текст)``: неизменённый chunk
+        получает тот же id и не эмбеддится повторно, chunks прежней
+        ревизии, которых нет в новой, попадают в ``stale_ids``.
+        ``chunk_idx`` пишется для новых chunks; у пропущенных остаётся
+        позиция из ревизии, в которой они были загружены.
+
+        Diff между ревизиями — только при явном ``metadata["source_id"]``;
+        без него ключ manifest'а — hash ``(namespace, doc_id)`` и
+        ``stale_ids`` пуст (повторная загрузка того же содержимого в тот же
+        namespace по-прежнему no-op, в другой — отдельные chunks).
+        """
+        metadata = metadata or {}
         doc_id = hashlib.sha256(content.encode()).hexdigest()[:16]
-        chunks = self.chunk_text(content)
-        embeddings = await self._embed(chunks)
-
-        ids = [f"{doc_id}_chunk_{i}" for i in range(len(chunks))]
-        metadatas = [
-            {
-                **(metadata or {}),
-                "namespace": namespace,
-                "doc_id": doc_id,
-                "chunk_idx": i,
-            }
-            for i in range(len(chunks))
-        ]
-
-        await self._store.upsert(
-            embeddings=embeddings, documents=chunks, ids=ids, metadatas=metadatas
+        explicit = _source_id(namespace, metadata)
+        source_id = explicit or _scoped(namespace, "doc_id", doc_id)
+        chunks = await asyncio.to_thread(self.chunk_text, content)
+        previous = await self._manifest.get(source_id) or set()
+
+        plan = ChunkPlan(
+            doc_id=doc_id,
+            source_id=source_id,
+            namespace=namespace,
+            total_chunks=len(chunks),
+            tags=_manifest_tags(namespace, doc_id, source_id, metadata),
         )
+        for idx, chunk in enumerate(chunks):
+            chunk_id = _chunk_id(source_id, chunk)
+            if chunk_id in plan.manifest:
+                continue
+            plan.manifest.add(chunk_id)
+            if chunk_id in previous:
+                continue
+            plan.ids.append(chunk_id)
+            plan.chunks.append(chunk)
+            plan.metadatas.append(
+                {
+                    **metadata,
+                    "namespace": namespace,
+                    "doc_id": doc_id,
+                    "source_id": source_id,
+                    "chunk_idx": idx,
+                }
+            )
+        if explicit is not None:
+            plan.stale_ids = sorted(previous - plan.manifest)
+        return plan
+
+    async def embed_chunks(self, plan: ChunkPlan) -> list[list[float]]:
+        """Эмбеддинги только новых chunks плана."""
+        if not plan.chunks:
+            return []
+        return await self._embed(plan.chunks)
+
+    async def commit_chunks(
+        self, plan: ChunkPlan, embeddings: list[list[float]]
+    ) -> None:
+        """Upsert новых chunks, удаление исчезнувших, запись manifest'а."""
+        if plan.ids:
+            await self._store.upsert(
+                embeddings=embeddings,
+                documents=plan.chunks,
+                ids=plan.ids,
+                metadatas=plan.metadatas,
+            )
+        if plan.stale_ids:
+            await self._store.delete(plan.stale_ids)
+        await self._manifest.put(plan.source_id, plan.manifest, plan.tags)
+
+        logger.info(
+            "Ingested document %s: %d chunks (%d new, %d unchanged, %d deleted)",
+            plan.doc_id,
+            plan.total_chunks,
+            len(plan.ids),
+            plan.skipped_chunks,
+            len(plan.stale_ids),
+        )
+        if plan.ids or plan.stale_ids:
+            await self._invalidate_namespace(plan.namespace)
 
-        logger.info("Ingested document %s: %d chunks", doc_id, len(chunks))
-        await self._invalidate_namespace(namespace)
-        return doc_id
+    async def ingest(
+        self,
+        content: str,
+        metadata: dict[str, Any] | None = None,
+        namespace: str = "default",
+    ) -> str:
+        """Загружает документ → chunking → hash/diff → embedding → vector store."""
+        plan = await self.prepare_chunks(content, metadata, namespace)
+        embeddings = await self.embed_chunks(plan)
+        await self.commit_chunks(plan, embeddings)
+        return plan.doc_id
 
     async def _invalidate_namespace(self, namespace: str | None) -> None:
         """Сбрасывает закэшированные ответы по namespace-tag."""
@@ -82,3 +82,42 @@ class AugmentResult:
             "freshness_distribution": self.freshness_distribution,
             "worst_freshness": self.worst_freshness.value,
         }
+
+
+@dataclass(slots=True)
+class ChunkPlan:
+    """План инкрементального ingest'а одного документа (diff по manifest'у).
+
+    Attributes:
+        doc_id: sha256-префикс содержимого документа.
+        source_id: Ключ manifest'а: hash ``(namespace, metadata.source_id)``,
+            одинаковый для всех ревизий документа, либо hash
+            ``(namespace, doc_id)``, если caller не передал ``source_id``
+            (тогда ``stale_ids`` пуст).
+        namespace: Логическая партиция в коллекции.
+        ids: Content-addressed id новых chunks (нужны embedding + upsert).
+        chunks: Тексты новых chunks (parallel к ``ids``).
+        metadatas: Metadata новых chunks (parallel к ``ids``).
+        stale_ids: Id chunks прежней ревизии, которых больше нет.
+        manifest: Все id текущей ревизии (новый manifest источника).
+        total_chunks: Число chunks документа после chunking'а.
+        tags: Скалярная metadata источника для manifest'а (``namespace``,
+            ``doc_id``, поля ingest-metadata) — фильтр ``discard``.
+
+    """
+
+    doc_id: str
+    source_id: str
+    namespace: str
+    ids: list[str] = field(default_factory=list)
+    chunks: list[str] = field(default_factory=list)
+    metadatas: list[dict[str, Any]] = field(default_factory=list)
+    stale_ids: list[str] = field(default_factory=list)
+    manifest: set[str] = field(default_factory=set)
+    total_chunks: int = 0
+    tags: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def skipped_chunks(self) -> int:
+        """Неизменённые chunks (без embedding и upsert)."""
+        return len(self.manifest) - len(self.ids)
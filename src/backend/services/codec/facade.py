@@ -99,11 +99,9 @@ class CodecFacade:
         raise ValueError(f"Unsupported format: {fmt}")  # pragma: no cover
 
     def _encode_json(self, data: Any) -> bytes:
-        import orjson
-
-        from src.backend.core.codec.json import to_jsonable
+        from src.backend.core.codec.json import json_dumps
 
-        return orjson.dumps(to_jsonable(data))
+        return json_dumps(data)
 
     def _decode_json(self, data: bytes) -> Any:
         import orjson
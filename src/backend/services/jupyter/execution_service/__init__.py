@@ -6,6 +6,7 @@
 - ``jupyter_mixin.py`` (4): _wait_for_server, _upload_notebook, _create_session, _execute_cell
 - ``errors.py``: JupyterExecutionError
 - ``backend.py``: NbClientExecutionBackend
+- ``kernel_pool.py``: KernelPool (прогретые kernel'ы для nbclient/papermill)
 
 Core (2) остается в __init__.py: __init__, _server_to_ws_url.
 
@@ -45,6 +46,9 @@ from src.backend.services.jupyter.execution_service.io_mixin import (
 from src.backend.services.jupyter.execution_service.jupyter_mixin import (
     JupyterBackendMixin,  # S60 W1: MRO
 )
+from src.backend.services.jupyter.execution_service.kernel_pool import (
+    KernelPool,  # re-export: пул прогретых kernel'ов
+)
 from src.backend.services.jupyter.execution_service.kernelspec import (  # S75 W3
     DEFAULT_FALLBACK_SPECS,  # S75 W3: re-export
     KernelSpecDiscovery,  # S75 W3: re-export
@@ -59,6 +63,7 @@ __all__ = (
     "E2BExecutionBackend",  # S75 W1
     "ExecutionBackendFactory",  # S74 W2
     "JupyterExecutionError",
+    "KernelPool",
     "KernelSpecDiscovery",  # S75 W3
     "NbClientExecutionBackend",
     "NotebookExecutionService",
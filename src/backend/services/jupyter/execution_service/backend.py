@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.backend.services.jupyter.execution_service.errors import JupyterExecutionError
 
+if TYPE_CHECKING:
+    from src.backend.services.jupyter.execution_service.kernel_pool import KernelPool
+
 
 class NbClientExecutionBackend:
     """Local notebook execution via nbclient (no JupyterHub required).
@@ -12,11 +15,20 @@ class NbClientExecutionBackend:
 
         backend = NbClientExecutionBackend(kernel_name="python3")
         outputs = await backend.execute(cells=[{"cell_type": "code", "source": "1+1"}])
+
+    With ``kernel_pool`` cells run on a warm pooled kernel (async
+    ``async_execute_cell``) instead of starting a new kernel per call.
     """
 
-    def __init__(self, kernel_name: str = "python3", timeout: float = 60.0) -> None:
+    def __init__(
+        self,
+        kernel_name: str = "python3",
+        timeout: float = 60.0,
+        kernel_pool: KernelPool | None = None,
+    ) -> None:
         self._kernel_name = kernel_name
         self._timeout = timeout
+        self._kernel_pool = kernel_pool
 
     async def execute(
         self, cells: list[dict[str, Any]], *, notebook_path: str = "local.ipynb"
@@ -50,44 +62,55 @@ class NbClientExecutionBackend:
         )
 
         results: list[dict[str, Any]] = []
+        code_indices = [
+            idx for idx, cell in enumerate(cells) if cell.get("cell_type") == "code"
+        ]
         try:
-            with client.setup_kernel():
-                for idx, cell in enumerate(cells):
-                    if cell.get("cell_type") != "code":
-                        continue
-                    client.execute_cell(cell=nb.cells[idx], cell_index=idx)
-                    outputs = []
-                    for output in nb.cells[idx].outputs:
-                        out_type = output.output_type
-                        if out_type == "stream":
-                            outputs.append(
-                                {
-                                    "output_type": "stream",
-                                    "name": output.name,
-                                    "text": output.text,
-                                }
-                            )
-                        elif out_type == "execute_result":
-                            outputs.append(
-                                {
-                                    "output_type": "execute_result",
-                                    "execution_count": output.execution_count,
-                                    "data": output.data,
-                                }
-                            )
-                        elif out_type == "error":
-                            outputs.append(
-                                {
-                                    "output_type": "error",
-                                    "ename": output.ename,
-                                    "evalue": output.evalue,
-                                    "traceback": output.traceback,
-                                }
-                            )
-                    results.append({"cell_index": idx, "outputs": outputs})
+            if self._kernel_pool is None:
+                with client.setup_kernel():
+                    for idx in code_indices:
+                        client.execute_cell(cell=nb.cells[idx], cell_index=idx)
+                        results.append(_cell_result(nb, idx))
+            else:
+                async with self._kernel_pool.acquire(self._kernel_name) as kernel:
+                    kernel.attach(client)
+                    for idx in code_indices:
+                        await client.async_execute_cell(
+                            cell=nb.cells[idx], cell_index=idx
+                        )
+                        results.append(_cell_result(nb, idx))
         except Exception as exc:
             raise JupyterExecutionError(
                 f"Local nbclient execution failed: {exc}"
             ) from exc
 
         return results
+
+
+def _cell_result(nb: Any, idx: int) -> dict[str, Any]:
+    """Outputs выполненной ячейки в формате Hub execution."""
+    outputs = []
+    for output in nb.cells[idx].outputs:
+        out_type = output.output_type
+        if out_type == "stream":
+            outputs.append(
+                {"output_type": "stream", "name": output.name, "text": output.text}
+            )
+        elif out_type == "execute_result":
+            outputs.append(
+                {
+                    "output_type": "execute_result",
+                    "execution_count": output.execution_count,
+                    "data": output.data,
+                }
+            )
+        elif out_type == "error":
+            outputs.append(
+                {
+                    "output_type": "error",
+                    "ename": output.ename,
+                    "evalue": output.evalue,
+                    "traceback": output.traceback,
+                }
+            )
+    return {"cell_index": idx, "outputs": outputs}
@@ -17,6 +17,10 @@ isolation, и runtime substitution (для mock'ов).
 * ``ExecutionBackendFactory.from_config(backend_kind=None)`` —
   auto-detect from settings (env: ``JUPYTER_BACKEND``)
 
+**Kernel pool**: ``"papermill"`` / ``"nbclient"`` получают общий
+:func:`get_kernel_pool` (прогретые kernel'ы, ``JUPYTER_HUB_KERNEL_POOL_SIZE``),
+если ``kernel_pool`` не передан явно (``kernel_pool=None`` — без пула).
+
 **Security policy** (S74 W2 stub):
 * ``"hub"`` — production default (JupyterHub auth, isolated kernels)
 * ``"papermill"`` — opt-in local (developer machines, CI)
@@ -118,12 +122,14 @@ class ExecutionBackendFactory:
                 PapermillExecutionBackend,
             )
 
+            _default_kernel_pool(kwargs)
             return PapermillExecutionBackend(**kwargs)
         if kind == BackendKind.NBCLIENT:
             from src.backend.services.jupyter.execution_service import (
                 NbClientExecutionBackend,
             )
 
+            _default_kernel_pool(kwargs)
             return NbClientExecutionBackend(**kwargs)
         if kind == BackendKind.E2B:
             # S75 W2: E2BExecutionBackend integration (was NotImplementedError
@@ -155,6 +161,16 @@ class ExecutionBackendFactory:
         return self.create(kind_str, settings=settings, **kwargs)
 
 
+def _default_kernel_pool(kwargs: dict[str, Any]) -> None:
+    """Подставить общий пул kernel'ов локальным backend'ам."""
+    if "kernel_pool" not in kwargs:
+        from src.backend.services.jupyter.execution_service.kernel_pool import (
+            get_kernel_pool,
+        )
+
+        kwargs["kernel_pool"] = get_kernel_pool()
+
+
 _default_factory: ExecutionBackendFactory | None = None
 
 
@@ -0,0 +1,429 @@
+"""Пул прогретых Jupyter kernel'ов для локальных backend'ов.
+
+``NbClientExecutionBackend`` и ``PapermillExecutionBackend`` запускали
+новый kernel на каждый прогон: старт процесса + импорт IPython +
+handshake по ZMQ занимает секунды, тогда как короткая параметризованная
+ячейка выполняется за миллисекунды. :class:`KernelPool` держит уже
+запущенные kernel'ы, сгруппированные по имени kernelspec:
+
+* ``acquire(kernel_name, cwd=...)`` отдаёт idle-kernel (после
+  health-check'а ``km.is_alive()``) либо запускает новый и переводит
+  его в ``cwd`` (каталог ноутбука — относительные пути и локальные
+  импорты работают как у нового kernel'а); одновременно занято не
+  больше ``max_kernels`` kernel'ов на spec (остальные ждут);
+* при старте kernel запоминает базовое состояние (``sys.modules``,
+  ``os.environ``, cwd); при возврате ``reset_code`` восстанавливает
+  его — выгружает модули, импортированные прогоном (кроме
+  инфраструктуры kernel'а), откатывает ``os.environ`` и cwd — и
+  очищает user namespace (``%reset -f``); неудачный или зависший
+  reset (ячейка упала по timeout'у и kernel всё ещё занят) — kernel
+  уничтожается;
+* после ``max_uses`` прогонов kernel пересоздаётся (утечки памяти,
+  состояние C-расширений, изменённый ``sys.path`` — всё, что reset
+  не чистит);
+* в фоне поддерживается ``min_idle`` тёплых kernel'ов, живых kernel'ов
+  на spec — не больше ``max_kernels``.
+
+Метрики: ``jupyter_kernel_pool_total{kernel,event}`` (hit / miss /
+unhealthy / recycled) и ``jupyter_kernel_start_seconds{kernel}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.backend.core.logging import get_logger
+from src.backend.core.utils.metrics_registry import metrics_registry
+
+__all__ = ("KernelPool", "PooledKernel", "close_kernel_pool", "get_kernel_pool")
+
+_logger = get_logger("services.jupyter.kernel_pool")
+
+# Снимок базового состояния kernel'а; ``__import__`` — чтобы не
+# оставлять имён в user namespace до первого ``%reset``.
+_BASELINE_CODE = (
+    "__import__('sys')._kernel_pool_baseline = ("
+    "frozenset(__import__('sys').modules), "
+    "dict(__import__('os').environ), "
+    "__import__('os').getcwd())"
+)
+# Модули инфраструктуры kernel'а не выгружаются: их классы уже
+# используются ipykernel'ом, повторный импорт разорвёт isinstance.
+_RESET_CODE = """\
+import os as _kp_os, sys as _kp_sys
+_kp_modules, _kp_environ, _kp_cwd = _kp_sys._kernel_pool_baseline
+_kp_keep = ("IPython", "ipykernel", "jupyter_client", "zmq", "traitlets", "tornado")
+for _kp_name in set(_kp_sys.modules) - _kp_modules:
+    if _kp_name.split(".", 1)[0] not in _kp_keep:
+        del _kp_sys.modules[_kp_name]
+_kp_os.environ.clear()
+_kp_os.environ.update(_kp_environ)
+_kp_os.chdir(_kp_cwd)
+%reset -f
+"""
+
+kernel_pool_total = metrics_registry.counter(
+    "jupyter_kernel_pool_total",
+    "Kernel pool events (hit/miss/unhealthy/recycled).",
+    labels=("kernel", "event"),
+)
+kernel_start_seconds = metrics_registry.histogram(
+    "jupyter_kernel_start_seconds",
+    "Jupyter kernel startup latency.",
+    labels=("kernel",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+KernelFactory = Callable[[str], Awaitable[tuple[Any, Any]]]
+
+
+async def _start_jupyter_kernel(
+    kernel_name: str, *, timeout: float = 60.0
+) -> tuple[Any, Any]:
+    """Запустить kernel через ``jupyter_client``; вернуть ``(km, kc)``."""
+    try:
+        from jupyter_client.manager import (
+            AsyncKernelManager,  # type: ignore[import-not-found]
+        )
+    except ImportError as exc:
+        from src.backend.services.jupyter.execution_service.errors import (
+            JupyterExecutionError,
+        )
+
+        raise JupyterExecutionError(
+            "jupyter_client required для kernel pool. "
+            "Install: uv sync --extra jupyter"
+        ) from exc
+
+    km = AsyncKernelManager(kernel_name=kernel_name)
+    await km.start_kernel()
+    kc = km.client()
+    kc.start_channels()
+    try:
+        await kc.wait_for_ready(timeout=timeout)
+    except BaseException:
+        kc.stop_channels()
+        await km.shutdown_kernel(now=True)
+        raise
+    return km, kc
+
+
+@dataclass(slots=True)
+class PooledKernel:
+    """Запущенный kernel: manager + client и счётчик прогонов."""
+
+    kernel_name: str
+    km: Any
+    kc: Any
+    uses: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def attach(self, client: Any) -> Any:
+        """Подключить ``nbclient.NotebookClient`` к этому kernel'у.
+
+        Клиенту не вызывается ``setup_kernel``: kernel и каналы уже
+        готовы, ячейки выполняются через ``async_execute_cell``.
+        """
+        client.km = self.km
+        client.kc = self.kc
+        return client
+
+    async def is_alive(self) -> bool:
+        """Health-check: процесс kernel'а жив."""
+        try:
+            return bool(await self.km.is_alive())
+        except Exception:
+            return False
+
+    async def run(self, code: str, timeout: float) -> bool:
+        """Выполнить служебный ``code``; ``True`` — kernel пригоден."""
+        try:
+            reply = await self.kc.execute_interactive(
+                code, silent=True, store_history=False, timeout=timeout
+            )
+        except Exception as exc:
+            _logger.debug("Kernel %s run failed: %s", self.kernel_name, exc)
+            return False
+        return bool(reply.get("content", {}).get("status") == "ok")
+
+    async def shutdown(self) -> None:
+        """Остановить каналы и процесс kernel'а (ошибки — в debug-лог)."""
+        try:
+            self.kc.stop_channels()
+            await self.km.shutdown_kernel(now=True)
+        except Exception as exc:
+            _logger.debug("Kernel %s shutdown failed: %s", self.kernel_name, exc)
+
+
+@dataclass(slots=True)
+class _SpecPool:
+    slots: asyncio.Semaphore
+    idle: deque[PooledKernel] = field(default_factory=deque)
+    live: int = 0
+    warming: int = 0
+
+
+class KernelPool:
+    """Ограниченный пул прогретых kernel'ов по kernelspec.
+
+    Args:
+        max_kernels: Живых (и одновременно занятых) kernel'ов на spec.
+        max_uses: Прогонов до пересоздания kernel'а.
+        min_idle: Тёплых kernel'ов, которые пул держит наготове.
+        reset_code: Код сброса состояния между прогонами (по умолчанию
+            откат к снимку, сделанному при старте kernel'а).
+        reset_timeout: Таймаут сброса (сек); превышен — kernel
+            уничтожается.
+        start_timeout: Таймаут готовности нового kernel'а (сек).
+        kernel_factory: ``kernel_name -> (km, kc)``; по умолчанию —
+            ``jupyter_client.AsyncKernelManager``.
+
+    Usage::
+
+        pool = KernelPool(max_kernels=4)
+        async with pool.acquire("python3") as kernel:
+            kernel.attach(notebook_client)
+            await notebook_client.async_execute_cell(cell, 0)
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_kernels: int = 2,
+        max_uses: int = 50,
+        min_idle: int = 1,
+        reset_code: str = _RESET_CODE,
+        reset_timeout: float = 10.0,
+        start_timeout: float = 60.0,
+        kernel_factory: KernelFactory | None = None,
+    ) -> None:
+        if max_kernels < 1 or max_uses < 1:
+            raise ValueError("max_kernels и max_uses должны быть >= 1")
+        self._max_kernels = max_kernels
+        self._max_uses = max_uses
+        self._min_idle = min(max(min_idle, 0), max_kernels)
+        self._reset_code = reset_code
+        self._reset_timeout = reset_timeout
+        self._start_timeout = start_timeout
+        self._factory = kernel_factory
+        self._specs: dict[str, _SpecPool] = {}
+        self._closed = False
+
+    @asynccontextmanager
+    async def acquire(
+        self, kernel_name: str, *, cwd: str | None = None
+    ) -> AsyncIterator[PooledKernel]:
+        """Занять kernel ``kernel_name`` на время блока.
+
+        ``cwd`` — рабочий каталог kernel'а на этот прогон (обычно каталог
+        ноутбука); при возврате kernel'а cwd откатывается reset'ом.
+        """
+        if self._closed:
+            raise RuntimeError("KernelPool закрыт")
+        spec = self._spec(kernel_name)
+        async with spec.slots:
+            kernel = await self._checkout(spec, kernel_name)
+            if cwd is not None and not await kernel.run(
+                f"__import__('os').chdir({cwd!r})", self._reset_timeout
+            ):
+                self._retire(spec, kernel, "unhealthy")
+                raise RuntimeError(f"Kernel {kernel_name}: chdir в {cwd!r} не удался")
+            try:
+                yield kernel
+            except Exception:
+                await self._release(spec, kernel)
+                raise
+            except BaseException:
+                # Отмена посреди ячейки: состояние kernel'а неизвестно.
+                self._retire(spec, kernel, "recycled")
+                raise
+            else:
+                await self._release(spec, kernel)
+
+    async def prewarm(self, kernel_names: Iterable[str]) -> None:
+        """Запустить ``min_idle`` (минимум один) kernel'ов для каждого spec."""
+        starts = []
+        for name in kernel_names:
+            spec = self._spec(name)
+            target = max(self._min_idle, 1)
+            while spec.live < min(target, self._max_kernels):
+                spec.live += 1
+                starts.append(self._warm(spec, name))
+        await asyncio.gather(*starts)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Состояние пула по spec'ам (для health/diagnostics)."""
+        return {
+            name: {
+                "idle": len(spec.idle),
+                "live": spec.live,
+                "warming": spec.warming,
+                "busy": spec.live - len(spec.idle) - spec.warming,
+            }
+            for name, spec in self._specs.items()
+        }
+
+    async def aclose(self) -> None:
+        """Остановить все idle-kernel'ы; занятые остановятся при возврате."""
+        self._closed = True
+        kernels = []
+        for spec in self._specs.values():
+            while spec.idle:
+                kernels.append(spec.idle.popleft())
+                spec.live -= 1
+        await asyncio.gather(*(kernel.shutdown() for kernel in kernels))
+
+    def _spec(self, kernel_name: str) -> _SpecPool:
+        spec = self._specs.get(kernel_name)
+        if spec is None:
+            spec = _SpecPool(slots=asyncio.Semaphore(self._max_kernels))
+            self._specs[kernel_name] = spec
+        return spec
+
+    async def _checkout(self, spec: _SpecPool, kernel_name: str) -> PooledKernel:
+        while spec.idle:
+            kernel = spec.idle.popleft()
+            if await kernel.is_alive():
+                kernel_pool_total.labels(kernel=kernel_name, event="hit").inc()
+                self._replenish(spec, kernel_name)
+                return kernel
+            self._retire(spec, kernel, "unhealthy")
+        kernel_pool_total.labels(kernel=kernel_name, event="miss").inc()
+        spec.live += 1
+        try:
+            kernel = await self._start(kernel_name)
+        except BaseException:
+            spec.live -= 1
+            raise
+        self._replenish(spec, kernel_name)
+        return kernel
+
+    async def _release(self, spec: _SpecPool, kernel: PooledKernel) -> None:
+        kernel.uses += 1
+        if self._closed or kernel.uses >= self._max_uses:
+            self._retire(spec, kernel, "recycled")
+            return
+        if spec.live > self._max_kernels or not await kernel.run(
+            self._reset_code, self._reset_timeout
+        ):
+            self._retire(spec, kernel, "recycled")
+            return
+        spec.idle.append(kernel)
+
+    def _retire(self, spec: _SpecPool, kernel: PooledKernel, event: str) -> None:
+        """Уничтожить kernel в фоне и дозапустить тёплый на замену."""
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        spec.live -= 1
+        kernel_pool_total.labels(kernel=kernel.kernel_name, event=event).inc()
+        _logger.debug(
+            "Kernel %s retired (%s) after %d runs",
+            kernel.kernel_name,
+            event,
+            kernel.uses,
+        )
+        get_task_registry().create_task(
+            kernel.shutdown(), name=f"kernel-pool-shutdown-{id(kernel)}"
+        )
+        self._replenish(spec, kernel.kernel_name)
+
+    def _replenish(self, spec: _SpecPool, kernel_name: str) -> None:
+        if self._closed:
+            return
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        while (
+            len(spec.idle) + spec.warming < self._min_idle
+            and spec.live < self._max_kernels
+        ):
+            spec.live += 1
+            get_task_registry().create_task(
+                self._warm(spec, kernel_name),
+                name=f"kernel-pool-warm-{kernel_name}-{spec.live}",
+            )
+
+    async def _warm(self, spec: _SpecPool, kernel_name: str) -> None:
+        """Запустить kernel в idle (``spec.live`` уже учитывает его)."""
+        spec.warming += 1
+        try:
+            kernel = await self._start(kernel_name)
+        except Exception as exc:
+            spec.live -= 1
+            _logger.warning("Kernel %s prewarm failed: %s", kernel_name, exc)
+            return
+        finally:
+            spec.warming -= 1
+        if self._closed:
+            spec.live -= 1
+            await kernel.shutdown()
+            return
+        spec.idle.append(kernel)
+
+    async def _start(self, kernel_name: str) -> PooledKernel:
+        started = time.monotonic()
+        if self._factory is not None:
+            km, kc = await self._factory(kernel_name)
+        else:
+            km, kc = await _start_jupyter_kernel(
+                kernel_name, timeout=self._start_timeout
+            )
+        kernel_start_seconds.labels(kernel=kernel_name).observe(
+            time.monotonic() - started
+        )
+        kernel = PooledKernel(kernel_name=kernel_name, km=km, kc=kc)
+        if not await kernel.run(_BASELINE_CODE, self._reset_timeout):
+            await kernel.shutdown()
+            raise RuntimeError(f"Kernel {kernel_name}: снимок состояния не снят")
+        return kernel
+
+
+_kernel_pool: KernelPool | None = None
+
+
+def get_kernel_pool() -> KernelPool | None:
+    """Общий пул из ``JupyterHubSettings`` (``None`` — пул выключен).
+
+    По умолчанию ``kernel_pool_size=0``: новый kernel на каждый прогон;
+    пул включается явно. ``kernel_pool_prewarm`` прогревается в фоне при
+    первом обращении из работающего event loop'а.
+    """
+    global _kernel_pool
+    if _kernel_pool is not None:
+        return _kernel_pool
+    from src.backend.core.config.services.jupyter_hub import jupyter_hub_settings
+
+    settings = jupyter_hub_settings
+    if settings.kernel_pool_size <= 0:
+        return None
+    _kernel_pool = KernelPool(
+        max_kernels=settings.kernel_pool_size,
+        max_uses=settings.kernel_pool_max_uses,
+        min_idle=settings.kernel_pool_min_idle,
+    )
+    if settings.kernel_pool_prewarm:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _kernel_pool
+        from src.backend.core.utils.task_registry import get_task_registry
+
+        get_task_registry().create_task(
+            _kernel_pool.prewarm(settings.kernel_pool_prewarm),
+            name="kernel-pool-prewarm",
+        )
+    return _kernel_pool
+
+
+async def close_kernel_pool() -> None:
+    """Остановить общий пул (shutdown приложения)."""
+    global _kernel_pool
+    if _kernel_pool is not None:
+        await _kernel_pool.aclose()
+        _kernel_pool = None
@@ -31,6 +31,12 @@ Implementation notes:
 * Lazy-import papermill (opt-in extra) — если пакет не установлен,
   ``JupyterExecutionError`` с actionable message.
 * Output notebook path writable — caller responsible для cleanup.
+* С ``kernel_pool`` papermill используется только для parameter
+  injection (``parameterize_notebook``), ячейки выполняются nbclient'ом
+  на прогретом kernel'е из :class:`KernelPool` — без старта kernel'а
+  на каждый прогон. Pooled kernel на время прогона переходит в
+  директорию notebook'а; при возврате в пул cwd, ``os.environ`` и
+  импортированные прогоном модули откатываются.
 """
 
 from __future__ import annotations
@@ -39,10 +45,13 @@ import asyncio
 import os
 import time
 from collections.abc import Mapping
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.backend.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from src.backend.services.jupyter.execution_service.kernel_pool import KernelPool
+
 _logger = get_logger("services.jupyter.papermill")
 
 __all__ = ("PapermillExecutionBackend",)
@@ -69,10 +78,12 @@ class PapermillExecutionBackend:
         kernel_name: str = "python3",
         timeout: float = 600.0,
         progress_bar: bool = False,
+        kernel_pool: KernelPool | None = None,
     ) -> None:
         self._kernel_name = kernel_name
         self._timeout = timeout
         self._progress_bar = progress_bar
+        self._kernel_pool = kernel_pool
 
     async def execute_with_params(
         self,
@@ -112,8 +123,8 @@ class PapermillExecutionBackend:
         # Lazy-import papermill (opt-in extra).
         try:
             import papermill as pm  # type: ignore[import-not-found]
-            from papermill.exceptions import (  # type: ignore[import-not-found]
-                PapermillExecutionError as PMError,
+            from papermill.exceptions import (
+                PapermillExecutionError as PMError,  # type: ignore[import-not-found]
             )
         except ImportError as exc:
             from src.backend.services.jupyter.execution_service.errors import (
@@ -140,20 +151,29 @@ class PapermillExecutionBackend:
 
         # Sync papermill call в thread (не block event loop).
         start = time.monotonic()
-        try:
-            await asyncio.to_thread(
-                pm.execute_notebook,
-                input_path=notebook_path,
-                output_path=output_path,
-                parameters=dict(parameters),
-                kernel_name=self._kernel_name,
-                progress_bar=self._progress_bar,
-                log_output=False,
+        if self._kernel_pool is not None:
+            await self._execute_pooled(
+                self._kernel_pool, notebook_path, output_path, parameters
             )
-        except PMError as exc:
-            raise JupyterExecutionError(
-                f"Papermill execution failed для {notebook_path}: {exc}"
-            ) from exc
+        else:
+            try:
+                await asyncio.to_thread(
+                    pm.execute_notebook,
+                    input_path=notebook_path,
+                    output_path=output_path,
+                    parameters=dict(parameters),
+                    kernel_name=self._kernel_name,
+                    progress_bar=self._progress_bar,
+                    log_output=False,
+                )
+            except PMError as exc:
+                from src.backend.services.jupyter.execution_service.errors import (
+                    JupyterExecutionError,
+                )
+
+                raise JupyterExecutionError(
+                    f"Papermill execution failed для {notebook_path}: {exc}"
+                ) from exc
         duration = time.monotonic() - start
 
         # Read executed notebook для cell count + error collection.
@@ -187,3 +207,51 @@ class PapermillExecutionBackend:
             "duration_seconds": duration,
             "errors": errors,
         }
+
+    async def _execute_pooled(
+        self,
+        pool: KernelPool,
+        notebook_path: str,
+        output_path: str,
+        parameters: Mapping[str, Any],
+    ) -> None:
+        """Parameter injection papermill'ом + execution на pooled kernel.
+
+        Executed notebook пишется в ``output_path`` и при ошибке ячейки
+        (как papermill), затем ошибка поднимается как
+        ``JupyterExecutionError``.
+        """
+        import nbclient
+        import nbformat
+        from nbclient.exceptions import CellExecutionError
+        from papermill.parameterize import (
+            parameterize_notebook,  # type: ignore[import-not-found]
+        )
+
+        from src.backend.services.jupyter.execution_service.errors import (
+            JupyterExecutionError,
+        )
+
+        nb = nbformat.read(notebook_path, as_version=4)
+        nb = parameterize_notebook(
+            nb, dict(parameters), kernel_name=self._kernel_name
+        )
+        notebook_dir = os.path.dirname(os.path.abspath(notebook_path))
+        client = nbclient.NotebookClient(
+            nb,
+            kernel_name=self._kernel_name,
+            timeout=self._timeout,
+            resources={"metadata": {"path": notebook_dir}},
+        )
+        try:
+            async with pool.acquire(self._kernel_name, cwd=notebook_dir) as kernel:
+                kernel.attach(client)
+                for idx, cell in enumerate(nb.cells):
+                    if cell.cell_type == "code":
+                        await client.async_execute_cell(cell=cell, cell_index=idx)
+        except CellExecutionError as exc:
+            raise JupyterExecutionError(
+                f"Papermill execution failed для {notebook_path}: {exc}"
+            ) from exc
+        finally:
+            await asyncio.to_thread(nbformat.write, nb, output_path)
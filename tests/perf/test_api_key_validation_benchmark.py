@@ -0,0 +1,127 @@
+"""Бенчмарк ``APIKeyManager.validate_key`` при 100 API-клиентах.
+
+* **legacy_scan** — ключ последнего клиента в legacy-формате без индекса:
+  SCAN + MGET + verify по всем клиентам (поведение до key_id);
+* **key_id** — ``<key_id>.<secret>``: GET индекса + один verify
+  (кэш проверок выключен);
+* **cached** — повторная проверка того же ключа из in-process кэша.
+
+Argon2 с облегчёнными параметрами (~1ms на verify): абсолютные цифры
+занижены, соотношение O(n) vs O(1) сохраняется.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_api_key_validation_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from src.backend.core.auth.api_key_backend import APIKeyAuth
+from src.backend.infrastructure.security.api_key_manager import APIKeyManager
+
+_CLIENTS = 100
+_HASHER = APIKeyAuth(time_cost=1, memory_cost=1024, parallelism=1)
+
+
+class _Conn:
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ex: int | None = None) -> None:
+        # Индекс legacy-ключа не сохраняем — каждый замер идёт через SCAN.
+        if not key.startswith("apikey_legacy:"):
+            self.data[key] = value
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [self.data.get(k) for k in keys]
+
+    async def scan_iter(self, match: str, count: int) -> Any:
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+
+class _Client:
+    def __init__(self) -> None:
+        self._redis = _Conn()
+
+    async def execute(self, kind: str, operation: Any) -> Any:
+        return await operation(self._redis)
+
+    async def add_to_stream(self, stream_name: str, data: dict[str, str]) -> None:
+        return None
+
+
+@pytest.fixture(scope="module")
+def store() -> Iterator[tuple[_Client, str, str]]:
+    client = _Client()
+    legacy_raw = new_raw = ""
+    for index in range(_CLIENTS):
+        legacy_raw = f"gd_legacy{index:04d}"
+        key_id = f"gd_{index:016x}"
+        new_raw = f"{key_id}.secret{index}"
+        client._redis.data[f"apikey:legacy{index}"] = orjson.dumps(
+            {"client_id": f"legacy{index}", "key_hash": _HASHER.hash_key(legacy_raw)}
+        )
+        client._redis.data[f"apikey:new{index}"] = orjson.dumps(
+            {
+                "client_id": f"new{index}",
+                "key_id": key_id,
+                "prev_key_id": None,
+                "key_hash": _HASHER.hash_key(new_raw),
+            }
+        )
+        client._redis.data[f"apikey_id:{key_id}"] = f"new{index}"
+    with patch(
+        "src.backend.infrastructure.clients.storage.redis.get_redis_client",
+        return_value=client,
+    ):
+        yield client, legacy_raw, new_raw
+
+
+def _manager(cache_ttl: float) -> APIKeyManager:
+    manager = APIKeyManager(verified_cache_ttl=cache_ttl)
+    manager._hasher = _HASHER
+    manager._global_key_hash = _HASHER.hash_key("global-key")
+    manager._listener_task = object()  # type: ignore[assignment]
+    return manager
+
+
+@pytest.mark.benchmark(group="api_key_validate_100_clients")
+def test_legacy_scan_validate(benchmark: Any, store: tuple[_Client, str, str]) -> None:
+    """Legacy-ключ: SCAN + verify по всем клиентам."""
+    manager = _manager(0)
+    with patch.object(manager, "_legacy_index_key", return_value="apikey_legacy:x"):
+        info = benchmark(lambda: asyncio.run(manager.validate_key(store[1])))
+    assert info is not None
+
+
+@pytest.mark.benchmark(group="api_key_validate_100_clients")
+def test_key_id_validate(benchmark: Any, store: tuple[_Client, str, str]) -> None:
+    """key_id: GET индекса + один verify."""
+    manager = _manager(0)
+    info = benchmark(lambda: asyncio.run(manager.validate_key(store[2])))
+    assert info is not None
+
+
+@pytest.mark.benchmark(group="api_key_validate_100_clients")
+def test_cached_validate(benchmark: Any, store: tuple[_Client, str, str]) -> None:
+    """Повторная проверка из кэша (без Redis и Argon2)."""
+    manager = _manager(30.0)
+    asyncio.run(manager.validate_key(store[2]))
+    info = benchmark(lambda: asyncio.run(manager.validate_key(store[2])))
+    assert info is not None
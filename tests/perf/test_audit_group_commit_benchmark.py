@@ -0,0 +1,74 @@
+"""Бенчмарк group commit'а ``ImmutableAuditStore.append``.
+
+Postgres заменён fake-сессией с ~0.5ms на транзакцию (advisory lock +
+commit/fsync — то, что сериализует writer'ов). 500 конкурентных
+``append``:
+
+* **per_event** — ``max_batch=1``: транзакция на событие (прежнее поведение);
+* **group_commit** — ``max_batch=256``: lock и multi-row INSERT на batch.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_audit_group_commit_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.backend.infrastructure.observability.immutable_audit import ImmutableAuditStore
+
+_EVENTS = 500
+_TX_LATENCY = 0.0005
+
+
+class _Result:
+    def first(self) -> None:
+        return None
+
+
+class _Session:
+    async def __aenter__(self) -> _Session:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def execute(self, stmt: Any, params: Any = None) -> _Result:
+        return _Result()
+
+    async def commit(self) -> None:
+        await asyncio.sleep(_TX_LATENCY)
+
+
+async def _burst(max_batch: int) -> None:
+    store = ImmutableAuditStore(_Session, secret_key=b"bench", max_batch=max_batch)
+    await asyncio.gather(
+        *(
+            store.append(
+                actor="svc-orders",
+                action="orders.update",
+                resource=f"order:{index}",
+                outcome="success",
+                metadata={"n": index},
+            )
+            for index in range(_EVENTS)
+        )
+    )
+
+
+@pytest.mark.benchmark(group="audit_append_500_events")
+def test_append_per_event(benchmark: Any) -> None:
+    """Транзакция на каждое событие."""
+    benchmark(lambda: asyncio.run(_burst(1)))
+
+
+@pytest.mark.benchmark(group="audit_append_500_events")
+def test_append_group_commit(benchmark: Any) -> None:
+    """Один lock + multi-row INSERT на batch."""
+    benchmark(lambda: asyncio.run(_burst(256)))
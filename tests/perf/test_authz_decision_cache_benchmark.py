@@ -0,0 +1,94 @@
+"""Бенчмарк ``AuthorizationGateway.authorize`` с кэшем решений и без.
+
+OPA-stand-in отвечает за ~1ms (сетевой round-trip к policy-серверу),
+Casbin — синхронный fake. Замер — 200 решений по 10 повторяющимся
+``(principal, resource, action, tenant_id)``, как в реальном API-миксе:
+
+* **uncached** — вся policy-цепочка на каждый запрос;
+* **cached** — ``DecisionCache``: один проход цепочки на ключ.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_authz_decision_cache_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.backend.core.config.features import feature_flags
+from src.backend.core.security.authorization_gateway import (
+    AuthorizationGateway,
+    DecisionCache,
+)
+
+_DECISIONS = 200
+_TENANTS = 10
+
+
+class _Capabilities:
+    def check(self, principal: str, resource: str, scope: Any) -> None:
+        return None
+
+
+class _Casbin:
+    def enforce(
+        self, user_id: str, resource: str, action: str, tenant_id: str | None = None
+    ) -> bool:
+        return True
+
+
+class _Decision:
+    allow = True
+    reasons: list[str] = []
+
+
+class _Opa:
+    async def query(self, policy: str, input_doc: dict[str, Any]) -> _Decision:
+        await asyncio.sleep(0.001)
+        return _Decision()
+
+
+@pytest.fixture(autouse=True)
+def _flags(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(feature_flags, "authz_gateway_enabled", True)
+    monkeypatch.setattr(feature_flags, "opa_runtime_query_enabled", True)
+
+
+def _gateway(cache: DecisionCache | None) -> AuthorizationGateway:
+    return AuthorizationGateway(
+        capability_gateway=_Capabilities(),
+        policies=(
+            AuthorizationGateway.opa_step(_Opa(), "authz/default"),
+            AuthorizationGateway.casbin_step(_Casbin()),
+        ),
+        decision_cache=cache,
+    )
+
+
+async def _burst(gateway: AuthorizationGateway) -> None:
+    for index in range(_DECISIONS):
+        decision = await gateway.authorize(
+            principal="svc-orders",
+            resource="orders",
+            action="read",
+            context={"tenant_id": f"t{index % _TENANTS}"},
+        )
+        assert decision.allowed
+
+
+@pytest.mark.benchmark(group="authz_200_decisions")
+def test_authorize_uncached(benchmark: Any) -> None:
+    """Policy-цепочка (OPA + Casbin) на каждое решение."""
+    benchmark(lambda: asyncio.run(_burst(_gateway(None))))
+
+
+@pytest.mark.benchmark(group="authz_200_decisions")
+def test_authorize_cached(benchmark: Any) -> None:
+    """Кэш решений: OPA опрашивается один раз на tenant."""
+    benchmark(lambda: asyncio.run(_burst(_gateway(DecisionCache()))))
@@ -0,0 +1,59 @@
+"""Бенчмарк checkpoint'а LSN в ``CdcPostgresLogicalSource``.
+
+``cdc_cursors`` заменён fake-store с ~0.5ms на upsert (round-trip +
+commit), подтверждение слота — no-op. 2 000 событий потока:
+
+* **per_event** — ``batch_size=1``: запись cursor'а на каждое событие
+  (прежнее поведение);
+* **batched** — ``batch_size=500``: один checkpoint на batch.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_cdc_checkpoint_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.backend.infrastructure.sources.cdc_postgres_logical import LsnCheckpointer
+
+_EVENTS = 2_000
+_WRITE_LATENCY = 0.0005
+
+
+class _Store:
+    async def set_last_lsn(self, slot_name: str, lsn: str) -> None:
+        await asyncio.sleep(_WRITE_LATENCY)
+
+
+async def _confirm(lsn: Any) -> None:
+    return None
+
+
+async def _stream(batch_size: int) -> None:
+    checkpointer = LsnCheckpointer(
+        "bench", store=_Store(), batch_size=batch_size, flush_interval=60
+    )
+    checkpointer.bind(_confirm)
+    for lsn in range(1, _EVENTS + 1):
+        await checkpointer.ack(lsn)
+    await checkpointer.flush()
+    assert checkpointer.confirmed_lsn == _EVENTS
+
+
+@pytest.mark.benchmark(group="cdc_checkpoint_2000_events")
+def test_checkpoint_per_event(benchmark: Any) -> None:
+    """Запись cursor'а на каждое событие."""
+    benchmark(lambda: asyncio.run(_stream(1)))
+
+
+@pytest.mark.benchmark(group="cdc_checkpoint_2000_events")
+def test_checkpoint_batched(benchmark: Any) -> None:
+    """Один checkpoint на 500 событий."""
+    benchmark(lambda: asyncio.run(_stream(500)))
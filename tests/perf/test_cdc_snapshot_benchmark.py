@@ -0,0 +1,76 @@
+"""Бенчмарк initial snapshot'а ``CdcPostgresLogicalSource`` (mode=full).
+
+Таблица 100 000 строк, asyncpg-stand-in отдаёт keyset-страницу
+1 000 строк за ~5ms (сеть + чтение heap). Сравнение:
+
+* **single_connection** — ``workers=1``: один проход по всему PK;
+* **parallel_ranges** — ``workers=4``: диапазоны PK в 4 соединениях
+  одного экспортированного snapshot'а.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_cdc_snapshot_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.backend.infrastructure.sources.cdc_postgres_snapshot import PgTableSnapshot
+
+_ROWS = 100_000
+_PAGE = 1_000
+_PAGE_LATENCY = 0.005
+_TABLE = [{"id": i, "amount": i * 10} for i in range(1, _ROWS + 1)]
+
+
+class _Conn:
+    async def execute(self, sql: str) -> None:
+        return None
+
+    async def fetchrow(self, sql: str) -> dict[str, int]:
+        return {"lo": 1, "hi": _ROWS}
+
+    async def fetch(self, sql: str, lo: int, hi: int) -> list[dict[str, int]]:
+        await asyncio.sleep(_PAGE_LATENCY)
+        start = lo if ">=" in sql.split("AND")[0] else lo + 1
+        stop = min(start + _PAGE - 1, hi)
+        return _TABLE[start - 1 : stop]
+
+    async def close(self) -> None:
+        return None
+
+
+async def _connect() -> _Conn:
+    return _Conn()
+
+
+async def _snapshot(workers: int) -> None:
+    reader = PgTableSnapshot(
+        "orders", connect=_connect, key_column="id", workers=workers, chunk_rows=_PAGE
+    )
+    seen = 0
+
+    async def emit(rows: list[dict[str, Any]]) -> None:
+        nonlocal seen
+        seen += len(rows)
+
+    await reader.run("00000003-00000002-1", emit)
+    assert seen == _ROWS
+
+
+@pytest.mark.benchmark(group="cdc_snapshot_100k_rows")
+def test_snapshot_single_connection(benchmark: Any) -> None:
+    """Один worker — последовательный keyset-проход."""
+    benchmark(lambda: asyncio.run(_snapshot(1)))
+
+
+@pytest.mark.benchmark(group="cdc_snapshot_100k_rows")
+def test_snapshot_parallel_ranges(benchmark: Any) -> None:
+    """Четыре соединения, диапазоны PK из общей очереди."""
+    benchmark(lambda: asyncio.run(_snapshot(4)))
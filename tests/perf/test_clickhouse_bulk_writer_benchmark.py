@@ -0,0 +1,136 @@
+"""Бенчмарк ClickHouse ingest: JSONEachRow против JSONColumns + zstd.
+
+Audit-подобные строки (8 полей: uuid, время, строки, числа, dict).
+HTTP подменён fake-транспортом: общий канал 1 Гбит/с (передача тела
+сериализована) + 2 мс на обработку INSERT сервером; кодирование и
+сжатие — настоящие:
+
+* **encode** — 10 000 строк одним ``insert`` (несжатый JSONEachRow)
+  против ``insert_columnar`` (JSONColumns + zstd): по CPU паритет, тело
+  ~2.4 МБ против ~0.22 МБ;
+* **writer** — 100 000 строк через :class:`ClickHouseBulkWriter`
+  (batch 5 000): один INSERT в полёте + JSONEachRow против
+  ``max_inflight=4`` + колоночного INSERT.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_clickhouse_bulk_writer_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.backend.infrastructure.clients.storage.clickhouse import ClickHouseClient
+from src.backend.infrastructure.clients.storage.clickhouse_bulk_writer import (
+    ClickHouseBulkWriter,
+)
+
+_ROWS = [
+    {
+        "event_id": str(uuid4()),
+        "ts": datetime(2026, 10, 18, 12, index % 60, tzinfo=UTC),
+        "event_type": ("login", "logout", "invoke")[index % 3],
+        "principal": f"user-{index % 500}",
+        "action": f"orders.action{index % 40}",
+        "duration_ms": index % 1000 / 3,
+        "status": 200 if index % 17 else 500,
+        "attributes": {"ip": f"10.0.{index % 255}.1", "tenant": index % 12},
+    }
+    for index in range(100_000)
+]
+
+
+_BANDWIDTH = 125_000_000  # байт/с (1 Гбит/с)
+_SERVER_TIME = 0.002
+
+
+class _FakeHttp:
+    def __init__(self, network: bool) -> None:
+        self._network = network
+        self._link = asyncio.Lock()
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        if self._network:
+            async with self._link:
+                await asyncio.sleep(len(kwargs["content"]) / _BANDWIDTH)
+            await asyncio.sleep(_SERVER_TIME)
+        return MagicMock(status_code=200)
+
+
+def _client(network: bool = False) -> ClickHouseClient:
+    client = ClickHouseClient(max_batch_size=10_000, insert_compression="zstd")
+    patcher = patch.object(client, "_ensure_client", return_value=_FakeHttp(network))
+    patcher.start()
+    return client
+
+
+class _RowClient:
+    """Клиент без ``insert_columnar`` — writer уходит в JSONEachRow."""
+
+    def __init__(self, client: ClickHouseClient) -> None:
+        self.insert = client.insert
+
+
+async def _write(client: Any, max_inflight: int) -> None:
+    writer = ClickHouseBulkWriter(
+        client=client,
+        table="audit_events",
+        max_buffer_size=5_000,
+        flush_interval_seconds=10.0,
+        queue_max_size=50_000,
+        max_inflight=max_inflight,
+    )
+    await writer.start()
+    await writer.add_many(_ROWS)
+    await writer.aclose()
+    assert writer.stats.rows_flushed == len(_ROWS)
+
+
+@pytest.mark.benchmark(group="clickhouse_encode_10000")
+def test_encode_json_each_row(benchmark: Any) -> None:
+    """Прежний путь: dumps + decode на каждую строку, тело без сжатия."""
+    client = _client()
+    benchmark.pedantic(
+        lambda: asyncio.run(client.insert("audit_events", _ROWS[:10_000])),
+        rounds=5,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="clickhouse_encode_10000")
+def test_encode_json_columns_zstd(benchmark: Any) -> None:
+    """Колоночное тело: один dumps на batch + zstd."""
+    client = _client()
+    benchmark.pedantic(
+        lambda: asyncio.run(client.insert_columnar("audit_events", _ROWS[:10_000])),
+        rounds=5,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="clickhouse_writer_100k")
+def test_writer_serial_rows(benchmark: Any) -> None:
+    """Один INSERT в полёте, JSONEachRow."""
+    benchmark.pedantic(
+        lambda: asyncio.run(_write(_RowClient(_client(network=True)), max_inflight=1)),
+        rounds=3,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="clickhouse_writer_100k")
+def test_writer_parallel_columnar(benchmark: Any) -> None:
+    """До четырёх INSERT'ов в полёте, JSONColumns + zstd."""
+    benchmark.pedantic(
+        lambda: asyncio.run(_write(_client(network=True), max_inflight=4)),
+        rounds=3,
+        iterations=1,
+    )
@@ -0,0 +1,114 @@
+"""Бенчмарк dispatch: JSON → dict → pydantic против скомпилированного thunk'а.
+
+5 000 вызовов высокочастотного action (payload ~10 полей: id, enum,
+даты, список тегов, вложенный dict) из сырых JSON-байтов — как их
+держат HTTP/Redis Streams/gRPC:
+
+* **dict_dispatch** — прежний путь: ``orjson.loads`` + ``dispatch``
+  (``ActionCommandSchema`` + ``model_validate`` + kwargs);
+* **dispatch_raw** — ``dispatch_raw``: msgspec-декодер, собранный по
+  модели, валидирует байты за один проход.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_compiled_dispatch_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+import orjson
+import pytest
+from pydantic import BaseModel, Field
+
+from src.backend.dsl.commands.action_registry import ActionHandlerRegistry
+from src.backend.schemas.invocation import ActionCommandSchema
+
+_CALLS = 5_000
+
+
+class _Channel(Enum):
+    WEB = "web"
+    MOBILE = "mobile"
+
+
+class _PaymentPayload(BaseModel):
+    payment_id: int = Field(ge=1)
+    account: str = Field(min_length=1, max_length=34)
+    amount: float = Field(gt=0)
+    currency: str = "RUB"
+    channel: _Channel = _Channel.WEB
+    created_at: datetime
+    tags: list[str] = Field(default_factory=list)
+    attributes: dict[str, Any] = Field(default_factory=dict)
+    comment: str | None = None
+    priority: int = 0
+
+
+class _PaymentService:
+    async def accept(self, **kwargs: Any) -> int:
+        return kwargs["payment_id"]
+
+
+_SERVICE = _PaymentService()
+_BODIES = [
+    orjson.dumps(
+        {
+            "payment_id": index + 1,
+            "account": f"40817810{index:012d}",
+            "amount": 100.5 + index,
+            "channel": "mobile" if index % 2 else "web",
+            "created_at": "2026-10-18T12:00:00+03:00",
+            "tags": ["sbp", "retail"],
+            "attributes": {"terminal": index % 17, "mcc": "5411"},
+            "priority": index % 3,
+        }
+    )
+    for index in range(_CALLS)
+]
+
+
+@pytest.fixture
+def registry() -> ActionHandlerRegistry:
+    registry = ActionHandlerRegistry()
+    registry.register(
+        action="payments.accept",
+        service_getter=lambda: _SERVICE,
+        service_method="accept",
+        payload_model=_PaymentPayload,
+    )
+    return registry
+
+
+async def _dict_dispatch(registry: ActionHandlerRegistry) -> None:
+    for body in _BODIES:
+        command = ActionCommandSchema(
+            action="payments.accept", payload=orjson.loads(body)
+        )
+        await registry.dispatch(command)
+
+
+async def _raw_dispatch(registry: ActionHandlerRegistry) -> None:
+    for body in _BODIES:
+        await registry.dispatch_raw("payments.accept", body)
+
+
+@pytest.mark.benchmark(group="action_dispatch_5000")
+def test_dict_dispatch(benchmark: Any, registry: ActionHandlerRegistry) -> None:
+    """Прежний путь: декодирование в dict, затем pydantic."""
+    benchmark.pedantic(
+        lambda: asyncio.run(_dict_dispatch(registry)), rounds=5, iterations=1
+    )
+
+
+@pytest.mark.benchmark(group="action_dispatch_5000")
+def test_dispatch_raw(benchmark: Any, registry: ActionHandlerRegistry) -> None:
+    """Скомпилированный thunk: msgspec из байтов за один проход."""
+    benchmark.pedantic(
+        lambda: asyncio.run(_raw_dispatch(registry)), rounds=5, iterations=1
+    )
@@ -0,0 +1,59 @@
+"""Бенчмарк IPC-накладных ``run_cpu_bound``: pickle vs shared memory.
+
+Функция в worker'е — ``len`` (O(1)), поэтому замер — чистая передача 50 MB
+входа (и 50 MB результата) между event loop и process pool:
+
+* **pickle** — ``share_memory=False``: буфер сериализуется в pipe и
+  копируется при unpickle;
+* **shm** — ``share_memory=True``: одна копия в сегмент, worker читает
+  zero-copy view.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_cpu_bound_shm_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import operator
+from typing import Any
+
+import pytest
+
+from src.backend.core.utils.cpu_bound import run_cpu_bound
+
+PAYLOAD = b"\x5a" * (50 * 1024 * 1024)
+
+
+def _run(fn: Any, *args: Any, share_memory: bool) -> Any:
+    return asyncio.run(
+        run_cpu_bound(fn, *args, use_process_pool=True, share_memory=share_memory)
+    )
+
+
+@pytest.mark.benchmark(group="cpu_bound_ipc_50mb_in")
+def test_pickle_transfer_50mb(benchmark: Any) -> None:
+    """50 MB аргумент через pickle."""
+    benchmark(_run, len, PAYLOAD, share_memory=False)
+
+
+@pytest.mark.benchmark(group="cpu_bound_ipc_50mb_in")
+def test_shared_memory_transfer_50mb(benchmark: Any) -> None:
+    """50 MB аргумент через shared memory."""
+    assert _run(len, PAYLOAD, share_memory=True) == len(PAYLOAD)
+    benchmark(_run, len, PAYLOAD, share_memory=True)
+
+
+@pytest.mark.benchmark(group="cpu_bound_ipc_50mb_out")
+def test_pickle_result_50mb(benchmark: Any) -> None:
+    """50 MB результат через pickle."""
+    benchmark(_run, operator.mul, b"\x5a", len(PAYLOAD), share_memory=False)
+
+
+@pytest.mark.benchmark(group="cpu_bound_ipc_50mb_out")
+def test_shared_memory_result_50mb(benchmark: Any) -> None:
+    """50 MB результат через shared memory."""
+    benchmark(_run, operator.mul, b"\x5a", len(PAYLOAD), share_memory=True)
@@ -0,0 +1,99 @@
+"""Бенчмарк очереди отложенных задач: APScheduler vs sorted set.
+
+20 000 retry-задач со случайным ``run_at`` в пределах часа ставятся в
+очередь, затем все due-задачи выбираются batch'ами по 500:
+
+* **apscheduler** — ``MemoryJobStore`` приостановленного
+  ``BackgroundScheduler``: ``add_job`` (вставка в отсортированный список,
+  O(n)) + ``get_due_jobs`` / ``remove_job``;
+* **sorted_set** — ``MemoryDelayedJobStore`` (heap, O(log n)):
+  ``schedule`` + ``claim_due`` / ``ack``. Redis-store выполняет те же
+  операции на ZSET.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_delayed_jobs_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from src.backend.infrastructure.scheduler.delayed_jobs import (
+    DelayedJob,
+    MemoryDelayedJobStore,
+)
+
+_JOBS = 20_000
+_BATCH = 500
+_NOW = 1_700_000_000.0
+_OFFSETS = [random.Random(40).uniform(0, 3600) for _ in range(_JOBS)]
+
+
+def _noop(index: int) -> None:
+    return None
+
+
+def _apscheduler() -> None:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    scheduler = BackgroundScheduler(timezone=UTC)
+    scheduler.start(paused=True)
+    try:
+        base = datetime.fromtimestamp(_NOW, UTC)
+        for index, offset in enumerate(_OFFSETS):
+            scheduler.add_job(
+                _noop,
+                trigger="date",
+                run_date=base + timedelta(seconds=offset),
+                args=(index,),
+                id=f"retry-{index}",
+            )
+        store = scheduler._lookup_jobstore("default")
+        done = 0
+        due_at = base + timedelta(hours=2)
+        while due := store.get_due_jobs(due_at)[:_BATCH]:
+            for job in due:
+                store.remove_job(job.id)
+            done += len(due)
+        assert done == _JOBS
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+async def _sorted_set() -> None:
+    store = MemoryDelayedJobStore()
+    for index, offset in enumerate(_OFFSETS):
+        await store.schedule(
+            DelayedJob(
+                id=f"retry-{index}",
+                ref="noop",
+                run_at=_NOW + offset,
+                args=[index],
+            )
+        )
+    done = 0
+    while jobs := await store.claim_due(_NOW + 7200, limit=_BATCH, lease_seconds=30):
+        for job in jobs:
+            await store.ack(job)
+        done += len(jobs)
+    assert done == _JOBS
+
+
+@pytest.mark.benchmark(group="delayed_jobs_20k")
+def test_delayed_jobs_apscheduler(benchmark: Any) -> None:
+    """APScheduler MemoryJobStore."""
+    benchmark.pedantic(_apscheduler, rounds=3)
+
+
+@pytest.mark.benchmark(group="delayed_jobs_20k")
+def test_delayed_jobs_sorted_set(benchmark: Any) -> None:
+    """Heap-store с lease-claim batch'ами."""
+    benchmark.pedantic(lambda: asyncio.run(_sorted_set()), rounds=3)
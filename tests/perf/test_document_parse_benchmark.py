@@ -0,0 +1,122 @@
+"""Бенчмарк парсинга PDF: поштучный ``to_thread`` против сервиса с кэшем.
+
+Корпус — 6 различных PDF по 40 страниц (~40 строк текста на странице),
+каждый загружен дважды (дубли upload'ов / re-ingest), всего 12 загрузок:
+
+* **sequential** — прежний путь: ``asyncio.to_thread(_parse_pdf)`` на
+  каждую загрузку, по одной;
+* **service** — ``DocumentParsingService.parse`` (legacy engine) на все
+  загрузки конкурентно: страницы — в process pool, дубли — из кэша /
+  single-flight;
+* **reingest** — повторный проход по корпусу прогретым сервисом.
+
+Выигрыш process pool масштабируется с числом ядер
+(``PROCESS_POOL_SIZE = cpu_count - 1``); на одном ядре остаётся только
+эффект кэша.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_document_parse_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import Any
+
+import pytest
+
+from src.backend.core.config.ai import markitdown_settings
+from src.backend.services.ai.document_parsers import DocumentParsingService
+from src.backend.services.ai.document_parsers._legacy import _parse_pdf
+
+_PAGES = 40
+_LINES = 40
+
+
+def _pdf(seed: int) -> bytes:
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for page_index in range(_PAGES):
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        lines = " ".join(
+            f"BT /F1 9 Tf 36 {760 - line * 18} Td "
+            f"(doc {seed} page {page_index} line {line} contract amount) Tj ET"
+            for line in range(_LINES)
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(lines.encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+_UNIQUE = [_pdf(seed) for seed in range(6)]
+_UPLOADS = _UNIQUE * 2
+
+
+@pytest.fixture
+def legacy_engine() -> Any:
+    original = (
+        markitdown_settings.engine_enabled,
+        markitdown_settings.pdf_parallel_min_pages,
+    )
+    markitdown_settings.engine_enabled = False
+    markitdown_settings.pdf_parallel_min_pages = 16
+    yield
+    (
+        markitdown_settings.engine_enabled,
+        markitdown_settings.pdf_parallel_min_pages,
+    ) = original
+
+
+async def _sequential() -> None:
+    for content in _UPLOADS:
+        await asyncio.to_thread(_parse_pdf, content)
+
+
+async def _service(service: DocumentParsingService) -> None:
+    await asyncio.gather(
+        *(service.parse(content, "application/pdf") for content in _UPLOADS)
+    )
+
+
+@pytest.mark.benchmark(group="document_parse_12_uploads")
+def test_sequential_to_thread(benchmark: Any, legacy_engine: Any) -> None:
+    """Прежний путь: по одному документу, GIL-bound."""
+    benchmark.pedantic(lambda: asyncio.run(_sequential()), rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="document_parse_12_uploads")
+def test_service_cold(benchmark: Any, legacy_engine: Any) -> None:
+    """Сервис с пустым кэшем: process pool + дедупликация дублей."""
+    benchmark.pedantic(
+        lambda: asyncio.run(_service(DocumentParsingService())),
+        rounds=3,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="document_parse_12_uploads")
+def test_service_reingest(benchmark: Any, legacy_engine: Any) -> None:
+    """Re-ingest того же корпуса: парсинг пропущен целиком."""
+    service = DocumentParsingService()
+    asyncio.run(_service(service))
+    benchmark.pedantic(lambda: asyncio.run(_service(service)), rounds=3, iterations=1)
@@ -0,0 +1,111 @@
+"""Бенчмарк холодной загрузки каталога DSL-маршрутов.
+
+Каталог из 300 маршрутов (каждый подключает общий фрагмент через
+``include:``) грузится тремя способами:
+
+* ``legacy`` — последовательный ``load_pipeline_from_file`` по файлам;
+* ``cold`` — :class:`CompiledRouteCache` с пустым каталогом кэша
+  (параллельный парсинг + запись записей);
+* ``warm`` — повторный старт с заполненным кэшем (YAML не парсится,
+  include/миграции не выполняются).
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_dsl_route_cache_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.backend.dsl.yaml_loader import CompiledRouteCache, load_pipeline_from_file
+
+_ROUTES = 300
+
+_FRAGMENT = """
+route_id: shared.audit
+steps:
+  - audit: {action: shared.start}
+  - audit: {action: shared.proxy}
+"""
+
+
+def _route(index: int) -> str:
+    return f"""
+route_id: bench.route.{index}
+description: Benchmark route {index}
+include:
+  - ./fragments/shared.yaml
+steps:
+  - audit: {{action: bench.{index}.received}}
+  - audit: {{action: bench.{index}.validated}}
+  - audit: {{action: bench.{index}.done}}
+"""
+
+
+@pytest.fixture(scope="module")
+def routes_dir(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    root = tmp_path_factory.mktemp("dsl_routes")
+    (root / "fragments").mkdir()
+    (root / "fragments" / "shared.yaml").write_text(_FRAGMENT, encoding="utf-8")
+    files = []
+    for index in range(_ROUTES):
+        path = root / f"route_{index:04d}.yaml"
+        path.write_text(_route(index), encoding="utf-8")
+        files.append(path)
+    return files
+
+
+@pytest.fixture(autouse=True)
+def _composition_enabled() -> Iterator[None]:
+    with patch(
+        "src.backend.dsl.yaml_loader._is_route_composition_include_enabled",
+        return_value=True,
+    ):
+        yield
+
+
+@pytest.mark.benchmark(group="dsl_route_startup")
+def test_legacy_sequential_load(benchmark: Any, routes_dir: list[Path]) -> None:
+    """Последовательный load_pipeline_from_file."""
+    benchmark(lambda: [load_pipeline_from_file(path) for path in routes_dir])
+
+
+@pytest.mark.benchmark(group="dsl_route_startup")
+def test_cold_cache_load(
+    benchmark: Any, routes_dir: list[Path], tmp_path: Path
+) -> None:
+    """Пустой кэш: параллельный парсинг + запись записей."""
+    cache_dir = tmp_path / "cache"
+
+    def _setup() -> tuple[tuple[CompiledRouteCache], dict[str, Any]]:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return (CompiledRouteCache(cache_dir),), {}
+
+    benchmark.pedantic(
+        lambda cache: cache.load_pipelines(routes_dir), setup=_setup, rounds=5
+    )
+
+
+@pytest.mark.benchmark(group="dsl_route_startup")
+def test_warm_cache_load(
+    benchmark: Any, routes_dir: list[Path], tmp_path: Path
+) -> None:
+    """Заполненный кэш: только чтение msgpack + сборка Pipeline."""
+    cache_dir = tmp_path / "cache"
+    CompiledRouteCache(cache_dir).load_pipelines(routes_dir)
+
+    def _load() -> None:
+        cache = CompiledRouteCache(cache_dir)
+        outcomes = cache.load_pipelines(routes_dir)
+        assert cache.stats()["hits"] == len(outcomes)
+
+    benchmark(_load)
@@ -0,0 +1,83 @@
+"""Бенчмарк micro-batching эмбеддингов (embeddings/sec под конкурентной нагрузкой).
+
+Модель — stand-in с профилем sentence-transformers на CPU: фиксированная
+стоимость вызова (~3ms: токенизатор, dispatch forward pass) плюс
+матричное умножение на текст (384-dim). 256 конкурентных запросов по
+одной уникальной строке (RAG-запросы + semantic-кэш):
+
+* **per_call** — прежний путь: ``asyncio.to_thread(model.encode)`` на
+  каждый вызов и ``tolist()`` на каждый вектор;
+* **micro_batched** — :class:`MicroBatchingEmbedder`: batch'и до 64
+  текстов на выделенном executor'е, float32 ``ndarray``.
+
+Пропускная способность пишется в ``extra_info["embeddings_per_s"]``.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_embedding_batcher_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.backend.services.ai.embedding_batcher import MicroBatchingEmbedder
+
+_REQUESTS = 256
+_DIM = 384
+_WEIGHTS = np.random.default_rng(36).standard_normal((_DIM, _DIM)).astype(np.float32)
+
+
+def _encode(texts: list[str]) -> np.ndarray:
+    time.sleep(0.003)
+    features = np.full((len(texts), _DIM), 0.5, dtype=np.float32)
+    features[:, 0] = [len(text) for text in texts]
+    return np.tanh(features @ _WEIGHTS)
+
+
+async def _per_call(text: str) -> list[list[float]]:
+    def _run() -> list[list[float]]:
+        return [vector.tolist() for vector in _encode([text])]
+
+    return await asyncio.to_thread(_run)
+
+
+async def _burst_per_call() -> None:
+    await asyncio.gather(*(_per_call(f"query {i}") for i in range(_REQUESTS)))
+
+
+async def _burst_batched() -> None:
+    embedder = MicroBatchingEmbedder(_encode, cache_size=0)
+    await asyncio.gather(
+        *(embedder.embed_array([f"query {i}"]) for i in range(_REQUESTS))
+    )
+    await embedder.aclose()
+
+
+def _report(benchmark: Any) -> None:
+    stats = getattr(benchmark, "stats", None)
+    if stats is not None:
+        benchmark.extra_info["embeddings_per_s"] = round(
+            _REQUESTS / stats.stats.mean
+        )
+
+
+@pytest.mark.benchmark(group="embedding_256_concurrent_queries")
+def test_embed_per_call(benchmark: Any) -> None:
+    """Поток + вызов модели на каждый запрос."""
+    benchmark(lambda: asyncio.run(_burst_per_call()))
+    _report(benchmark)
+
+
+@pytest.mark.benchmark(group="embedding_256_concurrent_queries")
+def test_embed_micro_batched(benchmark: Any) -> None:
+    """Конкурентные запросы склеены в batch'и модели."""
+    benchmark(lambda: asyncio.run(_burst_batched()))
+    _report(benchmark)
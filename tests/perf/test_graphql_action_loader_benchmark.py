@@ -0,0 +1,100 @@
+"""Бенчмарк auto-schema GraphQL: dispatch на поле против ActionLoader.
+
+Списочный экран запрашивает одно read-действие 60 раз через алиасы
+(карточки заказов), уникальных payload'ов — 12. ``dispatch_action``
+эмулирует поход в БД: 2 ms на вызов, не больше 4 одновременных
+(пул соединений):
+
+* **per_field** — контекст без loader'а: 60 dispatch'ей;
+* **loader** — request-scoped ``ActionLoader``: 12 dispatch'ей;
+* **batch_handler** — плюс зарегистрированный batch-handler: один
+  вызов на 12 payload'ов.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_graphql_action_loader_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.backend.core.interfaces.action_dispatcher import ActionMetadata
+from src.backend.entrypoints.graphql import action_loader
+from src.backend.entrypoints.graphql.action_loader import (
+    ActionLoader,
+    register_batch_handler,
+)
+from src.backend.entrypoints.graphql.auto_schema import build_auto_strawberry_schema
+
+_FIELDS = 60
+_UNIQUE = 12
+_LATENCY = 0.002
+
+_QUERY = "query {%s}" % " ".join(
+    f"f{i}: ordersGet(payload: {{id: {i % _UNIQUE}}})" for i in range(_FIELDS)
+)
+_SCHEMA = build_auto_strawberry_schema(
+    [ActionMetadata(action="orders.get", side_effect="read", transports=("graphql",))]
+).schema
+
+
+@pytest.fixture
+def fake_db() -> Any:
+    state: dict[str, Any] = {}
+
+    async def dispatch_action(action: str, payload: dict, source: str) -> Any:
+        if "pool" not in state:
+            state["pool"] = asyncio.Semaphore(4)
+        async with state["pool"]:
+            await asyncio.sleep(_LATENCY)
+        return {"id": payload["id"]}
+
+    async def batch(payloads: list[dict]) -> list[Any]:
+        await asyncio.sleep(_LATENCY)
+        return [{"id": payload["id"]} for payload in payloads]
+
+    module = SimpleNamespace(dispatch_action=dispatch_action)
+    with patch.dict(sys.modules, {"src.backend.entrypoints.base": module}):
+        yield state, batch
+    action_loader._batch_handlers.clear()
+
+
+def _run(context: Any, state: dict[str, Any]) -> None:
+    async def _execute() -> None:
+        state.pop("pool", None)
+        result = await _SCHEMA.execute(_QUERY, context_value=context())
+        assert result.errors is None
+
+    asyncio.run(_execute())
+
+
+@pytest.mark.benchmark(group="graphql_aliased_reads")
+def test_per_field_dispatch(benchmark: Any, fake_db: Any) -> None:
+    """Прежний путь: каждое поле — свой dispatch."""
+    state, _ = fake_db
+    benchmark.pedantic(lambda: _run(dict, state), rounds=5, iterations=1)
+
+
+@pytest.mark.benchmark(group="graphql_aliased_reads")
+def test_action_loader(benchmark: Any, fake_db: Any) -> None:
+    """ActionLoader: дубли склеены, уникальные payload'ы — конкурентно."""
+    state, _ = fake_db
+    context = lambda: {"action_loader": ActionLoader()}  # noqa: E731
+    benchmark.pedantic(lambda: _run(context, state), rounds=5, iterations=1)
+
+
+@pytest.mark.benchmark(group="graphql_aliased_reads")
+def test_action_loader_batch_handler(benchmark: Any, fake_db: Any) -> None:
+    """ActionLoader + batch-handler: один вызов на весь запрос."""
+    state, batch = fake_db
+    register_batch_handler("orders.get", batch)
+    context = lambda: {"action_loader": ActionLoader()}  # noqa: E731
+    benchmark.pedantic(lambda: _run(context, state), rounds=5, iterations=1)
@@ -0,0 +1,177 @@
+"""Бенчмарк marker-JSON кодека: рекурсивный ``to_jsonable`` vs single-pass.
+
+Сравнивает на типичных payload'ах проекта:
+
+* **order** — заказ с UUID/datetime/Decimal/Enum, вложенными pydantic-строками
+  и dataclass-адресом (×50 в пачке, как при кэшировании списка);
+* **user** — профиль пользователя (pydantic) ×100.
+
+Группы:
+
+* ``json_encode_*`` — legacy ``orjson.dumps(to_jsonable(x))`` vs
+  :func:`json_dumps` (один проход C-энкодера с ``default``-хуком);
+* ``json_decode_*`` — legacy ``from_jsonable(orjson.loads(x))`` vs
+  :func:`json_loads` (``object_hook``) vs ``json_loads(schema=T)``.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_json_codec_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID, uuid4
+
+import msgspec
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from src.backend.core.codec.json import (
+    from_jsonable,
+    json_dumps,
+    json_loads,
+    plain_dumps,
+    to_jsonable,
+)
+
+
+class OrderStatus(Enum):
+    NEW = "new"
+    PAID = "paid"
+
+
+class OrderLine(BaseModel):
+    sku: str
+    quantity: int
+    price: Decimal
+
+
+class User(BaseModel):
+    id: UUID
+    name: str
+    email: str
+    created_at: datetime
+    roles: list[str]
+    is_active: bool
+
+
+@dataclass
+class Address:
+    city: str
+    street: str
+    zip: str
+
+
+class OrderStruct(msgspec.Struct):
+    id: UUID
+    status: str
+    created_at: datetime
+    due: date
+    total: Decimal
+    customer: dict[str, Any]
+    lines: list[dict[str, Any]]
+
+
+def _order(index: int) -> dict[str, Any]:
+    return {
+        "id": uuid4(),
+        "status": OrderStatus.NEW if index % 2 else OrderStatus.PAID,
+        "created_at": datetime(2026, 5, 1, 12, index % 60, tzinfo=UTC),
+        "due": date(2026, 6, 1),
+        "total": Decimal("1499.90"),
+        "customer": Address(city="Москва", street="Тверская 1", zip="125009"),
+        "lines": [
+            OrderLine(sku=f"SKU-{index}-{n}", quantity=n + 1, price=Decimal("149.99"))
+            for n in range(10)
+        ],
+    }
+
+
+ORDERS = [_order(i) for i in range(50)]
+USERS = [
+    User(
+        id=uuid4(),
+        name="Иван Петров",
+        email="ivan@example.com",
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        roles=["operator", "auditor"],
+        is_active=True,
+    )
+    for _ in range(100)
+]
+ORDERS_JSON = json_dumps(ORDERS)
+ORDERS_PLAIN_JSON = plain_dumps(ORDERS)
+USERS_JSON = json_dumps(USERS)
+USERS_PLAIN_JSON = plain_dumps(USERS)
+
+
+def _legacy_dumps(value: Any) -> bytes:
+    return orjson.dumps(to_jsonable(value))
+
+
+def _legacy_loads(payload: bytes) -> Any:
+    return from_jsonable(orjson.loads(payload))
+
+
+@pytest.mark.benchmark(group="json_encode_orders")
+def test_legacy_encode_orders(benchmark: Any) -> None:
+    """Рекурсивный to_jsonable + orjson."""
+    benchmark(_legacy_dumps, ORDERS)
+
+
+@pytest.mark.benchmark(group="json_encode_orders")
+def test_single_pass_encode_orders(benchmark: Any) -> None:
+    """json_dumps — один нативный проход."""
+    assert json_dumps(ORDERS) == _legacy_dumps(ORDERS)
+    benchmark(json_dumps, ORDERS)
+
+
+@pytest.mark.benchmark(group="json_encode_users")
+def test_legacy_encode_users(benchmark: Any) -> None:
+    """Рекурсивный to_jsonable + orjson."""
+    benchmark(_legacy_dumps, USERS)
+
+
+@pytest.mark.benchmark(group="json_encode_users")
+def test_single_pass_encode_users(benchmark: Any) -> None:
+    """json_dumps — один нативный проход."""
+    benchmark(json_dumps, USERS)
+
+
+@pytest.mark.benchmark(group="json_decode_orders")
+def test_legacy_decode_orders(benchmark: Any) -> None:
+    """orjson.loads + рекурсивный from_jsonable."""
+    benchmark(_legacy_loads, ORDERS_JSON)
+
+
+@pytest.mark.benchmark(group="json_decode_orders")
+def test_single_pass_decode_orders(benchmark: Any) -> None:
+    """json_loads — object_hook C-парсера."""
+    assert json_loads(ORDERS_JSON) == _legacy_loads(ORDERS_JSON)
+    benchmark(json_loads, ORDERS_JSON)
+
+
+@pytest.mark.benchmark(group="json_decode_orders")
+def test_typed_decode_orders(benchmark: Any) -> None:
+    """json_loads(schema=list[OrderStruct]) — msgspec-декодер по схеме."""
+    benchmark(json_loads, ORDERS_PLAIN_JSON, schema=list[OrderStruct])
+
+
+@pytest.mark.benchmark(group="json_decode_users")
+def test_legacy_decode_users(benchmark: Any) -> None:
+    """orjson.loads + рекурсивный from_jsonable."""
+    benchmark(_legacy_loads, USERS_JSON)
+
+
+@pytest.mark.benchmark(group="json_decode_users")
+def test_typed_decode_users(benchmark: Any) -> None:
+    """json_loads(schema=list[User]) — pydantic TypeAdapter по схеме."""
+    benchmark(json_loads, USERS_PLAIN_JSON, schema=list[User])
@@ -0,0 +1,90 @@
+"""Бенчмарк JWT-аутентификации: полная верификация против кеша claims.
+
+2 000 запросов с 20 повторяющимися RS256-токенами (типичный фронт:
+сессия пользователя шлёт один bearer-токен много раз), JWKS — in-memory:
+
+* **full_verify** — ``JwtBackend`` без кеша: RSA-подпись + claims на
+  каждый запрос;
+* **claims_cache** — ``JwtBackend(claims_cache=JwtClaimsCache())``:
+  20 верификаций, остальное — поиск по ``blake2b(token)``.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_jwt_claims_cache_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+from joserfc import jwt as joserfc_jwt
+from joserfc.jwk import RSAKey
+
+from src.backend.core.auth.jwks_cache import JwksCache
+from src.backend.core.auth.jwt_backend import JwtBackend
+from src.backend.core.auth.jwt_claims_cache import JwtClaimsCache
+
+_REQUESTS = 2_000
+_TOKENS = 20
+
+_KEY = RSAKey.generate_key(2048, parameters={"kid": "k1", "use": "sig"})
+_JWKS = {"keys": [_KEY.as_dict()]}
+_ISSUED = [
+    joserfc_jwt.encode(
+        {"alg": "RS256", "kid": "k1"},
+        {
+            "sub": f"user-{index}",
+            "iss": "idp",
+            "aud": "gd",
+            "iat": int(time.time()),
+            "exp": int(time.time()) + 3600,
+            "jti": f"jti-{index}",
+        },
+        _KEY,
+    )
+    for index in range(_TOKENS)
+]
+_STREAM = [_ISSUED[index % _TOKENS] for index in range(_REQUESTS)]
+
+
+class _Fetcher:
+    async def fetch(self, url: str) -> dict[str, Any]:
+        return _JWKS
+
+
+def _backend(cache: JwtClaimsCache | None) -> JwtBackend:
+    return JwtBackend(
+        algorithms=["RS256"],
+        jwks=JwksCache("https://idp/jwks", fetcher=_Fetcher()),
+        issuer="idp",
+        audience="gd",
+        claims_cache=cache,
+    )
+
+
+async def _authenticate(backend: JwtBackend) -> None:
+    for token in _STREAM:
+        await backend.decode(token)
+
+
+@pytest.mark.benchmark(group="jwt_auth_2000")
+def test_full_verify(benchmark: Any) -> None:
+    """Прежний путь: подпись и claims проверяются на каждый запрос."""
+    backend = _backend(None)
+    benchmark.pedantic(
+        lambda: asyncio.run(_authenticate(backend)), rounds=3, iterations=1
+    )
+
+
+@pytest.mark.benchmark(group="jwt_auth_2000")
+def test_claims_cache(benchmark: Any) -> None:
+    """Кеш claims: холодный старт на каждый раунд (20 верификаций)."""
+    benchmark.pedantic(
+        lambda: asyncio.run(_authenticate(_backend(JwtClaimsCache()))),
+        rounds=3,
+        iterations=1,
+    )
@@ -0,0 +1,84 @@
+"""Бенчмарк ``KernelPool``: новый kernel на прогон против прогретого пула.
+
+Kernel эмулируется: старт — 50 мс (реальный ipykernel — 1-3 с: процесс,
+импорт IPython, ZMQ handshake), выполнение короткой параметризованной
+ячейки — 1 мс, ``%reset -f`` — 0.2 мс. 20 последовательных прогонов:
+
+* **cold** — ``max_uses=1``, без тёплого резерва: каждый прогон
+  запускает kernel (прежнее поведение backend'ов);
+* **warm** — пул после ``prewarm``: kernel переиспользуется, между
+  прогонами только reset.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_kernel_pool_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.backend.services.jupyter.execution_service.kernel_pool import KernelPool
+
+_START_S = 0.05
+_CELL_S = 0.001
+_RESET_S = 0.0002
+_RUNS = 20
+
+
+class _SimKM:
+    async def is_alive(self) -> bool:
+        return True
+
+    async def shutdown_kernel(self, now: bool = False) -> None:
+        return None
+
+
+class _SimKC:
+    async def execute_interactive(self, code: str, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(_RESET_S)
+        return {"content": {"status": "ok"}}
+
+    def stop_channels(self) -> None:
+        return None
+
+
+async def _start(kernel_name: str) -> tuple[_SimKM, _SimKC]:
+    await asyncio.sleep(_START_S)
+    return _SimKM(), _SimKC()
+
+
+async def _runs(pool: KernelPool) -> None:
+    for _ in range(_RUNS):
+        async with pool.acquire("python3"):
+            await asyncio.sleep(_CELL_S)
+
+
+def _bench(benchmark: Any, **pool_kwargs: Any) -> None:
+    def _run() -> None:
+        async def _main() -> None:
+            pool = KernelPool(kernel_factory=_start, **pool_kwargs)
+            if pool_kwargs.get("min_idle", 1):
+                await pool.prewarm(["python3"])
+            await _runs(pool)
+            await pool.aclose()
+
+        asyncio.run(_main())
+
+    benchmark.pedantic(_run, rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="jupyter_kernel_pool_20_runs")
+def test_cold_kernel_per_run(benchmark: Any) -> None:
+    """Прежнее поведение: старт kernel'а на каждый прогон."""
+    _bench(benchmark, max_uses=1, min_idle=0)
+
+
+@pytest.mark.benchmark(group="jupyter_kernel_pool_20_runs")
+def test_warm_pool(benchmark: Any) -> None:
+    """Прогретый пул: reuse + ``%reset -f`` между прогонами."""
+    _bench(benchmark, max_uses=50, min_idle=1)
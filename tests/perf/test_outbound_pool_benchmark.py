@@ -0,0 +1,135 @@
+"""Бенчмарк исходящего HTTPS: клиент на вызов vs общий пул соединений.
+
+Локальный HTTPS-stand-in (asyncio + self-signed сертификат на
+``localhost``) отвечает ``200 ok`` с keep-alive. Замер — 20 последовательных
+POST'ов, как делает sink/AI-провайдер:
+
+* **per_call** — ``async with OutboundHttpClient(...)`` на каждый запрос:
+  TCP connect + TLS handshake + загрузка CA на каждый вызов;
+* **pooled** — ``OutboundHttpClient(pooled=True)``: соединение и
+  ``SSLContext`` переиспользуются.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_outbound_pool_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import ipaddress
+import ssl
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from src.backend.core.net import OutboundHttpClient, shutdown_outbound_client_pool
+
+_REQUESTS = 20
+
+
+def _self_signed(directory: Path) -> tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [
+                    x509.DNSName("localhost"),
+                    x509.IPAddress(ipaddress.ip_address("127.0.0.1")),
+                ]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    await reader.readexactly(int(line.split(b":", 1)[1]))
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError, ssl.SSLError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture(scope="module")
+def https_stand_in(tmp_path_factory: pytest.TempPathFactory) -> Iterator[tuple[str, str]]:
+    cert_path, key_path = _self_signed(tmp_path_factory.mktemp("tls"))
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        asyncio.start_server(_handle, "127.0.0.1", 0, ssl=context)
+    )
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield f"https://localhost:{port}/ingest", str(cert_path)
+    loop.call_soon_threadsafe(server.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+
+
+async def _burst(url: str, ca: str, *, pooled: bool) -> None:
+    for _ in range(_REQUESTS):
+        async with OutboundHttpClient(verify=ca, pooled=pooled) as client:
+            response = await client.post(url, content=b'{"event":"ping"}')
+            assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="outbound_https_20_requests")
+def test_client_per_call(benchmark: Any, https_stand_in: tuple[str, str]) -> None:
+    """Новый клиент (connect + TLS handshake) на каждый запрос."""
+    url, ca = https_stand_in
+    benchmark(lambda: asyncio.run(_burst(url, ca, pooled=False)))
+
+
+@pytest.mark.benchmark(group="outbound_https_20_requests")
+def test_pooled_client(benchmark: Any, https_stand_in: tuple[str, str]) -> None:
+    """Общий пул: одно keep-alive соединение на серию (пул — на loop)."""
+    url, ca = https_stand_in
+
+    async def _run() -> None:
+        await _burst(url, ca, pooled=True)
+        await shutdown_outbound_client_pool()
+
+    benchmark(lambda: asyncio.run(_run()))
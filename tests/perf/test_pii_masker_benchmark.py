@@ -0,0 +1,111 @@
+"""Бенчмарк пропускной способности ``PIIMasker`` (MB/s).
+
+Корпус — ~1.6 MB (UTF-8) текста документа (строки ~80 символов, PII примерно в
+каждой 50-й строке) и JSON-подобный payload из 5 000 записей, где PII
+есть в 2% записей:
+
+* **sequential** — прежний алгоритм: ``pattern.sub`` каждого из 16
+  patterns по всей строке (16 проходов);
+* **prefilter** — ``mask_text``: дешёвые триггеры (цифра, ``@``, литералы),
+  цепочка ``sub`` только по сегментам с триггерами;
+* **stream** — ``mask_chunks`` блоками по 64 KB;
+* **dict** — ``mask_dict`` без копирования поддеревьев без PII.
+
+Пропускная способность пишется в ``extra_info["mb_per_s"]``.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_pii_masker_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from src.backend.core.security.pii_masker import PIIMasker, build_default_patterns
+
+_PII = (
+    "контакт alice@example.com",
+    "тел. +7 (999) 123-45-67",
+    "СНИЛС 123-456-789 12",
+    "карта 4111 1111 1111 1111",
+)
+
+
+def _document(lines: int = 12_500) -> str:
+    rng = random.Random(34)
+    words = ("договор", "поставка", "оплата", "счёт", "акт", "приложение", "срок")
+    out = []
+    for index in range(lines):
+        line = " ".join(rng.choice(words) for _ in range(10)).capitalize()
+        if index % 50 == 0:
+            line += " " + rng.choice(_PII)
+        out.append(line)
+    return "\n".join(out) + "\n"
+
+
+_TEXT = _document()
+_TEXT_MB = len(_TEXT.encode()) / 1_000_000
+_PAYLOAD = {
+    "records": [
+        {
+            "id": index,
+            "status": "ok",
+            "note": _PII[index % 4] if index % 50 == 0 else "без замечаний",
+            "tags": ["a", "b"],
+        }
+        for index in range(5_000)
+    ]
+}
+
+
+def _sequential(masker: PIIMasker, text: str) -> str:
+    patterns = build_default_patterns()
+    for name in masker._order:
+        text = patterns[name].sub(masker.replacement, text)
+    return text
+
+
+def _report(benchmark: Any, megabytes: float) -> None:
+    benchmark.extra_info["payload_mb"] = round(megabytes, 3)
+    stats = getattr(benchmark, "stats", None)
+    if stats is not None:
+        benchmark.extra_info["mb_per_s"] = round(megabytes / stats.stats.mean, 1)
+
+
+@pytest.mark.benchmark(group="pii_mask_document")
+def test_sequential_mask_text(benchmark: Any) -> None:
+    """Прежний алгоритм: 16 полных проходов."""
+    masker = PIIMasker()
+    result = benchmark(_sequential, masker, _TEXT)
+    _report(benchmark, _TEXT_MB)
+    assert result == masker.mask_text(_TEXT)
+
+
+@pytest.mark.benchmark(group="pii_mask_document")
+def test_prefilter_mask_text(benchmark: Any) -> None:
+    """Триггеры + цепочка только по сегментам с PII."""
+    masker = PIIMasker()
+    benchmark(masker.mask_text, _TEXT)
+    _report(benchmark, _TEXT_MB)
+
+
+@pytest.mark.benchmark(group="pii_mask_document")
+def test_stream_mask_chunks(benchmark: Any) -> None:
+    """Потоковый режим блоками по 64 KB."""
+    masker = PIIMasker()
+    chunks = [_TEXT[i : i + 65_536] for i in range(0, len(_TEXT), 65_536)]
+    benchmark(lambda: "".join(masker.mask_chunks(chunks)))
+    _report(benchmark, _TEXT_MB)
+
+
+@pytest.mark.benchmark(group="pii_mask_payload_5k_records")
+def test_mask_dict_payload(benchmark: Any) -> None:
+    """``mask_dict``: чистые записи не копируются."""
+    masker = PIIMasker()
+    benchmark(masker.mask_dict, _PAYLOAD)
@@ -0,0 +1,131 @@
+"""Бенчмарк повторного ingest'а корпуса 10k страниц с мелкими правками.
+
+Корпус — 100 документов по 100 страниц (~1.7 KB на страницу, реальный
+``RecursiveChunker``), в 1% документов правится один абзац. Embedder —
+stand-in с ~1ms на вызов + 20µs на chunk, vector store — in-memory:
+
+* **full_sequential** — прежний путь: файлы по одному, каждый chunk
+  каждого документа эмбеддится и upsert'ится заново;
+* **incremental_pipeline** — ``RagIngestService`` со staged pipeline и
+  content-hash diff: эмбеддятся и пишутся только изменённые chunks.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_rag_incremental_ingest_benchmark.py --benchmark-only
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any
+
+import pytest
+
+from src.backend.core.interfaces.vector_store import BaseVectorStore
+from src.backend.services.ai.rag_ingest_service import RagIngestService
+from src.backend.services.ai.rag_ingest_store import InMemoryChunkManifestStore
+from src.backend.services.ai.rag_service import RAGService
+
+_DOCS = 100
+_PAGES_PER_DOC = 100
+
+
+class _Store(BaseVectorStore):
+    def __init__(self) -> None:
+        self.points: dict[str, str] = {}
+
+    async def upsert(self, embeddings, documents, ids, metadatas=None) -> None:
+        self.points.update(zip(ids, documents, strict=True))
+
+    async def query(self, embedding, top_k=5, where=None) -> list[dict[str, Any]]:
+        return []
+
+    async def delete(self, ids: list[str]) -> None:
+        for point_id in ids:
+            self.points.pop(point_id, None)
+
+    async def count(self) -> int:
+        return len(self.points)
+
+
+class _Embedder:
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        await asyncio.sleep(0.001 + 0.00002 * len(texts))
+        return [[0.0] * 8 for _ in texts]
+
+
+def _corpus(edited: bool) -> list[tuple[str, bytes]]:
+    rng = random.Random(37)
+    words = "договор поставка оплата счёт акт приложение срок условия".split()
+    files = []
+    for doc in range(_DOCS):
+        pages = [
+            "\n\n".join(
+                " ".join(rng.choice(words) for _ in range(60)) + "."
+                for _ in range(4)
+            )
+            for _ in range(_PAGES_PER_DOC)
+        ]
+        if edited and doc % 100 == 0:
+            pages[50] = "Исправленный абзац: срок поставки продлён.\n\n" + pages[50]
+        files.append((f"doc-{doc}.txt", "\n\n".join(pages).encode()))
+    return files
+
+
+_ORIGINAL = _corpus(edited=False)
+_EDITED = _corpus(edited=True)
+_SOURCE_IDS = [filename for filename, _ in _ORIGINAL]
+
+
+def _service() -> RagIngestService:
+    rag = RAGService(
+        store=_Store(), embedder=_Embedder(), manifest=InMemoryChunkManifestStore()
+    )
+    return RagIngestService(rag_service=rag)
+
+
+@pytest.fixture(autouse=True)
+def _no_pii_mask(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.backend.core.config import ai_stack
+
+    monkeypatch.setattr(ai_stack.rag_ingest_settings, "pii_mask_on_ingest", False)
+
+
+@pytest.mark.benchmark(group="rag_reingest_10k_pages")
+def test_reingest_full_sequential(benchmark: Any) -> None:
+    """Каждый документ по очереди, все chunks эмбеддятся заново."""
+
+    async def _run() -> None:
+        rag = RAGService(
+            store=_Store(), embedder=_Embedder(), manifest=InMemoryChunkManifestStore()
+        )
+        for filename, content in _EDITED:
+            plan = await rag.prepare_chunks(
+                content.decode(), metadata={"source_id": filename}
+            )
+            await rag.commit_chunks(plan, await rag.embed_chunks(plan))
+
+    benchmark.pedantic(lambda: asyncio.run(_run()), rounds=3)
+
+
+@pytest.mark.benchmark(group="rag_reingest_10k_pages")
+def test_reingest_incremental_pipeline(benchmark: Any) -> None:
+    """Staged pipeline: изменённый 1% корпуса — единственная работа embedder'а."""
+
+    def _setup() -> tuple[tuple[RagIngestService], dict[str, Any]]:
+        service = _service()
+        asyncio.run(
+            service.ingest(_ORIGINAL, collection="docs", source_ids=_SOURCE_IDS)
+        )
+        return (service,), {}
+
+    def _reingest(service: RagIngestService) -> None:
+        result = asyncio.run(
+            service.ingest(_EDITED, collection="docs", source_ids=_SOURCE_IDS)
+        )
+        assert result["progress"]["chunks"]["embedded"] < 10
+
+    benchmark.pedantic(_reingest, setup=_setup, rounds=3)
@@ -0,0 +1,147 @@
+"""Бенчмарк SchemaRegistry: схема на каждое сообщение против компиляции.
+
+2 000 событий типичного размера (десяток полей), одна схема на subject:
+
+* **json_per_message** — прежний путь: ``jsonschema.validate`` заново
+  проверяет схему и строит validator на каждое сообщение;
+* **json_compiled** — ``SchemaRegistry.validate_json``: validator
+  компилируется один раз на subject;
+* **json_batch** — ``SchemaRegistry.validate_json_many`` по всему списку;
+* **avro_per_message** / **avro_batch** — ``fastavro.parse_schema`` на
+  каждое сообщение против ``SchemaRegistry.decode_avro_many``.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_schema_registry_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+
+import fastavro
+import jsonschema
+import pytest
+
+from src.backend.infrastructure.eventing.schema_registry import SchemaRegistry
+
+_MESSAGES = 2_000
+
+_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["order_id", "action", "amount", "currency"],
+    "properties": {
+        "order_id": {"type": "integer", "minimum": 1},
+        "action": {"type": "string", "enum": ["created", "updated", "completed"]},
+        "amount": {"type": "number"},
+        "currency": {"type": "string", "pattern": "^[A-Z]{3}$"},
+        "customer": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "segment": {"type": "string"},
+            },
+        },
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+_EVENTS = [
+    {
+        "order_id": index + 1,
+        "action": "created",
+        "amount": index * 1.5,
+        "currency": "RUB",
+        "customer": {"id": f"c-{index}", "segment": "retail"},
+        "tags": ["web", "promo"],
+    }
+    for index in range(_MESSAGES)
+]
+
+_AVRO_SCHEMA: dict[str, Any] = {
+    "type": "record",
+    "name": "Order",
+    "fields": [
+        {"name": "order_id", "type": "long"},
+        {"name": "action", "type": "string"},
+        {"name": "amount", "type": "double"},
+        {"name": "currency", "type": "string"},
+    ],
+}
+_AVRO_SCHEMA_STR = json.dumps(_AVRO_SCHEMA)
+
+
+def _encode(record: dict[str, Any]) -> bytes:
+    buffer = io.BytesIO()
+    fastavro.schemaless_writer(buffer, fastavro.parse_schema(_AVRO_SCHEMA), record)
+    return buffer.getvalue()
+
+
+_AVRO_PAYLOADS = [
+    _encode({key: event[key] for key in ("order_id", "action", "amount", "currency")})
+    for event in _EVENTS
+]
+
+
+def _registry() -> SchemaRegistry:
+    registry = SchemaRegistry()
+    registry.register_json("orders", _JSON_SCHEMA)
+    registry.register_avro("orders", _AVRO_SCHEMA_STR)
+    return registry
+
+
+@pytest.mark.benchmark(group="schema_json_2000")
+def test_json_per_message(benchmark: Any) -> None:
+    """Прежний путь: ``jsonschema.validate`` на каждое сообщение."""
+
+    def run() -> None:
+        for event in _EVENTS:
+            jsonschema.validate(instance=event, schema=_JSON_SCHEMA)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="schema_json_2000")
+def test_json_compiled(benchmark: Any) -> None:
+    """Validator компилируется при первом сообщении каждого раунда."""
+
+    def run() -> None:
+        registry = _registry()
+        for event in _EVENTS:
+            registry.validate_json("orders", event)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="schema_json_2000")
+def test_json_batch(benchmark: Any) -> None:
+    """Пакетная валидация всего списка одним вызовом."""
+    benchmark.pedantic(
+        lambda: _registry().validate_json_many("orders", _EVENTS),
+        rounds=3,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="schema_avro_2000")
+def test_avro_per_message(benchmark: Any) -> None:
+    """Прежний путь: ``parse_schema(json.loads(...))`` на каждое сообщение."""
+
+    def run() -> None:
+        for payload in _AVRO_PAYLOADS:
+            schema = fastavro.parse_schema(json.loads(_AVRO_SCHEMA_STR))
+            fastavro.schemaless_reader(io.BytesIO(payload), schema)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="schema_avro_2000")
+def test_avro_batch(benchmark: Any) -> None:
+    """Схема разбирается один раз на subject."""
+    benchmark.pedantic(
+        lambda: _registry().decode_avro_many("orders", _AVRO_PAYLOADS),
+        rounds=3,
+        iterations=1,
+    )
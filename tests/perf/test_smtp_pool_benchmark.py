@@ -0,0 +1,126 @@
+"""Бенчмарк SMTP-доставки: handshake на каждое письмо против пула сессий.
+
+200 писем в локальный SMTP stand-in, который задерживает приветствие и
+EHLO на 5 мс (имитация RTT + TLS/AUTH реального провайдера), 8
+конкурентных отправителей (воркеры marketing-очереди NotificationGateway):
+
+* **send_per_message** — прежний ``EmailSink``: ``aiosmtplib.send``
+  (connect → EHLO → письмо → QUIT) на каждое письмо;
+* **session_pool** — :class:`SmtpSessionPool` (``max_size=4``): сессии
+  открываются один раз и переиспользуются.
+
+Запуск (требует extra ``perf``)::
+
+    uv pip install -e .[perf]
+    pytest tests/perf/test_smtp_pool_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+from email.message import EmailMessage
+from typing import Any
+
+import aiosmtplib
+import pytest
+
+from src.backend.infrastructure.clients.transport.smtp_pool import SmtpSessionPool
+
+_MESSAGES = 200
+_SENDERS = 8
+_HANDSHAKE_DELAY = 0.005
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    await asyncio.sleep(_HANDSHAKE_DELAY)
+    writer.write(b"220 localhost ESMTP\r\n")
+    try:
+        while line := await reader.readline():
+            command = line.strip().upper()
+            if command.startswith(b"EHLO"):
+                await asyncio.sleep(_HANDSHAKE_DELAY)
+                writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+            elif command == b"DATA":
+                writer.write(b"354 end with .\r\n")
+                await writer.drain()
+                while await reader.readline() != b".\r\n":
+                    pass
+                writer.write(b"250 queued\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 ok\r\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def _messages() -> list[EmailMessage]:
+    messages = []
+    for index in range(_MESSAGES):
+        message = EmailMessage()
+        message["From"] = "promo@test"
+        message["To"] = f"user{index}@test"
+        message["Subject"] = "Осенняя акция"
+        message.set_content("Скидки для постоянных клиентов. " * 20)
+        messages.append(message)
+    return messages
+
+
+_BATCH = _messages()
+
+
+async def _deliver(send: Any) -> None:
+    queue: asyncio.Queue[EmailMessage] = asyncio.Queue()
+    for message in _BATCH:
+        queue.put_nowait(message)
+
+    async def worker() -> None:
+        while not queue.empty():
+            await send(queue.get_nowait())
+
+    await asyncio.gather(*(worker() for _ in range(_SENDERS)))
+
+
+async def _run_per_message() -> None:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def send(message: EmailMessage) -> None:
+        await aiosmtplib.send(
+            message, hostname="127.0.0.1", port=port, start_tls=False
+        )
+
+    async with server:
+        await _deliver(send)
+
+
+async def _run_pool() -> None:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def connect() -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(hostname="127.0.0.1", port=port, start_tls=False)
+        await client.connect()
+        return client
+
+    pool = SmtpSessionPool(connect, max_size=4)
+    async with server:
+        await _deliver(pool.send_message)
+        await pool.aclose()
+
+
+@pytest.mark.benchmark(group="smtp_delivery_200")
+def test_send_per_message(benchmark: Any) -> None:
+    """Прежний путь: отдельное соединение на каждое письмо."""
+    benchmark.pedantic(lambda: asyncio.run(_run_per_message()), rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="smtp_delivery_200")
+def test_session_pool(benchmark: Any) -> None:
+    """Пул из 4 сессий на 8 отправителей."""
+    benchmark.pedantic(lambda: asyncio.run(_run_pool()), rounds=3, iterations=1)
@@ -0,0 +1,226 @@
+"""Unit-тесты :class:`JwtClaimsCache` и его связки с JwtBackend/blacklist."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from typing import Any
+from unittest.mock import patch
+
+import fakeredis.aioredis
+import pytest
+from joserfc import jwt as joserfc_jwt
+from joserfc.jwk import OctKey, RSAKey
+
+from src.backend.core.auth import jwt_blacklist, jwt_claims_cache
+from src.backend.core.auth.jwks_cache import JwksCache
+from src.backend.core.auth.jwt_backend import (
+    JwtBackend,
+    JwtClaims,
+    JwtVerificationError,
+)
+from src.backend.core.auth.jwt_blacklist import RedisJwtBlacklist
+from src.backend.core.auth.jwt_claims_cache import JwtClaimsCache
+from src.backend.core.utils import async_helpers
+
+HS_SECRET = "Zq8vN3xL0pR7tY2wK9mB4cF6hJ1dS5gA"
+
+
+def _hs_token(**claims: Any) -> str:
+    payload = {"sub": "user-1", "exp": int(time.time()) + 3600, **claims}
+    return joserfc_jwt.encode({"alg": "HS256"}, payload, OctKey.import_key(HS_SECRET))
+
+
+def _claims(
+    jti: str = "j", exp: int | None = None, iat: int | None = None
+) -> JwtClaims:
+    raw = {"sub": "u", "jti": jti, "iat": iat}
+    return JwtClaims(sub="u", iss=None, aud=None, exp=exp, jti=jti, raw=raw)
+
+
+def _counting_decode() -> tuple[list[str], Any]:
+    calls: list[str] = []
+    original = joserfc_jwt.decode
+
+    def decode(token: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(token)
+        return original(token, *args, **kwargs)
+
+    return calls, decode
+
+
+class TestJwtClaimsCache:
+    def test_entry_capped_at_token_exp(self) -> None:
+        cache = JwtClaimsCache(max_ttl=300)
+        now = time.time()
+        cache.put("t", _claims(exp=int(now) + 5))
+
+        assert cache.get("t") is not None
+        with patch.object(jwt_claims_cache.time, "time", return_value=now + 10):
+            assert cache.get("t") is None
+
+    def test_expired_token_not_stored(self) -> None:
+        cache = JwtClaimsCache()
+        cache.put("t", _claims(exp=int(time.time()) - 1))
+        assert len(cache) == 0
+
+    def test_lru_bound(self) -> None:
+        cache = JwtClaimsCache(max_entries=2)
+        for token in ("a", "b", "c"):
+            cache.put(token, _claims(jti=token))
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_jwks_version_mismatch_is_miss(self) -> None:
+        cache = JwtClaimsCache()
+        cache.put("t", _claims(), jwks_version=1)
+        assert cache.get("t", jwks_version=2) is None
+        assert len(cache) == 0
+
+    def test_hit_returns_independent_raw(self) -> None:
+        cache = JwtClaimsCache()
+        cache.put("t", _claims())
+        cache.get("t").raw["sub"] = "mutated"  # type: ignore[union-attr]
+        assert cache.get("t").raw["sub"] == "u"  # type: ignore[union-attr]
+
+    def test_notify_functions_evict_in_all_caches(self) -> None:
+        first, second = JwtClaimsCache(), JwtClaimsCache()
+        for cache in (first, second):
+            cache.put("old", _claims(jti="old", iat=100))
+            cache.put("new", _claims(jti="new", iat=200))
+
+        jwt_claims_cache.notify_revoked("new")
+        assert first.get("new") is None and second.get("new") is None
+
+        jwt_claims_cache.notify_revoked_before(150)
+        assert first.get("old") is None and second.get("old") is None
+
+
+class TestBackendWithCache:
+    async def test_repeat_token_skips_verification(self) -> None:
+        backend = JwtBackend(
+            algorithms=["HS256"], secret=HS_SECRET, claims_cache=JwtClaimsCache()
+        )
+        token = _hs_token()
+        calls, decode = _counting_decode()
+        with patch.object(joserfc_jwt, "decode", decode):
+            first = await backend.decode(token)
+            second = await backend.decode(token)
+
+        assert len(calls) == 1
+        assert second.sub == first.sub == "user-1"
+
+    async def test_invalid_token_never_cached(self) -> None:
+        cache = JwtClaimsCache()
+        backend = JwtBackend(algorithms=["HS256"], secret=HS_SECRET, claims_cache=cache)
+        with pytest.raises(JwtVerificationError):
+            await backend.decode(_hs_token(exp=int(time.time()) - 3600))
+        assert len(cache) == 0
+
+    async def test_revoke_evicts_and_rejects(self) -> None:
+        blacklist = RedisJwtBlacklist(fakeredis.aioredis.FakeRedis())
+        backend = JwtBackend(
+            algorithms=["HS256"],
+            secret=HS_SECRET,
+            blacklist=blacklist,
+            claims_cache=JwtClaimsCache(),
+        )
+        token = _hs_token(jti="jti-1")
+        with patch.object(JwtClaimsCache, "ensure_revocation_listener"):
+            await backend.decode(token)
+            await blacklist.revoke("jti-1", int(time.time()) + 3600)
+
+            with pytest.raises(JwtVerificationError, match="отозван"):
+                await backend.decode(token)
+
+    async def test_jwks_rotation_forces_reverification(self) -> None:
+        key = RSAKey.generate_key(2048, parameters={"kid": "k1", "use": "sig"})
+        documents = [{"keys": [key.as_dict()]}]
+
+        class _Fetcher:
+            async def fetch(self, url: str) -> dict[str, Any]:
+                return documents[-1]
+
+        jwks = JwksCache("https://idp/jwks", ttl=300, fetcher=_Fetcher())
+        backend = JwtBackend(
+            algorithms=["RS256"], jwks=jwks, claims_cache=JwtClaimsCache()
+        )
+        token = joserfc_jwt.encode(
+            {"alg": "RS256", "kid": "k1"},
+            {"sub": "user-1", "exp": int(time.time()) + 3600},
+            key,
+        )
+        await backend.decode(token)
+        version = jwks.version
+
+        # IdP убрал ключ k1; следующий refresh приносит другой документ.
+        documents.append({"keys": []})
+        jwks._expires_at = 0.0
+
+        with pytest.raises(JwtVerificationError, match="не найден"):
+            await backend.decode(token)
+        assert jwks.version == version + 1
+
+
+class TestRevocationListener:
+    async def test_events_from_other_workers_reach_cache(self) -> None:
+        server = fakeredis.FakeServer()
+        local = RedisJwtBlacklist(fakeredis.aioredis.FakeRedis(server=server))
+        remote = RedisJwtBlacklist(fakeredis.aioredis.FakeRedis(server=server))
+        cache = JwtClaimsCache()
+        cache.put("t", _claims(jti="jti-9"))
+
+        listener = asyncio.create_task(local.listen_revocations(cache._on_revocation))
+        try:
+            await asyncio.sleep(0.05)
+            # Локальная эвикция выключена — кеш чистит только pub/sub.
+            with patch.object(jwt_blacklist, "notify_revoked"):
+                await remote.revoke("jti-9", int(time.time()) + 60)
+            for _ in range(50):
+                if len(cache) == 0:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            listener.cancel()
+
+        assert cache.get("t") is None
+
+    async def test_listener_restarted_and_cache_paused_while_down(self) -> None:
+        sessions: list[asyncio.Event] = []
+
+        class _Blacklist:
+            async def listen_revocations(
+                self, handler: Any, *, on_subscribed: Any
+            ) -> None:
+                dropped = asyncio.Event()
+                sessions.append(dropped)
+                on_subscribed()
+                await dropped.wait()
+                raise ConnectionError("pub/sub connection lost")
+
+        cache = JwtClaimsCache()
+        restarts = functools.partial(
+            async_helpers.run_with_restarts, initial_delay=0.05
+        )
+        with patch.object(async_helpers, "run_with_restarts", restarts):
+            cache.ensure_revocation_listener(_Blacklist())
+        try:
+            await asyncio.sleep(0.01)
+            cache.put("t", _claims())
+            assert cache.get("t") is not None
+
+            sessions[0].set()
+            await asyncio.sleep(0.01)
+            # Между разрывом и повторной подпиской кеш не используется.
+            assert cache.get("t") is None
+            cache.put("t", _claims())
+            assert len(cache) == 0
+
+            await asyncio.sleep(0.1)
+            assert len(sessions) == 2
+            cache.put("t", _claims())
+            assert cache.get("t") is not None
+        finally:
+            assert cache._listener_task is not None
+            cache._listener_task.cancel()
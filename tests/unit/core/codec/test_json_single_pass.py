@@ -0,0 +1,168 @@
+"""Unit-тесты single-pass marker-кодека и schema-aware декодирования.
+
+Покрывает:
+
+* совместимость :func:`json_dumps` с прежним ``orjson.dumps(to_jsonable(...))``
+  (вложенные модели, dataclass'ы, маркеры) и известные байтовые отличия
+  (экспонента float, ключи bool/None);
+* legacy-путь для ключей/значений, которые C-энкодер не принимает;
+* ``json_loads(schema=T)`` для plain- и marker-payload (msgspec и pydantic);
+* plain-формат и его общность с ``msgspec_hotpath``.
+"""
+
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from uuid import UUID
+
+import msgspec
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from src.backend.core.codec.json import (
+    PLAIN_ENCODER,
+    json_dumps,
+    json_loads,
+    plain_dumps,
+    plain_loads,
+    to_jsonable,
+)
+from src.backend.core.serialization import msgspec_hotpath
+
+_UID = UUID("12345678-1234-5678-1234-567812345678")
+_TS = datetime(2026, 3, 1, 12, 30, tzinfo=UTC)
+
+
+class _Status(Enum):
+    NEW = "new"
+
+
+class _Priority(IntEnum):
+    HIGH = 1
+
+
+class _Line(BaseModel):
+    sku: str
+    price: Decimal
+
+
+class _Order(BaseModel):
+    id: UUID
+    created_at: datetime
+    lines: list[_Line]
+
+
+@dataclass
+class _Address:
+    city: str
+    since: date
+
+
+class _OrderStruct(msgspec.Struct):
+    id: UUID
+    created_at: datetime
+    total: Decimal
+
+
+def _payload() -> dict[str, object]:
+    return {
+        "order": _Order(
+            id=_UID,
+            created_at=_TS,
+            lines=[_Line(sku="a", price=Decimal("1.50"))],
+        ),
+        "address": _Address(city="Москва", since=date(2020, 1, 2)),
+        "status": _Status.NEW,
+        "priority": _Priority.HIGH,
+        "tags": {"vip"},
+        "pair": (1, 2),
+        "raw": b"\x00\x01",
+        "ids": [_UID],
+        1: "int-key",
+    }
+
+
+class TestMarkerEncoding:
+    def test_bytes_match_legacy_walk(self) -> None:
+        payload = _payload()
+        assert json_dumps(payload) == orjson.dumps(to_jsonable(payload))
+
+    def test_round_trip_restores_markers(self) -> None:
+        restored = json_loads(json_dumps(_payload()))
+        assert restored["order"]["id"] == _UID
+        assert restored["order"]["created_at"] == _TS
+        assert restored["order"]["lines"] == [{"sku": "a", "price": Decimal("1.50")}]
+        assert restored["address"] == {"city": "Москва", "since": date(2020, 1, 2)}
+        assert restored["raw"] == b"\x00\x01"
+        assert restored["1"] == "int-key"
+
+    def test_legacy_fallback_for_exotic_keys_and_nan(self) -> None:
+        payload = {_UID: 1, "nan": float("nan")}
+        assert json_dumps(payload) == orjson.dumps(to_jsonable(payload))
+
+    def test_known_byte_differences_from_legacy(self) -> None:
+        payload = {True: 1, None: 2, "tiny": 1e-7, "small": 1e-5, "big": 1e16}
+        assert json_dumps(payload) == (
+            b'{"true":1,"null":2,"tiny":1e-07,"small":1e-05,"big":1e+16}'
+        )
+        assert orjson.dumps(to_jsonable(payload)) == (
+            b'{"True":1,"None":2,"tiny":1e-7,"small":0.00001,"big":1e+16}'
+        )
+        restored = json_loads(json_dumps(payload))
+        assert restored == {
+            "true": 1,
+            "null": 2,
+            "tiny": 1e-7,
+            "small": 1e-5,
+            "big": 1e16,
+        }
+
+    def test_unserializable_raises(self) -> None:
+        with pytest.raises(TypeError):
+            json_dumps({"obj": object()})
+
+
+class TestSchemaDecoding:
+    def test_msgspec_schema_from_plain_payload(self) -> None:
+        data = plain_dumps({"id": _UID, "created_at": _TS, "total": Decimal("9.99")})
+        decoded = json_loads(data, schema=_OrderStruct)
+        assert decoded == _OrderStruct(id=_UID, created_at=_TS, total=Decimal("9.99"))
+
+    def test_msgspec_schema_from_marker_payload(self) -> None:
+        data = json_dumps({"id": _UID, "created_at": _TS, "total": Decimal("9.99")})
+        decoded = json_loads(data, schema=_OrderStruct)
+        assert decoded.id == _UID
+        assert decoded.total == Decimal("9.99")
+
+    def test_pydantic_schema(self) -> None:
+        order = _Order(id=_UID, created_at=_TS, lines=[])
+        assert json_loads(json_dumps(order), schema=_Order) == order
+        assert plain_loads(plain_dumps(order), schema=_Order) == order
+
+    def test_container_schema(self) -> None:
+        data = plain_dumps([{"id": _UID, "created_at": _TS, "total": "1"}])
+        decoded = plain_loads(data, schema=list[_OrderStruct])
+        assert decoded[0].created_at == _TS
+
+    def test_schema_mismatch_raises(self) -> None:
+        with pytest.raises(msgspec.ValidationError):
+            json_loads(b'{"id": 1}', schema=_OrderStruct)
+
+
+class TestPlainFormat:
+    def test_plain_has_no_markers(self) -> None:
+        assert orjson.loads(plain_dumps({"id": _UID, "total": Decimal("2")})) == {
+            "id": str(_UID),
+            "total": "2",
+        }
+
+    def test_hotpath_shares_codec_instances(self) -> None:
+        assert msgspec_hotpath._ENCODER is PLAIN_ENCODER
+        order = _Order(id=_UID, created_at=_TS, lines=[])
+        assert msgspec_hotpath.encode_json(order) == plain_dumps(order)
+        assert msgspec_hotpath.decode_json(plain_dumps(order), schema=_Order) == order
@@ -0,0 +1,201 @@
+"""Unit-тесты общего пула исходящих HTTP-соединений (OutboundClientPool)."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.backend.core.net import OutboundHttpClient
+from src.backend.core.net.client_pool import (
+    OutboundClientPool,
+    TlsProfile,
+    _DnsCache,
+    get_outbound_client_pool,
+    shutdown_outbound_client_pool,
+)
+from src.backend.core.net.per_host_metering import PerHostMeter
+
+
+class _KeepAliveServer:
+    """Минимальный HTTP/1.1 keep-alive сервер, считающий TCP-соединения."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.heads: list[bytes] = []
+        self.server: asyncio.AbstractServer | None = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                self.heads.append(head)
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nSet-Cookie: session=tenant-a\r\n"
+                    b"Content-Length: 2\r\n\r\n"
+                )
+                if head.startswith(b"GET /slow "):
+                    # Тело приходит позже заголовков — ответ «в полёте».
+                    await writer.drain()
+                    await asyncio.sleep(0.1)
+                writer.write(b"ok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @property
+    def port(self) -> int:
+        assert self.server is not None
+        return self.server.sockets[0].getsockname()[1]
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[_KeepAliveServer]:
+    stub = _KeepAliveServer()
+    stub.server = await asyncio.start_server(stub._handle, "127.0.0.1", 0)
+    yield stub
+    stub.server.close()
+    await shutdown_outbound_client_pool()
+
+
+class TestConnectionReuse:
+    async def test_pooled_clients_share_keepalive_connection(
+        self, server: _KeepAliveServer
+    ) -> None:
+        url = f"http://127.0.0.1:{server.port}/"
+        for _ in range(3):
+            async with OutboundHttpClient(pooled=True) as client:
+                assert (await client.get(url)).text == "ok"
+        assert server.connections == 1
+
+    async def test_unpooled_client_opens_connection_per_call(
+        self, server: _KeepAliveServer
+    ) -> None:
+        url = f"http://127.0.0.1:{server.port}/"
+        for _ in range(2):
+            async with OutboundHttpClient() as client:
+                await client.get(url)
+        assert server.connections == 2
+
+    async def test_shutdown_closes_pool_and_next_call_recreates(
+        self, server: _KeepAliveServer
+    ) -> None:
+        first = get_outbound_client_pool()
+        await shutdown_outbound_client_pool()
+        with pytest.raises(RuntimeError):
+            first.client()
+        assert get_outbound_client_pool() is not first
+
+
+class TestPoolRegistry:
+    async def test_clients_are_keyed_by_tls_profile(self) -> None:
+        pool = OutboundClientPool()
+        assert pool.client() is pool.client()
+        assert pool.client(http2=True) is not pool.client()
+        await pool.aclose()
+
+    async def test_per_host_limit_override(self) -> None:
+        limits = httpx.Limits(max_connections=2)
+        pool = OutboundClientPool(per_host_overrides={"api.example.com": limits})
+        assert pool.limits_for("api.example.com") is limits
+        assert pool.limits_for("other.example.com").max_connections == 50
+
+    async def test_requests_are_recorded_in_per_host_meter(
+        self, server: _KeepAliveServer
+    ) -> None:
+        meter = PerHostMeter(enabled=True)
+        with patch(
+            "src.backend.core.net.per_host_metering.get_per_host_meter",
+            return_value=meter,
+        ):
+            async with OutboundHttpClient(pooled=True) as client:
+                await client.get(f"http://127.0.0.1:{server.port}/")
+        stats = meter.get_stats("127.0.0.1")
+        assert stats is not None and stats.request_count == 1
+
+    async def test_origin_pools_are_bounded(self, server: _KeepAliveServer) -> None:
+        pool = OutboundClientPool(max_origins=1)
+        client = pool.client()
+        await client.get(f"http://127.0.0.1:{server.port}/")
+        await client.get(f"http://localhost:{server.port}/")
+        origins = pool.stats()["origins"]
+        assert list(origins.values()) == [[f"http://localhost:{server.port}"]]
+        await pool.aclose()
+
+
+class TestSharedClientIsolation:
+    async def test_cookies_are_not_persisted(self, server: _KeepAliveServer) -> None:
+        pool = OutboundClientPool()
+        client = pool.client()
+        url = f"http://127.0.0.1:{server.port}/"
+        first = await client.get(url)
+        assert first.cookies["session"] == "tenant-a"
+        await client.get(url)
+        assert not any(b"cookie:" in head.lower() for head in server.heads)
+        await pool.aclose()
+
+    async def test_evicted_origin_pool_finishes_inflight_response(
+        self, server: _KeepAliveServer
+    ) -> None:
+        pool = OutboundClientPool(max_origins=1)
+        client = pool.client()
+        slow_url = f"http://127.0.0.1:{server.port}/slow"
+        async with client.stream("GET", slow_url) as slow:
+            await client.get(f"http://localhost:{server.port}/")
+            assert await slow.aread() == b"ok"
+        transport = pool._transports[TlsProfile()]
+        assert transport._retired == set()
+        await pool.aclose()
+
+
+class TestDnsCache:
+    async def test_pool_connects_through_cached_resolution(
+        self, server: _KeepAliveServer
+    ) -> None:
+        calls: list[str] = []
+
+        async def _fake(host: str, port: int, **_: Any) -> list[Any]:
+            calls.append(host)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+        pool = OutboundClientPool()
+        client = pool.client()
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "getaddrinfo", _fake):
+            for _ in range(2):
+                response = await client.get(f"http://svc.internal:{server.port}/")
+                assert response.text == "ok"
+        assert calls == ["svc.internal"]
+        await pool.aclose()
+
+    async def test_resolution_is_cached(self) -> None:
+        calls: list[tuple[str, int]] = []
+
+        async def _fake(host: str, port: int, **_: Any) -> list[Any]:
+            calls.append((host, port))
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", port))]
+
+        cache = _DnsCache(ttl=60.0)
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "getaddrinfo", _fake):
+            assert await cache.resolve("svc.local", 443) == ["10.0.0.1"]
+            assert await cache.resolve("svc.local", 443) == ["10.0.0.1"]
+            cache.invalidate("svc.local", 443)
+            await cache.resolve("svc.local", 443)
+        assert len(calls) == 2
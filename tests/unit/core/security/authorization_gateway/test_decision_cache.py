@@ -0,0 +1,302 @@
+"""Unit-тесты кэша решений AuthorizationGateway (DecisionCache).
+
+Покрытие:
+* повторный запрос отдаётся из кэша без вызова policy-движков;
+* tenant_id входит в ключ;
+* add_policy / remove_policy / invalidate_decisions сбрасывают stamp;
+* notify_policy_changed (мутации Casbin) сбрасывает все кэши процесса;
+* deny из-за сбоя движка (transient) не кэшируется;
+* состояние ``opa_runtime_query_enabled`` входит в ключ;
+* раздельные TTL allow/deny (deny_ttl=0 — deny не кэшируется);
+* single-flight: конкурентные одинаковые запросы — один вызов движка;
+* capability-check и audit остаются на каждый запрос.
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.backend.core.config.features import feature_flags
+from src.backend.core.security.authorization_gateway import (
+    AuthorizationGateway,
+    AuthorizationReason,
+    DecisionCache,
+    notify_policy_changed,
+)
+from src.backend.core.security.capabilities import (
+    CapabilityRef,
+    build_default_vocabulary,
+)
+from src.backend.core.security.capabilities.gate import CapabilityGate
+
+
+@pytest.fixture(autouse=True)
+def _enable_gateway(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(feature_flags, "authz_gateway_enabled", True)
+
+
+class _CountingPolicy:
+    """PolicyDecider, считающий вызовы (stand-in для OPA/Casbin)."""
+
+    __name__ = "counting_policy"
+
+    def __init__(self, allow: bool = True, delay: float = 0.0) -> None:
+        self.allow = allow
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(
+        self, principal: str, resource: str, action: str, ctx: dict[str, Any]
+    ) -> AuthorizationReason:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return AuthorizationReason(
+            source="opa", outcome="allow" if self.allow else "deny"
+        )
+
+
+def _gateway(
+    policy: _CountingPolicy, cache: DecisionCache | None = None, **kwargs: Any
+) -> AuthorizationGateway:
+    gate = CapabilityGate(vocabulary=build_default_vocabulary())
+    gate.declare("p1", (CapabilityRef(name="db.read", scope="users"),))
+    return AuthorizationGateway(
+        capability_gateway=gate,
+        policies=(policy,),
+        decision_cache=cache if cache is not None else DecisionCache(),
+        **kwargs,
+    )
+
+
+async def _authorize(gateway: AuthorizationGateway, tenant: str = "acme") -> bool:
+    decision = await gateway.authorize(
+        principal="p1",
+        resource="db.read",
+        action="read",
+        context={"scope": "users", "tenant_id": tenant},
+    )
+    return decision.allowed
+
+
+class TestDecisionCaching:
+    async def test_repeat_decision_skips_policy_engine(self) -> None:
+        policy = _CountingPolicy()
+        cache = DecisionCache()
+        gateway = _gateway(policy, cache)
+        assert await _authorize(gateway)
+        assert await _authorize(gateway)
+        assert policy.calls == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_tenant_is_part_of_key(self) -> None:
+        policy = _CountingPolicy()
+        gateway = _gateway(policy)
+        await _authorize(gateway, tenant="acme")
+        await _authorize(gateway, tenant="globex")
+        assert policy.calls == 2
+
+    async def test_capability_and_audit_run_per_request(self) -> None:
+        events: list[dict[str, Any]] = []
+        policy = _CountingPolicy()
+        gateway = _gateway(policy, audit_callback=events.append)
+        await _authorize(gateway)
+        denied = await gateway.authorize(
+            principal="p1", resource="db.write", action="write", context={}
+        )
+        await _authorize(gateway)
+        assert not denied.allowed
+        assert [e["outcome"] for e in events] == ["allow", "deny", "allow"]
+        assert policy.calls == 1
+
+
+class TestPolicyVersion:
+    async def test_add_and_remove_policy_bump_version(self) -> None:
+        policy = _CountingPolicy()
+        cache = DecisionCache()
+        gateway = _gateway(policy, cache)
+        await _authorize(gateway)
+        gateway.add_policy("p1", "read", "db.read")
+        await _authorize(gateway)
+        gateway.remove_policy("p1", "read", "db.read")
+        await _authorize(gateway)
+        assert policy.calls == 3
+        assert cache.version == 2
+
+    async def test_bundle_reload_invalidates(self) -> None:
+        policy = _CountingPolicy()
+        gateway = _gateway(policy)
+        assert await _authorize(gateway)
+        policy.allow = False
+        gateway.invalidate_decisions("opa_bundle_reload")
+        assert not await _authorize(gateway)
+
+    async def test_notify_policy_changed_invalidates_every_cache(self) -> None:
+        policy = _CountingPolicy()
+        cache = DecisionCache()
+        gateway = _gateway(policy, cache)
+        await _authorize(gateway)
+        notify_policy_changed("casbin_add_policy")
+        await _authorize(gateway)
+        assert policy.calls == 2
+        assert cache.version == 1
+
+    async def test_tenant_scoped_casbin_mutations_notify(self) -> None:
+        from src.backend.infrastructure.policy.casbin_tenant_scoped import (
+            TenantScopedCasbin,
+        )
+
+        class _Enforcer:
+            def add_policy(self, *args: str) -> bool:
+                return True
+
+            def remove_policy(self, *args: str) -> bool:
+                return True
+
+            def add_role_for_user(self, user: str, role: str) -> bool:
+                return True
+
+            def load_policy(self) -> None:
+                return None
+
+        base = type("Base", (), {"_ensure_enforcer": lambda self: _Enforcer()})()
+        casbin = TenantScopedCasbin(base_adapter=base)
+        cache = DecisionCache()
+        casbin.add_policy("alice", "orders", "read", "acme")
+        casbin.remove_policy("alice", "orders", "read", "acme")
+        casbin.add_role("alice", "admin")
+        casbin.load_policy()
+        assert cache.version == 4
+
+
+class TestTtl:
+    async def test_deny_not_cached_with_zero_ttl(self) -> None:
+        policy = _CountingPolicy(allow=False)
+        gateway = _gateway(policy, DecisionCache(deny_ttl=0))
+        await _authorize(gateway)
+        await _authorize(gateway)
+        assert policy.calls == 2
+
+    async def test_expired_entry_is_recomputed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.backend.core.security.authorization_gateway import decision_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(decision_cache.time, "monotonic", lambda: now[0])
+        policy = _CountingPolicy()
+        gateway = _gateway(policy, DecisionCache(allow_ttl=10))
+        await _authorize(gateway)
+        now[0] += 11
+        await _authorize(gateway)
+        assert policy.calls == 2
+
+    async def test_entries_are_bounded(self) -> None:
+        policy = _CountingPolicy()
+        cache = DecisionCache(max_entries=2)
+        gateway = _gateway(policy, cache)
+        for tenant in ("a", "b", "c"):
+            await _authorize(gateway, tenant=tenant)
+        assert cache.stats()["entries"] == 2
+
+
+class TestSingleFlight:
+    async def test_concurrent_identical_queries_coalesce(self) -> None:
+        policy = _CountingPolicy(delay=0.01)
+        cache = DecisionCache()
+        gateway = _gateway(policy, cache)
+        results = await asyncio.gather(*(_authorize(gateway) for _ in range(10)))
+        assert all(results)
+        assert policy.calls == 1
+        assert cache.stats()["coalesced"] == 9
+
+    async def test_failure_is_propagated_and_not_cached(self) -> None:
+        cache = DecisionCache()
+        calls = 0
+
+        async def _boom() -> Any:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("engine down")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cache.get_or_compute("p1", "r", "read", None, _boom)
+        assert calls == 2
+
+
+class _FakeOpa:
+    """OPA-клиент, всегда отвечающий deny."""
+
+    def __init__(self, reasons: tuple[str, ...] = ("denied",)) -> None:
+        self.queries = 0
+        self.reasons = list(reasons)
+
+    async def query(self, policy: str, input_doc: dict[str, Any]) -> Any:
+        self.queries += 1
+        return type("Decision", (), {"allow": False, "reasons": self.reasons})()
+
+
+class TestTransientDeny:
+    async def test_policy_exception_deny_is_not_cached(self) -> None:
+        calls = 0
+
+        async def _broken(*_: Any) -> AuthorizationReason:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("opa down")
+
+        gate = CapabilityGate(vocabulary=build_default_vocabulary())
+        gate.declare("p1", (CapabilityRef(name="db.read", scope="users"),))
+        gateway = AuthorizationGateway(
+            capability_gateway=gate,
+            policies=(_broken,),
+            decision_cache=DecisionCache(deny_ttl=30.0),
+        )
+        assert await _authorize(gateway) is False
+        assert await _authorize(gateway) is False
+        assert calls == 2
+
+    async def test_opa_fail_closed_deny_is_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(feature_flags, "opa_runtime_query_enabled", True)
+        opa = _FakeOpa(reasons=("opa_unavailable",))
+        gate = CapabilityGate(vocabulary=build_default_vocabulary())
+        gate.declare("p1", (CapabilityRef(name="db.read", scope="users"),))
+        gateway = AuthorizationGateway(
+            capability_gateway=gate,
+            policies=(AuthorizationGateway.opa_step(opa, "authz/default"),),
+            decision_cache=DecisionCache(deny_ttl=30.0),
+        )
+        assert await _authorize(gateway) is False
+        assert await _authorize(gateway) is False
+        assert opa.queries == 2
+
+
+class TestFeatureFlagStamp:
+    async def test_opa_flag_flip_is_not_served_from_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        opa = _FakeOpa()
+        gate = CapabilityGate(vocabulary=build_default_vocabulary())
+        gate.declare("p1", (CapabilityRef(name="db.read", scope="users"),))
+        gateway = AuthorizationGateway(
+            capability_gateway=gate,
+            policies=(AuthorizationGateway.opa_step(opa, "authz/default"),),
+            decision_cache=DecisionCache(deny_ttl=30.0),
+        )
+
+        monkeypatch.setattr(feature_flags, "opa_runtime_query_enabled", False)
+        assert await _authorize(gateway) is True
+        assert await _authorize(gateway) is True
+        assert opa.queries == 0
+
+        monkeypatch.setattr(feature_flags, "opa_runtime_query_enabled", True)
+        assert await _authorize(gateway) is False
+        assert await _authorize(gateway) is False
+        assert opa.queries == 1
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from src.backend.core.utils.async_helpers import async_chunk_iterator
+from src.backend.core.utils.async_helpers import async_chunk_iterator, run_with_restarts
 
 
 @pytest.mark.unit
@@ -31,3 +33,49 @@ class TestAsyncChunkIterator:
         async for chunk in async_chunk_iterator([b"hello", b" ", b"world"]):
             chunks.append(chunk)
         assert chunks == [b"hello", b" ", b"world"]
+
+
+@pytest.mark.unit
+class TestRunWithRestarts:
+    """Tests for run_with_restarts."""
+
+    @pytest.mark.asyncio
+    async def test_restarts_after_error_and_exit_with_backoff(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        runs: list[int] = []
+        restarts: list[int] = []
+        delays: list[float] = []
+        done = asyncio.Event()
+
+        async def listener() -> None:
+            runs.append(len(runs))
+            if len(runs) == 1:
+                raise ConnectionError("pubsub dropped")
+            if len(runs) == 3:
+                done.set()
+                await asyncio.Event().wait()
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        task = asyncio.ensure_future(
+            run_with_restarts(
+                listener,
+                name="test listener",
+                on_restart=lambda: restarts.append(1),
+                initial_delay=0.5,
+            )
+        )
+        monkeypatch.setattr(
+            "src.backend.core.utils.async_helpers.asyncio.sleep", fake_sleep
+        )
+        await done.wait()
+        monkeypatch.undo()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert len(runs) == 3
+        assert len(restarts) == 2
+        assert delays == [0.5, 1.0]
@@ -1,9 +1,29 @@
 """Tests for run_cpu_bound (S171 M6 — performance helper)."""
 from __future__ import annotations
 
+from typing import Any, NamedTuple
+
 import pytest
 
 
+class _Pair(NamedTuple):
+    left: Any
+    right: Any
+
+
+def _slow_nested_blob(size: int) -> dict[str, bytes]:
+    import time
+
+    time.sleep(0.3)
+    return {"blob": b"x" * size}
+
+
+def _shm_segments() -> set[str]:
+    import os
+
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
 class TestRunCpuBound:
     @pytest.mark.asyncio
     async def test_thread_pool_default(self) -> None:
@@ -67,3 +87,183 @@ class TestPickleFallback:
 
         result = await run_cpu_bound(top_level_fn, 41, use_process_pool=True)
         assert result == 42
+
+
+class TestPicklabilityCache:
+    def test_result_cached_per_function(self) -> None:
+        from src.backend.core.utils import cpu_bound
+
+        def local_fn() -> None:
+            return None
+
+        assert cpu_bound._is_picklable(local_fn) is False
+        assert cpu_bound._picklable_cache[local_fn] is False
+        assert cpu_bound._is_picklable(sum) is True
+        assert cpu_bound._picklable_cache[sum] is True
+
+
+class TestSharedMemoryTransfer:
+    @pytest.mark.asyncio
+    async def test_large_bytes_arrive_as_memoryview(self) -> None:
+        import zlib
+
+        from src.backend.core.utils.cpu_bound import (
+            SHARED_MEMORY_MIN_BYTES,
+            cpu_pool_stats,
+            run_cpu_bound,
+        )
+
+        payload = bytes(range(256)) * (SHARED_MEMORY_MIN_BYTES // 256 + 1)
+        before = cpu_pool_stats()["shared_bytes_in"]
+        kind = await run_cpu_bound(
+            type, payload, use_process_pool=True, share_memory=True
+        )
+        crc = await run_cpu_bound(
+            zlib.crc32, payload, use_process_pool=True, share_memory=True
+        )
+        assert kind is memoryview
+        assert crc == zlib.crc32(payload)
+        assert cpu_pool_stats()["shared_bytes_in"] - before == 2 * len(payload)
+
+    @pytest.mark.asyncio
+    async def test_small_and_nested_buffers(self) -> None:
+        from src.backend.core.utils.cpu_bound import (
+            SHARED_MEMORY_MIN_BYTES,
+            run_cpu_bound,
+        )
+
+        big = b"x" * SHARED_MEMORY_MIN_BYTES
+        # len() от списка: вложенный крупный буфер заменён view, мелкий — нет.
+        assert await run_cpu_bound(
+            len, [big, b"small"], use_process_pool=True, share_memory=True
+        ) == 2
+
+    def test_container_types_preserved(self) -> None:
+        from collections import OrderedDict
+
+        from src.backend.core.utils.cpu_bound import (
+            SHARED_MEMORY_MIN_BYTES,
+            _close,
+            _copy_shared,
+            _to_shared,
+        )
+
+        segments: list[Any] = []
+        small = _Pair(OrderedDict(a=b"x"), [1])
+        assert _to_shared(small, segments, track=True) is small
+        assert not segments
+
+        value = _Pair(OrderedDict(blob=b"x" * SHARED_MEMORY_MIN_BYTES), 1)
+        try:
+            shared = _to_shared(value, segments, track=True)
+            assert type(shared) is _Pair
+            assert type(shared.left) is OrderedDict
+            restored = _copy_shared(shared)
+        finally:
+            _close(segments, unlink=True)
+        assert restored == value
+        assert type(restored) is _Pair
+        assert type(restored.left) is OrderedDict
+
+    @pytest.mark.asyncio
+    async def test_large_result_returned_via_segment(self) -> None:
+        import operator
+
+        from src.backend.core.utils.cpu_bound import (
+            SHARED_MEMORY_MIN_BYTES,
+            cpu_pool_stats,
+            run_cpu_bound,
+        )
+
+        before = cpu_pool_stats()["shared_bytes_out"]
+        result = await run_cpu_bound(
+            operator.mul, b"ab", SHARED_MEMORY_MIN_BYTES, use_process_pool=True,
+            share_memory=True,
+        )
+        assert isinstance(result, bytes)
+        assert len(result) == 2 * SHARED_MEMORY_MIN_BYTES
+        assert cpu_pool_stats()["shared_bytes_out"] - before == len(result)
+
+    @pytest.mark.asyncio
+    async def test_nested_large_result_copied_and_released(self) -> None:
+        from src.backend.core.utils.cpu_bound import (
+            SHARED_MEMORY_MIN_BYTES,
+            run_cpu_bound,
+        )
+
+        before = _shm_segments()
+        result = await run_cpu_bound(
+            _slow_nested_blob, SHARED_MEMORY_MIN_BYTES,
+            use_process_pool=True, share_memory=True,
+        )
+        assert result == {"blob": b"x" * SHARED_MEMORY_MIN_BYTES}
+        assert _shm_segments() <= before
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_releases_result_segment(self) -> None:
+        import asyncio
+
+        from src.backend.core.utils.cpu_bound import (
+            SHARED_MEMORY_MIN_BYTES,
+            run_cpu_bound,
+        )
+
+        await run_cpu_bound(len, b"", use_process_pool=True)  # пул поднят
+        before = _shm_segments()
+        task = asyncio.create_task(
+            run_cpu_bound(
+                _slow_nested_blob, SHARED_MEMORY_MIN_BYTES,
+                use_process_pool=True, share_memory=True,
+            )
+        )
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.5)
+        assert _shm_segments() <= before
+
+    @pytest.mark.asyncio
+    async def test_numpy_array_round_trip(self) -> None:
+        np = pytest.importorskip("numpy")
+        from src.backend.core.utils.cpu_bound import run_cpu_bound
+
+        arr = np.arange(400_000, dtype=np.float64)
+        result = await run_cpu_bound(
+            np.negative, arr, use_process_pool=True, share_memory=True
+        )
+        assert isinstance(result, np.ndarray)
+        assert np.array_equal(result, -arr)
+
+
+class TestPoolLifecycle:
+    @pytest.mark.asyncio
+    async def test_initializer_runs_in_warm_workers(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        import os
+
+        from src.backend.core.utils import cpu_bound
+
+        await cpu_bound.shutdown_cpu_pool()
+        cpu_bound.register_cpu_worker_initializer(os.chdir, str(tmp_path))
+        try:
+            workers = await cpu_bound.warm_cpu_pool()
+            assert 1 <= workers <= cpu_bound.PROCESS_POOL_SIZE
+            cwd = await cpu_bound.run_cpu_bound(os.getcwd, use_process_pool=True)
+            assert cwd == str(tmp_path)
+        finally:
+            cpu_bound._initializers.clear()
+            await cpu_bound.shutdown_cpu_pool()
+
+    @pytest.mark.asyncio
+    async def test_stats_track_outcomes(self) -> None:
+        from src.backend.core.utils.cpu_bound import cpu_pool_stats, run_cpu_bound
+
+        before = cpu_pool_stats()
+        with pytest.raises(ZeroDivisionError):
+            await run_cpu_bound(divmod, 1, 0, use_process_pool=True)
+        await run_cpu_bound(lambda: None, use_process_pool=True)
+        after = cpu_pool_stats()
+        assert after["failed"] == before["failed"] + 1
+        assert after["thread_fallbacks"] == before["thread_fallbacks"] + 1
+        assert after["inflight"] == 0
+        assert after["queue_depth"] == 0
@@ -0,0 +1,40 @@
+"""Unit-тесты TimerWheel: истечение по дедлайну, обороты, пустое колесо."""
+
+
+from __future__ import annotations
+
+import pytest
+
+from src.backend.core.utils.timer_wheel import TimerWheel
+
+
+def test_items_expire_not_before_deadline() -> None:
+    wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=8, start=0.0)
+    wheel.schedule(2.5, "a")
+    wheel.schedule(4.0, "b")
+    assert wheel.advance(2.4) == []
+    assert wheel.advance(3.0) == ["a"]
+    assert wheel.advance(4.0) == ["b"]
+    assert len(wheel) == 0
+
+
+def test_deadline_beyond_one_rotation_uses_rounds() -> None:
+    wheel: TimerWheel[int] = TimerWheel(tick=1.0, slots=4, start=0.0)
+    wheel.schedule(10.0, 1)
+    assert wheel.advance(9.0) == []
+    assert wheel.advance(10.0) == [1]
+
+
+def test_empty_wheel_fast_forwards() -> None:
+    wheel: TimerWheel[str] = TimerWheel(tick=0.5, slots=4, start=0.0)
+    assert wheel.advance(1_000_000.0) == []
+    wheel.schedule(1_000_001.0, "x")
+    assert wheel.advance(1_000_000.9) == []
+    assert wheel.advance(1_000_001.5) == ["x"]
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="tick"):
+        TimerWheel(tick=0)
+    with pytest.raises(ValueError, match="slots"):
+        TimerWheel(tick=1.0, slots=0)
@@ -85,3 +85,153 @@ async def test_resequencer_max_keys_eviction() -> None:
         await proc.process(e, ctx)
 
     assert len(proc._buffers) <= 2
+
+
+def _seq_ex(seq: int, key: str = "k") -> Exchange[Any]:
+    return _ex(body={"seq": seq, "key": key})
+
+
+@pytest.mark.asyncio
+async def test_resequencer_releases_contiguous_run_immediately() -> None:
+    """Ожидаемый номер выпускает себя и накопленных преемников без ожидания batch."""
+    proc = ResequencerProcessor(
+        correlation_key=lambda ex: ex.in_message.body["key"],
+        batch_size=100,
+        start_sequence=1,
+    )
+    ctx = AsyncMock()
+
+    e3 = _seq_ex(3)
+    await proc.process(e3, ctx)
+    assert e3.stopped is True
+    e2 = _seq_ex(2)
+    await proc.process(e2, ctx)
+    assert e2.stopped is True
+
+    e1 = _seq_ex(1)
+    await proc.process(e1, ctx)
+    assert e1.properties.get("resequenced") is True
+    assert [b["seq"] for b in e1.out_message.body] == [1, 2, 3]
+
+    e4 = _seq_ex(4)
+    await proc.process(e4, ctx)
+    assert [b["seq"] for b in e4.out_message.body] == [4]
+    assert proc.stats()["buffered"] == 0
+    assert proc.stats()["released_total"] == 4
+
+
+@pytest.mark.asyncio
+async def test_resequencer_keys_are_independent() -> None:
+    proc = ResequencerProcessor(
+        correlation_key=lambda ex: ex.in_message.body["key"], start_sequence=0,
+    )
+    ctx = AsyncMock()
+    blocked = _seq_ex(1, key="a")
+    await proc.process(blocked, ctx)
+    assert blocked.stopped is True
+
+    other = _seq_ex(0, key="b")
+    await proc.process(other, ctx)
+    assert [b["key"] for b in other.out_message.body] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_resequencer_timeout_skips_gap_into_sink() -> None:
+    """Пропуск не ждётся дольше timeout: буфер уходит в timeout_sink по порядку."""
+    from src.backend.core.clock import FakeClock
+
+    clock = FakeClock()
+    released: list[tuple[str, list[int]]] = []
+    proc = ResequencerProcessor(
+        correlation_key=lambda ex: ex.in_message.body["key"],
+        start_sequence=1,
+        timeout_seconds=5.0,
+        tick_seconds=1.0,
+        clock=clock,
+        timeout_sink=lambda key, bodies: released.append(
+            (key, [b["seq"] for b in bodies])
+        ),
+    )
+    ctx = AsyncMock()
+    for seq in (4, 3, 6):
+        await proc.process(_seq_ex(seq), ctx)
+
+    clock.advance(4.0)
+    assert await proc.flush_expired() == 0
+
+    clock.advance(2.0)
+    # Номера 1-2 потеряны: выпускаем 3-4, затем ждём 5 заново.
+    assert await proc.flush_expired() == 2
+    assert released == [("k", [3, 4])]
+
+    clock.advance(6.0)
+    assert await proc.flush_expired() == 1
+    assert released[-1] == ("k", [6])
+    assert proc.stats()["timeout_total"] == 3
+
+    stale = _seq_ex(2)
+    await proc.process(stale, ctx)
+    assert stale.properties.get("resequence_stale") is True
+    assert proc.stats()["stale_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_resequencer_timeout_without_sink_drops_explicitly() -> None:
+    """Без timeout_sink выпуск по таймауту отбрасывается, а не копится."""
+    from src.backend.core.clock import FakeClock
+
+    clock = FakeClock()
+    proc = ResequencerProcessor(
+        correlation_key=lambda ex: "k",
+        start_sequence=1,
+        timeout_seconds=1.0,
+        tick_seconds=0.5,
+        clock=clock,
+    )
+    ctx = AsyncMock()
+    await proc.process(_seq_ex(3), ctx)
+    clock.advance(2.0)
+    assert await proc.flush_expired() == 1
+    assert proc.stats()["dropped_total"] == 1
+    assert proc.stats()["buffered"] == 0
+
+    nxt = _seq_ex(4)
+    await proc.process(nxt, ctx)
+    assert [b["seq"] for b in nxt.out_message.body] == [4]
+
+
+@pytest.mark.asyncio
+async def test_resequencer_duplicate_in_buffer_released_once() -> None:
+    proc = ResequencerProcessor(
+        correlation_key=lambda ex: "k", batch_size=100, start_sequence=1
+    )
+    ctx = AsyncMock()
+    await proc.process(_seq_ex(2), ctx)
+    duplicate = _seq_ex(2)
+    await proc.process(duplicate, ctx)
+    assert duplicate.properties.get("resequence_stale") is True
+
+    first = _seq_ex(1)
+    await proc.process(first, ctx)
+    assert [b["seq"] for b in first.out_message.body] == [1, 2]
+    assert proc.stats()["stale_total"] == 1
+    assert proc.stats()["buffered"] == 0
+
+
+@pytest.mark.asyncio
+async def test_resequencer_eviction_releases_buffer_to_sink() -> None:
+    """Вытесненный ключ отдаёт буфер в sink, а не теряет его."""
+    evicted: list[tuple[str, list[Any]]] = []
+    proc = ResequencerProcessor(
+        correlation_key=lambda ex: ex.in_message.body["key"],
+        start_sequence=0,
+        max_keys=1,
+        timeout_sink=lambda key, bodies: evicted.append((key, bodies)),
+    )
+    ctx = AsyncMock()
+    await proc.process(_seq_ex(2, key="a"), ctx)
+    await proc.process(_seq_ex(5, key="b"), ctx)
+
+    assert [(k, [b["seq"] for b in bodies]) for k, bodies in evicted] == [("a", [2])]
+    assert proc.stats()["keys"] == 1
+    assert proc.stats()["evicted_total"] == 1
@@ -13,8 +13,11 @@ from src.backend.dsl.engine.processors.rpa.documents import (
     PdfReadProcessor,
     WordReadProcessor,
     WordWriteProcessor,
+    _merge_pdfs,
 )
 
+_DOCUMENTS = "src.backend.dsl.engine.processors.rpa.documents"
+
 
 def _allow(processor: object) -> None:
     """Обойти fail-closed ``BaseProcessor.auth_check`` для unit-тестов.
@@ -50,26 +53,40 @@ class TestPdfMergeProcessor:
 
     @pytest.mark.asyncio
     async def test_process_merges_pdfs(self) -> None:
-        # S164 W1: mock both PdfWriter and PdfReader (pypdf integration).
+        # Склейка уходит в CPU process pool с shared memory для входов.
         processor = PdfMergeProcessor()
         _allow(processor)
         exchange = MagicMock(spec=Exchange)
         exchange.in_message = MagicMock()
-        exchange.in_message.body = [b"%PDF-1.4 a", b"%PDF-1.4 b"]
+        exchange.in_message.body = [b"%PDF-1.4 a", "not-a-pdf", b"%PDF-1.4 b"]
         exchange.set_property = MagicMock()
 
-        with patch("pypdf.PdfWriter") as mock_writer_cls, \
-             patch("pypdf.PdfReader") as mock_reader_cls:
-            mock_writer = MagicMock()
-            mock_writer_cls.return_value = mock_writer
-            mock_writer.write.return_value = None
-            mock_reader = MagicMock()
-            mock_reader.pages = []
-            mock_reader_cls.return_value = mock_reader
+        run = AsyncMock(return_value=b"%PDF merged")
+        with patch(f"{_DOCUMENTS}.run_cpu_bound", run):
             await processor.process(exchange, MagicMock())
 
+        run.assert_awaited_once_with(
+            _merge_pdfs,
+            [b"%PDF-1.4 a", b"%PDF-1.4 b"],
+            use_process_pool=True,
+            share_memory=True,
+        )
+        exchange.set_out.assert_called_once()
+        assert exchange.set_out.call_args.kwargs["body"] == b"%PDF merged"
         exchange.set_property.assert_called()
 
+    def test_merge_pdfs_accepts_views(self) -> None:
+        # S164 W1: mock both PdfWriter and PdfReader (pypdf integration).
+        with patch("pypdf.PdfWriter") as mock_writer_cls, \
+             patch("pypdf.PdfReader") as mock_reader_cls:
+            mock_writer = mock_writer_cls.return_value
+            mock_reader_cls.return_value.pages = ["p1", "p2"]
+            _merge_pdfs([b"%PDF-1.4 a", memoryview(b"%PDF-1.4 b")])
+
+        assert mock_reader_cls.call_count == 2
+        assert mock_writer.add_page.call_count == 4
+        mock_writer.write.assert_called_once()
+
 
 class TestWordReadProcessor:
     """Tests for WordReadProcessor."""
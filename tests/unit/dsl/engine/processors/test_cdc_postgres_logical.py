@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
@@ -12,6 +15,7 @@ from src.backend.core.config.features import feature_flags
 from src.backend.infrastructure.sources.cdc_postgres_logical import (
     CdcCursorStore,
     CdcPostgresLogicalSource,
+    LsnCheckpointer,
 )
 
 
@@ -29,6 +33,11 @@ def test_validates_required_args() -> None:
         CdcPostgresLogicalSource("s1", "orders", dsn="")
 
 
+def test_full_mode_requires_cursor_store() -> None:
+    with pytest.raises(ValueError, match="cursor_store"):
+        CdcPostgresLogicalSource("s1", "orders", dsn="postgres://x", mode="full")
+
+
 def test_default_slot_and_publication() -> None:
     src = CdcPostgresLogicalSource("s1", "orders", dsn="postgres://x")
     assert src.slot_name == "cdc_orders"
@@ -90,10 +99,181 @@ async def test_full_mode_emits_snapshot_marker(monkeypatch: pytest.MonkeyPatch)
     async def on_event(event):  # type: ignore[no-untyped-def]
         received.append(event)
 
-    src = CdcPostgresLogicalSource("s1", "orders", dsn="postgres://x", mode="full")
+    store = AsyncMock(spec=CdcCursorStore)
+    store.get_last_lsn.return_value = None
+    src = CdcPostgresLogicalSource(
+        "s1", "orders", dsn="postgres://x", mode="full", cursor_store=store
+    )
     # Stub _inner.start, чтобы не подключаться к настоящему PG.
     monkeypatch.setattr(
         "src.backend.infrastructure.sources.cdc.CDCSource.start", AsyncMock(),
     )
     await src.start(on_event)
     assert any(e.payload.get("event") == "snapshot_started" for e in received)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_flushes_by_event_count() -> None:
+    store = AsyncMock(spec=CdcCursorStore)
+    confirmed: list[int] = []
+
+    async def confirm(lsn: int) -> None:
+        confirmed.append(lsn)
+
+    checkpointer = LsnCheckpointer(
+        "slot1", store=store, batch_size=3, flush_interval=60, clock=_Clock()
+    )
+    checkpointer.bind(confirm)
+    for lsn in range(1, 8):
+        await checkpointer.ack(lsn)
+
+    assert confirmed == [3, 6]
+    assert [c.args for c in store.set_last_lsn.await_args_list] == [
+        ("slot1", "0/3"),
+        ("slot1", "0/6"),
+    ]
+    assert checkpointer.pending == 1
+    assert await checkpointer.flush() == 7
+    assert checkpointer.confirmed_lsn == 7
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_stores_pg_lsn_text_for_any_ack_form() -> None:
+    store = AsyncMock(spec=CdcCursorStore)
+    confirm = AsyncMock()
+    checkpointer = LsnCheckpointer("slot1", store=store, batch_size=1)
+    checkpointer.bind(confirm)
+    await checkpointer.ack("1/16D5E40")
+    await checkpointer.ack((1 << 32) + 0x16D5E41)
+
+    assert [c.args for c in store.set_last_lsn.await_args_list] == [
+        ("slot1", "1/16D5E40"),
+        ("slot1", "1/16D5E41"),
+    ]
+    assert [c.args for c in confirm.await_args_list] == [
+        ((1 << 32) + 0x16D5E40,),
+        ((1 << 32) + 0x16D5E41,),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_flushes_by_elapsed_time() -> None:
+    clock = _Clock()
+    store = AsyncMock(spec=CdcCursorStore)
+    checkpointer = LsnCheckpointer(
+        "slot1", store=store, batch_size=1000, flush_interval=1.0, clock=clock
+    )
+    await checkpointer.ack(10)
+    clock.now = 0.5
+    await checkpointer.ack(11)
+    store.set_last_lsn.assert_not_awaited()
+    clock.now = 1.0
+    await checkpointer.ack(12)
+    store.set_last_lsn.assert_awaited_once_with("slot1", "0/C")
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_ticker_flushes_idle_tail() -> None:
+    store = AsyncMock(spec=CdcCursorStore)
+    checkpointer = LsnCheckpointer(
+        "slot1", store=store, batch_size=1000, flush_interval=0.01
+    )
+    checkpointer.start()
+    await checkpointer.ack(5)
+    await asyncio.sleep(0.05)
+    store.set_last_lsn.assert_awaited_once_with("slot1", "0/5")
+    await checkpointer.aclose()
+    assert checkpointer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_cursor_write_failure_still_advances_slot() -> None:
+    store = AsyncMock(spec=CdcCursorStore)
+    store.set_last_lsn.side_effect = RuntimeError("db down")
+    confirm = AsyncMock()
+    checkpointer = LsnCheckpointer("slot1", store=store, batch_size=1)
+    checkpointer.bind(confirm)
+    await checkpointer.ack(42)
+    confirm.assert_awaited_once_with(42)
+
+
+@pytest.mark.asyncio
+async def test_replication_loop_sends_feedback_per_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``CDCSource`` подтверждает LSN слоту batch'ами, а не на каждое событие."""
+    from src.backend.infrastructure.sources.cdc import CDCSource
+
+    feedback: list[int] = []
+
+    class _Msg:
+        def __init__(self, lsn: int) -> None:
+            self.data_start = lsn
+            self.wal_end = lsn
+            self.payload = b"{}"
+
+    class _Cursor:
+        async def start_replication(self, **kwargs: object) -> None:
+            return None
+
+        async def send_feedback(self, *, flush_lsn: int) -> None:
+            feedback.append(flush_lsn)
+
+        async def close(self) -> None:
+            return None
+
+        async def __aiter__(self):  # type: ignore[no-untyped-def]
+            for lsn in range(1, 11):
+                yield _Msg(lsn)
+
+    class _Conn:
+        async def execute(self, *args: object) -> None:
+            return None
+
+        def cursor(self) -> _Cursor:
+            return _Cursor()
+
+        async def __aenter__(self) -> _Conn:
+            return self
+
+        async def __aexit__(self, *exc: object) -> None:
+            return None
+
+    class _AsyncConnection:
+        @staticmethod
+        async def connect(*args: object, **kwargs: object) -> _Conn:
+            return _Conn()
+
+    monkeypatch.setitem(
+        sys.modules, "psycopg", SimpleNamespace(AsyncConnection=_AsyncConnection)
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "psycopg.replication",
+        SimpleNamespace(LogicalReplicationConnection=object),
+    )
+    store = AsyncMock(spec=CdcCursorStore)
+    checkpointer = LsnCheckpointer(
+        "slot1", store=store, batch_size=4, flush_interval=60
+    )
+    received = []
+
+    async def on_event(event):  # type: ignore[no-untyped-def]
+        received.append(event.payload["lsn"])
+
+    source = CDCSource(
+        "s1", dsn="postgres://x", slot_name="slot1", checkpointer=checkpointer
+    )
+    await source._run(on_event)
+
+    assert len(received) == 10
+    assert feedback == [4, 8, 10]
+    assert store.set_last_lsn.await_count == 3
@@ -0,0 +1,282 @@
+"""Unit-тесты KeyedWindowProcessor и pane-агрегатов.
+
+Покрывает:
+
+* PaneAggregate: add/merge/result, distinct-скетч, msgpack round-trip;
+* tumbling / sliding keyed окна с event time и watermark-срабатыванием;
+* allowed_lateness и выведенный из потока watermark (max_out_of_orderness);
+* SpillingKeyedStateStore: вытеснение холодных ключей в SQLite без
+  потери агрегатов;
+* BatchAggregatorProcessor: sliding и session окна.
+"""
+
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.backend.core.clock import FakeClock
+from src.backend.core.types.window_state import (
+    PaneAggregate,
+    decode_panes,
+    encode_panes,
+)
+from src.backend.dsl.engine.exchange import Exchange, Message
+from src.backend.dsl.engine.processors.eip.aggregation import BatchAggregatorProcessor
+from src.backend.dsl.engine.processors.streaming import KeyedWindowProcessor
+from src.backend.infrastructure.streaming_state import (
+    MemoryKeyedStateStore,
+    SpillingKeyedStateStore,
+)
+
+
+def _ex(
+    body: Any, *, event_time: float, watermark: float | None = None
+) -> Exchange[Any]:
+    return Exchange(
+        in_message=Message(
+            body=body,
+            headers={"x-event-time": str(event_time)},
+            watermark=watermark,
+        )
+    )
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = []
+        self.calls = 0
+
+    def __call__(self, batch: list[dict[str, Any]]) -> None:
+        self.calls += 1
+        self.rows.extend(batch)
+
+
+class TestPaneAggregate:
+    def test_add_and_merge(self) -> None:
+        left = PaneAggregate()
+        for v in (1.0, 5.0):
+            left.add(v)
+        right = PaneAggregate()
+        right.add(-2.0)
+        left.merge(right)
+        assert left.result(("sum", "count", "min", "max", "avg")) == {
+            "sum": 4.0,
+            "count": 3,
+            "min": -2.0,
+            "max": 5.0,
+            "avg": pytest.approx(4.0 / 3),
+        }
+
+    def test_empty_result(self) -> None:
+        assert PaneAggregate().result(("min", "avg", "count")) == {
+            "min": None,
+            "avg": None,
+            "count": 0,
+        }
+
+    def test_distinct_sketch_estimate(self) -> None:
+        pane = PaneAggregate()
+        for i in range(2000):
+            pane.add(1.0, distinct_item=f"user-{i % 500}")
+        estimate = pane.result(("distinct",))["distinct"]
+        assert 450 <= estimate <= 550
+
+    def test_wire_round_trip(self) -> None:
+        pane = PaneAggregate()
+        pane.add(3.0, distinct_item="a")
+        restored = decode_panes(encode_panes({7: pane}))
+        assert restored[7].result(("sum", "distinct")) == pane.result(
+            ("sum", "distinct")
+        )
+
+
+class TestKeyedWindowProcessor:
+    @pytest.mark.asyncio
+    async def test_tumbling_fires_on_watermark(self) -> None:
+        sink = _Sink()
+        proc = KeyedWindowProcessor(
+            sink=sink,
+            key_path="user",
+            value_path="amount",
+            window_seconds=10.0,
+            aggregates=("sum", "count", "max"),
+        )
+        await proc.process(_ex({"user": "a", "amount": 2}, event_time=1.0), None)  # type: ignore[arg-type]
+        await proc.process(_ex({"user": "b", "amount": 5}, event_time=3.0), None)  # type: ignore[arg-type]
+        await proc.process(_ex({"user": "a", "amount": 4}, event_time=9.0), None)  # type: ignore[arg-type]
+        assert sink.rows == []
+
+        # Watermark 10 закрывает окно [0, 10).
+        await proc.process(
+            _ex({"user": "a", "amount": 1}, event_time=12.0, watermark=10.0), None  # type: ignore[arg-type]
+        )
+        by_key = {row["key"]: row for row in sink.rows}
+        assert by_key["a"] == {
+            "key": "a",
+            "window_start": 0.0,
+            "window_end": 10.0,
+            "sum": 6.0,
+            "count": 2,
+            "max": 4.0,
+        }
+        assert by_key["b"]["sum"] == 5.0
+        # Закрытые pane вычищены: в store остался только ключ "a" с pane [10, 20).
+        assert await proc.state_store.due(10**9) == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_sliding_window_merges_panes(self) -> None:
+        sink = _Sink()
+        proc = KeyedWindowProcessor(
+            sink=sink,
+            key_path="k",
+            window_seconds=10.0,
+            slide_seconds=5.0,
+            aggregates=("count",),
+        )
+        for t in (1.0, 6.0, 11.0):
+            await proc.process(_ex({"k": "x"}, event_time=t), None)  # type: ignore[arg-type]
+        await proc.flush()
+        windows = [(r["window_start"], r["window_end"], r["count"]) for r in sink.rows]
+        assert windows == [
+            (-5.0, 5.0, 1),
+            (0.0, 10.0, 2),
+            (5.0, 15.0, 2),
+            (10.0, 20.0, 1),
+        ]
+        assert await proc.state_store.min_timer() is None
+
+    @pytest.mark.asyncio
+    async def test_late_event_dropped_and_lateness_delays_firing(self) -> None:
+        sink = _Sink()
+        proc = KeyedWindowProcessor(
+            sink=sink,
+            key_path="k",
+            window_seconds=10.0,
+            allowed_lateness_seconds=5.0,
+        )
+        await proc.process(_ex({"k": "x"}, event_time=2.0), None)  # type: ignore[arg-type]
+        await proc.process(_ex({"k": "x"}, event_time=11.0, watermark=12.0), None)  # type: ignore[arg-type]
+        # 10 + 5 > 12 — окно ещё ждёт опоздавших.
+        assert sink.rows == []
+        await proc.process(_ex({"k": "x"}, event_time=8.0), None)  # type: ignore[arg-type]
+        await proc.process(_ex({"k": "x"}, event_time=16.0, watermark=15.0), None)  # type: ignore[arg-type]
+        assert [r["count"] for r in sink.rows] == [2]
+
+        late = _ex({"k": "x"}, event_time=1.0)
+        await proc.process(late, None)  # type: ignore[arg-type]
+        assert late.properties.get("_late_dropped") is True
+        assert proc.stats()["late_events_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_derived_watermark_from_event_time(self) -> None:
+        sink = _Sink()
+        proc = KeyedWindowProcessor(
+            sink=sink,
+            key_fn=lambda body: body["k"],
+            window_seconds=10.0,
+            max_out_of_orderness_seconds=2.0,
+            clock=FakeClock(wall_start=100.0),
+        )
+        await proc.process(_ex({"k": 1}, event_time=5.0), None)  # type: ignore[arg-type]
+        await proc.process(_ex({"k": 1}, event_time=11.0), None)  # type: ignore[arg-type]
+        assert sink.rows == []
+        await proc.process(_ex({"k": 1}, event_time=12.5), None)  # type: ignore[arg-type]
+        assert [(r["key"], r["count"]) for r in sink.rows] == [("1", 1)]
+
+    @pytest.mark.asyncio
+    async def test_emit_batch_size_splits_sink_calls(self) -> None:
+        sink = _Sink()
+        proc = KeyedWindowProcessor(
+            sink=sink, key_path="k", window_seconds=10.0, emit_batch_size=2
+        )
+        for key in "abcde":
+            await proc.process(_ex({"k": key}, event_time=1.0), None)  # type: ignore[arg-type]
+        await proc.flush()
+        assert len(sink.rows) == 5
+        assert sink.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_spilling_store_keeps_cold_keys(self, tmp_path: Path) -> None:
+        sink = _Sink()
+        store = SpillingKeyedStateStore(
+            tmp_path / "state.db", max_hot_keys=4, spill_batch=2
+        )
+        proc = KeyedWindowProcessor(
+            sink=sink,
+            key_path="k",
+            value_path="v",
+            window_seconds=10.0,
+            state_store=store,
+        )
+        for i in range(20):
+            await proc.process(_ex({"k": f"key-{i % 10}", "v": i}, event_time=1.0), None)  # type: ignore[arg-type]
+        stats = store.stats()
+        assert stats["hot_keys"] <= 4
+        assert stats["spilled_total"] > 0
+
+        await proc.process(_ex({"k": "key-0", "v": 0}, event_time=20.0, watermark=10.0), None)  # type: ignore[arg-type]
+        sums = {row["key"]: row["sum"] for row in sink.rows}
+        assert sums == {f"key-{i}": float(i + i + 10) for i in range(10)}
+        # Срабатывание окна читает холодные ключи на месте, не поднимая в RAM:
+        # поднят только key-0 событием (event_time=20).
+        after = store.stats()
+        assert after["promoted_total"] - stats["promoted_total"] <= 1
+        assert after["hot_keys"] <= 4
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_store_timer_index(self) -> None:
+        store = MemoryKeyedStateStore()
+        for index in range(5):
+            await store.put(f"k{index}", {}, timer=index)
+        await store.put("k0", {}, timer=10)
+        await store.put("k0", {}, timer=10)
+        await store.put("k1", {}, timer=1)
+        await store.delete("k2")
+
+        assert sorted(await store.due(4)) == ["k1", "k3"]
+        assert sorted(await store.due(4)) == ["k1", "k3"]
+        assert await store.min_timer() == 1
+        await store.delete("k1")
+        await store.delete("k3")
+        await store.delete("k4")
+        assert await store.min_timer() == 10
+        assert await store.due(11) == ["k0"]
+
+    def test_invalid_configuration(self) -> None:
+        with pytest.raises(ValueError, match="кратен"):
+            KeyedWindowProcessor(
+                sink=_Sink(), key_path="k", window_seconds=10.0, slide_seconds=3.0
+            )
+        with pytest.raises(ValueError, match="distinct_path"):
+            KeyedWindowProcessor(
+                sink=_Sink(), key_path="k", aggregates=("distinct",)
+            )
+        with pytest.raises(ValueError, match="key_path"):
+            KeyedWindowProcessor(sink=_Sink())
+
+
+class TestBatchAggregatorWindows:
+    def _events(self, *seconds: int) -> list[dict[str, Any]]:
+        return [
+            {"key": "a", "value": 1, "ts": datetime(2026, 1, 1, 12, 0, s, tzinfo=UTC)}
+            for s in seconds
+        ]
+
+    def test_sliding_counts_each_event_in_overlapping_windows(self) -> None:
+        proc = BatchAggregatorProcessor(
+            window_type="sliding", window_size_seconds=20.0, slide_seconds=10.0
+        )
+        windows = proc.aggregate(self._events(5, 15), key="key", value="value")
+        assert [w["count"] for w in windows] == [1, 2, 1]
+
+    def test_session_splits_on_gap(self) -> None:
+        proc = BatchAggregatorProcessor(window_type="session", window_size_seconds=5.0)
+        windows = proc.aggregate(self._events(0, 3, 20, 22), key="key", value="value")
+        assert [w["count"] for w in windows] == [2, 2]
+        assert windows[0]["window_end"] == datetime(2026, 1, 1, 12, 0, 8, tzinfo=UTC)
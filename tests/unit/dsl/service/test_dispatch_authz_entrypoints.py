@@ -57,6 +57,12 @@ def _make_pipeline(route_id: str, security: tuple[str, ...] | None) -> Pipeline:
     return pipeline
 
 
+async def _stream(*chunks: bytes) -> Any:
+    """Имитация ``Request.stream()`` для SOAP-handler'а."""
+    for chunk in chunks:
+        yield chunk
+
+
 def _ok_exchange(body: Any = None) -> Exchange[Any]:
     """Создаёт ``Exchange`` со статусом COMPLETED."""
     exchange = Exchange(
@@ -275,7 +281,7 @@ class TestSoapHandlerAuthContextPropagation:
         mock_request = MagicMock(spec=Request)
         mock_request.headers = {"SOAPAction": "adminOp"}
         mock_request.state.auth = auth
-        mock_request.body = AsyncMock(return_value=self._SOAP_XML)
+        mock_request.stream = lambda: _stream(self._SOAP_XML)
 
         captured_context: dict[str, Any] = {}
 
@@ -325,7 +331,7 @@ class TestSoapHandlerAuthContextPropagation:
         mock_request = MagicMock(spec=Request)
         mock_request.headers = {"SOAPAction": "adminOp"}
         mock_request.state.auth = None
-        mock_request.body = AsyncMock(return_value=self._SOAP_XML)
+        mock_request.stream = lambda: _stream(self._SOAP_XML)
 
         pipeline = _make_pipeline("soap.adminOp", security=("role:admin",))
         route_registry.register(pipeline)
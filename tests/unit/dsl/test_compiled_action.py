@@ -0,0 +1,161 @@
+"""Unit-тесты скомпилированных thunk'ов и ``ActionHandlerRegistry.dispatch_raw``."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+from src.backend.dsl.commands.action_registry import (
+    ActionHandlerRegistry,
+    ActionHandlerSpec,
+)
+from src.backend.dsl.commands.compiled_action import compile_action
+from src.backend.schemas.invocation import ActionCommandSchema
+
+
+class _Kind(Enum):
+    RETAIL = "retail"
+    CORPORATE = "corporate"
+
+
+class _OrderPayload(BaseModel):
+    order_id: int = Field(ge=1)
+    kind: _Kind = _Kind.RETAIL
+    tags: list[str] = Field(default_factory=list)
+    note: str | None = None
+
+
+class _ValidatedPayload(BaseModel):
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def _upper(cls, value: str) -> str:
+        return value.upper()
+
+
+class _AliasedPayload(BaseModel):
+    order_id: int = Field(alias="orderId")
+
+
+class _ForbidPayload(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+
+
+@dataclass(slots=True)
+class _EchoService:
+    async def run(self, **kwargs: Any) -> dict[str, Any]:
+        return dict(kwargs)
+
+
+def _registry(model: type[BaseModel] | None) -> ActionHandlerRegistry:
+    registry = ActionHandlerRegistry()
+    registry.register(
+        action="orders.get",
+        service_getter=_EchoService,
+        service_method="run",
+        payload_model=model,
+    )
+    return registry
+
+
+def _spec(model: type[BaseModel] | None) -> ActionHandlerSpec:
+    return ActionHandlerSpec(
+        action="orders.get",
+        service_getter=_EchoService,
+        service_method="run",
+        payload_model=model,
+    )
+
+
+class TestCompileAction:
+    def test_plain_model_gets_msgspec_struct(self) -> None:
+        assert compile_action(_spec(_OrderPayload)).struct is not None
+
+    @pytest.mark.parametrize(
+        "model", [_ValidatedPayload, _AliasedPayload], ids=["validator", "alias"]
+    )
+    def test_pydantic_only_models_fall_back(self, model: type[BaseModel]) -> None:
+        assert compile_action(_spec(model)).struct is None
+
+    def test_raw_kwargs_match_python_path(self) -> None:
+        compiled = compile_action(_spec(_OrderPayload))
+        body = b'{"order_id": 7, "kind": "corporate", "tags": ["a"]}'
+
+        assert compiled.kwargs_from_json(body) == compiled.kwargs_from_python(
+            {"order_id": 7, "kind": "corporate", "tags": ["a"]}
+        )
+        assert compiled.kwargs_from_json(body)["kind"] is _Kind.CORPORATE
+
+    def test_lax_coercion_preserved(self) -> None:
+        compiled = compile_action(_spec(_OrderPayload))
+        assert compiled.kwargs_from_json(b'{"order_id": "5"}')["order_id"] == 5
+
+    def test_constraint_violation_raises_pydantic_error(self) -> None:
+        compiled = compile_action(_spec(_OrderPayload))
+        with pytest.raises(ValidationError):
+            compiled.kwargs_from_json(b'{"order_id": 0}')
+
+    @pytest.mark.parametrize("body", [b'{"order_id": ', b"[1, 2]", b"not json"])
+    def test_malformed_json_raises_pydantic_error(self, body: bytes) -> None:
+        compiled = compile_action(_spec(_OrderPayload))
+        with pytest.raises(ValidationError):
+            compiled.kwargs_from_json(body)
+
+    def test_fallback_model_runs_validators_and_aliases(self) -> None:
+        assert compile_action(_spec(_ValidatedPayload)).kwargs_from_json(
+            b'{"name": "abc"}'
+        ) == {"name": "ABC"}
+        assert compile_action(_spec(_AliasedPayload)).kwargs_from_json(
+            b'{"orderId": 3}'
+        ) == {"order_id": 3}
+
+    def test_extra_forbid_respected(self) -> None:
+        compiled = compile_action(_spec(_ForbidPayload))
+        assert compiled.struct is not None
+        with pytest.raises(ValidationError):
+            compiled.kwargs_from_json(b'{"name": "a", "other": 1}')
+
+
+class TestDispatchRaw:
+    async def test_dispatch_raw_drops_none_fields(self) -> None:
+        registry = _registry(_OrderPayload)
+        result = await registry.dispatch_raw("orders.get", b'{"order_id": 2}')
+        assert result == {"order_id": 2, "kind": _Kind.RETAIL, "tags": []}
+
+    async def test_empty_body_validated_like_empty_dict(self) -> None:
+        registry = _registry(_OrderPayload)
+        with pytest.raises(ValidationError):
+            await registry.dispatch_raw("orders.get", b"")
+
+    async def test_without_model_requires_json_object(self) -> None:
+        registry = _registry(None)
+        assert await registry.dispatch_raw("orders.get", b'{"a": 1}') == {"a": 1}
+        with pytest.raises(ValueError, match="JSON-объектом"):
+            await registry.dispatch_raw("orders.get", b"[1]")
+
+    async def test_unknown_action_raises_key_error(self) -> None:
+        with pytest.raises(KeyError):
+            await ActionHandlerRegistry().dispatch_raw("missing", b"{}")
+
+    async def test_reregistration_recompiles_thunk(self) -> None:
+        registry = _registry(_OrderPayload)
+        first = registry.compiled("orders.get")
+        assert registry.compiled("orders.get") is first
+
+        registry.register(
+            action="orders.get",
+            service_getter=_EchoService,
+            service_method="run",
+            payload_model=_ValidatedPayload,
+        )
+        command = ActionCommandSchema(action="orders.get", payload={"name": "x"})
+
+        assert registry.compiled("orders.get") is not first
+        assert await registry.dispatch(command) == {"name": "X"}
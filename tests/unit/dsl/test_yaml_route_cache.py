@@ -0,0 +1,148 @@
+"""Unit-тесты CompiledRouteCache (content-hash кэш resolved DSL-spec'ов)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.backend.dsl.commands.registry import RouteRegistry
+from src.backend.dsl.yaml_loader import CompiledRouteCache, load_all_from_directory
+from src.backend.dsl.yaml_watcher import DSLYamlWatcher
+
+_SHARED = """
+route_id: shared.route
+steps:
+  - audit: {action: shared.start}
+"""
+
+_MAIN = """
+route_id: main.route
+include:
+  - ./fragments/shared.yaml
+steps:
+  - audit: {action: main.step}
+"""
+
+
+@pytest.fixture
+def composition_enabled() -> Iterator[None]:
+    with patch(
+        "src.backend.dsl.yaml_loader._is_route_composition_include_enabled",
+        return_value=True,
+    ):
+        yield
+
+
+@pytest.fixture
+def routes(tmp_path: Path) -> Path:
+    root = tmp_path / "routes"
+    (root / "fragments").mkdir(parents=True)
+    (root / "fragments" / "shared.yaml").write_text(_SHARED, encoding="utf-8")
+    (root / "main.yaml").write_text(_MAIN, encoding="utf-8")
+    return root
+
+
+def _simple_route(index: int) -> str:
+    return f"route_id: r{index}\nsteps:\n  - audit: {{action: step{index}}}\n"
+
+
+class TestCompiledRouteCache:
+    def test_second_process_hits_disk_cache(
+        self, tmp_path: Path, routes: Path, composition_enabled: None
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        first = CompiledRouteCache(cache_dir)
+        pipeline = first.load_pipeline(routes / "main.yaml")
+        assert len(list(pipeline.processors)) == 2
+        assert first.stats()["misses"] == 1
+        assert len(list(cache_dir.glob("*.msgpack"))) == 1
+
+        second = CompiledRouteCache(cache_dir)
+        cached = second.load_pipeline(routes / "main.yaml")
+        assert second.stats()["hits"] == 1
+        assert cached.route_id == "main.route"
+        assert len(list(cached.processors)) == 2
+
+    def test_include_change_invalidates_entry(
+        self, tmp_path: Path, routes: Path, composition_enabled: None
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        CompiledRouteCache(cache_dir).load_pipeline(routes / "main.yaml")
+        (routes / "fragments" / "shared.yaml").write_text(
+            _SHARED + "  - audit: {action: shared.extra}\n", encoding="utf-8"
+        )
+
+        cache = CompiledRouteCache(cache_dir)
+        pipeline = cache.load_pipeline(routes / "main.yaml")
+        assert cache.stats()["hits"] == 0
+        assert len(list(pipeline.processors)) == 3
+
+    def test_dependents_tracks_includes(
+        self, routes: Path, composition_enabled: None
+    ) -> None:
+        cache = CompiledRouteCache(None)
+        cache.load_pipeline(routes / "main.yaml")
+        fragment = routes / "fragments" / "shared.yaml"
+        assert cache.dependents(fragment) == {(routes / "main.yaml").resolve()}
+        cache.forget(routes / "main.yaml")
+        assert cache.dependents(fragment) == set()
+
+    def test_failed_build_is_not_cached(self, tmp_path: Path) -> None:
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("route_id: bad\nsteps:\n  - no_such_step: {}\n")
+        cache_dir = tmp_path / "cache"
+        outcomes = CompiledRouteCache(cache_dir).load_pipelines([bad])
+        assert isinstance(outcomes[0][1], Exception)
+        assert not list(cache_dir.glob("*.msgpack"))
+
+    def test_parallel_load_keeps_order_and_prunes(self, tmp_path: Path) -> None:
+        routes = tmp_path / "routes"
+        routes.mkdir()
+        for index in range(20):
+            (routes / f"r{index:02d}.yaml").write_text(_simple_route(index))
+        (routes / "broken.yaml").write_text("route_id: [unclosed\n")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "stale.msgpack").write_bytes(b"\x00")
+
+        cache = CompiledRouteCache(cache_dir, max_workers=4)
+        files = sorted(routes.glob("*.yaml"))
+        outcomes = cache.load_pipelines(files)
+        assert [path for path, _ in outcomes] == files
+        assert isinstance(dict(outcomes)[routes / "broken.yaml"], Exception)
+        assert cache.prune() == 1
+        assert len(list(cache_dir.glob("*.msgpack"))) == 20
+
+    def test_load_all_from_directory_uses_cache(self, tmp_path: Path) -> None:
+        for index in range(3):
+            (tmp_path / f"r{index}.yaml").write_text(_simple_route(index))
+        cache = CompiledRouteCache(tmp_path / ".cache")
+        pipelines = load_all_from_directory(tmp_path, cache=cache)
+        assert [p.route_id for p in pipelines] == ["r0", "r1", "r2"]
+        assert cache.stats()["misses"] == 3
+
+
+class TestWatcherWithRouteCache:
+    def test_fragment_change_reloads_dependent_route(
+        self, tmp_path: Path, routes: Path, composition_enabled: None
+    ) -> None:
+        registry = RouteRegistry()
+        watcher = DSLYamlWatcher(
+            routes_dir=routes,
+            route_registry=registry,
+            route_cache=CompiledRouteCache(tmp_path / "cache"),
+        )
+        watcher._initial_load()
+        assert "main.route" in registry.list_routes()
+
+        fragment = routes / "fragments" / "shared.yaml"
+        fragment.write_text(
+            _SHARED + "  - audit: {action: shared.extra}\n", encoding="utf-8"
+        )
+        watcher._sync_reload_incremental({(2, str(fragment))})
+
+        main = watcher._pipeline_cache[routes / "main.yaml"]
+        assert len(list(main.processors)) == 3
@@ -0,0 +1,162 @@
+"""Тесты ActionLoader: склейка, дедупликация и batch-dispatch read-полей."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.backend.core.interfaces.action_dispatcher import ActionMetadata
+from src.backend.entrypoints.graphql import action_loader
+from src.backend.entrypoints.graphql.action_loader import (
+    ActionLoader,
+    register_batch_handler,
+)
+from src.backend.entrypoints.graphql.auto_schema import build_auto_strawberry_schema
+
+
+@pytest.fixture(autouse=True)
+def _clean_batch_handlers() -> Any:
+    yield
+    action_loader._batch_handlers.clear()
+
+
+def _patch_dispatch(dispatch: AsyncMock) -> Any:
+    return patch.dict(
+        sys.modules,
+        {"src.backend.entrypoints.base": SimpleNamespace(dispatch_action=dispatch)},
+    )
+
+
+def _recorder() -> tuple[list[tuple[str, dict]], Any]:
+    calls: list[tuple[str, dict]] = []
+
+    async def dispatch(action: str, payload: dict) -> Any:
+        calls.append((action, payload))
+        await asyncio.sleep(0)
+        return {"id": payload.get("id")}
+
+    return calls, dispatch
+
+
+class TestActionLoader:
+    async def test_same_tick_duplicates_dispatched_once(self) -> None:
+        calls, dispatch = _recorder()
+        loader = ActionLoader(dispatch=dispatch)
+
+        results = await asyncio.gather(
+            loader.load("orders.get", {"id": 1, "x": [1, 2]}),
+            loader.load("orders.get", {"x": [1, 2], "id": 1}),
+            loader.load("orders.get", {"id": 2}),
+        )
+
+        assert results == [{"id": 1}, {"id": 1}, {"id": 2}]
+        assert sorted(p["id"] for _, p in calls) == [1, 2]
+
+    async def test_repeat_in_request_served_from_memo(self) -> None:
+        calls, dispatch = _recorder()
+        loader = ActionLoader(dispatch=dispatch)
+
+        await loader.load("orders.get", {"id": 1})
+        await loader.load("orders.get", {"id": 1})
+
+        assert len(calls) == 1
+
+    async def test_batch_handler_gets_unique_payloads_in_chunks(self) -> None:
+        handler = AsyncMock(side_effect=lambda batch: [p["id"] * 10 for p in batch])
+        register_batch_handler("orders.get", handler)
+        loader = ActionLoader(max_batch_size=2)
+
+        results = await asyncio.gather(
+            *(loader.load("orders.get", {"id": i % 3}) for i in range(6))
+        )
+
+        assert results == [0, 10, 20, 0, 10, 20]
+        assert [len(c.args[0]) for c in handler.await_args_list] == [2, 1]
+
+    async def test_errors_propagate_to_every_waiter(self) -> None:
+        loader = ActionLoader(dispatch=AsyncMock(side_effect=RuntimeError("boom")))
+
+        results = await asyncio.gather(
+            loader.load("orders.get", {"id": 1}),
+            loader.load("orders.get", {"id": 1}),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_batch_handler_length_mismatch_fails_chunk(self) -> None:
+        register_batch_handler("orders.get", AsyncMock(return_value=[1]))
+        loader = ActionLoader()
+
+        with pytest.raises(ValueError, match="batch handler"):
+            await asyncio.gather(
+                loader.load("orders.get", {"id": 1}),
+                loader.load("orders.get", {"id": 2}),
+            )
+
+
+class TestAutoSchemaCoalescing:
+    _QUERY = """
+        query {
+          a: ordersGet(payload: {id: 1})
+          b: ordersGet(payload: {id: 1})
+          c: ordersGet(payload: {id: 2})
+        }
+    """
+
+    def _schema(self) -> Any:
+        return build_auto_strawberry_schema(
+            [
+                ActionMetadata(
+                    action="orders.get", side_effect="read", transports=("graphql",)
+                ),
+                ActionMetadata(
+                    action="orders.touch", side_effect="write", transports=("graphql",)
+                ),
+            ]
+        ).schema
+
+    async def test_aliased_read_fields_share_dispatch(self) -> None:
+        calls, dispatch = _recorder()
+        context = {"action_loader": ActionLoader(dispatch=dispatch)}
+        result = await self._schema().execute(self._QUERY, context_value=context)
+
+        assert result.errors is None
+        assert result.data["a"] == result.data["b"]
+        assert result.data["a"]["data"] == {"id": 1}
+        assert result.data["c"]["data"] == {"id": 2}
+        assert len(calls) == 2
+
+    async def test_without_loader_dispatches_each_field(self) -> None:
+        dispatch = AsyncMock(return_value={"ok": True})
+        with _patch_dispatch(dispatch):
+            result = await self._schema().execute(self._QUERY)
+
+        assert result.errors is None
+        assert dispatch.await_count == 3
+
+    async def test_mutations_never_coalesced(self) -> None:
+        calls, loader_dispatch = _recorder()
+        dispatch = AsyncMock(return_value={"ok": True})
+        with _patch_dispatch(dispatch):
+            result = await self._schema().execute(
+                "mutation { a: ordersTouch(payload: {id: 1})"
+                " b: ordersTouch(payload: {id: 1}) }",
+                context_value={"action_loader": ActionLoader(dispatch=loader_dispatch)},
+            )
+
+        assert result.errors is None
+        assert dispatch.await_count == 2
+        assert calls == []
+
+    def test_context_getter_builds_fresh_loader(self) -> None:
+        from src.backend.entrypoints.graphql.auto_schema import _graphql_context
+
+        first, second = _graphql_context(), _graphql_context()
+        assert isinstance(first["action_loader"], ActionLoader)
+        assert first["action_loader"] is not second["action_loader"]
@@ -16,6 +16,7 @@ test_grpc_server.py.
 
 from __future__ import annotations
 
+import asyncio
 import sys
 import types
 from typing import Any
@@ -166,6 +167,34 @@ class _MockStorage:
         }
 
 
+class _StreamingStorage(_MockStorage):
+    """Storage с ``read_stream`` / ``write_stream``: файл хранится чанками."""
+
+    def __init__(self, stored_chunk: int = 40 * 1024) -> None:
+        super().__init__()
+        self.stored_chunk = stored_chunk
+        self.produced = 0
+        self.received: list[bytes] = []
+
+    async def read_stream(
+        self, meta: dict[str, Any], *, offset: int = 0, chunk_size: int,
+    ) -> Any:
+        data = meta["data"]
+        for start in range(offset, len(data), self.stored_chunk):
+            self.produced += 1
+            yield data[start : start + self.stored_chunk]
+
+    async def write_stream(
+        self, file_id: int, filename: str, stream: Any, object_uuid: str,
+    ) -> None:
+        received = []
+        async for chunk in stream:
+            received.append(chunk)
+        # Commit только после полного приёма (как tmp + rename / multipart).
+        self.received = received
+        await self.write(file_id, filename, b"".join(received), object_uuid)
+
+
 # --------------------------------------------------------------------------- #
 # Helper
 # --------------------------------------------------------------------------- #
@@ -193,6 +222,7 @@ class TestFileStreamConfig:
     def test_custom(self) -> None:
         cfg = FileStreamConfig(chunk_size=128 * 1024, max_file_size=2**30)
         assert cfg.chunk_size == 128 * 1024
+        assert cfg.prefetch_chunks == 4
 
 
 # --------------------------------------------------------------------------- #
@@ -373,6 +403,78 @@ class TestDownloadFile:
         assert chunks[0].data == b"x" * 36 * 1024
 
 
+class TestDownloadFileStreaming:
+    @pytest.mark.asyncio
+    async def test_read_stream_chunks_pass_through(self) -> None:
+        """Чанки storage ≤ chunk_size уходят как есть, без склейки."""
+        storage = _StreamingStorage(stored_chunk=40 * 1024)
+        data = bytes(range(256)) * 400  # 100KB
+        storage.files[1] = {"filename": "a", "data": data, "object_uuid": "u"}
+        servicer = FileStreamGRPCServicer(get_storage=lambda: storage)
+
+        chunks = [c async for c in servicer.DownloadFile(_request(1), _MockContext())]
+
+        assert [len(c.data) for c in chunks] == [40 * 1024, 40 * 1024, 20 * 1024]
+        assert [c.sequence for c in chunks] == [0, 1, 2]
+        assert [c.is_last for c in chunks] == [False, False, True]
+        assert b"".join(c.data for c in chunks) == data
+        assert chunks[-1].final_fingerprint == compute_sha256(data)
+
+    @pytest.mark.asyncio
+    async def test_large_storage_buffers_resliced(self) -> None:
+        storage = _StreamingStorage(stored_chunk=150 * 1024)
+        data = b"y" * (150 * 1024)
+        storage.files[1] = {"filename": "a", "data": data, "object_uuid": "u"}
+        cfg = FileStreamConfig(chunk_size=64 * 1024)
+        servicer = FileStreamGRPCServicer(config=cfg, get_storage=lambda: storage)
+
+        chunks = [c async for c in servicer.DownloadFile(_request(1), _MockContext())]
+
+        assert [len(c.data) for c in chunks] == [64 * 1024, 64 * 1024, 22 * 1024]
+        assert all(isinstance(c.data, bytes) for c in chunks)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_is_bounded(self) -> None:
+        """Медленный клиент не заставляет storage читать файл целиком."""
+        storage = _StreamingStorage(stored_chunk=1024)
+        storage.files[1] = {
+            "filename": "big.bin",
+            "data": b"z" * (1024 * 1024),
+            "object_uuid": "u",
+        }
+        cfg = FileStreamConfig(chunk_size=1024, prefetch_chunks=2)
+        servicer = FileStreamGRPCServicer(config=cfg, get_storage=lambda: storage)
+
+        gen = servicer.DownloadFile(_request(1), _MockContext())
+        await gen.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await gen.aclose()
+
+        # очередь (2) + кусок в ожидании + кусок в руках производителя + lookahead
+        assert storage.produced <= cfg.prefetch_chunks + 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_stopped_when_client_leaves(self) -> None:
+        storage = _StreamingStorage(stored_chunk=1024)
+        storage.files[1] = {"filename": "a", "data": b"z" * 65536, "object_uuid": "u"}
+        cfg = FileStreamConfig(chunk_size=1024, prefetch_chunks=2)
+        servicer = FileStreamGRPCServicer(config=cfg, get_storage=lambda: storage)
+
+        gen = servicer.DownloadFile(_request(1), _MockContext())
+        await gen.__anext__()
+        await gen.aclose()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # all_tasks() — только незавершённые: подкачка остановлена.
+        assert not [
+            task
+            for task in asyncio.all_tasks()
+            if task.get_name() == "grpc-file-download-prefetch"
+        ]
+
+
 # --------------------------------------------------------------------------- #
 # UploadFile (client streaming)
 # --------------------------------------------------------------------------- #
@@ -467,6 +569,55 @@ class TestUploadFile:
         assert 1 not in storage.files
 
 
+class TestUploadFileStreaming:
+    @pytest.mark.asyncio
+    async def test_write_stream_receives_chunks_unbuffered(self) -> None:
+        storage = _StreamingStorage()
+        servicer = FileStreamGRPCServicer(get_storage=lambda: storage)
+        parts = [b"a" * 10, b"b" * 10, b"c" * 5]
+
+        async def request_iter() -> Any:
+            for seq, part in enumerate(parts):
+                yield _upload_req(
+                    file_id=7, filename="f.bin", data=part, seq=seq,
+                    last=seq == len(parts) - 1,
+                )
+
+        response = await servicer.UploadFile(request_iter(), _MockContext())
+
+        assert response.error == ""
+        assert response.size_bytes == 25
+        assert response.fingerprint == compute_sha256(b"".join(parts))
+        assert all(got is sent for got, sent in zip(storage.received, parts))
+        assert storage.files[7]["filename"] == "f.bin"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("storage_cls", [_MockStorage, _StreamingStorage])
+    async def test_max_size_rejected_before_stream_drained(
+        self, storage_cls: type[_MockStorage],
+    ) -> None:
+        storage = storage_cls()
+        cfg = FileStreamConfig(max_file_size=50, prefetch_chunks=0)
+        servicer = FileStreamGRPCServicer(config=cfg, get_storage=lambda: storage)
+        sent = 0
+
+        async def request_iter() -> Any:
+            nonlocal sent
+            for seq in range(100):
+                sent += 1
+                yield _upload_req(
+                    file_id=1, filename="big", data=b"x" * 10, seq=seq,
+                    last=seq == 99,
+                )
+
+        response = await servicer.UploadFile(request_iter(), _MockContext())
+
+        assert "max size" in response.error
+        assert response.file_id == 1
+        assert sent == 6
+        assert 1 not in storage.files
+
+
 def _upload_req(file_id: int, filename: str, data: bytes, seq: int, last: bool) -> Any:
     req = type("R", (), {})()
     req.file_id = file_id
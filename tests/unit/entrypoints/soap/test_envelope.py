@@ -0,0 +1,104 @@
+"""Unit-тесты потокового разбора SOAP envelope."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from xml.etree.ElementTree import ParseError
+
+import pytest
+from defusedxml.ElementTree import fromstring
+
+from src.backend.entrypoints.soap.envelope import (
+    SOAP_NS,
+    SoapEnvelopeTooLargeError,
+    parse_envelope,
+    read_envelope,
+)
+
+_ENVELOPE = (
+    f'<soap:Envelope xmlns:soap="{SOAP_NS}">'
+    "<soap:Header><auth>x</auth></soap:Header>"
+    "<soap:Body>"
+    '<ns:GetOrder xmlns:ns="urn:orders">'
+    "<ns:id>42</ns:id>"
+    "<empty/>"
+    "<mixed>head<inner>deep</inner>tail</mixed>"
+    "<batch><item>1</item><item>2</item></batch>"
+    "<id>43</id>"
+    "</ns:GetOrder>"
+    "<Ignored><x>1</x></Ignored>"
+    "</soap:Body>"
+    "</soap:Envelope>"
+).encode()
+
+
+def _tree_reference(xml_body: bytes) -> tuple[str, dict[str, Any]]:
+    """Прежняя семантика: полное дерево + ``find(Body)``."""
+    body = fromstring(xml_body).find(f"{{{SOAP_NS}}}Body")
+    operation = next(iter(body))
+    local = lambda tag: tag.split("}")[1] if "}" in tag else tag  # noqa: E731
+    return local(operation.tag), {local(c.tag): c.text for c in operation}
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+class TestParseEnvelope:
+    def test_matches_element_tree_semantics(self) -> None:
+        envelope = parse_envelope(_ENVELOPE)
+
+        assert (envelope.operation, envelope.fields) == _tree_reference(_ENVELOPE)
+        assert envelope.fields == {
+            "id": "43",
+            "empty": None,
+            "mixed": "head",
+            "batch": None,
+        }
+
+    @pytest.mark.parametrize("size", [1, 7, 4096])
+    async def test_streamed_chunks_give_same_result(self, size: int) -> None:
+        envelope = await read_envelope(_chunks(_ENVELOPE, size))
+        assert envelope == parse_envelope(_ENVELOPE)
+
+    @pytest.mark.parametrize(
+        ("xml", "message"),
+        [
+            (b"<Envelope><Body><op/></Body></Envelope>", "не найден"),
+            (f'<s:Envelope xmlns:s="{SOAP_NS}"><s:Body/></s:Envelope>', "пуст"),
+        ],
+        ids=["no-soap-body", "empty-body"],
+    )
+    def test_structure_errors(self, xml: bytes | str, message: str) -> None:
+        raw = xml.encode() if isinstance(xml, str) else xml
+        with pytest.raises(ValueError, match=message):
+            parse_envelope(raw)
+
+    async def test_size_cap_stops_stream_early(self) -> None:
+        consumed: list[bytes] = []
+
+        async def endless() -> AsyncIterator[bytes]:
+            yield f'<s:Envelope xmlns:s="{SOAP_NS}"><s:Body><op>'.encode()
+            while True:
+                chunk = b"<v>" + b"x" * 1024 + b"</v>"
+                consumed.append(chunk)
+                yield chunk
+
+        with pytest.raises(SoapEnvelopeTooLargeError):
+            await read_envelope(endless(), max_bytes=16 * 1024)
+        assert len(consumed) < 20
+
+    def test_entities_rejected(self) -> None:
+        xml = (
+            b'<!DOCTYPE r [<!ENTITY e "boom">]>'
+            b'<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">'
+            b"<s:Body><op><v>&e;</v></op></s:Body></s:Envelope>"
+        )
+        with pytest.raises(Exception, match="EntitiesForbidden|entity"):
+            parse_envelope(xml)
+
+    def test_malformed_xml_raises_parse_error(self) -> None:
+        with pytest.raises(ParseError):
+            parse_envelope(f'<s:Envelope xmlns:s="{SOAP_NS}"><s:Body>'.encode())
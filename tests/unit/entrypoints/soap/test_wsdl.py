@@ -0,0 +1,55 @@
+"""Unit-тесты кеша WSDL по версии реестра actions."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from src.backend.dsl.commands.action_registry import ActionHandlerRegistry
+from src.backend.entrypoints.soap import wsdl
+from src.backend.entrypoints.soap.wsdl import WsdlCache
+
+
+class _Service:
+    async def run(self, **kwargs: Any) -> dict[str, Any]:
+        return kwargs
+
+
+def _register(registry: ActionHandlerRegistry, action: str) -> None:
+    registry.register(action=action, service_getter=_Service, service_method="run")
+
+
+class TestWsdlCache:
+    def test_built_once_per_registry_version(self) -> None:
+        registry = ActionHandlerRegistry()
+        _register(registry, "orders.get")
+        cache = WsdlCache()
+
+        with patch.object(wsdl, "build_wsdl", wraps=wsdl.build_wsdl) as build:
+            first = cache.get(registry)
+            assert cache.get(registry)[0] is first[0]
+            assert build.call_count == 1
+
+            _register(registry, "orders.list")
+            document, etag = cache.get(registry)
+            assert build.call_count == 2
+
+        assert b'soapAction="orders.list"' in document
+        assert etag != first[1]
+
+    def test_clear_invalidates(self) -> None:
+        registry = ActionHandlerRegistry()
+        _register(registry, "orders.get")
+        cache = WsdlCache()
+        cache.get(registry)
+
+        registry.clear()
+        document, _ = cache.get(registry)
+        assert b"orders_get" not in document
+
+    def test_etag_is_content_hash(self) -> None:
+        first, second = ActionHandlerRegistry(), ActionHandlerRegistry()
+        for registry in (first, second):
+            _register(registry, "orders.get")
+
+        assert WsdlCache().get(first) == WsdlCache().get(second)
@@ -119,3 +119,68 @@ async def test_writer_start_idempotent() -> None:
     await writer.start()
     await writer.start()  # second call — no-op
     await writer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_writer_flushes_when_buffer_fills() -> None:
+    """Полный batch уходит сразу, не дожидаясь таймера; хвост — ждёт."""
+    client = _FakeClient()
+    writer = ClickHouseBulkWriter(
+        client=client, table="audit", max_buffer_size=10, flush_interval_seconds=10.0,
+    )
+    await writer.start()
+    await writer.add_many([{"id": i} for i in range(25)])
+    await asyncio.sleep(0.05)
+    assert [len(rows) for _, rows in client.calls] == [10, 10]
+    await writer.aclose()
+    assert writer.stats.rows_flushed == 25
+
+
+@pytest.mark.asyncio
+async def test_writer_keeps_bounded_batches_in_flight() -> None:
+    active = peak = 0
+
+    class _SlowClient(_FakeClient):
+        async def insert(self, table: str, rows: list[dict[str, object]]) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return await super().insert(table, rows)
+
+    client = _SlowClient()
+    writer = ClickHouseBulkWriter(
+        client=client,
+        table="audit",
+        max_buffer_size=5,
+        flush_interval_seconds=10.0,
+        max_inflight=3,
+    )
+    await writer.start()
+    await writer.add_many([{"id": i} for i in range(50)])
+    await writer.aclose()
+
+    assert peak == 3
+    assert writer.stats.rows_flushed == 50
+
+
+@pytest.mark.asyncio
+async def test_writer_prefers_columnar_insert() -> None:
+    class _ColumnarClient(_FakeClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.columnar: list[int] = []
+
+        async def insert_columnar(
+            self, table: str, rows: list[dict[str, object]]
+        ) -> int:
+            self.columnar.append(len(rows))
+            return len(rows)
+
+    client = _ColumnarClient()
+    writer = ClickHouseBulkWriter(client=client, table="audit")
+    await writer.add({"id": 1})
+    assert await writer.flush_now() == 1
+    assert client.columnar == [1]
+    assert client.calls == []
@@ -19,6 +19,7 @@ import pytest
 from src.backend.infrastructure.clients.storage.clickhouse import (
     MAX_INSERT_ROWS,
     ClickHouseClient,
+    encode_columns,
 )
 
 # ── insert(): chunking + batch_size override ────────────────────────
@@ -149,6 +150,58 @@ async def test_chunking_covers_all_rows_without_duplicates() -> None:
     assert seen_ids == set(range(10))
 
 
+# ── insert_columnar(): JSONColumns + сжатие ──────────────────────────
+
+
+def test_encode_columns_fills_missing_fields_with_null() -> None:
+    import orjson
+
+    body = encode_columns([{"a": 1, "b": "x"}, {"a": 2}, {"c": True}])
+    assert orjson.loads(body) == {
+        "a": [1, 2, None],
+        "b": ["x", None, None],
+        "c": [None, None, True],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["zstd", "gzip", "none"])
+async def test_insert_columnar_compresses_body(method: str) -> None:
+    import gzip
+
+    import orjson
+    import zstandard
+
+    client = ClickHouseClient(max_batch_size=3, insert_compression=method)
+    fake_http = AsyncMock()
+    fake_http.post = AsyncMock(return_value=MagicMock(status_code=200))
+    with patch.object(client, "_ensure_client", return_value=fake_http):
+        n = await client.insert_columnar("events", [{"id": i} for i in range(5)])
+
+    assert n == 5
+    assert fake_http.post.await_count == 2
+    decompress = {
+        "zstd": zstandard.ZstdDecompressor().decompress,
+        "gzip": gzip.decompress,
+        "none": lambda data: data,
+    }[method]
+    ids: list[int] = []
+    for call in fake_http.post.await_args_list:
+        assert call.kwargs["params"]["query"] == "INSERT INTO events FORMAT JSONColumns"
+        assert call.kwargs["headers"].get("Content-Encoding") == (
+            None if method == "none" else method
+        )
+        ids += orjson.loads(decompress(call.kwargs["content"]))["id"]
+    assert ids == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_insert_columnar_fails_fast_on_oversized_batch() -> None:
+    client = ClickHouseClient()
+    with pytest.raises(ValueError, match="oversized batch"):
+        await client.insert_columnar("events", [{}] * (MAX_INSERT_ROWS + 1))
+
+
 # ── Sprint 3.6: ping() / pre-ping не должны пробрасывать httpx.HTTPError ──
 # ── когда CH down: httpx.ConnectError/ConnectTimeout НЕ являются ──
 # ── наследниками (ConnectionError, TimeoutError, OSError) stdlib'а. ──
@@ -0,0 +1,215 @@
+"""Unit-тесты :class:`SmtpSessionPool` против локального SMTP-сервера.
+
+Сервер — минимальный asyncio-stand-in (EHLO / MAIL / RCPT / DATA / RSET /
+NOOP / QUIT), считающий соединения и принятые письма.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from email.message import EmailMessage
+from typing import Any
+from unittest.mock import MagicMock
+
+import aiosmtplib
+import pytest
+
+from src.backend.infrastructure.clients.transport.smtp_pool import SmtpSessionPool
+
+
+class LocalSmtpServer:
+    """Однопоточный SMTP stand-in для тестов пула."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.messages: list[bytes] = []
+        self.writers: list[asyncio.StreamWriter] = []
+        self.port = 0
+        self.drop_after_data = False
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        for writer in self.writers:
+            writer.close()
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_all(self) -> None:
+        """Разорвать все открытые соединения (сервер «закрыл простой»)."""
+        for writer in self.writers:
+            writer.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self.writers.append(writer)
+        writer.write(b"220 localhost ESMTP stand-in\r\n")
+        try:
+            while line := await reader.readline():
+                command = line.strip().upper()
+                if command.startswith((b"EHLO", b"HELO")):
+                    writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+                elif command == b"DATA":
+                    writer.write(b"354 end with .\r\n")
+                    await writer.drain()
+                    body = bytearray()
+                    while (chunk := await reader.readline()) != b".\r\n":
+                        body += chunk
+                    self.messages.append(bytes(body))
+                    if self.drop_after_data:
+                        break
+                    writer.write(b"250 queued\r\n")
+                elif command == b"QUIT":
+                    writer.write(b"221 bye\r\n")
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(b"250 ok\r\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def smtp_server() -> AsyncIterator[LocalSmtpServer]:
+    server = LocalSmtpServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _pool(server: LocalSmtpServer, **kwargs: Any) -> SmtpSessionPool:
+    async def connect() -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname="127.0.0.1", port=server.port, start_tls=False, timeout=5
+        )
+        await client.connect()
+        return client
+
+    return SmtpSessionPool(connect, **kwargs)
+
+
+def _message(index: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "sender@test"
+    message["To"] = f"user{index}@test"
+    message["Subject"] = f"promo {index}"
+    message.set_content("body")
+    return message
+
+
+class TestSmtpSessionPool:
+    async def test_sessions_reused_and_bounded(
+        self, smtp_server: LocalSmtpServer
+    ) -> None:
+        pool = _pool(smtp_server, max_size=2)
+        await asyncio.gather(*(pool.send_message(_message(i)) for i in range(20)))
+
+        assert len(smtp_server.messages) == 20
+        assert smtp_server.connections == 2
+        assert pool.idle == 2 and pool.in_use == 0
+        await pool.aclose()
+        assert pool.idle == 0
+
+    async def test_recycled_after_max_messages(
+        self, smtp_server: LocalSmtpServer
+    ) -> None:
+        pool = _pool(smtp_server, max_size=1, max_messages=3)
+        for index in range(7):
+            await pool.send_message(_message(index))
+
+        assert smtp_server.connections == 3
+        await pool.aclose()
+
+    async def test_idle_session_recycled(self, smtp_server: LocalSmtpServer) -> None:
+        pool = _pool(smtp_server, max_size=1, max_idle=0.0)
+        await pool.send_message(_message(0))
+        await asyncio.sleep(0.01)
+        await pool.send_message(_message(1))
+
+        assert smtp_server.connections == 2
+        await pool.aclose()
+
+    async def test_dropped_session_resent_on_fresh_connection(
+        self, smtp_server: LocalSmtpServer
+    ) -> None:
+        pool = _pool(smtp_server, max_size=1)
+        await pool.send_message(_message(0))
+        smtp_server.drop_all()
+        await asyncio.sleep(0.01)
+
+        await pool.send_message(_message(1))
+        assert len(smtp_server.messages) == 2
+        assert smtp_server.connections == 2
+        await pool.aclose()
+
+    async def test_drop_after_data_not_resent(
+        self, smtp_server: LocalSmtpServer
+    ) -> None:
+        pool = _pool(smtp_server, max_size=1)
+        await pool.send_message(_message(0))
+        smtp_server.drop_after_data = True
+
+        with pytest.raises(aiosmtplib.SMTPServerDisconnected):
+            await pool.send_message(_message(1))
+        assert len(smtp_server.messages) == 2
+        assert smtp_server.connections == 1
+        assert pool.idle == 0
+        await pool.aclose()
+
+    async def test_error_inside_acquire_discards_session(
+        self, smtp_server: LocalSmtpServer
+    ) -> None:
+        pool = _pool(smtp_server, max_size=1)
+        with pytest.raises(RuntimeError):
+            async with pool.acquire() as smtp:
+                await smtp.noop()
+                raise RuntimeError("boom")
+        assert pool.idle == 0
+
+        await pool.send_message(_message(0))
+        assert smtp_server.connections == 2
+        await pool.aclose()
+
+
+class TestSmtpClientUsesPool:
+    async def test_send_email_reuses_session(
+        self, smtp_server: LocalSmtpServer
+    ) -> None:
+        from src.backend.infrastructure.clients.transport.smtp import SmtpClient
+
+        settings = MagicMock()
+        settings.host = "127.0.0.1"
+        settings.port = smtp_server.port
+        settings.use_tls = False
+        settings.validate_certs = False
+        settings.username = None
+        settings.password = None
+        settings.connect_timeout = 5
+        settings.command_timeout = 5
+        settings.connection_pool_size = 2
+        settings.circuit_breaker_max_failures = 3
+        settings.circuit_breaker_reset_timeout = 30
+
+        client = SmtpClient(settings)
+        for index in range(5):
+            await client.send_email(
+                recipient=f"user{index}@test",
+                subject="notice",
+                body="body",
+                from_address="noreply@test",
+            )
+
+        assert len(smtp_server.messages) == 5
+        assert smtp_server.connections == 1
+        assert client.metrics()["pool_capacity"] == "1/2"
+        await client.close_pool()
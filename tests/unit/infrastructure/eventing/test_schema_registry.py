@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 import sys
 from typing import Any
@@ -9,9 +10,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.backend.infrastructure.eventing import schema_registry
 from src.backend.infrastructure.eventing.schema_registry import (
     SchemaRegistry,
     SchemaRegistryError,
+    compile_json_schema,
     get_schema_registry,
 )
 
@@ -105,17 +108,87 @@ class TestSchemaRegistryValidateAvro:
         fake_record = {"id": 42}
         fake_fastavro.schemaless_reader.return_value = fake_record
 
-        fake_io = MagicMock()
-        fake_bytesio = fake_io.BytesIO.return_value
-
-        with patch.dict(sys.modules, {"fastavro": fake_fastavro, "io": fake_io}):
+        with patch.dict(sys.modules, {"fastavro": fake_fastavro}):
             result = registry.validate_avro("user", b"\x00")
+            registry.validate_avro("user", b"\x00")
 
         assert result == fake_record
+        # Схема разбирается один раз на subject, reader — на каждое сообщение.
         fake_fastavro.parse_schema.assert_called_once()
-        fake_fastavro.schemaless_reader.assert_called_once_with(
-            fake_bytesio, parsed_schema,
+        assert fake_fastavro.schemaless_reader.call_count == 2
+        assert fake_fastavro.schemaless_reader.call_args.args[1] is parsed_schema
+
+
+@pytest.mark.unit
+class TestSchemaRegistryCompiledValidators:
+    _SCHEMA: dict[str, Any] = {
+        "type": "object",
+        "required": ["id"],
+        "properties": {"id": {"type": "integer"}},
+    }
+
+    def test_json_validator_compiled_once_per_subject(self) -> None:
+        registry = SchemaRegistry()
+        registry.register_json("test", self._SCHEMA)
+        with patch.object(
+            schema_registry, "compile_json_schema", wraps=compile_json_schema
+        ) as compile_spy:
+            for index in range(5):
+                registry.validate_json("test", {"id": index})
+        assert compile_spy.call_count == 1
+
+    def test_reregister_replaces_compiled_validator(self) -> None:
+        registry = SchemaRegistry()
+        registry.register_json("test", self._SCHEMA)
+        with pytest.raises(SchemaRegistryError):
+            registry.validate_json("test", {"id": "x"})
+
+        registry.register_json("test", {"type": "object"})
+        registry.validate_json("test", {"id": "x"})
+
+    def test_invalid_schema_raises_registry_error(self) -> None:
+        registry = SchemaRegistry()
+        registry.register_json("bad", {"type": "no-such-type"})
+        with pytest.raises(SchemaRegistryError, match="bad"):
+            registry.validate_json("bad", {})
+
+    def test_validate_json_many_reports_per_payload(self) -> None:
+        registry = SchemaRegistry()
+        registry.register_json("test", self._SCHEMA)
+        errors = registry.validate_json_many(
+            "test", [{"id": 1}, {"id": "x"}, {}, {"id": 2}]
         )
+        assert errors[0] is None and errors[3] is None
+        assert "'x' is not of type 'integer'" in errors[1]  # type: ignore[operator]
+        assert "'id' is a required property" in errors[2]  # type: ignore[operator]
+
+    def test_validate_json_many_schema_not_found(self) -> None:
+        with pytest.raises(SchemaRegistryError, match="JSON schema not found"):
+            SchemaRegistry().validate_json_many("missing", [{}])
+
+    def test_decode_avro_many_roundtrip(self) -> None:
+        fastavro = pytest.importorskip("fastavro")
+        schema = {
+            "type": "record",
+            "name": "User",
+            "fields": [{"name": "id", "type": "long"}],
+        }
+        parsed = fastavro.parse_schema(schema)
+        payloads = []
+        for index in range(3):
+            buffer = io.BytesIO()
+            fastavro.schemaless_writer(buffer, parsed, {"id": index})
+            payloads.append(buffer.getvalue())
+
+        registry = SchemaRegistry()
+        registry.register_avro("user", json.dumps(schema))
+        assert registry.decode_avro_many("user", payloads) == [
+            {"id": 0},
+            {"id": 1},
+            {"id": 2},
+        ]
+        with pytest.raises(SchemaRegistryError, match=r"user\[1\]"):
+            registry.decode_avro_many("user", [payloads[0], b""])
 
 
 @pytest.mark.unit
@@ -430,3 +430,21 @@ async def test_try_start_default_idempotent_via_global_scheduler() -> None:
     assert lifecycle_mod.default_scheduler is not None
     # Идемпотентность: тот же объект scheduler, не новый инстанс.
     assert lifecycle_mod.default_scheduler.is_running is True
+
+
+@pytest.mark.asyncio
+async def test_loop_alternates_full_and_incremental_verify() -> None:
+    """``full_verify_every=3`` → полный проход на итерациях 1, 4; между ними incremental."""
+    store = AsyncMock()
+    store.verify = AsyncMock(return_value=_make_ok_verify_result())
+    scheduler = AuditVerifyScheduler(
+        store=store, interval_hours=0.001 / 3600.0, full_verify_every=3
+    )
+    await scheduler.start()
+    deadline = asyncio.get_event_loop().time() + 2.0
+    while store.verify.await_count < 4 and asyncio.get_event_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+    await scheduler.stop()
+
+    kwargs = [call.kwargs for call in store.verify.await_args_list[:4]]
+    assert kwargs == [{}, {"incremental": True}, {"incremental": True}, {}]
@@ -0,0 +1,210 @@
+"""Unit-тесты group commit'а и incremental verify :class:`ImmutableAuditStore`.
+
+Postgres заменён in-memory fake-сессией, понимающей ровно те SQL, что
+шлёт store (advisory lock, последний hash, multi-row INSERT, страничный
+SELECT). Покрытие:
+* конкурентные ``append`` объединяются в batch'и — один lock и один
+  INSERT на batch, цепочка валидна, каждый caller получает свой hash;
+* ошибка записи отдаётся всем участникам batch'а, очередь живёт дальше;
+* ``verify(incremental=True)`` проверяет только события после checkpoint'а;
+* постраничный verify эквивалентен полному.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from src.backend.infrastructure.observability import immutable_audit
+from src.backend.infrastructure.observability.immutable_audit import ImmutableAuditStore
+
+_COLUMNS = (
+    "seq",
+    "actor",
+    "action",
+    "resource",
+    "outcome",
+    "metadata",
+    "tenant_id",
+    "correlation_id",
+    "prev_hash",
+    "event_hash",
+    "occurred_at",
+)
+
+
+class _Result:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def first(self) -> tuple[Any, ...] | None:
+        return self._rows[0] if self._rows else None
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+class _FakeDb:
+    """In-memory ``audit_log_immutable`` + счётчики транзакций."""
+
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = []
+        self.locks = 0
+        self.inserts = 0
+        self.fail_next_insert = False
+
+    def session(self) -> _FakeSession:
+        return _FakeSession(self)
+
+
+class _FakeSession:
+    def __init__(self, db: _FakeDb) -> None:
+        self._db = db
+
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def commit(self) -> None:
+        await asyncio.sleep(0)
+
+    async def execute(self, stmt: Any, params: dict[str, Any] | None = None) -> _Result:
+        sql = str(stmt)
+        params = params or {}
+        rows = self._db.rows
+        if "pg_advisory_xact_lock" in sql:
+            self._db.locks += 1
+            return _Result([])
+        if sql.startswith("INSERT"):
+            if self._db.fail_next_insert:
+                self._db.fail_next_insert = False
+                raise RuntimeError("db down")
+            self._db.inserts += 1
+            for index in range(len(params) // 10):
+                row = {col: params[f"{col}_{index}"] for col in _COLUMNS[1:]}
+                row["metadata"] = json.loads(row["metadata"])
+                row["seq"] = len(rows) + 1
+                rows.append(row)
+            return _Result([])
+        if "ORDER BY seq DESC" in sql:
+            return _Result([(rows[-1]["event_hash"],)] if rows else [])
+        if "WHERE seq = :s" in sql:
+            found = [r for r in rows if r["seq"] == params["s"]]
+            return _Result([(found[0]["event_hash"],)] if found else [])
+        selected = [
+            tuple(r[col] for col in _COLUMNS)
+            for r in rows
+            if r["seq"] >= params["from_seq"]
+            and ("to_seq" not in params or r["seq"] <= params["to_seq"])
+        ]
+        return _Result(selected[: params["limit"]])
+
+
+def _store(db: _FakeDb, **kwargs: Any) -> ImmutableAuditStore:
+    return ImmutableAuditStore(db.session, secret_key=b"test-key", **kwargs)
+
+
+async def _append(store: ImmutableAuditStore, index: int) -> str:
+    return await store.append(
+        actor=f"user_{index}",
+        action="orders.update",
+        resource=f"order:{index}",
+        outcome="success",
+        metadata={"n": index},
+    )
+
+
+class TestGroupCommit:
+    async def test_concurrent_appends_share_transactions(self) -> None:
+        db = _FakeDb()
+        store = _store(db, max_batch=16)
+        hashes = await asyncio.gather(*(_append(store, i) for i in range(50)))
+        assert db.locks == db.inserts == 4
+        assert [r["event_hash"] for r in db.rows] == hashes
+        assert [r["actor"] for r in db.rows] == [f"user_{i}" for i in range(50)]
+        assert (await store.verify()).valid
+
+    async def test_max_batch_one_writes_one_event_per_transaction(self) -> None:
+        db = _FakeDb()
+        store = _store(db, max_batch=1)
+        await asyncio.gather(*(_append(store, i) for i in range(5)))
+        assert db.inserts == 5
+        assert (await store.verify()).total_checked == 5
+
+    async def test_failed_batch_is_reported_to_every_caller(self) -> None:
+        db = _FakeDb()
+        store = _store(db)
+        db.fail_next_insert = True
+        results = await asyncio.gather(
+            *(_append(store, i) for i in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert db.rows == []
+        await _append(store, 99)
+        assert len(db.rows) == 1
+        assert (await store.verify()).valid
+
+    def test_invalid_max_batch(self) -> None:
+        with pytest.raises(ValueError):
+            _store(_FakeDb(), max_batch=0)
+
+
+class TestIncrementalVerify:
+    async def test_incremental_checks_only_new_events(self) -> None:
+        db = _FakeDb()
+        store = _store(db)
+        await asyncio.gather(*(_append(store, i) for i in range(10)))
+        assert (await store.verify()).total_checked == 10
+        assert store.checkpoint == (10, db.rows[-1]["event_hash"])
+
+        await asyncio.gather(*(_append(store, i) for i in range(10, 13)))
+        result = await store.verify(incremental=True)
+        assert result.valid
+        assert result.total_checked == 3
+        assert store.checkpoint is not None and store.checkpoint[0] == 13
+        assert (await store.verify(incremental=True)).total_checked == 0
+
+    async def test_incremental_detects_tampering_after_checkpoint(self) -> None:
+        db = _FakeDb()
+        store = _store(db)
+        await asyncio.gather(*(_append(store, i) for i in range(5)))
+        await store.verify()
+        await asyncio.gather(*(_append(store, i) for i in range(5, 8)))
+        db.rows[6]["outcome"] = "denied"
+        result = await store.verify(incremental=True)
+        assert not result.valid
+        assert result.first_broken_seq == 7
+        assert store.checkpoint is not None and store.checkpoint[0] == 5
+
+    async def test_full_verify_still_sees_old_tampering(self) -> None:
+        db = _FakeDb()
+        store = _store(db)
+        await asyncio.gather(*(_append(store, i) for i in range(5)))
+        await store.verify()
+        db.rows[1]["actor"] = "mallory"
+        assert (await store.verify(incremental=True)).valid
+        assert (await store.verify()).first_broken_seq == 2
+
+    async def test_range_verify_does_not_move_checkpoint(self) -> None:
+        db = _FakeDb()
+        store = _store(db)
+        await asyncio.gather(*(_append(store, i) for i in range(5)))
+        assert (await store.verify(from_seq=3)).total_checked == 3
+        assert store.checkpoint is None
+
+
+async def test_paged_verify_matches_full_walk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(immutable_audit, "_VERIFY_PAGE_SIZE", 3)
+    db = _FakeDb()
+    store = _store(db)
+    await asyncio.gather(*(_append(store, i) for i in range(10)))
+    assert (await store.verify()).total_checked == 10
+    db.rows[7]["resource"] = "order:x"
+    assert (await store.verify()).first_broken_seq == 8
@@ -0,0 +1,241 @@
+"""Unit-тесты sorted-set очереди отложенных задач (memory + Redis store)."""
+
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from src.backend.infrastructure.scheduler.delayed_jobs import (
+    DelayedJob,
+    DelayedJobWorker,
+    MemoryDelayedJobStore,
+    RedisDelayedJobStore,
+    callable_ref,
+)
+from src.backend.infrastructure.scheduler.job_queue import JobQueue
+
+CALLS: list[Any] = []
+
+
+async def record(value: Any) -> None:
+    CALLS.append(value)
+
+
+def _job(job_id: str, run_at: float, ref: str = "noop") -> DelayedJob:
+    return DelayedJob(id=job_id, ref=ref, run_at=run_at, args=[job_id])
+
+
+async def _exercise_store(store: Any) -> None:
+    for index in range(5):
+        await store.schedule(_job(f"j{index}", run_at=100.0 + index))
+
+    assert await store.next_due() == 100.0
+    assert await store.claim_due(99.0, limit=10, lease_seconds=30) == []
+
+    assert [job.id for job in await store.peek(2)] == ["j0", "j1"]
+    first = await store.claim_due(102.0, limit=2, lease_seconds=30)
+    assert [job.id for job in first] == ["j0", "j1"]
+    assert first[0].lease is not None
+    assert first[0].attempts == 0
+    # Claimed задачи под lease — не due повторно, пока lease не истёк.
+    second = await store.claim_due(102.0, limit=10, lease_seconds=30)
+    assert [job.id for job in second] == ["j2"]
+
+    assert await store.ack(first[0]) is True
+    assert await store.ack(first[0]) is False
+    assert await store.reschedule(first[1], 200.0) is True
+
+    # Lease j2 (до 132.0) истёк — задача снова due; старый lease невалиден.
+    reclaimed = await store.claim_due(140.0, limit=10, lease_seconds=30)
+    assert [job.id for job in reclaimed] == ["j3", "j4", "j2"]
+    assert [job.attempts for job in reclaimed] == [0, 0, 1]
+    assert await store.ack(second[0]) is False
+    assert await store.ack(reclaimed[2]) is True
+
+    assert await store.cancel("j3") is True
+    assert await store.cancel("j3") is False
+    assert await store.size() == 2
+    assert await store.ack(reclaimed[1]) is True
+    (retried,) = await store.claim_due(200.0, limit=10, lease_seconds=30)
+    assert retried.id == "j1"
+    assert retried.run_at == 200.0
+    assert retried.attempts == 1
+
+    await store.schedule(_job("j1", run_at=300.0))
+    (replaced,) = await store.claim_due(300.0, limit=10, lease_seconds=30)
+    assert replaced.attempts == 0
+
+
+async def test_memory_store_claim_lease_and_ack() -> None:
+    await _exercise_store(MemoryDelayedJobStore())
+
+
+async def test_redis_store_claim_lease_and_ack() -> None:
+    pytest.importorskip("lupa", reason="fakeredis выполняет Lua только с lupa")
+    fakeredis = pytest.importorskip("fakeredis")
+
+    class _Client:
+        def __init__(self) -> None:
+            self.conn = fakeredis.FakeAsyncRedis()
+
+        async def execute(self, kind: str, op: Any) -> Any:
+            return await op(self.conn)
+
+    await _exercise_store(RedisDelayedJobStore(redis_client=_Client()))
+
+
+async def test_worker_runs_due_jobs_and_acks() -> None:
+    store = MemoryDelayedJobStore()
+    seen: list[str] = []
+
+    async def handler(value: str) -> None:
+        seen.append(value)
+
+    worker = DelayedJobWorker(store, handlers={"noop": handler}, batch_size=10)
+    for index in range(3):
+        await store.schedule(_job(f"j{index}", run_at=1.0))
+    await store.schedule(_job("later", run_at=1e12))
+
+    assert await worker.run_once(now=10.0) == 3
+    assert sorted(seen) == ["j0", "j1", "j2"]
+    assert await store.size() == 1
+
+
+async def test_worker_retries_with_backoff_then_gives_up() -> None:
+    store = MemoryDelayedJobStore()
+    attempts: list[int] = []
+
+    def flaky(value: str) -> None:
+        attempts.append(1)
+        raise RuntimeError("boom")
+
+    worker = DelayedJobWorker(
+        store, handlers={"noop": flaky}, max_attempts=3, retry_base=2.0
+    )
+    await store.schedule(_job("j", run_at=0.0))
+
+    assert await worker.run_once(now=1e12) == 1
+    (pending,) = await store.peek(1)
+    assert pending.attempts == 1
+    assert pending.run_at > time.time() + 1
+
+    await worker.run_once(now=1e12)
+    await worker.run_once(now=1e12)
+    assert len(attempts) == 3
+    assert await store.size() == 0
+
+
+async def test_expired_leases_count_toward_max_attempts() -> None:
+    store = MemoryDelayedJobStore()
+    runs: list[str] = []
+
+    async def handler(value: str) -> None:
+        runs.append(value)
+
+    worker = DelayedJobWorker(store, handlers={"noop": handler}, max_attempts=2)
+    await store.schedule(_job("poison", run_at=0.0))
+    # Два worker'а «умерли» под lease, не подтвердив задачу.
+    await store.claim_due(1.0, limit=1, lease_seconds=1)
+    await store.claim_due(3.0, limit=1, lease_seconds=1)
+
+    assert await worker.run_once(now=5.0) == 1
+    assert runs == []
+    assert await store.size() == 0
+
+
+class _Scheduler:
+    """APScheduler stand-in без cron-задач."""
+
+    def get_jobs(self) -> list[Any]:
+        return []
+
+    def remove_job(self, job_id: str) -> None:
+        raise KeyError(job_id)
+
+
+def _queue(store: MemoryDelayedJobStore) -> JobQueue:
+    queue = JobQueue(store=store)
+    queue._scheduler = _Scheduler()
+    return queue
+
+
+async def test_job_queue_schedules_by_import_ref() -> None:
+    CALLS.clear()
+    store = MemoryDelayedJobStore()
+    queue = _queue(store)
+    job_id = await queue.schedule(record, args=("hello",), delay=0)
+
+    (job,) = await store.peek(1)
+    assert job.ref == callable_ref(record)
+    assert await queue.worker.run_once(now=1e12) == 1  # type: ignore[union-attr]
+    assert CALLS == ["hello"]
+    assert await queue.cancel_scheduled(job_id) is False
+
+
+async def test_schedule_lists_and_cancels_store_jobs() -> None:
+    store = MemoryDelayedJobStore()
+    queue = _queue(store)
+    job_id = await queue.schedule(record, args=("x",), delay=60)
+
+    (listed,) = await queue.list_scheduled()
+    assert listed["id"] == job_id
+    assert listed["name"] == callable_ref(record)
+    assert listed["trigger"] == "delayed"
+    assert queue.list_jobs() == []
+
+    assert await queue.cancel_scheduled(job_id) is True
+    assert await store.size() == 0
+    assert await queue.list_scheduled() == []
+
+
+async def test_sync_enqueue_in_loop_writes_in_background() -> None:
+    store = MemoryDelayedJobStore()
+    queue = _queue(store)
+    job_id = queue.enqueue(record, args=("x",), delay=60)
+    await asyncio.sleep(0)
+    (job,) = await store.peek(1)
+    assert job.id == job_id
+
+
+def test_sync_api_without_loop_writes_and_cancels() -> None:
+    store = MemoryDelayedJobStore()
+    queue = _queue(store)
+    job_id = queue.enqueue(record, args=("x",), delay=60)
+    assert asyncio.run(store.size()) == 1
+    assert queue.cancel(job_id) is True
+    assert asyncio.run(store.size()) == 0
+
+
+def test_enqueue_surfaces_invalid_jobs_to_caller() -> None:
+    store = MemoryDelayedJobStore()
+    queue = _queue(store)
+    with pytest.raises(ValueError, match="уровня модуля"):
+        queue.enqueue(lambda: None)
+    with pytest.raises(TypeError):
+        queue.enqueue(record, args=(object(),))
+    assert asyncio.run(store.size()) == 0
+
+
+def test_redis_backend_falls_back_when_redis_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.backend.core.config.settings import settings
+
+    monkeypatch.setattr(settings.scheduler, "job_queue_backend", "redis")
+    monkeypatch.setattr(settings.redis, "enabled", False)
+    queue = JobQueue()
+    assert queue.worker is None
+
+
+def test_callable_ref_rejects_local_functions() -> None:
+    def local() -> None:
+        return None
+
+    with pytest.raises(ValueError, match="уровня модуля"):
+        callable_ref(local)
+    with pytest.raises(ValueError):
+        callable_ref(lambda: None)
@@ -0,0 +1,276 @@
+"""Unit-тесты O(1)-валидации APIKeyManager (key_id-индекс + кэш проверок).
+
+Redis подменяется in-memory fake'ом; Argon2 — облегчённые параметры,
+чтобы тесты не тратили по ~50ms на verify.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from src.backend.core.auth.api_key_backend import APIKeyAuth
+from src.backend.infrastructure.security import api_key_manager as module
+from src.backend.infrastructure.security.api_key_manager import APIKeyManager
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttl: dict[str, int] = {}
+        self.published: list[tuple[str, bytes]] = []
+        self.gets = 0
+        self.scans = 0
+
+    async def get(self, key: str) -> Any:
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ex: int | None = None) -> None:
+        self.data[key] = value
+        if ex is not None:
+            self.ttl[key] = ex
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def sadd(self, key: str, member: str) -> None:
+        self.data.setdefault(key, set()).add(member)
+
+    async def smembers(self, key: str) -> set[str]:
+        return set(self.data.get(key, set()))
+
+    async def expire(self, key: str, seconds: int) -> None:
+        self.ttl[key] = seconds
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [self.data.get(k) for k in keys]
+
+    async def scan_iter(self, match: str, count: int) -> Any:
+        self.scans += 1
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+    async def publish(self, channel: str, payload: bytes) -> int:
+        self.published.append((channel, payload))
+        return 1
+
+
+class _FakeRedisClient:
+    def __init__(self) -> None:
+        self._redis = _FakeConn()
+
+    async def execute(self, kind: str, operation: Any) -> Any:
+        return await operation(self._redis)
+
+    async def add_to_stream(self, stream_name: str, data: dict[str, str]) -> None:
+        return None
+
+
+@pytest.fixture
+def redis() -> Iterator[_FakeRedisClient]:
+    client = _FakeRedisClient()
+    with patch(
+        "src.backend.infrastructure.clients.storage.redis.get_redis_client",
+        return_value=client,
+    ):
+        yield client
+
+
+@pytest.fixture
+def manager(redis: _FakeRedisClient) -> APIKeyManager:
+    mgr = APIKeyManager(grace_period_seconds=3600)
+    mgr._hasher = APIKeyAuth(time_cost=1, memory_cost=1024, parallelism=1)
+    mgr._global_key_hash = mgr._hasher.hash_key("global-key")
+    # Listener pub/sub в unit-тестах не нужен.
+    mgr._listener_task = object()  # type: ignore[assignment]
+    return mgr
+
+
+@pytest.fixture
+def legacy_index() -> Iterator[None]:
+    with patch.object(
+        APIKeyManager,
+        "_legacy_index_key",
+        lambda self, raw: module._LEGACY_PREFIX + hashlib.sha256(raw.encode()).hexdigest(),
+    ):
+        yield
+
+
+class TestKeyIdLookup:
+    async def test_new_key_is_validated_without_scan(
+        self, manager: APIKeyManager, redis: _FakeRedisClient
+    ) -> None:
+        raw = await manager.create_client_key("crm")
+        key_id = module._split_key_id(raw)
+        assert key_id is not None and raw.startswith("gd_")
+        assert redis._redis.data[f"apikey_id:{key_id}"] == "crm"
+
+        info = await manager.validate_key(raw)
+        assert info is not None
+        assert info.client_id == "crm"
+        assert info.key_id == key_id
+        assert redis._redis.scans == 0
+
+    async def test_unknown_key_id_skips_scan(
+        self, manager: APIKeyManager, redis: _FakeRedisClient
+    ) -> None:
+        await manager.create_client_key("crm")
+        assert await manager.validate_key("gd_deadbeef.secret") is None
+        assert redis._redis.scans == 0
+
+    async def test_rotation_keeps_previous_key_in_grace(
+        self, manager: APIKeyManager, redis: _FakeRedisClient
+    ) -> None:
+        old = await manager.create_client_key("crm")
+        new = await manager.rotate_client_key("crm")
+        assert new is not None
+
+        prev = await manager.validate_key(old)
+        assert prev is not None and prev.description == "grace_period"
+        current = await manager.validate_key(new)
+        assert current is not None and current.version == 2
+        old_id = module._split_key_id(old)
+        assert redis._redis.ttl[f"apikey_id:{old_id}"] == 3600
+
+
+class TestVerifiedCache:
+    async def test_repeat_validation_hits_cache(
+        self, manager: APIKeyManager, redis: _FakeRedisClient
+    ) -> None:
+        raw = await manager.create_client_key("crm")
+        await manager.validate_key(raw)
+        gets = redis._redis.gets
+        with patch.object(
+            manager, "_verify_against_hash", side_effect=AssertionError("verify")
+        ):
+            assert (await manager.validate_key(raw)).client_id == "crm"  # type: ignore[union-attr]
+        assert redis._redis.gets == gets
+
+    async def test_revoke_invalidates_and_publishes(
+        self, manager: APIKeyManager, redis: _FakeRedisClient
+    ) -> None:
+        raw = await manager.create_client_key("crm")
+        assert await manager.validate_key(raw) is not None
+        assert await manager.revoke_client_key("crm")
+
+        assert await manager.validate_key(raw) is None
+        channel, payload = redis._redis.published[-1]
+        assert channel == "apikey:invalidate"
+        assert orjson.loads(payload) == {"client_id": "crm"}
+        assert not any(k.startswith("apikey_id:") for k in redis._redis.data)
+
+    async def test_remote_invalidation_drops_client_entries(
+        self, manager: APIKeyManager
+    ) -> None:
+        raw = await manager.create_client_key("crm")
+        await manager.validate_key(raw)
+        manager.invalidate_cached("crm")
+        assert manager._cache_get(manager._fingerprint(raw)) is None
+
+    async def test_cache_size_is_bounded(self, redis: _FakeRedisClient) -> None:
+        mgr = APIKeyManager(verified_cache_size=2)
+        for index in range(3):
+            info = module.APIKeyInfo(client_id=f"c{index}", key_hash="h")
+            mgr._cache_put(mgr._fingerprint(f"k{index}"), info, None)
+        assert len(mgr._verified) == 2
+        assert mgr._cache_get(mgr._fingerprint("k0")) is None
+
+
+class TestLegacyKeys:
+    async def test_legacy_key_is_indexed_after_first_scan(
+        self, manager: APIKeyManager, redis: _FakeRedisClient, legacy_index: None
+    ) -> None:
+        legacy_raw = "gd_legacyTokenWithoutKeyId"
+        redis._redis.data["apikey:old"] = orjson.dumps(
+            {
+                "client_id": "old",
+                "key_hash": hashlib.sha256(legacy_raw.encode()).hexdigest(),
+                "prev_key_hash": "",
+                "version": 1,
+                "is_active": True,
+            }
+        )
+
+        assert (await manager.validate_key(legacy_raw)).client_id == "old"  # type: ignore[union-attr]
+        assert redis._redis.scans == 1
+
+        manager.invalidate_cached()
+        assert (await manager.validate_key(legacy_raw)).client_id == "old"  # type: ignore[union-attr]
+        assert redis._redis.scans == 1
+
+    async def test_revoke_removes_legacy_index(
+        self, manager: APIKeyManager, redis: _FakeRedisClient, legacy_index: None
+    ) -> None:
+        legacy_raw = "gd_legacyTokenWithoutKeyId"
+        redis._redis.data["apikey:old"] = orjson.dumps(
+            {
+                "client_id": "old",
+                "key_hash": hashlib.sha256(legacy_raw.encode()).hexdigest(),
+                "is_active": True,
+            }
+        )
+        assert await manager.validate_key(legacy_raw) is not None
+        assert any(k.startswith("apikey_legacy:") for k in redis._redis.data)
+
+        assert await manager.revoke_client_key("old") is True
+        assert not any(k.startswith("apikey_legacy") for k in redis._redis.data)
+        assert await manager.validate_key(legacy_raw) is None
+        assert redis._redis.scans == 2
+
+    async def test_dangling_legacy_index_skips_scan(
+        self, manager: APIKeyManager, redis: _FakeRedisClient, legacy_index: None
+    ) -> None:
+        legacy_raw = "gd_legacyTokenWithoutKeyId"
+        index_key = manager._legacy_index_key(legacy_raw)
+        redis._redis.data[index_key] = "old"
+
+        assert await manager.validate_key(legacy_raw) is None
+        assert index_key not in redis._redis.data
+        assert redis._redis.scans == 0
+
+    async def test_global_key_still_accepted(self, manager: APIKeyManager) -> None:
+        info = await manager.validate_key("global-key")
+        assert info is not None and info.client_id == "global"
+
+    async def test_unknown_legacy_key_cached_as_rejected(
+        self, manager: APIKeyManager, redis: _FakeRedisClient, legacy_index: None
+    ) -> None:
+        redis._redis.data["apikey:old"] = orjson.dumps(
+            {"client_id": "old", "key_hash": "0" * 64, "is_active": True}
+        )
+
+        for _ in range(3):
+            assert await manager.validate_key("gd_garbageWithoutKeyId") is None
+        assert redis._redis.scans == 1
+
+        manager.invalidate_cached()
+        assert await manager.validate_key("gd_garbageWithoutKeyId") is None
+        assert redis._redis.scans == 2
+
+    async def test_legacy_scan_can_be_disabled(
+        self, manager: APIKeyManager, redis: _FakeRedisClient, legacy_index: None
+    ) -> None:
+        legacy_raw = "gd_legacyTokenWithoutKeyId"
+        redis._redis.data["apikey:old"] = orjson.dumps(
+            {
+                "client_id": "old",
+                "key_hash": hashlib.sha256(legacy_raw.encode()).hexdigest(),
+                "is_active": True,
+            }
+        )
+        assert await manager.validate_key(legacy_raw) is not None
+        manager.invalidate_cached()
+        manager._legacy_scan = False
+
+        # Проиндексированный ключ работает, неизвестный — без SCAN.
+        assert await manager.validate_key(legacy_raw) is not None
+        assert await manager.validate_key("gd_otherLegacyToken") is None
+        assert redis._redis.scans == 1
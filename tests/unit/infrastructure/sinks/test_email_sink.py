@@ -6,6 +6,7 @@ from __future__ import annotations
 import sys
 import types
 from email.message import EmailMessage
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -14,15 +15,43 @@ from src.backend.core.interfaces.sink import SinkKind
 from src.backend.infrastructure.sinks.email_sink import EmailSink
 
 
+class _FakeSMTP:
+    """Stub ``aiosmtplib.SMTP``: запоминает созданные сессии и письма."""
+
+    def __init__(self, registry: list[_FakeSMTP], **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.is_connected = False
+        self.connect = AsyncMock(side_effect=self._connect)
+        self.send_message = AsyncMock(return_value=({}, "OK"))
+        self.noop = AsyncMock()
+        self.quit = AsyncMock()
+        registry.append(self)
+
+    async def _connect(self) -> None:
+        self.is_connected = True
+
+    def close(self) -> None:
+        self.is_connected = False
+
+
 @pytest.fixture
 def fake_aiosmtplib(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
-    """Stub aiosmtplib with async send()."""
+    """Stub aiosmtplib with a session-recording SMTP class."""
     fake_mod = types.ModuleType("aiosmtplib")
-    fake_mod.send = AsyncMock(return_value=None)
+    fake_mod.sessions = []
+    fake_mod.SMTP = lambda **kwargs: _FakeSMTP(fake_mod.sessions, **kwargs)
     monkeypatch.setitem(sys.modules, "aiosmtplib", fake_mod)
     return fake_mod
 
 
+def _sent(fake_mod: types.ModuleType) -> list[EmailMessage]:
+    return [
+        call.args[0]
+        for session in fake_mod.sessions
+        for call in session.send_message.call_args_list
+    ]
+
+
 @pytest.mark.asyncio
 async def test_kind_is_mail() -> None:
     sink = EmailSink(sink_id="e1", host="smtp.test", from_addr="a@test")
@@ -43,9 +72,7 @@ async def test_send_dict_payload_success(fake_aiosmtplib: types.ModuleType) -> N
     assert result.ok is True
     assert result.details["to"] == "alice@test"
     assert result.details["subject"] == "Subj"
-    fake_aiosmtplib.send.assert_awaited_once()
-    call_args = fake_aiosmtplib.send.call_args
-    msg = call_args[0][0]
+    (msg,) = _sent(fake_aiosmtplib)
     assert isinstance(msg, EmailMessage)
     assert msg["To"] == "alice@test"
 
@@ -60,7 +87,7 @@ async def test_send_str_payload_success(fake_aiosmtplib: types.ModuleType) -> No
     )
     result = await sink.send("plain text")
     assert result.ok is True
-    fake_aiosmtplib.send.assert_awaited_once()
+    assert len(_sent(fake_aiosmtplib)) == 1
 
 
 @pytest.mark.asyncio
@@ -70,7 +97,7 @@ async def test_send_html_payload(fake_aiosmtplib: types.ModuleType) -> None:
     )
     result = await sink.send({"body": "<b>hi</b>", "html": True})
     assert result.ok is True
-    msg = fake_aiosmtplib.send.call_args[0][0]
+    (msg,) = _sent(fake_aiosmtplib)
     assert msg.is_multipart()
     html_part = next(p for p in msg.iter_parts() if p.get_content_type() == "text/html")
     assert html_part is not None
@@ -84,7 +111,7 @@ async def test_send_cc_and_bcc(fake_aiosmtplib: types.ModuleType) -> None:
     )
     result = await sink.send({"cc": ["c1@test", "c2@test"], "bcc": "bc@test"})
     assert result.ok is True
-    msg = fake_aiosmtplib.send.call_args[0][0]
+    (msg,) = _sent(fake_aiosmtplib)
     assert msg["Cc"] == "c1@test, c2@test"
     assert msg["Bcc"] == "bc@test"
 
@@ -130,7 +157,12 @@ async def test_send_returns_false_when_aiosmtplib_missing(
 
 @pytest.mark.asyncio
 async def test_send_handles_smtp_exception(fake_aiosmtplib: types.ModuleType) -> None:
-    fake_aiosmtplib.send = AsyncMock(side_effect=ConnectionRefusedError(" refused"))
+    def refuse(**kwargs: Any) -> _FakeSMTP:
+        session = _FakeSMTP(fake_aiosmtplib.sessions, **kwargs)
+        session.connect = AsyncMock(side_effect=ConnectionRefusedError(" refused"))
+        return session
+
+    fake_aiosmtplib.SMTP = refuse
     sink = EmailSink(
         sink_id="e9", host="smtp.test", from_addr="f@test", default_to="t@test",
     )
@@ -139,6 +171,45 @@ async def test_send_handles_smtp_exception(fake_aiosmtplib: types.ModuleType) ->
     assert "refused" in result.details["error"]
 
 
+@pytest.mark.asyncio
+async def test_sessions_reused_across_sends(fake_aiosmtplib: types.ModuleType) -> None:
+    sink = EmailSink(
+        sink_id="e13",
+        host="smtp.test",
+        from_addr="f@test",
+        default_to="t@test",
+        username="user",
+        password="secret",
+    )
+    for index in range(5):
+        assert (await sink.send(f"body {index}")).ok is True
+
+    (session,) = fake_aiosmtplib.sessions
+    assert session.kwargs["username"] == "user"
+    assert session.kwargs["start_tls"] is True
+    assert session.send_message.await_count == 5
+
+    await sink.aclose()
+    session.quit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_session_replaced(fake_aiosmtplib: types.ModuleType) -> None:
+    sink = EmailSink(
+        sink_id="e14", host="smtp.test", from_addr="f@test", default_to="t@test",
+    )
+    assert (await sink.send("first")).ok is True
+    broken = fake_aiosmtplib.sessions[0]
+    broken.send_message.side_effect = RuntimeError("421 service closing")
+
+    result = await sink.send("second")
+    assert result.ok is False
+    assert broken.is_connected is False
+
+    assert (await sink.send("third")).ok is True
+    assert len(fake_aiosmtplib.sessions) == 2
+
+
 @pytest.mark.asyncio
 async def test_health_true_when_connect_ok(monkeypatch: pytest.MonkeyPatch) -> None:
     fake_mod = types.ModuleType("aiosmtplib")
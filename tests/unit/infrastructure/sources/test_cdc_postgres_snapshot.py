@@ -0,0 +1,219 @@
+"""Unit-тесты initial snapshot'а ``CdcPostgresLogicalSource`` (mode=full)."""
+
+
+from __future__ import annotations
+
+import re
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.backend.core.config.features import feature_flags
+from src.backend.infrastructure.sources.cdc_postgres_logical import (
+    CdcCursorStore,
+    CdcPostgresLogicalSource,
+)
+from src.backend.infrastructure.sources.cdc_postgres_snapshot import PgTableSnapshot
+
+_SNAPSHOT = "00000003-00000002-1"
+
+
+class _FakeConn:
+    """asyncpg-подобное соединение поверх списка строк с PK ``id``."""
+
+    def __init__(self, db: _FakeDb) -> None:
+        self._db = db
+        self.statements: list[str] = []
+
+    async def execute(self, sql: str) -> None:
+        self.statements.append(sql)
+
+    async def fetchrow(self, sql: str, *args: Any) -> dict[str, Any]:
+        ids = [row["id"] for row in self._db.rows]
+        return {"lo": min(ids, default=None), "hi": max(ids, default=None)}
+
+    async def fetch(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        if "pg_index" in sql:
+            return [{"attname": name} for name in self._db.pk]
+        lo, hi = args
+        limit = int(re.search(r"LIMIT (\d+)", sql).group(1))  # type: ignore[union-attr]
+        strict = '"id" > $1' in sql
+        rows = [
+            row
+            for row in self._db.rows
+            if (row["id"] > lo if strict else row["id"] >= lo) and row["id"] <= hi
+        ]
+        self._db.queries += 1
+        return sorted(rows, key=lambda row: row["id"])[:limit]
+
+    async def close(self) -> None:
+        self._db.closed += 1
+
+
+class _FakeDb:
+    def __init__(self, count: int, pk: tuple[str, ...] = ("id",)) -> None:
+        self.rows = [{"id": i, "name": f"n{i}"} for i in range(1, count + 1)]
+        self.pk = pk
+        self.conns: list[_FakeConn] = []
+        self.queries = 0
+        self.closed = 0
+
+    async def connect(self) -> _FakeConn:
+        conn = _FakeConn(self)
+        self.conns.append(conn)
+        return conn
+
+
+async def _collect(reader: PgTableSnapshot) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+
+    async def emit(rows: list[dict[str, Any]]) -> None:
+        out.extend(rows)
+
+    assert await reader.run(_SNAPSHOT, emit) == len(out)
+    return out
+
+
+@pytest.mark.asyncio
+async def test_parallel_ranges_read_every_row_once_in_one_snapshot() -> None:
+    db = _FakeDb(1003)
+    reader = PgTableSnapshot("orders", connect=db.connect, workers=3, chunk_rows=50)
+    rows = await _collect(reader)
+
+    assert sorted(row["id"] for row in rows) == list(range(1, 1004))
+    # 1 соединение на планирование + по одному на worker.
+    assert len(db.conns) == 4
+    assert db.closed == 4
+    for conn in db.conns:
+        assert conn.statements[:2] == [
+            "BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY",
+            f"SET TRANSACTION SNAPSHOT '{_SNAPSHOT}'",
+        ]
+        assert conn.statements[-1] == "COMMIT"
+
+
+@pytest.mark.asyncio
+async def test_empty_table_yields_nothing() -> None:
+    db = _FakeDb(0)
+    assert await _collect(PgTableSnapshot("orders", connect=db.connect)) == []
+
+
+@pytest.mark.asyncio
+async def test_composite_primary_key_requires_key_column() -> None:
+    db = _FakeDb(10, pk=("a", "b"))
+    with pytest.raises(ValueError, match="key_column"):
+        await _collect(PgTableSnapshot("orders", connect=db.connect))
+    rows = await _collect(
+        PgTableSnapshot("orders", connect=db.connect, key_column="id")
+    )
+    assert len(rows) == 10
+
+
+@pytest.mark.asyncio
+async def test_rejects_unsafe_snapshot_name() -> None:
+    db = _FakeDb(1)
+    reader = PgTableSnapshot("orders", connect=db.connect)
+    with pytest.raises(ValueError, match="snapshot name"):
+        await reader.run("x'; DROP TABLE orders; --", AsyncMock())
+
+
+def _source(db: _FakeDb, store: Any) -> CdcPostgresLogicalSource:
+    @asynccontextmanager
+    async def exporter():  # type: ignore[no-untyped-def]
+        yield _SNAPSHOT, "0/16D5E40"
+
+    return CdcPostgresLogicalSource(
+        "s1",
+        "orders",
+        dsn="postgres://x",
+        mode="full",
+        cursor_store=store,
+        snapshot_workers=2,
+        snapshot_chunk_rows=7,
+        snapshot_connect=db.connect,
+        snapshot_exporter=exporter,
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_mode_streams_snapshot_then_hands_over_to_slot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(feature_flags, "cdc_postgres_enabled", True)
+    inner_start = AsyncMock()
+    monkeypatch.setattr(
+        "src.backend.infrastructure.sources.cdc.CDCSource.start", inner_start
+    )
+    store = AsyncMock(spec=CdcCursorStore)
+    store.get_last_lsn.return_value = None
+    db = _FakeDb(40)
+    events: list[dict[str, Any]] = []
+
+    async def on_event(event):  # type: ignore[no-untyped-def]
+        events.append(event.payload)
+
+    source = _source(db, store)
+    await source.start(on_event)
+    assert source._bootstrap is not None
+    await source._bootstrap
+
+    assert events[0]["event"] == "snapshot_started"
+    assert sorted(e["row"]["id"] for e in events[1:-1]) == list(range(1, 41))
+    assert events[-1] == {
+        "event": "snapshot_completed",
+        "table": "orders",
+        "lsn": "0/16D5E40",
+        "rows": 40,
+    }
+    store.set_last_lsn.assert_awaited_once_with("cdc_orders", "0/16D5E40")
+    inner_start.assert_awaited_once()
+    await source.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_mode_with_checkpoint_resumes_tail(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(feature_flags, "cdc_postgres_enabled", True)
+    inner_start = AsyncMock()
+    monkeypatch.setattr(
+        "src.backend.infrastructure.sources.cdc.CDCSource.start", inner_start
+    )
+    store = AsyncMock(spec=CdcCursorStore)
+    store.get_last_lsn.return_value = "0/16D5E40"
+    db = _FakeDb(40)
+    on_event = AsyncMock()
+
+    source = _source(db, store)
+    await source.start(on_event)
+
+    assert source._bootstrap is None
+    assert db.conns == []
+    on_event.assert_not_called()
+    inner_start.assert_awaited_once()
+    await source.stop()
+
+
+@pytest.mark.asyncio
+async def test_cursor_read_failure_does_not_recreate_slot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(feature_flags, "cdc_postgres_enabled", True)
+    inner_start = AsyncMock()
+    monkeypatch.setattr(
+        "src.backend.infrastructure.sources.cdc.CDCSource.start", inner_start
+    )
+    store = AsyncMock(spec=CdcCursorStore)
+    store.get_last_lsn.side_effect = RuntimeError("db down")
+    db = _FakeDb(40)
+    on_event = AsyncMock()
+
+    source = _source(db, store)
+    with pytest.raises(RuntimeError, match="db down"):
+        await source.start(on_event)
+
+    assert source._bootstrap is None
+    on_event.assert_not_called()
+    inner_start.assert_not_called()
@@ -22,12 +22,12 @@ from src.backend.plugins.composition.lifecycle.startup_phases import (
 
 @pytest.mark.unit
 def test_startup_phases_count() -> None:
-    """STARTUP_PHASES должен иметь 19 фаз (5 obs + 3 infra + 11 services).
+    """STARTUP_PHASES должен иметь 20 фаз (6 obs + 3 infra + 11 services).
 
     Если добавляешь новую фазу, обнови этот test.
     """
-    assert len(STARTUP_PHASES) == 19, (
-        f"Expected 19 phases, got {len(STARTUP_PHASES)}"
+    assert len(STARTUP_PHASES) == 20, (
+        f"Expected 20 phases, got {len(STARTUP_PHASES)}"
     )
 
 
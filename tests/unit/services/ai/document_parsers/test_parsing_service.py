@@ -0,0 +1,191 @@
+"""Тесты DocumentParsingService: content-hash кэш, single-flight, страницы PDF."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.backend.services.ai.document_parsers import (
+    DocumentParsingService,
+    parse_document,
+)
+
+_SERVICE = "src.backend.services.ai.document_parsers._service"
+
+
+def _pdf(pages: int) -> bytes:
+    """PDF с текстом ``page <i> body`` на каждой странице."""
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for index in range(pages):
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 72 720 Td (page {index} body) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _result(text: str = "parsed", warnings: list[str] | None = None) -> tuple:
+    return text, {
+        "mime": "application/pdf",
+        "size_bytes": 8,
+        "warnings": warnings or [],
+        "filename": "a.pdf",
+        "engine": "markitdown",
+        "markdown": True,
+    }
+
+
+class TestParseCache:
+    async def test_duplicate_content_parsed_once(self) -> None:
+        service = DocumentParsingService()
+        parse = AsyncMock(return_value=_result())
+        with patch(f"{_SERVICE}.parse_document", parse) as m:
+            first = await service.parse(b"%PDF-1.0", "application/pdf", "a.pdf")
+            text, meta = await service.parse(b"%PDF-1.0", "application/pdf", "b.pdf")
+
+        assert m.await_count == 1
+        assert text == first[0] == "parsed"
+        assert meta["filename"] == "b.pdf"
+        assert first[1]["filename"] == "a.pdf"
+
+    async def test_concurrent_duplicates_coalesced(self) -> None:
+        service = DocumentParsingService()
+
+        async def _slow(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _result()
+
+        with patch(f"{_SERVICE}.parse_document", AsyncMock(side_effect=_slow)) as m:
+            results = await asyncio.gather(
+                *(service.parse(b"same", "application/pdf", "a.pdf") for _ in range(5))
+            )
+
+        assert m.await_count == 1
+        assert {text for text, _ in results} == {"parsed"}
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self) -> None:
+        service = DocumentParsingService()
+        started = asyncio.Event()
+
+        async def _slow(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(0.05)
+            return _result()
+
+        with patch(f"{_SERVICE}.parse_document", AsyncMock(side_effect=_slow)) as m:
+            leader = asyncio.ensure_future(service.parse(b"same", "application/pdf"))
+            await started.wait()
+            waiters = [
+                asyncio.ensure_future(service.parse(b"same", "application/pdf"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            leader.cancel()
+            results = await asyncio.wait_for(asyncio.gather(*waiters), 5)
+
+        assert leader.cancelled()
+        assert {text for text, _ in results} == {"parsed"}
+        assert m.await_count == 2
+
+    async def test_markitdown_fallback_not_cached(self) -> None:
+        service = DocumentParsingService()
+        fallback = _result(warnings=["markitdown failed: timeout; fallback to legacy"])
+        with patch(f"{_SERVICE}.parse_document", AsyncMock(return_value=fallback)) as m:
+            await service.parse(b"doc", "application/pdf")
+            await service.parse(b"doc", "application/pdf")
+
+        assert m.await_count == 2
+
+    async def test_engine_switch_misses_cache(self) -> None:
+        from src.backend.core.config.ai import markitdown_settings
+
+        service = DocumentParsingService()
+        original = markitdown_settings.engine_enabled
+        try:
+            with patch(
+                f"{_SERVICE}.parse_document", AsyncMock(return_value=_result())
+            ) as m:
+                markitdown_settings.engine_enabled = True
+                await service.parse(b"doc", "application/pdf")
+                markitdown_settings.engine_enabled = False
+                await service.parse(b"doc", "application/pdf")
+        finally:
+            markitdown_settings.engine_enabled = original
+
+        assert m.await_count == 2
+
+    async def test_disabled_cache_always_parses(self) -> None:
+        service = DocumentParsingService(cache_max_chars=0)
+        parse = AsyncMock(return_value=_result())
+        with patch(f"{_SERVICE}.parse_document", parse) as m:
+            await service.parse(b"doc", "application/pdf")
+            await service.parse(b"doc", "application/pdf")
+
+        assert m.await_count == 2
+        assert service.stats()["max_chars"] == 0
+
+    async def test_errors_not_cached(self) -> None:
+        service = DocumentParsingService()
+        with pytest.raises(ValueError, match="не поддерживается"):
+            await service.parse(b"", "application/x-secret", "a.bin")
+        assert service.stats()["entries"] == 0
+
+
+class TestPdfPages:
+    async def test_iter_pages_streams_all_pages_then_caches(self) -> None:
+        content = _pdf(12)
+        service = DocumentParsingService(pages_per_task=2)
+
+        pages = [page async for page in service.iter_pages(content, "application/pdf")]
+
+        assert sorted(page.index for page in pages) == list(range(12))
+        assert all(page.text == f"page {page.index} body" for page in pages)
+        with patch(f"{_SERVICE}.iter_pdf_pages") as streamed:
+            cached = [p async for p in service.iter_pages(content, "application/pdf")]
+        streamed.assert_not_called()
+        assert [page.index for page in cached] == list(range(12))
+
+    async def test_non_pdf_single_page(self) -> None:
+        service = DocumentParsingService()
+        pages = [page async for page in service.iter_pages(b"hello", "text/plain")]
+        assert [(page.index, page.text) for page in pages] == [(0, "hello")]
+
+    async def test_legacy_pdf_parallel_keeps_page_order(self) -> None:
+        from src.backend.core.config.ai import markitdown_settings
+
+        original = (
+            markitdown_settings.engine_enabled,
+            markitdown_settings.pdf_parallel_min_pages,
+        )
+        markitdown_settings.engine_enabled = False
+        markitdown_settings.pdf_parallel_min_pages = 4
+        try:
+            text, meta = await parse_document(_pdf(9), "application/pdf", "a.pdf")
+        finally:
+            (
+                markitdown_settings.engine_enabled,
+                markitdown_settings.pdf_parallel_min_pages,
+            ) = original
+
+        assert text == "\n\n".join(f"page {index} body" for index in range(9))
+        assert meta["engine"] == "legacy"
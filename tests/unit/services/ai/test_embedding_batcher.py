@@ -0,0 +1,190 @@
+"""Тесты micro-batching эмбеддингов (:class:`MicroBatchingEmbedder`).
+
+Модель заменена детерминированной функцией ``texts -> ndarray``, которая
+записывает размеры своих batch'ей.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from src.backend.services.ai.embedding_batcher import MicroBatchingEmbedder
+
+
+class _FakeModel:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[str]] = []
+        self.threads: set[str] = set()
+        self.fail = fail
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        self.threads.add(threading.current_thread().name)
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return np.array([[len(t), ord(t[0]), 1.0] for t in texts], dtype=np.float64)
+
+
+def _expected(text: str) -> list[float]:
+    return [float(len(text)), float(ord(text[0])), 1.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_model_batch() -> None:
+    model = _FakeModel()
+    embedder = MicroBatchingEmbedder(model, max_wait_ms=20)
+    texts = [f"query {i}" for i in range(20)]
+    results = await asyncio.gather(*(embedder.embed_array([t]) for t in texts))
+    await embedder.aclose()
+
+    assert len(model.batches) == 1
+    assert sorted(model.batches[0]) == sorted(texts)
+    for text, matrix in zip(texts, results, strict=True):
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [_expected(text)]
+    assert all(name.startswith("embedding-encode") for name in model.threads)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_by_max_batch_size() -> None:
+    model = _FakeModel()
+    embedder = MicroBatchingEmbedder(model, max_batch_size=16, max_queue=8)
+    texts = [f"doc-{i}" for i in range(100)]
+    matrix = await embedder.embed_array(texts)
+    await embedder.aclose()
+
+    assert matrix.shape == (100, 3)
+    assert max(len(b) for b in model.batches) <= 16
+    assert sum(len(b) for b in model.batches) == 100
+
+
+@pytest.mark.asyncio
+async def test_lru_and_inflight_dedup_skip_the_model() -> None:
+    model = _FakeModel()
+    embedder = MicroBatchingEmbedder(model)
+    await asyncio.gather(*(embedder.embed(["same"]) for _ in range(5)))
+    assert await embedder.embed(["same", "other"]) == [
+        _expected("same"),
+        _expected("other"),
+    ]
+    await embedder.aclose()
+    assert model.batches == [["same"], ["other"]]
+
+
+@pytest.mark.asyncio
+async def test_cached_vectors_are_read_only_but_results_are_copies() -> None:
+    embedder = MicroBatchingEmbedder(_FakeModel())
+    first = await embedder.embed_array(["text"])
+    first[0, 0] = -1.0
+    second = await embedder.embed_array(["text"])
+    await embedder.aclose()
+    assert second[0, 0] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_model_failure_reaches_every_caller_and_is_not_cached() -> None:
+    model = _FakeModel(fail=True)
+    embedder = MicroBatchingEmbedder(model, max_wait_ms=10)
+    results = await asyncio.gather(
+        embedder.embed(["a"]), embedder.embed(["b"]), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    model.fail = False
+    assert await embedder.embed(["a"]) == [_expected("a")]
+    await embedder.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_result() -> None:
+    embedder = MicroBatchingEmbedder(_FakeModel(), max_wait_ms=30)
+    first = asyncio.ensure_future(embedder.embed(["shared"]))
+    second = asyncio.ensure_future(embedder.embed(["shared"]))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == [_expected("shared")]
+    await embedder.aclose()
+
+
+@pytest.mark.asyncio
+async def test_caller_cancelled_in_backpressure_leaves_no_orphan_future() -> None:
+    release = threading.Event()
+    model = _FakeModel()
+
+    def slow(texts: list[str]) -> np.ndarray:
+        release.wait(5)
+        return model(texts)
+
+    embedder = MicroBatchingEmbedder(slow, max_batch_size=1, max_queue=1)
+    running = asyncio.ensure_future(embedder.embed(["a"]))
+    await asyncio.sleep(0.01)
+    queued = asyncio.ensure_future(embedder.embed(["b"]))
+    blocked = asyncio.ensure_future(embedder.embed(["c"]))
+    await asyncio.sleep(0.01)
+    blocked.cancel()
+    await asyncio.sleep(0)
+
+    retry = asyncio.ensure_future(embedder.embed(["c"]))
+    release.set()
+    assert await asyncio.wait_for(retry, 5) == [_expected("c")]
+    assert await running == [_expected("a")]
+    assert await queued == [_expected("b")]
+    await embedder.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_fails_queued_and_running_callers() -> None:
+    release = threading.Event()
+    model = _FakeModel()
+
+    def slow(texts: list[str]) -> np.ndarray:
+        release.wait(5)
+        return model(texts)
+
+    embedder = MicroBatchingEmbedder(slow, max_batch_size=1, max_queue=4)
+    running = asyncio.ensure_future(embedder.embed(["a"]))
+    await asyncio.sleep(0.01)
+    queued = asyncio.ensure_future(embedder.embed(["b"]))
+    await asyncio.sleep(0.01)
+
+    await embedder.aclose()
+    release.set()
+    for caller in (running, queued):
+        with pytest.raises(RuntimeError, match="closed"):
+            await asyncio.wait_for(caller, 5)
+
+
+@pytest.mark.asyncio
+async def test_malformed_model_output_fails_batch_and_keeps_consumer() -> None:
+    model = _FakeModel()
+    broken = True
+
+    def encode(texts: list[str]) -> np.ndarray:
+        matrix = model(texts)
+        return matrix[:-1] if broken else matrix
+
+    embedder = MicroBatchingEmbedder(encode, max_wait_ms=10)
+    results = await asyncio.gather(
+        embedder.embed(["a"]), embedder.embed(["b"]), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+    broken = False
+    assert await asyncio.wait_for(embedder.embed(["a"]), 5) == [_expected("a")]
+    await embedder.aclose()
+
+
+def test_provider_factory_shares_sentence_transformer_instance(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src.backend.core.config.rag import rag_settings
+    from src.backend.services.ai import embedding_providers
+
+    monkeypatch.setattr(embedding_providers, "_shared_st_providers", {})
+    monkeypatch.setattr(rag_settings, "embedding_provider", "sentence-transformers")
+    first = embedding_providers.get_embedding_provider()
+    assert embedding_providers.get_embedding_provider() is first
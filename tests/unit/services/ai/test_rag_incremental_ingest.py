@@ -0,0 +1,273 @@
+"""Инкрементальный content-addressed ingest: RAGService + staged pipeline.
+
+Vector store и embedder — in-memory stand-in'ы; chunker заменён на
+разбиение по абзацам, чтобы правка одного абзаца меняла ровно один chunk.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import pytest
+
+from src.backend.core.interfaces.vector_store import BaseVectorStore
+from src.backend.services.ai.rag_ingest_service import RagIngestService
+from src.backend.services.ai.rag_ingest_store import (
+    InMemoryChunkManifestStore,
+    RedisChunkManifestStore,
+)
+from src.backend.services.ai.rag_service import RAGService
+
+
+class _MemoryStore(BaseVectorStore):
+    def __init__(self) -> None:
+        self.points: dict[str, tuple[str, dict[str, Any]]] = {}
+        self.upserts = 0
+        self.deleted: list[str] = []
+
+    async def upsert(self, embeddings, documents, ids, metadatas=None) -> None:
+        self.upserts += 1
+        for i, point_id in enumerate(ids):
+            self.points[point_id] = (documents[i], (metadatas or [{}])[i])
+
+    async def query(self, embedding, top_k=5, where=None) -> list[dict[str, Any]]:
+        return []
+
+    async def delete(self, ids: list[str]) -> None:
+        self.deleted.extend(ids)
+        for point_id in ids:
+            self.points.pop(point_id, None)
+
+    async def delete_where(self, where: dict[str, Any]) -> int:
+        matched = [
+            point_id
+            for point_id, (_, meta) in self.points.items()
+            if all(meta.get(k) == v for k, v in where.items())
+        ]
+        await self.delete(matched)
+        return len(matched)
+
+    async def count(self) -> int:
+        return len(self.points)
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.texts.extend(texts)
+        return [[float(len(t))] for t in texts]
+
+
+class _ParagraphRAG(RAGService):
+    def chunk_text(self, text: str) -> list[str]:
+        return [p for p in text.split("\n\n") if p]
+
+
+@pytest.fixture(autouse=True)
+def _no_pii_mask(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.backend.core.config import ai_stack
+
+    monkeypatch.setattr(ai_stack.rag_ingest_settings, "pii_mask_on_ingest", False)
+
+
+def _rag() -> tuple[_ParagraphRAG, _MemoryStore, _CountingEmbedder]:
+    store, embedder = _MemoryStore(), _CountingEmbedder()
+    rag = _ParagraphRAG(
+        store=store, embedder=embedder, manifest=InMemoryChunkManifestStore()
+    )
+    return rag, store, embedder
+
+
+def _doc(*paragraphs: str) -> str:
+    return "\n\n".join(paragraphs)
+
+
+class TestContentAddressedIngest:
+    async def test_reingest_of_unchanged_document_is_a_noop(self) -> None:
+        rag, store, embedder = _rag()
+        meta = {"source_id": "docs/a.txt"}
+        await rag.ingest(_doc("p1", "p2", "p3"), metadata=meta)
+        await rag.ingest(_doc("p1", "p2", "p3"), metadata=meta)
+        assert embedder.texts == ["p1", "p2", "p3"]
+        assert store.upserts == 1
+        assert all(uuid.UUID(point_id) for point_id in store.points)
+
+    async def test_edit_embeds_only_changed_chunk_and_deletes_old(self) -> None:
+        rag, store, embedder = _rag()
+        meta = {"source_id": "docs/a.txt"}
+        await rag.ingest(_doc("p1", "p2", "p3"), metadata=meta)
+        embedder.texts.clear()
+
+        await rag.ingest(_doc("p1", "p2 edited", "p3"), metadata=meta)
+        assert embedder.texts == ["p2 edited"]
+        assert len(store.deleted) == 1
+        assert sorted(doc for doc, _ in store.points.values()) == [
+            "p1",
+            "p2 edited",
+            "p3",
+        ]
+
+    async def test_removed_chunks_are_deleted_by_diff(self) -> None:
+        rag, store, embedder = _rag()
+        meta = {"source_id": "docs/a.txt"}
+        await rag.ingest(_doc("p1", "p2", "p3"), metadata=meta)
+        await rag.ingest(_doc("p1"), metadata=meta)
+        assert [doc for doc, _ in store.points.values()] == ["p1"]
+        assert embedder.texts == ["p1", "p2", "p3"]
+
+    async def test_sources_do_not_share_chunks(self) -> None:
+        rag, store, _ = _rag()
+        await rag.ingest(_doc("same"), metadata={"source_id": "a"})
+        await rag.ingest(_doc("same"), metadata={"source_id": "b"})
+        await rag.ingest(_doc("other"), metadata={"source_id": "b"})
+        assert sorted(doc for doc, _ in store.points.values()) == ["other", "same"]
+
+    async def test_same_filename_without_source_id_never_deletes(self) -> None:
+        rag, store, embedder = _rag()
+        await rag.ingest(_doc("p1", "p2"), metadata={"filename": "file"})
+        await rag.ingest(_doc("q1"), metadata={"filename": "file"})
+        await rag.ingest(_doc("p1", "p2"), metadata={"filename": "file"})
+        assert store.deleted == []
+        assert sorted(doc for doc, _ in store.points.values()) == ["p1", "p2", "q1"]
+        assert embedder.texts == ["p1", "p2", "q1"]
+
+    async def test_chunk_metadata_carries_source_and_position(self) -> None:
+        rag, store, _ = _rag()
+        doc_id = await rag.ingest(
+            _doc("p1", "p2"), metadata={"filename": "a.txt"}, namespace="ns"
+        )
+        metas = sorted((m for _, m in store.points.values()), key=lambda m: m["chunk_idx"])
+        assert [m["chunk_idx"] for m in metas] == [0, 1]
+        assert {m["doc_id"] for m in metas} == {doc_id}
+        assert {m["namespace"] for m in metas} == {"ns"}
+        assert len({m["source_id"] for m in metas}) == 1
+
+
+class TestManifestLifecycle:
+    async def test_same_content_in_another_namespace_is_upserted(self) -> None:
+        rag, store, _ = _rag()
+        await rag.ingest(_doc("p1", "p2"), namespace="a")
+        await rag.ingest(_doc("p1", "p2"), namespace="b")
+        assert store.upserts == 2
+        assert sorted(m["namespace"] for _, m in store.points.values()) == [
+            "a",
+            "a",
+            "b",
+            "b",
+        ]
+
+    async def test_delete_collection_drops_manifests(self) -> None:
+        rag, store, _ = _rag()
+        await rag.ingest(_doc("p1", "p2"), metadata={"source_id": "s"}, namespace="a")
+        await rag.ingest(_doc("q1"), namespace="b")
+        assert await rag.delete_collection("a") == 2
+
+        await rag.ingest(_doc("p1", "p2"), metadata={"source_id": "s"}, namespace="a")
+        assert store.upserts == 3
+        assert len(store.points) == 3
+
+    async def test_delete_by_doc_id_removes_chunks_and_manifest(self) -> None:
+        rag, store, _ = _rag()
+        doc_id = await rag.ingest(_doc("p1", "p2"))
+        assert await rag.delete(doc_id)
+        assert store.points == {}
+
+        await rag.ingest(_doc("p1", "p2"))
+        assert len(store.points) == 2
+
+    async def test_discard_by_metadata_matches_chunk_metadata(self) -> None:
+        rag, store, _ = _rag()
+        meta = {"entity_type": "user", "entity_id": "42"}
+        await rag.ingest(_doc("p1"), metadata=meta)
+        await rag.ingest(_doc("q1"), metadata={"entity_type": "user", "entity_id": "7"})
+        await rag.discard_manifests(meta)
+        await store.delete_where(meta)
+
+        await rag.ingest(_doc("p1"), metadata=meta)
+        assert sorted(doc for doc, _ in store.points.values()) == ["p1", "q1"]
+
+    async def test_redis_manifest_write_failure_is_a_warning(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        class _DownRedis:
+            async def execute(self, kind: str, op: Any) -> Any:
+                raise ConnectionError("redis down")
+
+        store = RedisChunkManifestStore(redis_client=_DownRedis())
+        with caplog.at_level("WARNING"):
+            await store.put("s", {"c1"}, {"namespace": "a"})
+        assert any(
+            r.levelname == "WARNING" and "redis down" in r.getMessage()
+            for r in caplog.records
+        )
+
+
+class TestStagedPipeline:
+    async def test_multi_file_ingest_reports_stage_progress(self) -> None:
+        rag, store, embedder = _rag()
+        service = RagIngestService(rag_service=rag)
+        files = [(f"f{i}.txt", _doc(f"a{i}", f"b{i}").encode()) for i in range(10)]
+
+        source_ids = [name for name, _ in files]
+        first = await service.ingest(files, collection="docs", source_ids=source_ids)
+        assert first["status"] == "completed"
+        assert first["processed"] == 10
+        assert len(first["doc_ids"]) == 10
+        assert first["progress"]["chunks"] == {
+            "total": 20,
+            "embedded": 20,
+            "skipped": 0,
+            "deleted": 0,
+        }
+
+        files[3] = ("f3.txt", _doc("a3", "b3 edited").encode())
+        second = await service.ingest(files, collection="docs", source_ids=source_ids)
+        status = await service.status(second["task_id"])
+        assert status is not None
+        assert status["progress"]["stages"]["upserted"] == 10
+        assert status["progress"]["chunks"] == {
+            "total": 20,
+            "embedded": 1,
+            "skipped": 19,
+            "deleted": 1,
+        }
+        assert status["progress"]["throughput"]["docs_per_s"] > 0
+        assert len(store.points) == 20
+        assert len(embedder.texts) == 21
+
+    async def test_uploads_without_source_ids_keep_every_revision(self) -> None:
+        rag, store, _ = _rag()
+        service = RagIngestService(rag_service=rag)
+        await service.ingest([("file", _doc("a", "b").encode())])
+        result = await service.ingest([("file", _doc("c").encode())])
+        assert result["progress"]["chunks"]["deleted"] == 0
+        assert len(store.points) == 3
+
+    async def test_source_ids_must_match_files(self) -> None:
+        rag, _, _ = _rag()
+        service = RagIngestService(rag_service=rag)
+        with pytest.raises(ValueError, match="source_ids"):
+            await service.ingest([("a.txt", b"a")], source_ids=["a", "b"])
+
+    async def test_doc_ids_follow_file_order_and_errors_are_per_file(self) -> None:
+        rag, _, _ = _rag()
+        service = RagIngestService(rag_service=rag)
+        original = rag.embed_chunks
+
+        async def _flaky(plan: Any) -> list[list[float]]:
+            if "bad" in plan.chunks[0]:
+                raise RuntimeError("embedder down")
+            return await original(plan)
+
+        object.__setattr__(rag, "embed_chunks", _flaky)
+        files = [("a.txt", b"first"), ("bad.txt", b"bad"), ("c.txt", b"third")]
+        result = await service.ingest(files)
+
+        assert result["status"] == "completed_with_errors"
+        assert result["errors"] == [{"file": "bad.txt", "error": "embedder down"}]
+        assert result["processed"] == 3
+        expected = [await rag.prepare_chunks(t.decode()) for _, t in (files[0], files[2])]
+        assert result["doc_ids"] == [plan.doc_id for plan in expected]
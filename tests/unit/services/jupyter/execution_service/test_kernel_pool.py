@@ -0,0 +1,249 @@
+"""Tests для KernelPool: reuse, reset, health-check, recycling, bound."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from src.backend.services.jupyter.execution_service.kernel_pool import (
+    _BASELINE_CODE,
+    _RESET_CODE,
+    KernelPool,
+)
+
+
+class _FakeKM:
+    def __init__(self) -> None:
+        self.alive = True
+        self.shutdowns = 0
+
+    async def is_alive(self) -> bool:
+        return self.alive
+
+    async def shutdown_kernel(self, now: bool = False) -> None:
+        self.alive = False
+        self.shutdowns += 1
+
+
+class _FakeKC:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+        self.reset_status = "ok"
+        self.fail_prefix: str | None = None
+        self.stopped = False
+
+    async def execute_interactive(self, code: str, **kwargs: Any) -> dict[str, Any]:
+        self.executed.append(code)
+        if self.fail_prefix is not None and code.startswith(self.fail_prefix):
+            return {"content": {"status": "error"}}
+        return {"content": {"status": self.reset_status}}
+
+    def stop_channels(self) -> None:
+        self.stopped = True
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.started: list[tuple[_FakeKM, _FakeKC]] = []
+
+    async def __call__(self, kernel_name: str) -> tuple[_FakeKM, _FakeKC]:
+        pair = (_FakeKM(), _FakeKC())
+        self.started.append(pair)
+        return pair
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_kernel_reused_and_reset_between_runs() -> None:
+    factory = _Factory()
+    pool = KernelPool(min_idle=0, kernel_factory=factory)
+
+    async with pool.acquire("python3") as first:
+        pass
+    async with pool.acquire("python3") as second:
+        pass
+
+    assert first is second
+    assert len(factory.started) == 1
+    baseline, *resets = factory.started[0][1].executed
+    assert "_kernel_pool_baseline" in baseline
+    assert len(resets) == 2
+    assert all(code.rstrip().endswith("%reset -f") for code in resets)
+    assert second.uses == 2
+
+
+async def test_acquire_switches_kernel_to_cwd() -> None:
+    factory = _Factory()
+    pool = KernelPool(min_idle=0, kernel_factory=factory)
+
+    async with pool.acquire("python3", cwd="/srv/notebooks"):
+        pass
+
+    assert factory.started[0][1].executed[1] == (
+        "__import__('os').chdir('/srv/notebooks')"
+    )
+
+
+async def test_failed_chdir_retires_kernel() -> None:
+    factory = _Factory()
+    pool = KernelPool(min_idle=0, kernel_factory=factory)
+    async with pool.acquire("python3") as first:
+        first.kc.fail_prefix = "__import__('os').chdir"
+
+    with pytest.raises(RuntimeError):
+        async with pool.acquire("python3", cwd="/missing"):
+            pass
+    await _settle()
+
+    assert pool.stats()["python3"]["live"] == 0
+    assert factory.started[0][0].shutdowns == 1
+
+
+def test_reset_code_restores_baseline(tmp_path: Any) -> None:
+    """Без ``%reset -f`` (IPython magic) код отката — обычный Python."""
+    restore = _RESET_CODE.replace("%reset -f", "")
+    script = "\n".join(
+        (
+            _BASELINE_CODE,
+            "import os, sys",
+            "start = os.getcwd()",
+            f"os.chdir({str(tmp_path)!r})",
+            "os.environ['KP_LEAK'] = '1'",
+            "import json.tool",
+            restore,
+            "import os, sys",
+            "assert 'KP_LEAK' not in os.environ",
+            "assert 'json.tool' not in sys.modules",
+            "assert os.getcwd() == start",
+        )
+    )
+    env = {k: v for k, v in os.environ.items() if k != "KP_LEAK"}
+
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)  # noqa: S603
+
+
+async def test_kernels_keyed_by_spec() -> None:
+    factory = _Factory()
+    pool = KernelPool(min_idle=0, kernel_factory=factory)
+
+    async with pool.acquire("python3") as py:
+        pass
+    async with pool.acquire("ir") as r:
+        pass
+
+    assert py is not r
+    assert (py.kernel_name, r.kernel_name) == ("python3", "ir")
+    assert set(pool.stats()) == {"python3", "ir"}
+
+
+async def test_recycled_after_max_uses() -> None:
+    factory = _Factory()
+    pool = KernelPool(max_uses=2, min_idle=0, kernel_factory=factory)
+
+    for _ in range(3):
+        async with pool.acquire("python3"):
+            pass
+    await _settle()
+
+    assert len(factory.started) == 2
+    assert factory.started[0][0].shutdowns == 1
+    assert factory.started[0][1].stopped
+
+
+async def test_dead_kernel_replaced_on_acquire() -> None:
+    factory = _Factory()
+    pool = KernelPool(min_idle=0, kernel_factory=factory)
+
+    async with pool.acquire("python3") as first:
+        pass
+    first.km.alive = False
+    async with pool.acquire("python3") as second:
+        pass
+
+    assert second is not first
+    assert pool.stats()["python3"]["live"] == 1
+
+
+async def test_failed_reset_recycles_kernel() -> None:
+    factory = _Factory()
+    pool = KernelPool(min_idle=0, kernel_factory=factory)
+
+    async with pool.acquire("python3") as first:
+        first.kc.reset_status = "error"
+    async with pool.acquire("python3") as second:
+        pass
+
+    assert second is not first
+    assert len(factory.started) == 2
+
+
+async def test_cell_error_keeps_kernel() -> None:
+    pool = KernelPool(min_idle=0, kernel_factory=_Factory())
+
+    with pytest.raises(ValueError):
+        async with pool.acquire("python3") as first:
+            raise ValueError("cell failed")
+    async with pool.acquire("python3") as second:
+        pass
+
+    assert second is first
+
+
+async def test_concurrency_bounded_by_max_kernels() -> None:
+    factory = _Factory()
+    pool = KernelPool(max_kernels=2, min_idle=0, kernel_factory=factory)
+    busy = 0
+    peak = 0
+
+    async def _run() -> None:
+        nonlocal busy, peak
+        async with pool.acquire("python3"):
+            busy += 1
+            peak = max(peak, busy)
+            await asyncio.sleep(0.01)
+            busy -= 1
+
+    await asyncio.gather(*(_run() for _ in range(6)))
+
+    assert peak == 2
+    assert len(factory.started) == 2
+
+
+async def test_min_idle_keeps_warm_spare() -> None:
+    factory = _Factory()
+    pool = KernelPool(max_kernels=2, min_idle=1, kernel_factory=factory)
+
+    await pool.prewarm(["python3"])
+    assert pool.stats()["python3"]["idle"] == 1
+
+    async with pool.acquire("python3"):
+        await _settle()
+        assert pool.stats()["python3"] == {
+            "idle": 1,
+            "live": 2,
+            "warming": 0,
+            "busy": 1,
+        }
+    assert len(factory.started) == 2
+
+
+async def test_aclose_shuts_down_idle_kernels() -> None:
+    factory = _Factory()
+    pool = KernelPool(min_idle=0, kernel_factory=factory)
+    async with pool.acquire("python3"):
+        pass
+
+    await pool.aclose()
+
+    assert factory.started[0][0].shutdowns == 1
+    with pytest.raises(RuntimeError):
+        async with pool.acquire("python3"):
+            pass